@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark OCTAVE compression parsing: shared single-pass scan vs legacy regexes.
+
+Usage:
+    python scripts/benchmark_octave_scanner.py [--sizes 100 1000 5000] [--repeat 5]
+
+For each size (number of decisions/learnings/blockers/files), builds a
+synthetic compression and times:
+- legacy: the per-consumer regex passes used before octave_scanner
+  (lazy DOTALL section patterns, DECISION_N lookahead, comma splitting)
+- scanner: the same extractions from one scan_octave() result, as used by
+  extract_context_from_octave, extract_learnings_keys and
+  verify_context_claims (file existence checks excluded from both)
+- truncated: the same documents with every list after DECISIONS left open
+- fragmented: size concatenated partial compressions whose LEARNINGS lists
+  were cut off (each unterminated "LEARNINGS::[" makes the lazy legacy
+  pattern rescan to end of input: quadratic)
+
+Prints best-of-repeat milliseconds per case.
+"""
+
+import argparse
+import re
+import time
+from collections.abc import Callable
+
+from hestai_mcp.modules.tools.shared.octave_scanner import scan_octave
+
+
+def build_compression(size: int) -> str:
+    """Synthetic compression with size entries per section."""
+    decisions = ",\n".join(
+        f"  DECISION_{i}::BECAUSE[constraint_{i}, evidence]→choice_{i}→outcome" for i in range(size)
+    )
+    outcomes = ",\n".join(f"  outcome_{i}[metric_{i}]" for i in range(size))
+    blockers = ",\n".join(f"  blocker_{i}⊗resolved[fix_{i}]" for i in range(size))
+    learnings = ",\n".join(f"  problem_{i}→solution→wisdom_{i}" for i in range(size))
+    files = ", ".join(f'"src/file_{i}.py"' for i in range(size))
+    return (
+        "===SESSION_COMPRESSION===\n"
+        f"DECISIONS::[\n{decisions}\n]\n"
+        f"OUTCOMES::[\n{outcomes}\n]\n"
+        f"BLOCKERS::[\n{blockers}\n]\n"
+        f"LEARNINGS::[\n{learnings}\n]\n"
+        f"FILES_MODIFIED::[{files}]\n"
+        "===END_SESSION_COMPRESSION===\n"
+    )
+
+
+def legacy_parse(content: str) -> None:
+    """The regex passes each consumer ran before the shared scan."""
+    for section in ("DECISIONS", "OUTCOMES", "BLOCKERS"):
+        match = re.search(rf"{section}::\[(.*?)\]", content, re.DOTALL)
+        if match:
+            [item.strip() for item in match.group(1).split(",")]
+    re.findall(r"DECISION_\d+::(.*?)(?=DECISION_\d+::|$)", content, re.DOTALL)
+    re.findall(r"(\w+)⊗(resolved|blocked)\[([^\]]+)\]", content)
+    match = re.search(r"LEARNINGS::\[(.*?)\]", content, re.DOTALL)
+    if match:
+        [item.strip() for item in match.group(1).split(",")]
+    match = re.search(r"FILES_MODIFIED::\[(.*?)\]", content, re.DOTALL)
+    if match:
+        re.findall(r'["\']([^"\']+)["\']|([^,\s]+)', match.group(1))
+
+
+def scanner_parse(content: str) -> None:
+    """The same extractions from one shared scan (cache cleared per run)."""
+    scan_octave.cache_clear()
+    scan = scan_octave(content)
+    for section in ("DECISIONS", "OUTCOMES", "BLOCKERS", "LEARNINGS", "FILES_MODIFIED"):
+        scan.items(section)
+    scan.values(re.compile(r"DECISION_\d+"))
+    re.findall(r"(\w+)⊗(resolved|blocked)\[([^\]]+)\]", content)
+
+
+def best_ms(run: Callable[[], None], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'entries':>8} {'chars':>10} {'case':>10} {'legacy ms':>10} {'scanner ms':>11}")
+    for size in args.sizes:
+        content = build_compression(size)
+        # Unterminated lists: drop every closing bracket after the first section
+        head, _sep, tail = content.partition("]\n")
+        truncated = head + "]\n" + tail.replace("]\n", "\n")
+        fragmented = "".join(
+            f"LEARNINGS::[\n  problem_{i}→solution, wisdom_{i}\n" for i in range(size)
+        )
+        cases = (("complete", content), ("truncated", truncated), ("fragmented", fragmented))
+        for case, document in cases:
+            legacy = best_ms(lambda d=document: legacy_parse(d), args.repeat)
+            scanner = best_ms(lambda d=document: scanner_parse(d), args.repeat)
+            print(f"{size:>8} {len(document):>10} {case:>10} {legacy:>10.2f} {scanner:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
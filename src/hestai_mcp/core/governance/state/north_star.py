@@ -0,0 +1,264 @@
+"""North Star model - Parsed, cached view of a project's North Star document.
+
+clock_in (architectural constraints for AI synthesis) and bind (immutables
+for the TENSION step) both need the same few facts from the North Star:
+SCOPE_BOUNDARIES and the immutables I1-I6. Instead of re-listing the
+directory, re-reading the file and re-scanning its text on every call, the
+document is parsed once per file version and cached in-process.
+
+Parsing:
+- OCTAVE documents are parsed with octave-mcp (as ContextSteward does)
+- Markdown North Stars (or OCTAVE the parser rejects) fall back to a
+  single-pass line scan that also understands "### I1: TITLE" headings
+
+Caching:
+- Parsed models are keyed by (path, mtime_ns, size)
+- Directory candidate listings are keyed by (directory, mtime_ns)
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+from octave_mcp import parse
+from octave_mcp.core.ast_nodes import Assignment, Block, Section
+
+logger = logging.getLogger(__name__)
+
+# Directories searched for the North Star, in order (workflow/ is legacy)
+NORTH_STAR_DIRS = ("north-star", "workflow")
+
+# Characters of raw SCOPE_BOUNDARIES text kept by the text fallback
+MAX_SCOPE_CHARS = 500
+
+IMMUTABLE_IDS = tuple(f"I{n}" for n in range(1, 7))
+
+# "I3::DUAL_LAYER_AUTHORITY", "  I3::DUAL_LAYER_AUTHORITY::[", "### I3: DUAL-LAYER AUTHORITY"
+_IMMUTABLE_LINE = re.compile(r"^[\s#*\-]*(I[1-6])\s*::?\s*([A-Za-z0-9][A-Za-z0-9_\- ]*)")
+
+# Sections that end a raw SCOPE_BOUNDARIES block in the text fallback
+_SCOPE_END = re.compile(r"IMMUTABLES|ASSUMPTIONS|CONSTRAINED_VARIABLES|===END")
+
+
+@dataclass(frozen=True)
+class NorthStar:
+    """Constraints extracted from one version of a North Star file."""
+
+    path: Path
+    source: Literal["octave", "text"]
+    immutables: dict[str, str] = field(default_factory=dict)
+    scope_boundaries: str | None = None
+
+    def immutable(self, immutable_id: str) -> str | None:
+        """Name of an immutable by id (e.g. "I4"), or None."""
+        return self.immutables.get(immutable_id)
+
+    def immutable_refs(self) -> list[str]:
+        """Immutables as "I1::NAME" references, in id order."""
+        return [f"{key}::{self.immutables[key]}" for key in IMMUTABLE_IDS if key in self.immutables]
+
+    def constraints_summary(self) -> str | None:
+        """Scope boundaries and key immutables for AI context, or None if empty."""
+        parts = []
+        if self.scope_boundaries:
+            parts.append(self.scope_boundaries)
+        refs = self.immutable_refs()
+        if refs:
+            parts.append("KEY IMMUTABLES:\n" + "\n".join(refs))
+        return "\n\n".join(parts) if parts else None
+
+
+# Parsed models: path -> (mtime_ns, size, model)
+_model_cache: dict[Path, tuple[int, int, NorthStar]] = {}
+
+# Candidate listings: directory -> (mtime_ns, candidates)
+_listing_cache: dict[Path, tuple[int, list[Path]]] = {}
+
+
+def clear_north_star_cache() -> None:
+    """Drop all cached models and directory listings."""
+    _model_cache.clear()
+    _listing_cache.clear()
+
+
+def find_north_star_file(working_dir: Path) -> Path | None:
+    """
+    Find the North Star file in .hestai/north-star/ using flexible naming patterns.
+
+    Per naming-standard.oct.md, North Star files follow pattern:
+    000-{PROJECT}-NORTH-STAR(-SUMMARY)?(.oct)?.md
+
+    Returns the first matching file, preferring .oct.md over .md, then
+    alphabetical. -SUMMARY files are excluded. Falls back to the legacy
+    .hestai/workflow/ directory when north-star/ has no candidates.
+    """
+    for dir_name in NORTH_STAR_DIRS:
+        candidates = _north_star_candidates(working_dir / ".hestai" / dir_name)
+        if candidates:
+            return candidates[0]
+    return None
+
+
+def _north_star_candidates(directory: Path) -> list[Path]:
+    """Sorted North Star candidates in directory (cached by directory mtime)."""
+    try:
+        mtime_ns = directory.stat().st_mtime_ns
+    except OSError:
+        return []
+
+    cached = _listing_cache.get(directory)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    try:
+        candidates = [
+            path
+            for path in directory.iterdir()
+            if path.name.startswith("000-")
+            and "NORTH-STAR" in path.name
+            and "-SUMMARY" not in path.name
+            and path.name.endswith(".md")
+        ]
+    except OSError:
+        return []
+
+    # .oct.md before .md, then alphabetical
+    candidates.sort(key=lambda p: (0 if p.name.endswith(".oct.md") else 1, p.name))
+    _listing_cache[directory] = (mtime_ns, candidates)
+    return candidates
+
+
+def load_north_star(path: Path) -> NorthStar | None:
+    """
+    Return the parsed North Star at path, re-parsing only when the file changed.
+
+    Args:
+        path: North Star file
+
+    Returns:
+        NorthStar model, or None if the file cannot be read
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    cached = _model_cache.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    try:
+        content = path.read_text()
+    except OSError as e:
+        logger.debug(f"Could not read North Star {path}: {e}")
+        return None
+
+    model = _parse_octave(path, content) or _scan_text(path, content)
+    _model_cache[path] = (stat.st_mtime_ns, stat.st_size, model)
+    return model
+
+
+def _parse_octave(path: Path, content: str) -> NorthStar | None:
+    """Build the model from the octave-mcp AST; None if content is not OCTAVE."""
+    if not content.lstrip().startswith("==="):
+        return None
+    try:
+        document = parse(content)
+    except Exception as e:
+        logger.debug(f"North Star {path.name} is not parseable OCTAVE ({e}), scanning text")
+        return None
+
+    immutables: dict[str, str] = {}
+    scope: str | None = None
+    for node in _walk(document.sections):
+        if node.key == "IMMUTABLES" and isinstance(node, Assignment):
+            for key, value in _pairs(node.value):
+                if key in IMMUTABLE_IDS:
+                    immutables.setdefault(key, _scalar(value))
+        elif node.key in IMMUTABLE_IDS:
+            immutables.setdefault(node.key, _immutable_name(node))
+        elif node.key == "SCOPE_BOUNDARIES" and scope is None:
+            scope = _render_scope(node)
+
+    if not immutables and scope is None:
+        # Valid OCTAVE without the expected fields: the text scan may still find them
+        return None
+    return NorthStar(path=path, source="octave", immutables=immutables, scope_boundaries=scope)
+
+
+def _walk(nodes: list[Any]) -> list[Assignment | Section | Block]:
+    """Flatten keyed AST nodes (sections and blocks include their children)."""
+    flat: list[Assignment | Section | Block] = []
+    for node in nodes:
+        if not isinstance(node, (Assignment, Section, Block)):
+            continue
+        flat.append(node)
+        if not isinstance(node, Assignment):
+            flat.extend(_walk(node.children))
+    return flat
+
+
+def _pairs(value: Any) -> list[tuple[str, Any]]:
+    """Key/value pairs from a list of inline maps ([K::V, ...])."""
+    pairs: list[tuple[str, Any]] = []
+    for item in getattr(value, "items", []):
+        item_pairs = getattr(item, "pairs", None)
+        if isinstance(item_pairs, dict):
+            pairs.extend(item_pairs.items())
+    return pairs
+
+
+def _scalar(value: Any) -> str:
+    """Render an OCTAVE value compactly (lists as [a, b])."""
+    items = getattr(value, "items", None)
+    if items is not None:
+        return "[" + ", ".join(_scalar(item) for item in items) + "]"
+    pairs = getattr(value, "pairs", None)
+    if isinstance(pairs, dict):
+        return ", ".join(f"{k}::{_scalar(v)}" for k, v in pairs.items())
+    return str(getattr(value, "value", value))
+
+
+def _immutable_name(node: Assignment | Section | Block) -> str:
+    """Name of a top-level immutable ("I1::NAME" or "I1::NAME::[...]")."""
+    if isinstance(node, Assignment):
+        text = _scalar(node.value)
+        return text.split("::", 1)[0].strip("[] ")
+    return getattr(node, "value", None) or ""
+
+
+def _render_scope(node: Assignment | Section | Block) -> str:
+    """Render SCOPE_BOUNDARIES as one "KEY::[...]" line per boundary."""
+    if isinstance(node, Assignment):
+        lines = [f"  {key}::{_scalar(value)}" for key, value in _pairs(node.value)]
+        if not lines:
+            lines = [f"  {_scalar(node.value)}"]
+    else:
+        lines = [
+            f"  {child.key}::{_scalar(child.value)}"
+            for child in node.children
+            if isinstance(child, Assignment)
+        ]
+    return "SCOPE_BOUNDARIES:\n" + "\n".join(lines)
+
+
+def _scan_text(path: Path, content: str) -> NorthStar:
+    """Single-pass fallback for markdown (or non-parseable) North Stars."""
+    immutables: dict[str, str] = {}
+    for line in content.splitlines():
+        match = _IMMUTABLE_LINE.match(line)
+        if match and match.group(1) not in immutables:
+            name = match.group(2).strip().upper().replace("-", "_").replace(" ", "_")
+            immutables[match.group(1)] = name.rstrip("_")
+
+    scope: str | None = None
+    start = content.find("SCOPE_BOUNDARIES")
+    if start != -1:
+        section = content[start:]
+        # Skip past "SCOPE_BOUNDARIES" itself before looking for the next section
+        end = _SCOPE_END.search(section, 20)
+        scope = section[: min(end.start() if end else len(section), MAX_SCOPE_CHARS)]
+
+    return NorthStar(path=path, source="text", immutables=immutables, scope_boundaries=scope)
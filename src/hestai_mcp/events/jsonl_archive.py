@@ -0,0 +1,248 @@
+"""
+Compressed JSONL archive format with a seekable frame index.
+
+Redacted session transcripts are append-once, read-rarely artifacts. Storing
+them as plain text wastes disk; storing them as a single gzip stream makes
+fetching one event cost a full decompression. This module writes a middle
+ground:
+
+- ``<name>.jsonl.gz``: a concatenation of independent gzip members ("frames"),
+  each holding up to ``frame_lines`` complete JSONL lines. Because gzip
+  permits multi-member files, standard tools (``zcat``, ``gzip.open``) read
+  it as one ordinary stream.
+- ``<name>.jsonl.gz.idx``: a JSON sidecar mapping line ranges to frame byte
+  offsets, so a single line can be fetched by decompressing one frame.
+
+Design Decisions:
+1. gzip (stdlib) rather than zstd: no extra runtime dependency on Python 3.11
+2. Frames are line-aligned: a JSONL record never straddles two frames
+3. The sidecar is optional for readers: without it, random access degrades
+   to a sequential scan rather than failing
+4. Writes are atomic (temp file + fsync + rename) for both files
+"""
+
+import bisect
+import gzip
+import json
+import os
+import tempfile
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+# gzip magic number (RFC 1952)
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Default number of JSONL lines per independent gzip frame
+DEFAULT_FRAME_LINES = 256
+
+# Sidecar index format version
+INDEX_VERSION = 1
+
+
+@dataclass
+class ArchiveIndex:
+    """Line -> frame mapping for a compressed JSONL archive.
+
+    Each frame is ``(first_line, offset, length)``: the 0-based number of the
+    first line it holds, and its byte range within the ``.jsonl.gz`` file.
+    """
+
+    frame_lines: int
+    line_count: int = 0
+    frames: list[tuple[int, int, int]] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the sidecar JSON structure."""
+        return {
+            "version": INDEX_VERSION,
+            "frame_lines": self.frame_lines,
+            "line_count": self.line_count,
+            "frames": [list(frame) for frame in self.frames],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ArchiveIndex":
+        """Deserialize from the sidecar JSON structure.
+
+        Raises:
+            ValueError: If the sidecar version is not supported
+        """
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported archive index version: {data.get('version')}")
+        return cls(
+            frame_lines=int(data["frame_lines"]),
+            line_count=int(data["line_count"]),
+            frames=[(int(f[0]), int(f[1]), int(f[2])) for f in data["frames"]],
+        )
+
+    def frame_for_line(self, line_number: int) -> tuple[int, int, int]:
+        """Return the frame containing line_number.
+
+        Raises:
+            IndexError: If line_number is outside the archive
+        """
+        if not 0 <= line_number < self.line_count:
+            raise IndexError(f"Line {line_number} out of range (0..{self.line_count - 1})")
+        starts = [frame[0] for frame in self.frames]
+        return self.frames[bisect.bisect_right(starts, line_number) - 1]
+
+
+def index_path_for(archive_path: Path) -> Path:
+    """Return the sidecar index path for a compressed archive."""
+    return archive_path.with_name(archive_path.name + ".idx")
+
+
+def is_compressed_archive(path: Path) -> bool:
+    """Detect a gzip archive by magic number (not by file extension)."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(2) == GZIP_MAGIC
+    except OSError:
+        return False
+
+
+def open_jsonl_text(path: Path) -> IO[str]:
+    """Open a JSONL file for text reading, transparently decompressing gzip.
+
+    Plain files are opened exactly as before (platform default encoding);
+    compressed archives are decoded as UTF-8, which is how they are written.
+    """
+    if is_compressed_archive(path):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path)
+
+
+def write_jsonl_archive(
+    src: Path, dst: Path, frame_lines: int = DEFAULT_FRAME_LINES
+) -> ArchiveIndex:
+    """Compress a plain JSONL file into a framed gzip archive plus sidecar index.
+
+    Args:
+        src: Plain JSONL source file
+        dst: Destination ``.jsonl.gz`` path (sidecar is written next to it)
+        frame_lines: Number of lines per independent gzip frame
+
+    Returns:
+        The ArchiveIndex written to the sidecar
+
+    Raises:
+        FileNotFoundError: If src doesn't exist
+        ValueError: If frame_lines is not positive
+        OSError: On write failure (no partial dst or sidecar is left behind)
+    """
+    if frame_lines <= 0:
+        raise ValueError("frame_lines must be positive")
+    if not src.exists():
+        raise FileNotFoundError(f"Source file not found: {src}")
+
+    index = ArchiveIndex(frame_lines=frame_lines)
+    idx_path = index_path_for(dst)
+    data_fd, data_tmp = tempfile.mkstemp(prefix=f".{dst.name}.", suffix=".tmp", dir=dst.parent)
+    idx_tmp: str | None = None
+    try:
+        with open(src, "rb") as src_file, os.fdopen(data_fd, "wb") as out:
+            batch: list[bytes] = []
+            for raw_line in src_file:
+                batch.append(raw_line)
+                if len(batch) >= frame_lines:
+                    _write_frame(out, batch, index)
+                    batch = []
+            if batch:
+                _write_frame(out, batch, index)
+            out.flush()
+            os.fsync(out.fileno())
+
+        idx_fd, idx_tmp = tempfile.mkstemp(
+            prefix=f".{idx_path.name}.", suffix=".tmp", dir=dst.parent
+        )
+        with os.fdopen(idx_fd, "w", encoding="utf-8") as idx_file:
+            json.dump(index.to_dict(), idx_file, separators=(",", ":"))
+            idx_file.flush()
+            os.fsync(idx_file.fileno())
+
+        # Data first: a present sidecar always describes a complete archive
+        os.replace(data_tmp, dst)
+        os.replace(idx_tmp, idx_path)
+    except BaseException:
+        Path(data_tmp).unlink(missing_ok=True)
+        if idx_tmp is not None:
+            Path(idx_tmp).unlink(missing_ok=True)
+        raise
+
+    return index
+
+
+def _write_frame(out: IO[bytes], lines: list[bytes], index: ArchiveIndex) -> None:
+    """Append one independent gzip member holding lines and record it in index."""
+    # A record without a trailing newline would merge with the next frame's
+    # first line when the members are read back as one stream.
+    if not lines[-1].endswith(b"\n"):
+        lines[-1] += b"\n"
+    frame = gzip.compress(b"".join(lines), mtime=0)
+    index.frames.append((index.line_count, out.tell(), len(frame)))
+    out.write(frame)
+    index.line_count += len(lines)
+
+
+def load_archive_index(archive_path: Path) -> ArchiveIndex | None:
+    """Load the sidecar index for an archive, or None if absent/unreadable."""
+    idx_path = index_path_for(archive_path)
+    try:
+        return ArchiveIndex.from_dict(json.loads(idx_path.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError, IndexError):
+        return None
+
+
+def read_jsonl_line(archive_path: Path, line_number: int) -> str:
+    """Fetch a single JSONL line (0-based) from a compressed archive.
+
+    Decompresses only the frame that holds the line when the sidecar index
+    is available; otherwise falls back to a sequential scan.
+
+    Returns:
+        The line content without its trailing newline
+
+    Raises:
+        IndexError: If line_number is outside the archive
+    """
+    index = load_archive_index(archive_path)
+    if index is None:
+        for current, line in enumerate(iter_jsonl_lines(archive_path)):
+            if current == line_number:
+                return line
+        raise IndexError(f"Line {line_number} out of range")
+
+    first_line, offset, length = index.frame_for_line(line_number)
+    with open(archive_path, "rb") as f:
+        f.seek(offset)
+        frame = gzip.decompress(f.read(length))
+    return frame.decode("utf-8").split("\n")[line_number - first_line]
+
+
+def iter_jsonl_lines(path: Path, start: int = 0) -> Iterator[str]:
+    """Iterate JSONL lines (without newlines) from a plain or compressed file.
+
+    For indexed archives, iteration begins at the frame containing ``start``
+    instead of decompressing everything before it.
+
+    Args:
+        path: Plain ``.jsonl`` or compressed ``.jsonl.gz`` file
+        start: 0-based line number to start from
+    """
+    index = load_archive_index(path) if start and is_compressed_archive(path) else None
+    if index is not None and start < index.line_count:
+        first_line, offset, _length = index.frame_for_line(start)
+        with open(path, "rb") as raw:
+            raw.seek(offset)
+            with gzip.open(raw, "rt", encoding="utf-8") as f:
+                for current, line in enumerate(f, start=first_line):
+                    if current >= start:
+                        yield line.rstrip("\n")
+        return
+
+    with open_jsonl_text(path) as f:
+        for current, line in enumerate(f):
+            if current >= start:
+                yield line.rstrip("\n")
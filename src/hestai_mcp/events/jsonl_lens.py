@@ -30,6 +30,8 @@ from typing import Any, Literal
 
 from pydantic import BaseModel
 
+from hestai_mcp.events.jsonl_archive import open_jsonl_text
+
 # ============================================================================
 # EXCEPTIONS
 # ============================================================================
@@ -146,8 +148,11 @@ class ClaudeJsonlLens:
         """
         Parse a Claude session JSONL file.
 
+        Compressed archives (.jsonl.gz written by jsonl_archive) are
+        detected by magic number and decompressed transparently.
+
         Args:
-            jsonl_path: Path to .jsonl file
+            jsonl_path: Path to .jsonl or .jsonl.gz file
 
         Yields:
             HestAIEvent subclass instances
@@ -156,7 +161,7 @@ class ClaudeJsonlLens:
             JsonlParseError: On malformed JSON
             UnknownSchemaError: On unknown record type (if strict=True)
         """
-        with open(jsonl_path) as f:
+        with open_jsonl_text(jsonl_path) as f:
             yield from self.parse_stream(f)
 
     def parse_stream(self, lines: Iterable[str]) -> Iterator[HestAIEvent]:
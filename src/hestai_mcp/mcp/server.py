@@ -4,7 +4,11 @@ HestAI MCP Server - Dual-Layer Context Architecture (ADR-0007).
 This MCP server provides context management tools for AI agents:
 - clock_in: Register session start and return context paths
 - clock_out: Archive session transcript with OCTAVE compression
+- compression_job_status: Progress of deferred clock_out compression jobs
+- query_learnings: Search archived session decisions, blockers and learnings
+- search_knowledge: Ranked full-text search of the optional FTS5 knowledge store
 - bind: Lightweight agent binding bootstrap
+- query_error_metrics: Read RCCAFP records, escalation rates and repeated root causes
 - document_submit: Submit documents to .hestai/ (TODO - Phase 4)
 
 Architecture:
@@ -13,6 +17,7 @@ Architecture:
 - Hub: Bundled with MCP server package (no external HESTAI_HUB_ROOT dependency)
 """
 
+import asyncio
 import logging
 import os
 import shutil
@@ -24,10 +29,24 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
+from hestai_mcp.modules.services.ai.client import (
+    close_shared_http_client,
+    start_shared_http_client,
+)
+from hestai_mcp.modules.services.ai.config import prewarm_api_keys
 from hestai_mcp.modules.tools.bind import bind
 from hestai_mcp.modules.tools.clock_in import clock_in_async, validate_working_dir
 from hestai_mcp.modules.tools.clock_out import clock_out
+from hestai_mcp.modules.tools.shared.compression_jobs import (
+    CompressionJobWorker,
+    get_compression_job_status,
+    jobs_dir,
+)
+from hestai_mcp.modules.tools.shared.error_metrics import query_error_metrics
 from hestai_mcp.modules.tools.shared.governance_integrity import store_governance_hash
+from hestai_mcp.modules.tools.shared.knowledge_store import KINDS as KNOWLEDGE_KINDS
+from hestai_mcp.modules.tools.shared.knowledge_store import query_knowledge_store
+from hestai_mcp.modules.tools.shared.learnings_index import query_learnings
 from hestai_mcp.modules.tools.shared.review_formats import VALID_ROLES as REVIEW_VALID_ROLES
 from hestai_mcp.modules.tools.submit_rccafp import submit_rccafp_record
 from hestai_mcp.modules.tools.submit_review import submit_review
@@ -48,6 +67,9 @@ load_dotenv(dotenv_path=_repo_root_env if _repo_root_env.exists() else None)
 
 logger = logging.getLogger(__name__)
 
+# Processes deferred clock_out compression jobs (.hestai/state/jobs/) in-process
+compression_worker = CompressionJobWorker()
+
 # Critical-Engineer: consulted for Governance injection target validation + clock_out target hardening
 
 
@@ -518,10 +540,141 @@ async def list_tools() -> list[Tool]:
                             "Project working directory (recommended). " "Falls back to cwd search."
                         ),
                     },
+                    "defer_compression": {
+                        "type": "boolean",
+                        "description": (
+                            "Return once the redacted archive is written and run OCTAVE "
+                            "compression as a background job (poll compression_job_status). "
+                            "Defaults to HESTAI_DEFER_COMPRESSION."
+                        ),
+                    },
                 },
                 "required": ["session_id"],
             },
         ),
+        Tool(
+            name="compression_job_status",
+            description=(
+                "Report progress of deferred clock_out compression jobs "
+                "(.hestai/state/jobs/): status, attempts, last error and result."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "working_dir": {
+                        "type": "string",
+                        "description": "Project working directory path",
+                    },
+                    "job_id": {
+                        "type": "string",
+                        "description": "Job ID returned by clock_out (compression_job_id)",
+                    },
+                    "session_id": {
+                        "type": "string",
+                        "description": "Report all jobs for this session",
+                    },
+                },
+                "required": ["working_dir"],
+            },
+        ),
+        Tool(
+            name="query_learnings",
+            description=(
+                "Search the learnings index of archived sessions "
+                "(.hestai/state/sessions/archive/learnings-index.jsonl) by keyword, "
+                "role, focus and time range. Returns matching entries, newest first."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "working_dir": {
+                        "type": "string",
+                        "description": "Project working directory path",
+                    },
+                    "keywords": {
+                        "type": "string",
+                        "description": "Terms that must all appear in decisions/blockers/learnings",
+                    },
+                    "role": {
+                        "type": "string",
+                        "description": "Only sessions of this role",
+                    },
+                    "focus": {
+                        "type": "string",
+                        "description": "Only sessions with this focus",
+                    },
+                    "since": {
+                        "type": "string",
+                        "description": "Earliest session timestamp (ISO 8601)",
+                    },
+                    "until": {
+                        "type": "string",
+                        "description": "Latest session timestamp (ISO 8601)",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum entries returned",
+                        "default": 20,
+                    },
+                },
+                "required": ["working_dir"],
+            },
+        ),
+        Tool(
+            name="search_knowledge",
+            description=(
+                "Ranked full-text search (SQLite FTS5) over archived session decisions, "
+                "blockers, learnings and outcomes "
+                "(.hestai/state/sessions/archive/knowledge.sqlite3). "
+                "clock_out populates the store when HESTAI_KNOWLEDGE_STORE=1; "
+                "backfill rebuilds it from existing archives."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "working_dir": {
+                        "type": "string",
+                        "description": "Project working directory path",
+                    },
+                    "query": {
+                        "type": "string",
+                        "description": "Terms that must all match",
+                    },
+                    "kinds": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": list(KNOWLEDGE_KINDS)},
+                        "description": "Only these kinds of knowledge",
+                    },
+                    "role": {
+                        "type": "string",
+                        "description": "Only sessions of this role",
+                    },
+                    "focus": {
+                        "type": "string",
+                        "description": "Only sessions with this focus",
+                    },
+                    "since": {
+                        "type": "string",
+                        "description": "Earliest session timestamp (ISO 8601)",
+                    },
+                    "until": {
+                        "type": "string",
+                        "description": "Latest session timestamp (ISO 8601)",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum results",
+                        "default": 20,
+                    },
+                    "backfill": {
+                        "type": "boolean",
+                        "description": "Rebuild the store from archived .oct.md files first",
+                        "default": False,
+                    },
+                },
+                "required": ["working_dir", "query"],
+            },
+        ),
         Tool(
             name="bind",
             description=(
@@ -678,6 +831,46 @@ async def list_tools() -> list[Tool]:
                 ],
             },
         ),
+        Tool(
+            name="query_error_metrics",
+            description=(
+                "Read RCCAFP records back from .hestai/state/error-metrics.jsonl "
+                "through its offset index: records by session and time window "
+                "(newest first), escalation rate by role and repeated root causes."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "working_dir": {
+                        "type": "string",
+                        "description": "Project working directory path",
+                    },
+                    "session_id": {
+                        "type": "string",
+                        "description": "Only records of this session",
+                    },
+                    "since": {
+                        "type": "string",
+                        "description": "Earliest timestamp or date (ISO 8601, inclusive)",
+                    },
+                    "until": {
+                        "type": "string",
+                        "description": "Latest timestamp or date (ISO 8601, inclusive)",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum records returned",
+                        "default": 100,
+                    },
+                    "min_count": {
+                        "type": "integer",
+                        "description": "Minimum occurrences for a repeated root cause",
+                        "default": 2,
+                    },
+                },
+                "required": ["working_dir"],
+            },
+        ),
     ]
 
 
@@ -801,6 +994,67 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             session_id=session_id,
             description=arguments.get("description", ""),
             project_root=actual_project_root,
+            defer_compression=arguments.get("defer_compression"),
+        )
+
+        if result.get("compression_job_id"):
+            compression_worker.watch(actual_project_root)
+
+        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+    elif name == "compression_job_status":
+        import json
+
+        project_root = validate_working_dir(arguments["working_dir"])
+        _validate_project_identity(project_root)
+
+        status = get_compression_job_status(
+            project_root,
+            job_id=arguments.get("job_id"),
+            session_id=arguments.get("session_id"),
+        )
+        # Resume any jobs left queued by a previous server process
+        if any(job["status"] not in ("succeeded", "failed") for job in status["jobs"]):
+            compression_worker.watch(project_root)
+
+        return [TextContent(type="text", text=json.dumps(status, indent=2))]
+
+    elif name == "query_learnings":
+        import json
+
+        project_root = validate_working_dir(arguments["working_dir"])
+        _validate_project_identity(project_root)
+
+        result = query_learnings(
+            project_root,
+            keywords=arguments.get("keywords"),
+            role=arguments.get("role"),
+            focus=arguments.get("focus"),
+            since=arguments.get("since"),
+            until=arguments.get("until"),
+            limit=arguments.get("limit", 20),
+        )
+
+        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+    elif name == "search_knowledge":
+        import json
+
+        project_root = validate_working_dir(arguments["working_dir"])
+        _validate_project_identity(project_root)
+
+        # SQLite search (and optional backfill) runs off the event loop
+        result = await asyncio.to_thread(
+            query_knowledge_store,
+            project_root,
+            arguments["query"],
+            kinds=arguments.get("kinds"),
+            role=arguments.get("role"),
+            focus=arguments.get("focus"),
+            since=arguments.get("since"),
+            until=arguments.get("until"),
+            limit=arguments.get("limit", 20),
+            backfill=arguments.get("backfill", False),
         )
 
         return [TextContent(type="text", text=json.dumps(result, indent=2))]
@@ -854,6 +1108,24 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
         return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
+    elif name == "query_error_metrics":
+        import json
+
+        project_root = validate_working_dir(arguments["working_dir"])
+        _validate_project_identity(project_root)
+
+        result = await asyncio.to_thread(
+            query_error_metrics,
+            project_root,
+            session_id=arguments.get("session_id"),
+            since=arguments.get("since"),
+            until=arguments.get("until"),
+            limit=arguments.get("limit", 100),
+            min_count=arguments.get("min_count", 2),
+        )
+
+        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
     else:
         raise ValueError(f"Unknown tool: {name}")
 
@@ -868,11 +1140,26 @@ async def main() -> None:
     # Fail-closed bootstrap: materialize .hestai-sys from bundled hub if needed.
     bootstrap_system_governance(None)
 
+    # Resume compression jobs left unfinished by a previous server process
+    startup_root = Path(os.environ.get("HESTAI_PROJECT_ROOT") or Path.cwd())
+    if jobs_dir(startup_root).is_dir():
+        compression_worker.watch(startup_root)
+
+    # One pooled AI HTTP client for the server lifetime (keep-alive across tool calls)
+    await start_shared_http_client()
+    # Resolve keyring secrets in the background rather than on the first
+    # completion; a slow or locked keyring must not delay the MCP handshake
+    prewarm_task = asyncio.create_task(prewarm_api_keys())
+
     async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+        try:
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+        finally:
+            prewarm_task.cancel()
+            # Unfinished jobs stay durable on disk and resume on next start
+            await compression_worker.stop()
+            await close_shared_http_client()
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
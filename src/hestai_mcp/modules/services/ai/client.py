@@ -2,8 +2,27 @@
 
 SS-I2 Compliance: All provider calls, MCP tool invocations, and I/O operations
 must be async. No blocking calls in the MCP server event loop.
+
+Resilience (configured in ai.yaml, all off by default):
+- retry: retryable errors (timeout, connect, 5xx) are retried with jittered
+  exponential backoff
+- fallbacks: per-tier chains of other tiers (possibly other providers) tried
+  in order once a tier's retries are exhausted on a retryable error
+- hedging: if the primary tier is slower than its observed p95 latency, the
+  first fallback tier is raced against it and the first success wins
+
+complete_text_streaming reads the provider's streaming API instead, so callers
+can enforce a time-to-first-token deadline and keep usable partial output.
+It applies retry and fallbacks to stream establishment (until the first chunk
+arrives) but never hedges: callers that need hedging stay on complete_text.
 """
 
+import asyncio
+import importlib.util
+import logging
+import random
+from collections import deque
+from collections.abc import Callable
 from types import TracebackType
 from typing import Self
 
@@ -11,8 +30,10 @@ import httpx
 
 from hestai_mcp.modules.services.ai.config import (
     AITier,
+    TierConfig,
     TieredAIConfig,
     async_resolve_api_key,
+    clear_api_key_cache,
     load_config,
 )
 from hestai_mcp.modules.services.ai.providers.base import BaseProvider, CompletionRequest
@@ -21,12 +42,77 @@ from hestai_mcp.modules.services.ai.providers.openai_compat import OpenAICompatP
 # // Critical-Engineer: consulted for async/sync boundary integrity and resource management
 
 
+logger = logging.getLogger(__name__)
+
 # Provider base URLs
 PROVIDER_URLS = {
     "openai": "https://api.openai.com/v1",
     "openrouter": "https://openrouter.ai/api/v1",
 }
 
+# Connection pool sizing for HTTP clients
+POOL_MAX_CONNECTIONS = 20
+POOL_MAX_KEEPALIVE = 10
+POOL_KEEPALIVE_EXPIRY_SECONDS = 120.0
+
+# Recent successful call latencies per provider/model, for hedge thresholds
+LATENCY_WINDOW = 200
+_latency_samples: dict[str, deque[float]] = {}
+
+# Server-scoped pooled client (see start_shared_http_client)
+_shared_http_client: httpx.AsyncClient | None = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (httpx[http2])."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _build_http_client(config: TieredAIConfig) -> httpx.AsyncClient:
+    """Create a pooled AsyncClient with timeouts from config."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            connect=config.timeouts.connect_seconds,
+            read=config.timeouts.request_seconds,
+            write=config.timeouts.request_seconds,
+            pool=config.timeouts.connect_seconds,
+        ),
+        limits=httpx.Limits(
+            max_connections=POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=POOL_MAX_KEEPALIVE,
+            keepalive_expiry=POOL_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        http2=_http2_available(),
+    )
+
+
+async def start_shared_http_client(config: TieredAIConfig | None = None) -> httpx.AsyncClient:
+    """Create the server-scoped pooled HTTP client (idempotent).
+
+    While it is open, every ``async with AIClient()`` borrows it instead of
+    opening (and TLS-handshaking) a fresh connection pool. Call once at
+    server startup from the event loop that will use it.
+
+    Args:
+        config: Config for pool timeouts. If None, loads from disk.
+
+    Returns:
+        The shared AsyncClient
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = _build_http_client(config if config is not None else load_config())
+        logger.info(f"Started shared AI HTTP client (http2={_http2_available()})")
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the server-scoped pooled HTTP client, if any (call at shutdown)."""
+    global _shared_http_client
+    client, _shared_http_client = _shared_http_client, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
 
 class AIClient:
     """AI client with tiered model support.
@@ -52,20 +138,23 @@ class AIClient:
         """
         self.config = config if config is not None else load_config()
         self._async_client: httpx.AsyncClient | None = None
+        self._owns_client = False
 
     async def __aenter__(self) -> Self:
-        """Enter async context manager, creating shared AsyncClient.
+        """Enter async context manager, borrowing or creating an AsyncClient.
+
+        Borrows the server-scoped pooled client when one is running (warm
+        keep-alive connections); otherwise creates a private client.
 
         SS-I2: Connection pooling requires proper async lifecycle.
         """
-        self._async_client = httpx.AsyncClient(
-            timeout=httpx.Timeout(
-                connect=self.config.timeouts.connect_seconds,
-                read=self.config.timeouts.request_seconds,
-                write=self.config.timeouts.request_seconds,
-                pool=self.config.timeouts.connect_seconds,
-            )
-        )
+        shared = _shared_http_client
+        if shared is not None and not shared.is_closed:
+            self._async_client = shared
+            self._owns_client = False
+        else:
+            self._async_client = _build_http_client(self.config)
+            self._owns_client = True
         return self
 
     async def __aexit__(
@@ -74,10 +163,10 @@ class AIClient:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Exit async context manager, closing AsyncClient."""
-        if self._async_client:
+        """Exit async context manager, closing the AsyncClient if we created it."""
+        if self._async_client and self._owns_client:
             await self._async_client.aclose()
-            self._async_client = None
+        self._async_client = None
 
     def _get_provider(self, provider_name: str) -> BaseProvider:
         """Get provider instance for a given provider name.
@@ -136,6 +225,24 @@ class AIClient:
             httpx.HTTPError: If provider request fails
             KeyError: If tier is not configured
         """
+        text, _served_tier = await self.complete_text_with_tier(request, tier)
+        return text
+
+    async def complete_text_with_tier(
+        self, request: CompletionRequest, tier: AITier | None = None
+    ) -> tuple[str, AITier]:
+        """Like complete_text, but also report which tier produced the text.
+
+        With fallbacks or hedging configured, the answering tier may differ
+        from the requested one; callers that persist results (caches) use
+        this to tell a primary answer from a fallback one.
+
+        Returns:
+            Tuple of (completion text, tier that answered)
+
+        Raises:
+            Same as complete_text
+        """
         # Ensure we have an async client (must be used within context manager)
         if self._async_client is None:
             raise RuntimeError(
@@ -150,42 +257,266 @@ class AIClient:
         request: CompletionRequest,
         client: httpx.AsyncClient,
         tier: AITier | None = None,
-    ) -> str:
+    ) -> tuple[str, AITier]:
         """Internal implementation of complete_text with explicit client.
 
+        Walks the tier's fallback chain (config.fallbacks), retrying each tier
+        per config.retry; with config.hedging enabled, races the first
+        fallback against a slow primary.
+
         Args:
             request: CompletionRequest with prompts and parameters
             client: httpx.AsyncClient to use for requests
             tier: AI tier to use (uses config default if None)
 
         Returns:
-            Completion text from provider
+            Tuple of (completion text, tier that answered)
+        """
+        chain = self.config.get_fallback_chain(tier)
+        if self.config.hedging.enabled and len(chain) > 1:
+            return await self._complete_hedged(request, client, chain)
+        return await self._complete_chain(request, client, chain)
+
+    async def _complete_chain(
+        self, request: CompletionRequest, client: httpx.AsyncClient, chain: list[AITier]
+    ) -> tuple[str, AITier]:
+        """Try each tier in order, moving on only after retryable failures."""
+        last_error: Exception | None = None
+        for tier in chain:
+            try:
+                return await self._complete_tier_with_retry(request, client, tier), tier
+            except Exception as e:
+                if not self._is_retryable_error(e):
+                    raise
+                last_error = e
+                logger.warning(f"AI tier '{tier}' failed ({type(e).__name__}), trying fallback")
+        assert last_error is not None  # chain is never empty
+        raise last_error
+
+    async def _complete_hedged(
+        self, request: CompletionRequest, client: httpx.AsyncClient, chain: list[AITier]
+    ) -> tuple[str, AITier]:
+        """Race the rest of the chain against a primary slower than its p95."""
+        primary_tier, backups = chain[0], chain[1:]
+        delay = self._hedge_delay(self.config.get_tier_config(primary_tier))
+
+        primary = asyncio.create_task(self._complete_chain(request, client, [primary_tier]))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            error = primary.exception()
+            if error is None:
+                return primary.result()
+            if not isinstance(error, Exception) or not self._is_retryable_error(error):
+                raise error
+            return await self._complete_chain(request, client, backups)
+
+        logger.info(f"AI tier '{primary_tier}' slower than {delay:.2f}s, hedging to fallback")
+        hedge = asyncio.create_task(self._complete_chain(request, client, backups))
+        pending: set[asyncio.Task[tuple[str, AITier]]] = {primary, hedge}
+        errors: list[BaseException] = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    errors.append(error)
+            raise errors[0]
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _hedge_delay(self, tier_config: TierConfig) -> float:
+        """Hedge threshold: observed latency percentile, or the configured delay."""
+        hedging = self.config.hedging
+        samples = _latency_samples.get(f"{tier_config.provider}/{tier_config.model}")
+        if not samples or len(samples) < hedging.min_samples:
+            return hedging.delay_seconds
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(hedging.percentile * len(ordered)))
+        return ordered[index]
+
+    async def _complete_tier_with_retry(
+        self, request: CompletionRequest, client: httpx.AsyncClient, tier: AITier
+    ) -> str:
+        """Complete on one tier, retrying retryable errors with jittered backoff."""
+        retry = self.config.retry
+        for attempt in range(1, retry.max_attempts + 1):
+            try:
+                return await self._complete_tier(request, client, tier)
+            except Exception as e:
+                if attempt >= retry.max_attempts or not self._is_retryable_error(e):
+                    raise
+                await self._retry_backoff(tier, attempt, e)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _retry_backoff(self, tier: AITier, attempt: int, error: Exception) -> None:
+        """Sleep a jittered exponential backoff before retry attempt + 1."""
+        retry = self.config.retry
+        backoff = min(retry.backoff_max_seconds, retry.backoff_base_seconds * (1 << (attempt - 1)))
+        delay = random.uniform(0, backoff)
+        logger.info(
+            f"AI tier '{tier}' attempt {attempt} failed ({type(error).__name__}), "
+            f"retrying in {delay:.2f}s"
+        )
+        await asyncio.sleep(delay)
+
+    async def _complete_tier(
+        self, request: CompletionRequest, client: httpx.AsyncClient, tier: AITier
+    ) -> str:
+        """Single completion attempt against one tier's provider/model."""
+        tier_config, provider, api_key = await self._resolve_tier(tier)
+        # Override model in request with tier-specific model (timeout etc. carried over)
+        tier_request = request.model_copy(update={"model": tier_config.model})
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            result = await provider.complete_text(tier_request, api_key, client)
+        except httpx.HTTPStatusError as e:
+            _forget_rejected_key(tier_config, e)
+            raise
+        _record_latency(tier_config, loop.time() - started)
+        return result
+
+    async def _resolve_tier(self, tier: AITier) -> tuple[TierConfig, BaseProvider, str]:
+        """Tier configuration, provider and API key for one tier.
+
+        Raises:
+            ValueError: If no API key is available or the provider is unsupported
         """
-        # Get tier configuration
         tier_config = self.config.get_tier_config(tier)
 
-        # Resolve API key for this provider
         api_key = await async_resolve_api_key(tier_config.provider)
         if not api_key:
+            # The miss is cached; forget it so a key added later is found
+            clear_api_key_cache(tier_config.provider)
             raise ValueError(
                 f"No API key available for provider '{tier_config.provider}'. "
                 f"Set {tier_config.provider.upper()}_API_KEY environment variable "
                 "or configure in keyring."
             )
 
-        try:
-            provider = self._get_provider(tier_config.provider)
-            # Override model in request with tier-specific model
-            tier_request = CompletionRequest(
-                system_prompt=request.system_prompt,
-                user_prompt=request.user_prompt,
-                model=tier_config.model,
-                temperature=request.temperature,
-                max_tokens=request.max_tokens,
+        return tier_config, self._get_provider(tier_config.provider), api_key
+
+    async def complete_text_streaming(
+        self,
+        request: CompletionRequest,
+        tier: AITier | None = None,
+        first_token_timeout: float | None = None,
+        accept_partial: Callable[[str], bool] | None = None,
+    ) -> str:
+        """Execute text completion over a streaming response, with deadlines.
+
+        request.timeout_seconds bounds the whole completion; first_token_timeout
+        (if set) bounds the wait for the first chunk. Retryable failures before
+        any text arrives (including a missed first-token deadline) are retried
+        per config.retry and then move on through the tier's fallback chain,
+        like complete_text. Hedging (config.hedging) is not applied. Once text
+        is flowing, a failure or deadline returns the partial text if
+        accept_partial(text) is true, otherwise the error propagates.
+
+        Args:
+            request: CompletionRequest with prompts and parameters
+            tier: AI tier to use (uses config default if None)
+            first_token_timeout: Seconds to wait for the first chunk
+            accept_partial: Predicate deciding whether partial text is usable
+
+        Returns:
+            Completion text (complete, or partial but accepted)
+
+        Raises:
+            RuntimeError: If called outside async context manager
+            TimeoutError: If a deadline passes and no acceptable text arrived
+            httpx.HTTPError: If provider request fails
+        """
+        if self._async_client is None:
+            raise RuntimeError(
+                "AIClient.complete_text_streaming must be called within an 'async with' "
+                "block to ensure proper connection pooling."
+            )
+
+        last_error: Exception | None = None
+        for chain_tier in self.config.get_fallback_chain(tier):
+            for attempt in range(1, self.config.retry.max_attempts + 1):
+                chunks: list[str] = []
+                try:
+                    return await self._stream_tier(
+                        request, self._async_client, chain_tier, chunks, first_token_timeout
+                    )
+                except Exception as e:
+                    partial = "".join(chunks)
+                    if partial and accept_partial is not None and accept_partial(partial):
+                        logger.warning(
+                            f"AI tier '{chain_tier}' stream ended early ({type(e).__name__}), "
+                            f"accepting {len(partial)} chars of partial output"
+                        )
+                        return partial
+                    retryable = isinstance(e, TimeoutError) or self._is_retryable_error(e)
+                    if chunks or not retryable:
+                        raise
+                    last_error = e
+                    if attempt < self.config.retry.max_attempts:
+                        await self._retry_backoff(chain_tier, attempt, e)
+            logger.warning(
+                f"AI tier '{chain_tier}' stream failed ({type(last_error).__name__}), "
+                "trying fallback"
             )
-            return await provider.complete_text(tier_request, api_key, client)
+        assert last_error is not None  # chain is never empty
+        raise last_error
 
-        except Exception:
-            # For now, no fallback chain - just raise the error
-            # Future: could add fallback to other tiers on retryable errors
+    async def _stream_tier(
+        self,
+        request: CompletionRequest,
+        client: httpx.AsyncClient,
+        tier: AITier,
+        chunks: list[str],
+        first_token_timeout: float | None,
+    ) -> str:
+        """Stream one tier's completion into chunks, enforcing deadlines."""
+        tier_config, provider, api_key = await self._resolve_tier(tier)
+        tier_request = request.model_copy(update={"model": tier_config.model})
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + request.timeout_seconds
+        first_token_deadline = (
+            started + first_token_timeout if first_token_timeout is not None else deadline
+        )
+
+        stream = provider.stream_text(tier_request, api_key, client)
+        try:
+            while True:
+                remaining = (first_token_deadline if not chunks else deadline) - loop.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"AI tier '{tier}' stream deadline exceeded")
+                try:
+                    chunk = await asyncio.wait_for(anext(stream), timeout=remaining)
+                except StopAsyncIteration:
+                    break
+                chunks.append(chunk)
+        except httpx.HTTPStatusError as e:
+            _forget_rejected_key(tier_config, e)
             raise
+        finally:
+            await stream.aclose()
+
+        _record_latency(tier_config, loop.time() - started)
+        return "".join(chunks)
+
+
+def _forget_rejected_key(tier_config: TierConfig, error: httpx.HTTPStatusError) -> None:
+    """Drop the cached API key of a provider that rejected it (401/403)."""
+    if error.response.status_code in (401, 403):
+        logger.warning(
+            f"AI provider '{tier_config.provider}' rejected its API key "
+            f"({error.response.status_code}); clearing cached key"
+        )
+        clear_api_key_cache(tier_config.provider)
+
+
+def _record_latency(tier_config: TierConfig, seconds: float) -> None:
+    """Remember a successful call's latency for hedge thresholds."""
+    _latency_samples.setdefault(
+        f"{tier_config.provider}/{tier_config.model}", deque(maxlen=LATENCY_WINDOW)
+    ).append(seconds)
@@ -13,11 +13,16 @@ Configuration is loaded from:
 API keys are resolved from:
 1. Keyring (secure, production)
 2. Environment variables / .env file (development, CI)
+
+Keyring lookups made by async_resolve_api_key (hits and misses) are cached
+per provider for API_KEY_CACHE_TTL_SECONDS (see prewarm_api_keys /
+clear_api_key_cache).
 """
 
 import asyncio
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Literal
 
@@ -36,6 +41,10 @@ logger = logging.getLogger(__name__)
 # Keyring service name for storing API keys
 KEYRING_SERVICE = "hestai-mcp"
 
+# How long a keyring lookup result (key or "no key") is reused by
+# async_resolve_api_key; clear_api_key_cache() invalidates it early
+API_KEY_CACHE_TTL_SECONDS = 300.0
+
 # Available AI tiers
 AITier = Literal["synthesis", "analysis", "critical"]
 
@@ -49,6 +58,8 @@ class TierConfig(BaseModel):
     provider: str
     model: str
     description: str = ""
+    # Estimated token budget for packed prompt context (e.g. clock_in synthesis)
+    context_budget_tokens: int = Field(default=1000, ge=100)
 
 
 class TimeoutConfig(BaseModel):
@@ -58,6 +69,31 @@ class TimeoutConfig(BaseModel):
     request_seconds: int = 30
 
 
+class RetryConfig(BaseModel):
+    """Retry policy for retryable provider errors (timeouts, connect errors, 5xx).
+
+    max_attempts counts the first try; 1 disables retries.
+    """
+
+    max_attempts: int = Field(default=1, ge=1)
+    backoff_base_seconds: float = Field(default=0.5, ge=0)
+    backoff_max_seconds: float = Field(default=4.0, ge=0)
+
+
+class HedgingConfig(BaseModel):
+    """Hedged requests: race the first fallback tier against a slow primary.
+
+    The hedge fires once the primary has been outstanding longer than the
+    observed latency percentile (after min_samples calls), or delay_seconds
+    until enough samples exist. Requires a fallback chain for the tier.
+    """
+
+    enabled: bool = False
+    delay_seconds: float = Field(default=2.0, gt=0)
+    percentile: float = Field(default=0.95, gt=0, le=1)
+    min_samples: int = Field(default=20, ge=1)
+
+
 class TieredAIConfig(BaseModel):
     """AI configuration with tiered model support.
 
@@ -74,6 +110,9 @@ class TieredAIConfig(BaseModel):
     operations: dict[str, AITier] = Field(default_factory=dict)
     default_tier: AITier = DEFAULT_TIER
     timeouts: TimeoutConfig = Field(default_factory=TimeoutConfig)
+    fallbacks: dict[AITier, list[AITier]] = Field(default_factory=dict)
+    retry: RetryConfig = Field(default_factory=RetryConfig)
+    hedging: HedgingConfig = Field(default_factory=HedgingConfig)
 
     @model_validator(mode="after")
     def validate_tier_references(self) -> "TieredAIConfig":
@@ -82,6 +121,7 @@ class TieredAIConfig(BaseModel):
         Ensures:
         - default_tier exists in tiers (if tiers is non-empty)
         - All operation mappings reference existing tiers
+        - All fallback chains start from and lead to existing tiers
 
         This catches configuration errors at load time rather than runtime.
         """
@@ -103,6 +143,15 @@ class TieredAIConfig(BaseModel):
                     f"Available tiers: {tier_names}"
                 )
 
+        # Validate fallback chains reference existing tiers
+        for tier, chain in self.fallbacks.items():
+            for name in [tier, *chain]:
+                if name not in tier_names:
+                    raise ValueError(
+                        f"Fallback chain for '{tier}' references unknown tier '{name}'. "
+                        f"Available tiers: {tier_names}"
+                    )
+
         return self
 
     def get_operation_tier(self, operation: str) -> AITier:
@@ -118,6 +167,18 @@ class TieredAIConfig(BaseModel):
         """
         return self.operations.get(operation, self.default_tier)
 
+    def get_fallback_chain(self, tier: AITier | None = None) -> list[AITier]:
+        """Get the ordered tiers to try for a request: the tier, then its fallbacks.
+
+        Args:
+            tier: The requested tier. Uses default_tier if None.
+
+        Returns:
+            Tier names without duplicates, requested tier first.
+        """
+        requested: AITier = tier or self.default_tier
+        return list(dict.fromkeys([requested, *self.fallbacks.get(requested, [])]))
+
     def get_tier_config(self, tier: AITier | None = None) -> TierConfig:
         """Get configuration for a specific tier.
 
@@ -191,23 +252,49 @@ def _get_default_tiered_config() -> TieredAIConfig:
     )
 
 
+# Parsed YAML config snapshot: (path, mtime_ns, size, config)
+_yaml_config_cache: tuple[Path, int, int, TieredAIConfig] | None = None
+
+
+def clear_config_cache() -> None:
+    """Drop the cached YAML config snapshot (next load_config re-reads the file)."""
+    global _yaml_config_cache
+    _yaml_config_cache = None
+
+
 def load_config() -> TieredAIConfig:
     """Load tiered AI configuration from disk.
 
     Tries YAML config first, then returns defaults from environment/.env.
 
+    The parsed YAML is kept as a snapshot and only re-read when the file's
+    path, mtime or size changes, so per-call AIClient construction does not
+    re-parse YAML. Environment defaults are always rebuilt (cheap, and the
+    environment may change between calls).
+
     Returns:
-        TieredAIConfig instance
+        TieredAIConfig instance (a private copy - safe to mutate)
     """
+    global _yaml_config_cache
     yaml_path = get_yaml_config_path()
 
     # Try YAML config (preferred)
-    if yaml_path.exists():
+    try:
+        stat = yaml_path.stat()
+    except OSError:
+        stat = None
+
+    if stat is not None:
+        cached = _yaml_config_cache
+        if cached is not None and cached[:3] == (yaml_path, stat.st_mtime_ns, stat.st_size):
+            return cached[3].model_copy(deep=True)
         try:
             config_data = yaml.safe_load(yaml_path.read_text())
             if config_data:
+                config = TieredAIConfig(**config_data)
+                _yaml_config_cache = (yaml_path, stat.st_mtime_ns, stat.st_size, config)
                 logger.info(f"Loaded AI config from {yaml_path}")
-                return TieredAIConfig(**config_data)
+                return config.model_copy(deep=True)
         except (yaml.YAMLError, TypeError, ValidationError) as e:
             logger.warning(f"Invalid YAML in {yaml_path}: {e}, using defaults")
 
@@ -228,6 +315,7 @@ def save_config(config: TieredAIConfig) -> None:
     config_dict = config.model_dump()
     yaml_content = yaml.dump(config_dict, default_flow_style=False, sort_keys=False)
     yaml_path.write_text(yaml_content)
+    clear_config_cache()
     logger.info(f"Saved AI config to {yaml_path}")
 
 
@@ -260,10 +348,50 @@ def resolve_api_key(provider: str) -> str | None:
     return os.environ.get(env_var_name)
 
 
+# Keyring lookup results per provider: provider -> (monotonic expiry, key or None)
+_keyring_cache: dict[str, tuple[float, str | None]] = {}
+
+
+def clear_api_key_cache(provider: str | None = None) -> None:
+    """Forget cached keyring lookups (one provider, or all if None).
+
+    Call after changing a key in the keyring so the next request sees it.
+    AIClient calls it for a provider that rejects its key (401/403) or has
+    no key at all, so a key added to the keyring later is picked up.
+    """
+    if provider is None:
+        _keyring_cache.clear()
+    else:
+        _keyring_cache.pop(provider, None)
+
+
+async def _async_keyring_lookup(provider: str) -> str | None:
+    """Keyring lookup for provider, served from the TTL cache when fresh."""
+    cached = _keyring_cache.get(provider)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    # Keyring access is blocking I/O (D-Bus, file backends): run in a thread
+    keyring_key: str | None = None
+    try:
+        found = await asyncio.to_thread(keyring.get_password, KEYRING_SERVICE, f"{provider}-key")
+        if found:
+            keyring_key = str(found)
+    except keyring.errors.NoKeyringError:
+        pass
+
+    # Misses are cached too: env-var users and keyring-less hosts skip the
+    # thread hop on every completion
+    _keyring_cache[provider] = (time.monotonic() + API_KEY_CACHE_TTL_SECONDS, keyring_key)
+    return keyring_key
+
+
 async def async_resolve_api_key(provider: str) -> str | None:
     """Resolve API key asynchronously to avoid blocking event loop.
 
-    Wraps keyring access in a separate thread.
+    Same resolution order as resolve_api_key. The keyring lookup runs in a
+    separate thread and its result (including "no key") is cached for
+    API_KEY_CACHE_TTL_SECONDS; the environment fallback is read every call.
 
     Args:
         provider: Provider name.
@@ -271,16 +399,36 @@ async def async_resolve_api_key(provider: str) -> str | None:
     Returns:
         API key string if found, None otherwise
     """
-    # Try keyring in a separate thread (blocking I/O)
-    try:
-        keyring_key = await asyncio.to_thread(
-            keyring.get_password, KEYRING_SERVICE, f"{provider}-key"
-        )
-        if keyring_key:
-            return str(keyring_key)
-    except keyring.errors.NoKeyringError:
-        pass
+    keyring_key = await _async_keyring_lookup(provider)
+    if keyring_key:
+        return keyring_key
 
     # Fall back to environment variable (non-blocking)
     env_var_name = f"{provider.upper()}_API_KEY"
     return os.environ.get(env_var_name)
+
+
+async def prewarm_api_keys(config: TieredAIConfig | None = None) -> dict[str, bool]:
+    """Resolve API keys for every provider referenced by the configured tiers.
+
+    Fills the keyring cache up front (call at server start) so the first
+    completion does not pay for the keyring round trip. Never raises.
+
+    Args:
+        config: Config whose tier providers are warmed. If None, loads from disk.
+
+    Returns:
+        Mapping of provider name to whether a key was found
+    """
+    try:
+        if config is None:
+            config = load_config()
+        providers = sorted({tier.provider for tier in config.tiers.values()})
+        keys = await asyncio.gather(*(async_resolve_api_key(p) for p in providers))
+    except Exception as e:
+        logger.warning(f"API key prewarm failed (non-blocking): {e}")
+        return {}
+
+    found = {provider: bool(key) for provider, key in zip(providers, keys, strict=True)}
+    logger.info(f"Prewarmed API keys: {found}")
+    return found
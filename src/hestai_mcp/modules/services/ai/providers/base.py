@@ -4,6 +4,7 @@ SS-I2 Compliance: All provider calls must be async.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
@@ -40,6 +41,9 @@ class BaseProvider(ABC):
     - list_models: Return available models for this provider (async)
     - test_connection: Verify API key and connectivity (async)
     - complete_text: Execute a text completion request (async)
+
+    Providers that support server-sent events should also override
+    stream_text; the default yields the whole completion as one chunk.
     """
 
     @abstractmethod
@@ -84,3 +88,23 @@ class BaseProvider(ABC):
             Various exceptions for connection errors, auth failures, etc.
         """
         pass
+
+    async def stream_text(
+        self, request: CompletionRequest, api_key: str, client: "httpx.AsyncClient"
+    ) -> AsyncGenerator[str, None]:
+        """Execute a text completion request, yielding text as it arrives.
+
+        SS-I2: Async-first - accepts shared AsyncClient for connection pooling.
+
+        Args:
+            request: CompletionRequest with prompt and parameters
+            api_key: API key for authentication
+            client: Shared httpx.AsyncClient for connection pooling
+
+        Yields:
+            Completion text chunks in order
+
+        Raises:
+            Various exceptions for connection errors, auth failures, etc.
+        """
+        yield await self.complete_text(request, api_key, client)
@@ -3,6 +3,9 @@
 SS-I2 Compliance: All provider calls are async.
 """
 
+import json
+from collections.abc import AsyncGenerator
+
 import httpx
 
 from hestai_mcp.modules.services.ai.providers.base import BaseProvider, CompletionRequest, ModelInfo
@@ -32,6 +35,9 @@ class OpenAICompatProvider(BaseProvider):
         "max_tokens": 4096,
         "temperature": 0.7
     }
+
+    stream_text sends the same payload with "stream": true and reads the
+    server-sent events ("data: {...}" lines, terminated by "data: [DONE]").
     """
 
     def __init__(self, provider_name: str, base_url: str) -> None:
@@ -159,15 +165,7 @@ class OpenAICompatProvider(BaseProvider):
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
             },
-            json={
-                "model": request.model,
-                "messages": [
-                    {"role": "system", "content": request.system_prompt},
-                    {"role": "user", "content": request.user_prompt},
-                ],
-                "max_tokens": request.max_tokens,
-                "temperature": request.temperature,
-            },
+            json=self._completion_payload(request),
             timeout=request.timeout_seconds,
         )
 
@@ -175,3 +173,60 @@ class OpenAICompatProvider(BaseProvider):
         data = response.json()
         content: str = data["choices"][0]["message"]["content"]
         return content
+
+    async def stream_text(
+        self, request: CompletionRequest, api_key: str, client: httpx.AsyncClient
+    ) -> AsyncGenerator[str, None]:
+        """Execute text completion as a server-sent event stream.
+
+        SS-I2: Async-first - uses shared AsyncClient for connection pooling.
+
+        Args:
+            request: CompletionRequest with prompts and parameters
+            api_key: API key for authentication
+            client: Shared httpx.AsyncClient for connection pooling
+
+        Yields:
+            Non-empty content deltas in arrival order
+
+        Raises:
+            httpx.HTTPError: On network or HTTP errors
+            ValueError: If an event is not valid JSON
+        """
+        async with client.stream(
+            "POST",
+            f"{self.base_url}/chat/completions",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+                "Accept": "text/event-stream",
+            },
+            json={**self._completion_payload(request), "stream": True},
+            timeout=request.timeout_seconds,
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    # Blank separators, ": keep-alive" comments, event:/id: fields
+                    continue
+                data = line[len("data:") :].strip()
+                if data == "[DONE]":
+                    break
+                event = json.loads(data)
+                for choice in event.get("choices", []):
+                    delta = (choice.get("delta") or {}).get("content")
+                    if delta:
+                        yield delta
+
+    @staticmethod
+    def _completion_payload(request: CompletionRequest) -> dict[str, object]:
+        """Chat completions request body for request."""
+        return {
+            "model": request.model,
+            "messages": [
+                {"role": "system", "content": request.system_prompt},
+                {"role": "user", "content": request.user_prompt},
+            ],
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+        }
@@ -13,6 +13,8 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from hestai_mcp.core.governance.state.north_star import find_north_star_file, load_north_star
+
 
 def _validate_role(role: str | None) -> bool:
     """
@@ -259,6 +261,14 @@ def execute_bind(
         tier=tier,
     )
 
+    # North Star immutables for T3 TENSION (parsed model is cached per file mtime)
+    north_star_immutables: list[str] = []
+    north_star_path = find_north_star_file(working_dir_path)
+    if north_star_path:
+        north_star = load_north_star(north_star_path)
+        if north_star is not None:
+            north_star_immutables = north_star.immutable_refs()
+
     # Minimal dashboard response + command steps
     response = {
         "success": True,
@@ -274,6 +284,7 @@ def execute_bind(
         "working_dir": working_dir_str,
         "todos": todos,
         "command_steps": command_steps,
+        "north_star_immutables": north_star_immutables,
     }
 
     return response
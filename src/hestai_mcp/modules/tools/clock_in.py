@@ -15,6 +15,7 @@ Key Integration Points:
 Note: Uses direct .hestai/ directory (ADR-0007), no symlinks or worktrees.
 """
 
+import asyncio
 import json
 import logging
 import re
@@ -24,13 +25,26 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from hestai_mcp.core.governance.state.north_star import find_north_star_file, load_north_star
+
 logger = logging.getLogger(__name__)
 
 
-# Maximum characters to include from each context file
-MAX_CONTEXT_FILE_CHARS = 2000
-# Maximum total context characters to send to AI
+# Maximum total context characters to send to AI (default budget)
 MAX_TOTAL_CONTEXT_CHARS = 4000
+# Default token budget for the synthesis context (~4 chars per token);
+# overridden per tier by TierConfig.context_budget_tokens
+DEFAULT_CONTEXT_BUDGET_TOKENS = MAX_TOTAL_CONTEXT_CHARS // 4
+
+# Packing priority of context sections (higher survives a tight budget)
+CONTEXT_SECTION_PRIORITIES = {
+    "I4 FRESHNESS WARNING": 100,
+    "ACTIVE BLOCKERS": 90,
+    "ARCHITECTURAL CONSTRAINTS": 80,
+    "PROJECT-CONTEXT.oct.md": 70,
+    "GIT STATE": 60,
+    "CHECKLIST": 50,
+}
 
 
 # Issue pattern regex: matches #XX, issue-XX, issues-XX
@@ -279,55 +293,11 @@ def _find_north_star_file(working_dir: Path) -> Path | None:
     Per naming-standard.oct.md, North Star files follow pattern:
     000-{PROJECT}-NORTH-STAR(-SUMMARY)?(.oct)?.md
 
-    This supports:
-    - 000-PROJECT-NORTH-STAR.oct.md (generic)
-    - 000-MCP-PRODUCT-NORTH-STAR.oct.md (project-specific)
-    - 000-MCP-PRODUCT-NORTH-STAR.md (without .oct)
-
     Returns the first matching file, preferring .oct.md over .md.
     Falls back to legacy .hestai/workflow/ path for backwards compatibility.
+    Directory listings are cached per directory mtime (see north_star module).
     """
-    # Try north-star/ first, fall back to legacy workflow/ if no matching files found
-    for dir_name in ("north-star", "workflow"):
-        north_star_dir = working_dir / ".hestai" / dir_name
-        if not north_star_dir.exists():
-            continue
-
-        # Priority order: .oct.md first, then .md
-        # Exclude -SUMMARY files (those are compressed versions)
-        candidates = _find_north_star_candidates(north_star_dir)
-        if candidates:
-            break
-    else:
-        return None
-
-    if not candidates:
-        return None
-
-    # Sort: .oct.md before .md, then alphabetical
-    def sort_key(p: Path) -> tuple[int, str]:
-        return (0 if p.name.endswith(".oct.md") else 1, p.name)
-
-    candidates.sort(key=sort_key)
-    return candidates[0]
-
-
-def _find_north_star_candidates(north_star_dir: Path) -> list[Path]:
-    """Find North Star candidate files in the given directory."""
-    try:
-        candidates = []
-        for path in north_star_dir.iterdir():
-            name = path.name
-            if (
-                name.startswith("000-")
-                and "NORTH-STAR" in name
-                and "-SUMMARY" not in name
-                and name.endswith(".md")
-            ):
-                candidates.append(path)
-        return candidates
-    except OSError:
-        return []
+    return find_north_star_file(working_dir)
 
 
 def build_rich_context_summary(
@@ -335,6 +305,7 @@ def build_rich_context_summary(
     context_paths: list[str],
     role: str,
     focus: str,
+    budget_tokens: int = DEFAULT_CONTEXT_BUDGET_TOKENS,
 ) -> str:
     """
     Build a rich context summary for AI synthesis by reading actual file contents.
@@ -342,36 +313,56 @@ def build_rich_context_summary(
     This is the key to useful AI synthesis - the AI can only work with what we give it.
     We read PROJECT-CONTEXT.oct.md and git state to provide real project information.
 
+    Sections are packed by priority into budget_tokens (see context_packer):
+    I4 freshness, active blockers and North Star constraints are kept ahead of
+    PROJECT-CONTEXT, git state and the carried-over checklist, which are cut
+    at a line boundary or dropped when the budget runs out.
+
     Args:
         working_dir: Project root directory
         context_paths: List of context file paths to read
         role: Agent role for context
         focus: Session focus for context
+        budget_tokens: Estimated token budget for the whole summary
 
     Returns:
         Rich context string with actual project information
     """
-    sections = []
+    from hestai_mcp.modules.tools.shared.context_packer import ContextSection, pack_sections
+
+    state_context_dir = working_dir / ".hestai" / "state" / "context"
+    sections: list[ContextSection] = []
+
+    def add(title: str, content: str) -> None:
+        sections.append(
+            ContextSection(
+                title=title,
+                content=content,
+                priority=CONTEXT_SECTION_PRIORITIES[title],
+                order=len(sections),
+            )
+        )
 
-    # 1. Read PROJECT-CONTEXT.oct.md (most important)
-    project_context_path = working_dir / ".hestai" / "state" / "context" / "PROJECT-CONTEXT.oct.md"
+    # 1. Check I4 freshness and add warning if stale
+    project_context_path = state_context_dir / "PROJECT-CONTEXT.oct.md"
+    freshness_warning = _check_context_freshness(project_context_path, working_dir)
+    if freshness_warning:
+        add("I4 FRESHNESS WARNING", freshness_warning)
+
+    # 2. Read PROJECT-CONTEXT.oct.md (most detailed project description)
     if project_context_path.exists():
         try:
-            content = project_context_path.read_text()
-            # Truncate if too long
-            if len(content) > MAX_CONTEXT_FILE_CHARS:
-                content = content[:MAX_CONTEXT_FILE_CHARS] + "\n... [truncated]"
-            sections.append(f"=== PROJECT-CONTEXT.oct.md ===\n{content}")
+            add("PROJECT-CONTEXT.oct.md", project_context_path.read_text())
         except OSError as e:
             logger.warning(f"Could not read PROJECT-CONTEXT: {e}")
 
-    # 2. Get git state (branch, recent commits, modified files)
+    # 3. Get git state (branch, recent commits, modified files)
     git_state = _get_git_state(working_dir)
     if git_state:
-        sections.append(f"=== GIT STATE ===\n{git_state}")
+        add("GIT STATE", git_state)
 
-    # 3. Check for blockers in state/ (if exists)
-    blockers_path = working_dir / ".hestai" / "state" / "context" / "state" / "blockers.oct.md"
+    # 4. Check for blockers in state/ (if exists)
+    blockers_path = state_context_dir / "state" / "blockers.oct.md"
     if blockers_path.exists():
         try:
             content = blockers_path.read_text()
@@ -379,32 +370,40 @@ def build_rich_context_summary(
                 # Only include if there are actual blockers
                 active_section = content.split("ACTIVE:")[1].split("===")[0].strip()
                 if active_section:
-                    sections.append(f"=== ACTIVE BLOCKERS ===\n{active_section}")
+                    add("ACTIVE BLOCKERS", active_section)
         except OSError:
             pass
 
-    # 4. Check I4 freshness and add warning if stale
-    freshness_warning = _check_context_freshness(project_context_path, working_dir)
-    if freshness_warning:
-        sections.insert(0, f"=== I4 FRESHNESS WARNING ===\n{freshness_warning}")
-
     # 5. Extract North Star constraints for architectural awareness (Issue #87)
     # Use flexible finder to support multiple naming patterns
     north_star_path = _find_north_star_file(working_dir)
     if north_star_path:
         constraints = _extract_north_star_constraints(north_star_path)
         if constraints:
-            sections.append(f"=== ARCHITECTURAL CONSTRAINTS ===\n{constraints}")
+            add("ARCHITECTURAL CONSTRAINTS", constraints)
 
-    # 6. Build summary with role and focus context
-    header = f"SESSION CONTEXT for {role}\nFOCUS: {focus}\n"
+    # 6. Carried-over checklist items from the previous session (FAST layer)
+    checklist_path = state_context_dir / "state" / "checklist.oct.md"
+    if checklist_path.exists():
+        try:
+            checklist = checklist_path.read_text()
+            if "ITEMS:" in checklist:
+                items = checklist.split("ITEMS:", 1)[1].split("===END===")[0].strip()
+                if items:
+                    add("CHECKLIST", items)
+        except OSError:
+            pass
 
-    # Combine sections, respecting max total size
-    combined = header + "\n\n".join(sections)
-    if len(combined) > MAX_TOTAL_CONTEXT_CHARS:
-        combined = combined[:MAX_TOTAL_CONTEXT_CHARS] + "\n... [context truncated]"
+    # 7. Build summary with role and focus context
+    header = f"SESSION CONTEXT for {role}\nFOCUS: {focus}\n"
 
-    return combined
+    packed = pack_sections(header, sections, budget_tokens)
+    if packed.truncated or packed.dropped:
+        logger.debug(
+            f"Context packed into {budget_tokens} tokens: "
+            f"truncated={packed.truncated}, dropped={packed.dropped}"
+        )
+    return packed.text
 
 
 def _get_git_state(working_dir: Path) -> str | None:
@@ -529,58 +528,19 @@ def _extract_north_star_constraints(north_star_path: Path) -> str | None:
     Per Issue #87: Agents need architectural context to avoid "system blindness".
     This helps the AI understand what the project IS and IS_NOT.
 
+    The parsed North Star is cached per file mtime, so repeated clock_ins do
+    not re-read or re-scan an unchanged document.
+
     Args:
         north_star_path: Path to North Star file
 
     Returns:
         Extracted constraints string, or None if not available
     """
-    if not north_star_path.exists():
-        return None
-
-    try:
-        content = north_star_path.read_text()
-
-        # Extract relevant sections
-        extracted_parts = []
-
-        # Look for SCOPE_BOUNDARIES section
-        if "SCOPE_BOUNDARIES" in content:
-            # Find the section and extract it
-            start_idx = content.find("SCOPE_BOUNDARIES")
-            if start_idx != -1:
-                # Find the end (next section or file end)
-                section_content = content[start_idx:]
-                # Take up to next major section or 500 chars
-                end_markers = ["IMMUTABLES", "ASSUMPTIONS", "CONSTRAINED_VARIABLES", "===END"]
-                end_idx = len(section_content)
-                for marker in end_markers:
-                    if marker in section_content[20:]:  # Skip past "SCOPE_BOUNDARIES" itself
-                        pos = section_content.find(marker, 20)
-                        if pos < end_idx:
-                            end_idx = pos
-                extracted_parts.append(section_content[: min(end_idx, 500)])
-
-        # Look for key IMMUTABLES mentions
-        if "IMMUTABLES" in content or "I3::" in content or "I4::" in content:
-            # Extract just the immutable references (compact)
-            immutable_refs = []
-            for line in content.split("\n"):
-                if "I1::" in line or "I2::" in line or "I3::" in line or "I4::" in line:
-                    immutable_refs.append(line.strip())
-                    if len(immutable_refs) >= 4:  # Limit to first 4
-                        break
-            if immutable_refs:
-                extracted_parts.append("KEY IMMUTABLES:\n" + "\n".join(immutable_refs))
-
-        if extracted_parts:
-            return "\n\n".join(extracted_parts)
-
-        return None
-
-    except OSError as e:
-        logger.debug(f"Could not extract North Star constraints: {e}")
+    north_star = load_north_star(north_star_path)
+    if north_star is None:
         return None
+    return north_star.constraints_summary()
 
 
 def ensure_hestai_structure(working_dir: Path) -> str:
@@ -683,46 +643,17 @@ def clock_in(
     focus_resolved = resolve_focus(explicit_focus=focus, branch=branch)
     resolved_focus_value = focus_resolved["value"]
 
-    # Get active sessions directory
-    active_dir = working_dir_path / ".hestai" / "state" / "sessions" / "active"
-
     # Generate session ID
     session_id = str(uuid.uuid4())
 
-    # Check for focus conflicts BEFORE creating session
-    focus_conflict = detect_focus_conflict(resolved_focus_value, active_dir, session_id)
-
-    # Create session directory
-    session_dir = active_dir / session_id
-    session_dir.mkdir(parents=True, exist_ok=True)
-
-    # Determine transcript path (will be populated by Claude Code)
-    # Format matches Claude's project directory structure
-    transcript_path = f"~/.claude/projects/{working_dir_path.name}/*.jsonl"
-
-    # Create session metadata
-    session_data = {
-        "session_id": session_id,
-        "role": role,
-        "working_dir": str(working_dir_path),
-        "focus": resolved_focus_value,
-        "focus_source": focus_resolved["source"],
-        "model": model,
-        "started_at": datetime.now(UTC).isoformat(),
-        "transcript_path": transcript_path,
-    }
-
-    # Write session.json
-    session_file = session_dir / "session.json"
-    session_file.write_text(json.dumps(session_data, indent=2))
-
-    logger.info(
-        f"Created session {session_id} for role {role} with focus {resolved_focus_value} "
-        f"(source: {focus_resolved['source']})"
+    # Check for focus conflicts, then create session directory and session.json
+    focus_conflict = _write_session_record(
+        working_dir_path, session_id, role, focus_resolved, model
     )
 
     # Update FAST layer (ADR-0046, ADR-0056)
     from hestai_mcp.modules.tools.shared.fast_layer import update_fast_layer_on_clock_in
+    from hestai_mcp.modules.tools.shared.fast_state import write_if_changed
 
     update_fast_layer_on_clock_in(working_dir_path, session_id, role, resolved_focus_value)
 
@@ -742,41 +673,16 @@ def clock_in(
             / "OPERATIONAL-WORKFLOW.oct.md"
         )
 
-        # Instantiate ContextSteward and synthesize constraints
+        # Synthesize constraints (compiled workflow and rendering are cached per file hash)
         steward = ContextSteward(workflow_path=workflow_path)
-        constraints = steward.synthesize_active_state(phase)
+        octave_content = steward.render_active_state(phase)
 
         # Write constraints to FAST layer
         state_dir = working_dir_path / ".hestai" / "state" / "context" / "state"
         state_dir.mkdir(parents=True, exist_ok=True)
 
         constraints_path = state_dir / "constraints.oct.md"
-        constraints_data = constraints.to_dict()
-
-        # Format as OCTAVE document
-        octave_content = f"""===PHASE_CONSTRAINTS===
-META:
-  TYPE::PHASE_CONSTRAINTS
-  PHASE::{constraints_data['phase']}
-  VELOCITY::SESSION
-
-PURPOSE::{constraints_data['purpose']}
-
-RACI::{constraints_data['raci']}
-
-DELIVERABLES::{constraints_data['deliverables']}
-
-ENTRY_CRITERIA::{constraints_data.get('entry_criteria', [])}
-
-EXIT_CRITERIA::{constraints_data.get('exit_criteria', [])}
-
-QUALITY_GATES::{constraints_data.get('quality_gates', [])}
-
-SUBPHASES::{constraints_data.get('subphases', {})}
-
-===END===
-"""
-        constraints_path.write_text(octave_content)
+        write_if_changed(constraints_path, octave_content)
         logger.info(f"Injected {phase} phase constraints to {constraints_path}")
 
     except Exception as e:
@@ -803,6 +709,141 @@ SUBPHASES::{constraints_data.get('subphases', {})}
     }
 
 
+def _write_session_record(
+    working_dir_path: Path,
+    session_id: str,
+    role: str,
+    focus_resolved: dict[str, str],
+    model: str | None,
+) -> dict[str, Any] | None:
+    """
+    Check for focus conflicts, then create the session directory and session.json.
+
+    Returns:
+        Conflict info dict if another active session has the same focus, else None
+    """
+    resolved_focus_value = focus_resolved["value"]
+    active_dir = working_dir_path / ".hestai" / "state" / "sessions" / "active"
+
+    # Check for focus conflicts BEFORE creating session
+    focus_conflict = detect_focus_conflict(resolved_focus_value, active_dir, session_id)
+
+    # Create session directory
+    session_dir = active_dir / session_id
+    session_dir.mkdir(parents=True, exist_ok=True)
+
+    # Determine transcript path (will be populated by Claude Code)
+    # Format matches Claude's project directory structure
+    transcript_path = f"~/.claude/projects/{working_dir_path.name}/*.jsonl"
+
+    # Create session metadata
+    session_data = {
+        "session_id": session_id,
+        "role": role,
+        "working_dir": str(working_dir_path),
+        "focus": resolved_focus_value,
+        "focus_source": focus_resolved["source"],
+        "model": model,
+        "started_at": datetime.now(UTC).isoformat(),
+        "transcript_path": transcript_path,
+    }
+
+    # Write session.json
+    session_file = session_dir / "session.json"
+    session_file.write_text(json.dumps(session_data, indent=2))
+
+    logger.info(
+        f"Created session {session_id} for role {role} with focus {resolved_focus_value} "
+        f"(source: {focus_resolved['source']})"
+    )
+    return focus_conflict
+
+
+def _fallback_synthesis(role: str, focus: str) -> dict[str, str]:
+    """OCTAVE fallback matching CLOCK_IN_SYNTHESIS_PROTOCOL in protocols.py (SS-I6)."""
+    # Per CRS issue #140: Fallback must emit same structured format as AI synthesis
+    synthesis = f"""CONTEXT_FILES::[@.hestai/state/context/PROJECT-CONTEXT.oct.md, @.hestai/north-star/000-MCP-PRODUCT-NORTH-STAR.md]
+FOCUS::{focus}
+PHASE::UNKNOWN
+BLOCKERS::[]
+TASKS::[Review context for {role}, Complete {focus} objectives]
+FRESHNESS_WARNING::AI_SYNTHESIS_UNAVAILABLE"""
+    return {"synthesis": synthesis, "source": "fallback"}
+
+
+def _synthesis_context_budget() -> int:
+    """Context token budget of the tier configured for clock_in synthesis."""
+    try:
+        from hestai_mcp.modules.services.ai.config import load_config
+
+        config = load_config()
+        tier_config = config.get_tier_config(config.get_operation_tier("clock_in_synthesis"))
+        return tier_config.context_budget_tokens
+    except Exception as e:
+        logger.debug(f"Using default context budget: {e}")
+        return DEFAULT_CONTEXT_BUDGET_TOKENS
+
+
+def _gather_synthesis_context(
+    working_dir_path: Path, role: str, focus: str, enable_ai_synthesis: bool
+) -> tuple[list[str], str | None]:
+    """
+    Resolve context paths and (if AI synthesis is enabled) build the rich summary.
+
+    Returns:
+        (context_paths, context_summary); summary is None when disabled or failed
+    """
+    context_paths = resolve_context_paths(working_dir_path)
+    if not enable_ai_synthesis:
+        return context_paths, None
+    try:
+        # Build RICH context summary with actual file contents and git state
+        # This is key to useful AI synthesis - the AI can only work with what we give it
+        summary = build_rich_context_summary(
+            working_dir=working_dir_path,
+            context_paths=context_paths,
+            role=role,
+            focus=focus,
+            budget_tokens=_synthesis_context_budget(),
+        )
+    except Exception as e:
+        logger.warning(f"Could not build context summary for AI synthesis: {e}")
+        return context_paths, None
+    return context_paths, summary
+
+
+def _recall_learnings(working_dir_path: Path, role: str, focus: str) -> list[dict[str, Any]]:
+    """Prior learnings/decisions relevant to this role and focus (empty on failure)."""
+    from hestai_mcp.modules.tools.shared.semantic_recall import recall_relevant
+
+    try:
+        return recall_relevant(working_dir_path, role, focus)
+    except Exception as e:
+        logger.warning(f"Semantic recall failed (non-blocking): {e}")
+        return []
+
+
+async def _run_ai_synthesis(
+    session_id: str, role: str, focus: str, context_summary: str, working_dir_path: Path
+) -> dict[str, str]:
+    """Run AI synthesis, returning the OCTAVE fallback on any failure (SS-I6)."""
+    from hestai_mcp.modules.tools.shared.fast_layer import synthesize_fast_layer_with_ai
+
+    try:
+        result = await synthesize_fast_layer_with_ai(
+            session_id=session_id,
+            role=role,
+            focus=focus,
+            context_summary=context_summary,
+            working_dir=working_dir_path,
+        )
+    except Exception as e:
+        logger.warning(f"AI synthesis failed for session {session_id}: {e}")
+        return _fallback_synthesis(role, focus)
+    logger.info(f"AI synthesis completed for session {session_id}")
+    return result
+
+
 async def clock_in_async(
     role: str,
     working_dir: str,
@@ -814,9 +855,20 @@ async def clock_in_async(
     Async version of clock_in with optional AI synthesis.
 
     This version can call AI synthesis for FAST layer content.
-    SS-I2 compliant: Fully async for MCP tool integration.
+    SS-I2 compliant: Fully async for MCP tool integration; blocking filesystem
+    and git work runs in threads.
     SS-I6 compliant: Graceful fallback if AI fails.
 
+    Runs as a dependency graph rather than a strict sequence:
+    1. Structure check || branch lookup
+    2. Focus resolution
+    3. FAST layer writes, then context paths + summary (the summary reads
+       current-focus/checklist/blockers and must see this session's state)
+    4. LLM synthesis || session record (conflict scan, session.json)
+       || semantic recall of archived learnings (started at step 3)
+    The LLM call starts as soon as the summary is ready, and the session
+    record and recall overlap it instead of adding to it.
+
     Args:
         role: Agent role name (e.g., 'implementation-lead')
         working_dir: Project working directory path
@@ -832,6 +884,8 @@ async def clock_in_async(
             - structure_status: 'present' | 'created'
             - focus_resolved: Dict with 'value' and 'source' keys
             - ai_synthesis: Dict with 'synthesis' and 'source' keys (if enabled)
+            - relevant_learnings: Archived learnings/decisions most relevant to
+              role and focus (only when any match)
 
     Raises:
         ValueError: If validation fails (path traversal, invalid role)
@@ -841,104 +895,70 @@ async def clock_in_async(
     role = validate_role_format(role)
     working_dir_path = validate_working_dir(working_dir)
 
-    # Ensure .hestai/ directory structure exists
-    structure_status = ensure_hestai_structure(working_dir_path)
-
-    # Get current branch for focus resolution
-    from hestai_mcp.modules.tools.shared.fast_layer import get_current_branch
+    from hestai_mcp.modules.tools.shared.fast_layer import (
+        get_current_branch,
+        update_fast_layer_on_clock_in,
+    )
 
-    branch = get_current_branch(working_dir=working_dir_path)
+    # Ensure .hestai/ directory structure exists while git resolves the branch
+    structure_status, branch = await asyncio.gather(
+        asyncio.to_thread(ensure_hestai_structure, working_dir_path),
+        asyncio.to_thread(get_current_branch, working_dir=working_dir_path),
+    )
 
     # Resolve focus with priority chain: explicit > github_issue > branch > default
     focus_resolved = resolve_focus(explicit_focus=focus, branch=branch)
     resolved_focus_value = focus_resolved["value"]
 
-    # Get active sessions directory
-    active_dir = working_dir_path / ".hestai" / "state" / "sessions" / "active"
-
     # Generate session ID
     session_id = str(uuid.uuid4())
 
-    # Check for focus conflicts BEFORE creating session
-    focus_conflict = detect_focus_conflict(resolved_focus_value, active_dir, session_id)
-
-    # Create session directory
-    session_dir = active_dir / session_id
-    session_dir.mkdir(parents=True, exist_ok=True)
-
-    # Determine transcript path (will be populated by Claude Code)
-    transcript_path = f"~/.claude/projects/{working_dir_path.name}/*.jsonl"
-
-    # Create session metadata
-    session_data = {
-        "session_id": session_id,
-        "role": role,
-        "working_dir": str(working_dir_path),
-        "focus": resolved_focus_value,
-        "focus_source": focus_resolved["source"],
-        "model": model,
-        "started_at": datetime.now(UTC).isoformat(),
-        "transcript_path": transcript_path,
-    }
-
-    # Write session.json
-    session_file = session_dir / "session.json"
-    session_file.write_text(json.dumps(session_data, indent=2))
-
-    logger.info(
-        f"Created session {session_id} for role {role} with focus {resolved_focus_value} "
-        f"(source: {focus_resolved['source']})"
+    # Session record and recall touch files the synthesis does not read
+    record_task = asyncio.create_task(
+        asyncio.to_thread(
+            _write_session_record, working_dir_path, session_id, role, focus_resolved, model
+        )
     )
-
-    # Update FAST layer (sync version for now)
-    from hestai_mcp.modules.tools.shared.fast_layer import (
-        synthesize_fast_layer_with_ai,
-        update_fast_layer_on_clock_in,
+    recall_task = asyncio.create_task(
+        asyncio.to_thread(_recall_learnings, working_dir_path, role, resolved_focus_value)
     )
+    ai_task: asyncio.Task[dict[str, str]] | None = None
 
-    update_fast_layer_on_clock_in(working_dir_path, session_id, role, resolved_focus_value)
+    try:
+        # FAST writes come first: the summary must reflect this session's focus
+        await asyncio.to_thread(
+            update_fast_layer_on_clock_in, working_dir_path, session_id, role, resolved_focus_value
+        )
+        context_paths, context_summary = await asyncio.to_thread(
+            _gather_synthesis_context,
+            working_dir_path,
+            role,
+            resolved_focus_value,
+            enable_ai_synthesis,
+        )
 
-    # Attempt AI synthesis if enabled
-    ai_synthesis_result = None
-    if enable_ai_synthesis:
-        try:
-            # Build RICH context summary with actual file contents and git state
-            # This is key to useful AI synthesis - the AI can only work with what we give it
-            context_paths = resolve_context_paths(working_dir_path)
-            context_summary = build_rich_context_summary(
-                working_dir=working_dir_path,
-                context_paths=context_paths,
-                role=role,
-                focus=resolved_focus_value,
+        # Start the LLM call now; session record and recall overlap with it
+        if context_summary is not None:
+            ai_task = asyncio.create_task(
+                _run_ai_synthesis(
+                    session_id, role, resolved_focus_value, context_summary, working_dir_path
+                )
             )
 
-            ai_synthesis_result = await synthesize_fast_layer_with_ai(
-                session_id=session_id,
-                role=role,
-                focus=resolved_focus_value,
-                context_summary=context_summary,
-            )
-            logger.info(f"AI synthesis completed for session {session_id}")
-        except Exception as e:
-            # SS-I6 Fallback: Use OCTAVE format matching AI output contract
-            # Per CRS issue #140: Fallback must emit same structured format as AI synthesis
-            logger.warning(f"AI synthesis failed for session {session_id}: {e}")
-
-            # OCTAVE format matching CLOCK_IN_SYNTHESIS_PROTOCOL in protocols.py
-            fallback_synthesis = f"""CONTEXT_FILES::[@.hestai/state/context/PROJECT-CONTEXT.oct.md, @.hestai/north-star/000-MCP-PRODUCT-NORTH-STAR.md]
-FOCUS::{resolved_focus_value}
-PHASE::UNKNOWN
-BLOCKERS::[]
-TASKS::[Review context for {role}, Complete {resolved_focus_value} objectives]
-FRESHNESS_WARNING::AI_SYNTHESIS_UNAVAILABLE"""
-
-            ai_synthesis_result = {
-                "synthesis": fallback_synthesis,
-                "source": "fallback",
-            }
-
-    # Resolve context paths (OCTAVE files from .hestai/context/)
-    context_paths = resolve_context_paths(working_dir_path)
+        focus_conflict = await record_task
+        relevant_learnings = await recall_task
+
+        ai_synthesis_result = None
+        if ai_task is not None:
+            ai_synthesis_result = await ai_task
+        elif enable_ai_synthesis:
+            ai_synthesis_result = _fallback_synthesis(role, resolved_focus_value)
+    except BaseException:
+        pending = [task for task in (record_task, recall_task, ai_task) if task is not None]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        raise
 
     # Build response
     response: dict[str, Any] = {
@@ -951,5 +971,7 @@ FRESHNESS_WARNING::AI_SYNTHESIS_UNAVAILABLE"""
 
     if ai_synthesis_result:
         response["ai_synthesis"] = ai_synthesis_result
+    if relevant_learnings:
+        response["relevant_learnings"] = relevant_learnings
 
     return response
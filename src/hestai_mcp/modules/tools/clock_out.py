@@ -18,8 +18,10 @@ Key Integration Points:
 - Learnings index for searchable session wisdom
 """
 
+import asyncio
 import json
 import logging
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
@@ -57,10 +59,151 @@ def validate_session_id(session_id: str) -> str:
     return session_id.strip()
 
 
+async def _compress_redacted_archive(redacted_jsonl_path: Path) -> Path:
+    """
+    Replace the plain redacted JSONL with a framed gzip archive + sidecar index.
+
+    Graceful degradation: on any failure the plain JSONL is kept and returned.
+
+    Args:
+        redacted_jsonl_path: Plain redacted JSONL archive
+
+    Returns:
+        Path of the archive that now holds the transcript
+    """
+    from hestai_mcp.events.jsonl_archive import write_jsonl_archive
+
+    compressed_path = redacted_jsonl_path.with_name(redacted_jsonl_path.name + ".gz")
+    try:
+        await asyncio.to_thread(write_jsonl_archive, redacted_jsonl_path, compressed_path)
+    except Exception as e:
+        logger.warning(f"Archive compression failed, keeping plain JSONL (non-blocking): {e}")
+        return redacted_jsonl_path
+
+    redacted_jsonl_path.unlink()
+    logger.info(f"Compressed redacted JSONL to {compressed_path}")
+    return compressed_path
+
+
+async def compress_and_index_session(
+    redacted_jsonl_path: Path,
+    session_data: dict[str, Any],
+    description: str,
+    project_root: Path,
+    octave_path: Path,
+) -> dict[str, Any]:
+    """
+    Run OCTAVE compression, claim verification and learnings indexing.
+
+    Graceful degradation: never raises. Shared by inline clock_out and the
+    deferred compression job worker.
+
+    Args:
+        redacted_jsonl_path: Redacted transcript archive (plain or gzip)
+        session_data: Session metadata from session.json
+        description: Optional session summary (used in compression)
+        project_root: Project root directory
+        octave_path: Destination for the OCTAVE compression
+
+    Returns:
+        dict with compression_status ("success" | "failed"), plus octave_path
+        once written and compression_stats when the transcript was distilled
+    """
+    archive_dir = octave_path.parent
+    hestai_dir = project_root / ".hestai"
+
+    # Feature 2: OCTAVE Compression (graceful degradation)
+    # SS-I2: Properly await async function - no asyncio.run() anti-pattern
+    compression_status = "failed"
+    compression_stats: dict[str, Any] = {}
+    saved_octave_path: Path | None = None
+
+    try:
+        from hestai_mcp.modules.tools.shared.compression import compress_session_transcript
+
+        # Await async compression function (SS-I2 compliance)
+        compression = await compress_session_transcript(
+            transcript_path=redacted_jsonl_path,
+            session_data=session_data,
+            description=description,
+            cache_dir=hestai_dir / "state" / "cache" / "compression",
+        )
+        octave_content = compression.content
+        compression_stats = compression.stats
+
+        if octave_content:
+            # Save OCTAVE compression
+            octave_path.write_text(octave_content)
+            saved_octave_path = octave_path
+            logger.info(f"Saved OCTAVE compression to {octave_path}")
+            compression_status = "success"
+
+            # Feature 4: Verify context claims before extraction
+            from hestai_mcp.modules.tools.shared.verification import verify_context_claims
+
+            verification_result = verify_context_claims(octave_content, project_root)
+
+            if verification_result["passed"]:
+                # Feature 3: Extract context for PROJECT-CONTEXT update
+                from hestai_mcp.modules.tools.shared.context_extraction import (
+                    extract_context_from_octave,
+                )
+
+                context_content = extract_context_from_octave(octave_content)
+                if context_content:
+                    logger.info("Extracted context from OCTAVE (ready for context_update)")
+                    # Note: Actual PROJECT-CONTEXT update happens via separate context_update tool
+
+                # Feature 5: Append to learnings index
+                from hestai_mcp.modules.tools.shared.learnings_index import (
+                    append_to_learnings_index,
+                    extract_learnings_keys,
+                )
+
+                learnings_keys = extract_learnings_keys(octave_content)
+                append_to_learnings_index(session_data, learnings_keys, archive_dir)
+
+                # Semantic recall vectors for future clock_ins
+                from hestai_mcp.modules.tools.shared.semantic_recall import update_recall_index
+
+                await asyncio.to_thread(update_recall_index, archive_dir)
+
+                # Optional FTS5 knowledge store (HESTAI_KNOWLEDGE_STORE=1)
+                from hestai_mcp.modules.tools.shared.knowledge_store import (
+                    index_session,
+                    knowledge_store_enabled,
+                )
+
+                if knowledge_store_enabled():
+                    await asyncio.to_thread(
+                        index_session, archive_dir, session_data, octave_content, octave_path
+                    )
+
+            else:
+                logger.warning(f"Context verification failed: {verification_result['issues']}")
+
+        else:
+            compression_status = "failed"
+            logger.warning("OCTAVE compression returned None (graceful degradation)")
+
+    except Exception as e:
+        # Non-blocking: Log warning but continue with raw JSONL archive
+        compression_status = "failed"
+        logger.warning(f"OCTAVE compression failed (non-blocking): {e}")
+
+    result: dict[str, Any] = {"compression_status": compression_status}
+    if saved_octave_path:
+        result["octave_path"] = str(saved_octave_path)
+    if compression_stats:
+        result["compression_stats"] = compression_stats
+    return result
+
+
 async def clock_out(
     session_id: str,
     description: str,
     project_root: Path,
+    defer_compression: bool | None = None,
 ) -> dict[str, Any]:
     """
     Extract and archive session transcript with OCTAVE compression.
@@ -75,6 +218,8 @@ async def clock_out(
         session_id: Session ID from clock_in
         description: Optional session summary (used in compression)
         project_root: Project root directory
+        defer_compression: Queue compression/verification/learnings as a durable
+            job instead of awaiting the LLM. None reads HESTAI_DEFER_COMPRESSION.
 
     Returns:
         dict with:
@@ -84,7 +229,10 @@ async def clock_out(
             - octave_path: Path to OCTAVE compression (if successful)
             - message_count: Number of messages parsed
             - session_id: Session ID
-            - compression_status: "success" | "failed" | "skipped"
+            - compression_status: "success" | "failed" | "skipped" | "deferred"
+            - compression_job_id: Job to poll via compression_job_status (deferred only)
+            - compression_stats: Distillation token counts, reduction_ratio and
+              compression cache hits/misses (when the transcript could be distilled)
 
     Raises:
         FileNotFoundError: If session or transcript not found
@@ -145,7 +293,8 @@ async def clock_out(
     from hestai_mcp.modules.tools.shared.security import RedactionEngine
 
     try:
-        RedactionEngine.copy_and_redact(jsonl_path, redacted_jsonl_path)
+        # SS-I2: Redaction is CPU-bound on large transcripts - keep it off the event loop
+        await asyncio.to_thread(RedactionEngine.copy_and_redact, jsonl_path, redacted_jsonl_path)
         logger.info(f"Preserved redacted JSONL to {redacted_jsonl_path}")
     except Exception as e:
         # BLOCKING: Fail-closed enforcement
@@ -153,66 +302,23 @@ async def clock_out(
         logger.error(f"SECURITY: Redaction failed, blocking archive: {e}")
         raise RuntimeError(f"Archive blocked: redaction failed - {str(e)}") from e
 
-    # Feature 2: OCTAVE Compression (graceful degradation)
-    # SS-I2: Properly await async function - no asyncio.run() anti-pattern
-    octave_path = None
-    compression_status = "skipped"
-
-    try:
-        from hestai_mcp.modules.tools.shared.compression import compress_to_octave
-
-        # Await async compression function (SS-I2 compliance)
-        octave_content = await compress_to_octave(
-            transcript_path=redacted_jsonl_path,
+    # Features 2-5: OCTAVE compression, verification, learnings index.
+    # Deferred mode hands these to the durable job queue once the archive is final.
+    if defer_compression is None:
+        defer_env = os.environ.get("HESTAI_DEFER_COMPRESSION", "")
+        defer_compression = defer_env.strip().lower() in ("1", "true", "yes")
+
+    octave_path = archive_dir / f"{timestamp}-{safe_focus}-{session_id}.oct.md"
+    compression: dict[str, Any] = {"compression_status": "deferred"}
+    if not defer_compression:
+        compression = await compress_and_index_session(
+            redacted_jsonl_path=redacted_jsonl_path,
             session_data=session_data,
             description=description,
+            project_root=project_root,
+            octave_path=octave_path,
         )
 
-        if octave_content:
-            # Save OCTAVE compression
-            octave_filename = f"{timestamp}-{safe_focus}-{session_id}.oct.md"
-            octave_path = archive_dir / octave_filename
-            octave_path.write_text(octave_content)
-            logger.info(f"Saved OCTAVE compression to {octave_path}")
-            compression_status = "success"
-
-            # Feature 4: Verify context claims before extraction
-            from hestai_mcp.modules.tools.shared.verification import verify_context_claims
-
-            verification_result = verify_context_claims(octave_content, project_root)
-
-            if verification_result["passed"]:
-                # Feature 3: Extract context for PROJECT-CONTEXT update
-                from hestai_mcp.modules.tools.shared.context_extraction import (
-                    extract_context_from_octave,
-                )
-
-                context_content = extract_context_from_octave(octave_content)
-                if context_content:
-                    logger.info("Extracted context from OCTAVE (ready for context_update)")
-                    # Note: Actual PROJECT-CONTEXT update happens via separate context_update tool
-
-                # Feature 5: Append to learnings index
-                from hestai_mcp.modules.tools.shared.learnings_index import (
-                    append_to_learnings_index,
-                    extract_learnings_keys,
-                )
-
-                learnings_keys = extract_learnings_keys(octave_content)
-                append_to_learnings_index(session_data, learnings_keys, archive_dir)
-
-            else:
-                logger.warning(f"Context verification failed: {verification_result['issues']}")
-
-        else:
-            compression_status = "failed"
-            logger.warning("OCTAVE compression returned None (graceful degradation)")
-
-    except Exception as e:
-        # Non-blocking: Log warning but continue with raw JSONL archive
-        compression_status = "failed"
-        logger.warning(f"OCTAVE compression failed (non-blocking): {e}")
-
     # Update FAST layer (ADR-0046, ADR-0056) -- graceful degradation
     try:
         from hestai_mcp.modules.tools.shared.fast_layer import update_fast_layer_on_clock_out
@@ -221,6 +327,11 @@ async def clock_out(
     except Exception as e:
         logger.warning(f"FAST layer update failed (non-blocking): {e}")
 
+    # Optional compressed archive format (HESTAI_ARCHIVE_COMPRESSION=gzip).
+    # Runs after compression so the steps above read the plain JSONL.
+    if os.environ.get("HESTAI_ARCHIVE_COMPRESSION", "").strip().lower() == "gzip":
+        redacted_jsonl_path = await _compress_redacted_archive(redacted_jsonl_path)
+
     # Verify archive integrity before deleting session
     if not redacted_jsonl_path.exists() or redacted_jsonl_path.stat().st_size == 0:
         raise RuntimeError(
@@ -228,6 +339,18 @@ async def clock_out(
             "Session directory preserved for manual recovery."
         )
 
+    if defer_compression:
+        from hestai_mcp.modules.tools.shared.compression_jobs import enqueue_compression_job
+
+        job = enqueue_compression_job(
+            project_root=project_root,
+            redacted_jsonl_path=redacted_jsonl_path,
+            session_data=session_data,
+            description=description,
+            octave_path=octave_path,
+        )
+        compression["compression_job_id"] = job["job_id"]
+
     # Remove active session directory
     shutil.rmtree(session_dir)
     logger.info(f"Removed active session directory: {session_dir}")
@@ -239,12 +362,9 @@ async def clock_out(
         "redacted_jsonl_path": str(redacted_jsonl_path),
         "message_count": message_count,
         "session_id": session_id,
-        "compression_status": compression_status,
+        **compression,
     }
 
-    if octave_path:
-        response["octave_path"] = str(octave_path)
-
     # Record session duration
     started_at = session_data.get("started_at")
     if started_at:
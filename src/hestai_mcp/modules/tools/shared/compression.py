@@ -9,17 +9,63 @@ Integration with clock_out workflow:
 1. clock_out() calls compress_to_octave() after redaction
 2. Returns OCTAVE content or None (graceful degradation)
 3. Content saved as {timestamp}-{focus}-{session_id}.oct.md
+
+The transcript is first distilled (see distillation.py) so the model sees
+conversation text and tool summaries rather than raw JSONL. Distilled
+transcripts larger than the model context are compressed map-reduce style:
+token-budgeted windows are compressed concurrently (bounded parallelism, one
+shared AIClient), then a reduce pass merges the partial DECISIONS/BLOCKERS/
+LEARNINGS into the final OCTAVE document.
+
+When a cache directory is supplied, every completion is cached by content
+hash (see compression_cache.py), so a retried clock_out replays finished
+calls - including completed map windows - instead of paying for them again.
 """
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from hestai_mcp.modules.services.ai.client import AIClient
 from hestai_mcp.modules.services.ai.providers.base import CompletionRequest
+from hestai_mcp.modules.tools.shared.compression_cache import CompressionCache
+from hestai_mcp.modules.tools.shared.distillation import (
+    CHARS_PER_TOKEN,
+    DistilledTranscript,
+    distill_transcript,
+    estimate_tokens,
+)
 
 logger = logging.getLogger(__name__)
 
+# Transcripts estimated above this size are compressed map-reduce style
+SINGLE_PASS_TOKEN_LIMIT = 60_000
+
+# Token budget for each map window (leaves headroom for the system prompt)
+MAP_WINDOW_TOKENS = 20_000
+
+# Maximum number of window compressions in flight at once
+MAP_CONCURRENCY = 4
+
+REDUCE_PROTOCOL = """===SESSION_COMPRESSION_REDUCE===
+ROLE::SYSTEM_STEWARD
+TASK::PARTIAL_COMPRESSIONS→SINGLE_OCTAVE_COMPRESSION
+PURPOSE::"Merge per-window SESSION_COMPRESSION documents of one session into one"
+
+MERGE_RULES::
+1. Partials are in chronological order; later windows supersede earlier ones
+2. DECISIONS::deduplicate, keep BECAUSE chains, renumber DECISION_1..N
+3. BLOCKERS::one entry per blocker, status from the latest window that mentions it
+4. LEARNINGS::deduplicate, keep transfer_guidance
+5. OUTCOMES+NEXT_ACTIONS::keep only those still valid at session end
+6. Emit exactly one document in the OUTPUT_FORMAT below
+
+===END_SESSION_COMPRESSION_REDUCE===
+"""
+
 
 def load_compression_prompt() -> str:
     """
@@ -83,8 +129,19 @@ CONSTRAINTS::
     return prompt_template
 
 
+@dataclass
+class CompressionResult:
+    """Outcome of a session compression: OCTAVE content plus run statistics."""
+
+    content: str | None
+    stats: dict[str, Any] = field(default_factory=dict)
+
+
 async def compress_to_octave(
-    transcript_path: Path, session_data: dict[str, Any], description: str = ""
+    transcript_path: Path,
+    session_data: dict[str, Any],
+    description: str = "",
+    cache_dir: Path | None = None,
 ) -> str | None:
     """
     Compress session transcript to OCTAVE format using AI.
@@ -96,6 +153,7 @@ async def compress_to_octave(
         transcript_path: Path to raw JSONL transcript
         session_data: Session metadata (session_id, role, duration, etc.)
         description: Optional user-provided summary from clockout
+        cache_dir: Optional persistent completion cache directory
 
     Returns:
         OCTAVE formatted content string, or None on failure
@@ -107,13 +165,42 @@ async def compress_to_octave(
         - User can manually compress later if needed
         - Prevents AI failures from blocking session archival
     """
+    result = await compress_session_transcript(
+        transcript_path, session_data, description, cache_dir=cache_dir
+    )
+    return result.content
+
+
+async def compress_session_transcript(
+    transcript_path: Path,
+    session_data: dict[str, Any],
+    description: str = "",
+    cache_dir: Path | None = None,
+) -> CompressionResult:
+    """
+    Compress session transcript to OCTAVE and report run statistics.
+
+    Same contract as compress_to_octave (never raises; content is None on
+    failure), plus stats describing the run: estimated source and distilled
+    tokens, reduction_ratio, the strategy used and, when cache_dir is given,
+    cache_hits/cache_misses/cache_hit_rate.
+
+    Args:
+        transcript_path: Path to raw JSONL transcript
+        session_data: Session metadata (session_id, role, duration, etc.)
+        description: Optional user-provided summary from clockout
+        cache_dir: Optional persistent completion cache directory
+
+    Returns:
+        CompressionResult (stats is empty if distillation itself failed)
+    """
+    result = CompressionResult(content=None)
+    cache = CompressionCache(cache_dir) if cache_dir is not None else None
     try:
         # Load transcript content
         if not transcript_path.exists():
             logger.error(f"Transcript not found: {transcript_path}")
-            return None
-
-        transcript_content = transcript_path.read_text()
+            return result
 
         # Load compression prompt
         prompt_template = load_compression_prompt()
@@ -128,7 +215,92 @@ async def compress_to_octave(
         system_prompt = system_prompt.replace("{{role}}", role)
         system_prompt = system_prompt.replace("{{duration}}", duration)
 
-        user_prompt = f"""Session Transcript:
+        # Distillation is file I/O: keep it off the event loop (SS-I2)
+        distilled = await asyncio.to_thread(distill_transcript, transcript_path)
+        result.stats = distilled.stats()
+        logger.info(
+            f"Distilled transcript for session {session_id}: "
+            f"~{distilled.source_tokens} -> ~{distilled.distilled_tokens} tokens "
+            f"({distilled.reduction_ratio:.0%} reduction)"
+        )
+
+        if not distilled.lines:
+            logger.warning(f"Transcript has no compressible events: {transcript_path}")
+            return result
+
+        map_reduce = distilled.distilled_tokens > SINGLE_PASS_TOKEN_LIMIT
+        result.stats["strategy"] = "map_reduce" if map_reduce else "single_pass"
+
+        # Create AI client and make request (SS-I2: async-first)
+        async with AIClient() as client:
+            tier_config = client.config.get_tier_config()
+            model = f"{tier_config.provider}/{tier_config.model}"
+
+            async def complete(request: CompletionRequest) -> str:
+                return await _complete_cached(client, request, cache, model)
+
+            if map_reduce:
+                logger.info(
+                    f"Distilled transcript for session {session_id} exceeds "
+                    f"{SINGLE_PASS_TOKEN_LIMIT} tokens, using map-reduce compression"
+                )
+                octave_content = await _compress_map_reduce(
+                    distilled, system_prompt, description, complete
+                )
+            else:
+                user_prompt = _build_user_prompt(distilled.text, description)
+                request = CompletionRequest(system_prompt=system_prompt, user_prompt=user_prompt)
+
+                # Get compression result (await async method)
+                octave_content = await complete(request)
+
+        logger.info(f"Successfully compressed session {session_id} to OCTAVE")
+        result.content = octave_content
+
+    except Exception as e:
+        # Graceful degradation - log error but don't raise
+        logger.warning(f"OCTAVE compression failed (graceful degradation): {e}")
+        result.content = None
+
+    if cache is not None and result.stats:
+        result.stats.update(cache.stats())
+    return result
+
+
+async def _complete_cached(
+    client: AIClient,
+    request: CompletionRequest,
+    cache: CompressionCache | None,
+    model: str,
+) -> str:
+    """Complete request through client, replaying/storing results via cache.
+
+    The key names the primary tier's model. A result served by a fallback
+    tier is returned but not stored, so a degraded compression is never
+    replayed as if the primary model had produced it.
+    """
+    if cache is None:
+        return await client.complete_text(request)
+
+    key = CompressionCache.key_for(request, model)
+    cached = await asyncio.to_thread(cache.get, key)
+    if cached is not None:
+        return cached
+
+    content, served_tier = await client.complete_text_with_tier(request)
+    served_config = client.config.get_tier_config(served_tier)
+    served_model = f"{served_config.provider}/{served_config.model}"
+    if served_model != model:
+        logger.info(f"Compression served by fallback {served_model}, not caching")
+        return content
+    await asyncio.to_thread(cache.put, key, content)
+    return content
+
+
+def _build_user_prompt(transcript_content: str, description: str, window: str = "") -> str:
+    """Build the compression user prompt for a transcript or transcript window."""
+    heading = f"Session Transcript ({window}):" if window else "Session Transcript:"
+    return f"""{heading}
 {transcript_content}
 
 Clockout Summary (if provided by user):
@@ -139,17 +311,140 @@ Extract DECISIONS, BLOCKERS, LEARNINGS, OUTCOMES, and NEXT_ACTIONS.
 Use OCTAVE operators throughout.
 """
 
-        # Create AI client and make request (SS-I2: async-first)
-        async with AIClient() as client:
-            request = CompletionRequest(system_prompt=system_prompt, user_prompt=user_prompt)
 
-            # Get compression result (await async method)
-            octave_content = await client.complete_text(request)
+def split_into_windows(lines: Iterable[str], window_tokens: int) -> list[str]:
+    """
+    Greedily pack rendered event lines into windows of at most window_tokens.
 
-        logger.info(f"Successfully compressed session {session_id} to OCTAVE")
-        return octave_content
+    A single line larger than the budget is truncated to fit its own window
+    rather than being dropped.
 
-    except Exception as e:
-        # Graceful degradation - log error but don't raise
-        logger.warning(f"OCTAVE compression failed (graceful degradation): {e}")
-        return None
+    Args:
+        lines: Rendered transcript lines in chronological order
+        window_tokens: Token budget per window
+
+    Returns:
+        List of window texts in chronological order
+    """
+    max_chars = window_tokens * CHARS_PER_TOKEN
+    windows: list[str] = []
+    current: list[str] = []
+    current_chars = 0
+
+    for line in lines:
+        if len(line) > max_chars:
+            line = line[: max_chars - len(" ... [truncated]")] + " ... [truncated]"
+        if current and current_chars + len(line) + 1 > max_chars:
+            windows.append("\n".join(current))
+            current = []
+            current_chars = 0
+        current.append(line)
+        current_chars += len(line) + 1
+
+    if current:
+        windows.append("\n".join(current))
+    return windows
+
+
+async def _compress_map_reduce(
+    distilled: DistilledTranscript,
+    system_prompt: str,
+    description: str,
+    complete_text: Callable[[CompletionRequest], Awaitable[str]],
+) -> str:
+    """
+    Compress an oversized transcript with a map pass per window plus a reduce pass.
+
+    Map: each token-budgeted window is compressed independently, at most
+    MAP_CONCURRENCY at a time, through the caller's completion function (one
+    shared AIClient, so one connection pool for the whole run).
+    Reduce: partial documents are merged - hierarchically if they do not fit
+    one request - into a single OCTAVE compression.
+
+    Raises:
+        Exception: Propagated to compress_session_transcript for graceful degradation
+    """
+    windows = split_into_windows(distilled.lines, MAP_WINDOW_TOKENS)
+
+    semaphore = asyncio.Semaphore(MAP_CONCURRENCY)
+
+    async def complete(request: CompletionRequest) -> str:
+        async with semaphore:
+            return await complete_text(request)
+
+    total = len(windows)
+    partials = await asyncio.gather(
+        *(
+            complete(
+                CompletionRequest(
+                    system_prompt=system_prompt,
+                    user_prompt=_build_user_prompt(
+                        window, description, window=f"window {i} of {total}"
+                    ),
+                )
+            )
+            for i, window in enumerate(windows, start=1)
+        )
+    )
+    logger.info(f"Map phase compressed {total} transcript windows")
+
+    reduce_system_prompt = f"{REDUCE_PROTOCOL}\n{system_prompt}"
+    while True:
+        groups = _group_partials(list(partials), SINGLE_PASS_TOKEN_LIMIT)
+        reduced = await asyncio.gather(
+            *(
+                complete(
+                    CompletionRequest(
+                        system_prompt=reduce_system_prompt,
+                        user_prompt=_build_reduce_prompt(group, description),
+                    )
+                )
+                for group in groups
+            )
+        )
+        if len(reduced) == 1:
+            return reduced[0]
+        partials = reduced
+
+
+def _group_partials(partials: list[str], group_tokens: int) -> list[list[str]]:
+    """Group consecutive partials so each reduce request stays within budget.
+
+    Every group holds at least two partials (when available) so that each
+    reduce round strictly shrinks the number of documents.
+    """
+    groups: list[list[str]] = []
+    current: list[str] = []
+    current_tokens = 0
+    for partial in partials:
+        tokens = estimate_tokens(partial)
+        if len(current) >= 2 and current_tokens + tokens > group_tokens:
+            groups.append(current)
+            current = []
+            current_tokens = 0
+        current.append(partial)
+        current_tokens += tokens
+    if current:
+        if len(current) == 1 and groups:
+            groups[-1].append(current[0])
+        else:
+            groups.append(current)
+    return groups
+
+
+def _build_reduce_prompt(partials: list[str], description: str) -> str:
+    """Build the reduce-pass user prompt from chronologically ordered partials."""
+    sections = "\n\n".join(
+        f"--- PARTIAL {i} of {len(partials)} ---\n{partial}"
+        for i, partial in enumerate(partials, start=1)
+    )
+    return f"""Partial Session Compressions (chronological):
+{sections}
+
+Clockout Summary (if provided by user):
+{description if description else "None provided"}
+
+Merge these partial compressions according to MERGE_RULES into one document.
+Extract DECISIONS, BLOCKERS, LEARNINGS, OUTCOMES, and NEXT_ACTIONS.
+Use OCTAVE operators throughout.
+"""
@@ -0,0 +1,132 @@
+"""
+Compression Cache - Persistent content-addressed cache for compression calls.
+
+A clock_out retried after a later-stage failure (or a transcript compressed
+twice) would otherwise pay for the same LLM calls again. Each completion is
+cached under a key derived from everything that determines its output:
+system prompt (template + session context), user prompt (distilled transcript
+or window), provider/model, and temperature.
+
+Design:
+- One file per entry: <cache_dir>/<sha256>.txt (written atomically)
+- LRU by file mtime: hits touch the entry, eviction removes the oldest
+  entries once the directory exceeds max_bytes
+- Failures never propagate: an unreadable cache is a miss, an unwritable
+  cache is skipped (compression itself must not fail because of caching)
+- Synchronous API; async callers wrap calls in asyncio.to_thread (SS-I2)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from hestai_mcp.modules.services.ai.providers.base import CompletionRequest
+
+logger = logging.getLogger(__name__)
+
+# Default cache size bound before LRU eviction
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Bump when the key derivation or entry format changes
+CACHE_FORMAT_VERSION = 1
+
+ENTRY_SUFFIX = ".txt"
+
+
+class CompressionCache:
+    """Persistent LRU cache of completion results keyed by request content."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Initialize the cache (directory is created lazily on first write).
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_bytes: Total entry size above which oldest entries are evicted
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(request: CompletionRequest, model: str) -> str:
+        """Derive the cache key for a request sent to model."""
+        payload = json.dumps(
+            {
+                "version": CACHE_FORMAT_VERSION,
+                "system_prompt": request.system_prompt,
+                "user_prompt": request.user_prompt,
+                "model": model,
+                "temperature": request.temperature,
+                "max_tokens": request.max_tokens,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> str | None:
+        """Return the cached content for key, or None (counted as hit/miss)."""
+        path = self._entry_path(key)
+        try:
+            content = path.read_text(encoding="utf-8")
+            # Touch for LRU ordering
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        """Store content under key, then evict least recently used entries."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=f".{key}.", suffix=".tmp", dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(content)
+                os.replace(tmp, self._entry_path(key))
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+            self._evict()
+        except OSError as e:
+            logger.warning(f"Compression cache write failed (non-blocking): {e}")
+
+    def _evict(self) -> None:
+        """Remove oldest entries until total size is within max_bytes."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.debug(f"Evicted compression cache entry {path.name}")
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for this cache instance."""
+        lookups = self.hits + self.misses
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
@@ -0,0 +1,471 @@
+"""
+Compression Jobs - Durable queue for deferred clock_out compression.
+
+clock_out's primary artifact (the redacted JSONL archive) is safe on disk
+before the LLM round trip starts. In deferred mode clock_out returns at that
+point and the remaining stages - OCTAVE compression, claim verification and
+learnings indexing - run as a durable job processed by a worker inside the
+MCP server.
+
+Directory model:
+- .hestai/state/jobs/{job_id}.json   job record (status, attempts, payload, result)
+- .hestai/state/jobs/{job_id}.lock   claim held by the process running the job
+
+Job lifecycle:
+    queued -> running -> succeeded
+                      -> queued (retry after backoff) -> ... -> failed
+
+Design:
+- Job records are written atomically (temp file + fsync + rename), so a
+  crash never leaves a half-written record
+- Claims use O_CREAT|O_EXCL lock files: several server processes may share
+  a project, only one runs a given job. A running job touches its lock every
+  LEASE_RENEW_SECONDS; locks not touched for LEASE_SECONDS are treated as
+  abandoned (crashed worker) and reclaimed. Reclaims are serialized by an
+  fcntl.flock on jobs/.reclaim.lock and re-check the lease under it, so two
+  workers never both take over the same stale claim
+- Retries use capped exponential backoff with jitter
+- The worker is an asyncio task (SS-I2); job record writes (fsync + rename)
+  run in asyncio.to_thread so they never block the loop
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+import uuid
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+JOB_KIND = "session_compression"
+
+# Attempts before a job is marked failed
+MAX_ATTEMPTS = 4
+
+# Backoff before retry N is BACKOFF_BASE_SECONDS * 2**(N-1), capped, with jitter
+BACKOFF_BASE_SECONDS = 30.0
+BACKOFF_MAX_SECONDS = 15 * 60.0
+
+# A claim not renewed for this long is considered abandoned by a crashed worker
+LEASE_SECONDS = 15 * 60.0
+
+# How often a running job renews its claim (well inside LEASE_SECONDS)
+LEASE_RENEW_SECONDS = LEASE_SECONDS / 3
+
+# Upper bound on how long an idle worker sleeps before rescanning
+WORKER_POLL_SECONDS = 60.0
+
+TERMINAL_STATUSES = frozenset({"succeeded", "failed"})
+
+
+def jobs_dir(project_root: Path) -> Path:
+    return project_root / ".hestai" / "state" / "jobs"
+
+
+def _job_path(project_root: Path, job_id: str) -> Path:
+    if not job_id or "/" in job_id or "\\" in job_id or ".." in job_id:
+        raise ValueError(f"Invalid job_id: {job_id!r}")
+    return jobs_dir(project_root) / f"{job_id}.json"
+
+
+def _lock_path(job_path: Path) -> Path:
+    return job_path.with_suffix(".lock")
+
+
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+
+def _save_job(job_path: Path, job: dict[str, Any]) -> None:
+    """Atomically write a job record."""
+    job_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{job_path.name}.", suffix=".tmp", dir=job_path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(job, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, job_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def load_job(job_path: Path) -> dict[str, Any]:
+    """Load a job record.
+
+    Raises:
+        FileNotFoundError: If the job does not exist
+        ValueError: If the record is not valid JSON
+    """
+    result: dict[str, Any] = json.loads(job_path.read_text(encoding="utf-8"))
+    return result
+
+
+def enqueue_compression_job(
+    *,
+    project_root: Path,
+    redacted_jsonl_path: Path,
+    session_data: dict[str, Any],
+    description: str,
+    octave_path: Path,
+) -> dict[str, Any]:
+    """Create a queued compression job for an archived session.
+
+    Args:
+        project_root: Project root directory
+        redacted_jsonl_path: Final redacted transcript archive (plain or gzip)
+        session_data: Session metadata from session.json
+        description: Optional session summary (used in compression)
+        octave_path: Destination for the OCTAVE compression
+
+    Returns:
+        The job record as written
+    """
+    now = _now().isoformat()
+    job_id = f"compress-{uuid.uuid4()}"
+    job: dict[str, Any] = {
+        "job_id": job_id,
+        "kind": JOB_KIND,
+        "status": "queued",
+        "session_id": session_data.get("session_id"),
+        "attempts": 0,
+        "max_attempts": MAX_ATTEMPTS,
+        "created_at": now,
+        "updated_at": now,
+        "next_attempt_at": now,
+        "last_error": None,
+        "result": None,
+        "payload": {
+            "redacted_jsonl_path": str(redacted_jsonl_path),
+            "octave_path": str(octave_path),
+            "session_data": session_data,
+            "description": description,
+        },
+    }
+    _save_job(_job_path(project_root, job_id), job)
+    logger.info(f"Queued compression job {job_id} for session {job['session_id']}")
+    return job
+
+
+def list_jobs(project_root: Path) -> list[dict[str, Any]]:
+    """Return all readable job records, oldest first."""
+    base = jobs_dir(project_root)
+    if not base.exists():
+        return []
+    jobs = []
+    for path in base.glob("*.json"):
+        try:
+            jobs.append(load_job(path))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable job record {path.name}: {e}")
+    return sorted(jobs, key=lambda job: str(job.get("created_at", "")))
+
+
+def get_compression_job_status(
+    project_root: Path, job_id: str | None = None, session_id: str | None = None
+) -> dict[str, Any]:
+    """Report progress of compression jobs.
+
+    Args:
+        project_root: Project root directory
+        job_id: Report a single job
+        session_id: Report jobs for one session (ignored if job_id given)
+
+    Returns:
+        dict with "jobs" (records without payload) and per-status "counts"
+
+    Raises:
+        FileNotFoundError: If job_id is given but does not exist
+    """
+    if job_id:
+        jobs = [load_job(_job_path(project_root, job_id))]
+    else:
+        jobs = list_jobs(project_root)
+        if session_id:
+            jobs = [job for job in jobs if job.get("session_id") == session_id]
+
+    counts: dict[str, int] = {}
+    for job in jobs:
+        counts[job.get("status", "unknown")] = counts.get(job.get("status", "unknown"), 0) + 1
+
+    return {
+        "jobs": [{k: v for k, v in job.items() if k != "payload"} for job in jobs],
+        "counts": counts,
+    }
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Capped exponential backoff with jitter for the retry after `attempts` tries."""
+    exponent = max(attempts - 1, 0)
+    delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (1 << exponent))
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _lock_age(job_path: Path) -> float:
+    """Seconds since the job's claim was taken or renewed (LEASE_SECONDS if unclaimed)."""
+    try:
+        return time.time() - _lock_path(job_path).stat().st_mtime
+    except FileNotFoundError:
+        return LEASE_SECONDS
+
+
+def _claim(job_path: Path) -> bool:
+    """Take the job's lock file; reclaim it if the previous holder's lease expired."""
+    lock = _lock_path(job_path)
+    if _create_lock(lock):
+        return True
+    if _lock_age(job_path) < LEASE_SECONDS:
+        return False
+
+    with _reclaim_mutex(job_path.parent):
+        # Another worker may have reclaimed (and re-created) the lock while we
+        # waited for the mutex: only remove it if it is still stale.
+        if _lock_age(job_path) < LEASE_SECONDS:
+            return False
+        logger.warning(f"Reclaiming abandoned compression job lock {lock.name}")
+        lock.unlink(missing_ok=True)
+        return _create_lock(lock)
+
+
+def _create_lock(lock: Path) -> bool:
+    """Atomically create the lock file (O_EXCL); False if it already exists."""
+    try:
+        fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, "w") as f:
+        f.write(str(os.getpid()))
+    return True
+
+
+@contextlib.contextmanager
+def _reclaim_mutex(base: Path) -> Iterator[None]:
+    """Hold an exclusive flock that serializes stale-lock reclaims in base."""
+    try:
+        import fcntl
+    except ImportError:  # Windows: no advisory locks, lease re-check only
+        yield
+        return
+
+    fd = os.open(base / ".reclaim.lock", os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _release(job_path: Path) -> None:
+    _lock_path(job_path).unlink(missing_ok=True)
+
+
+async def _renew_lease(job_path: Path) -> None:
+    """Refresh the claim's mtime while the job runs, so it is never seen as stale."""
+    lock = _lock_path(job_path)
+    while True:
+        await asyncio.sleep(LEASE_RENEW_SECONDS)
+        try:
+            os.utime(lock)
+        except FileNotFoundError:
+            logger.warning(f"Compression job lock {lock.name} disappeared while running")
+            return
+
+
+def _is_due(job: dict[str, Any], now: datetime) -> bool:
+    if job.get("status") in TERMINAL_STATUSES:
+        return False
+    try:
+        next_attempt = datetime.fromisoformat(str(job.get("next_attempt_at")))
+    except ValueError:
+        return True
+    return next_attempt <= now
+
+
+def due_job_paths(project_root: Path, now: datetime | None = None) -> list[Path]:
+    """Job records that are ready to run (queued and due, or interrupted)."""
+    now = now or _now()
+    base = jobs_dir(project_root)
+    if not base.exists():
+        return []
+    due = []
+    for path in sorted(base.glob("*.json")):
+        try:
+            job = load_job(path)
+        except (OSError, ValueError):
+            continue
+        # A "running" job is listed too: if its claim is stale the worker died
+        # mid-run and _claim() lets us retry it, otherwise the claim is refused
+        if _is_due(job, now):
+            due.append(path)
+    return due
+
+
+def seconds_until_next_job(project_root: Path, now: datetime | None = None) -> float | None:
+    """Seconds until the earliest non-terminal job is due, or None if none pending."""
+    now = now or _now()
+    earliest: float | None = None
+    for job in list_jobs(project_root):
+        if job.get("status") in TERMINAL_STATUSES:
+            continue
+        if job.get("status") == "running":
+            # Held by another worker: look again when its lease would expire
+            wait = LEASE_SECONDS - _lock_age(jobs_dir(project_root) / f"{job['job_id']}.json")
+        else:
+            try:
+                wait = (datetime.fromisoformat(str(job["next_attempt_at"])) - now).total_seconds()
+            except (KeyError, ValueError):
+                wait = 0.0
+        earliest = wait if earliest is None else min(earliest, wait)
+    return None if earliest is None else max(earliest, 0.0)
+
+
+async def run_compression_job(job_path: Path) -> dict[str, Any] | None:
+    """Run one compression job attempt.
+
+    Returns:
+        The updated job record, or None if another worker holds the job or
+        it is already finished
+    """
+    if not _claim(job_path):
+        return None
+    try:
+        job = load_job(job_path)
+        if job.get("status") in TERMINAL_STATUSES:
+            return None
+
+        job["status"] = "running"
+        job["attempts"] = int(job.get("attempts", 0)) + 1
+        job["updated_at"] = _now().isoformat()
+        await asyncio.to_thread(_save_job, job_path, job)
+
+        payload = job["payload"]
+        octave_path = Path(payload["octave_path"])
+        # jobs_dir is <root>/.hestai/state/jobs
+        project_root = job_path.parents[3]
+
+        from hestai_mcp.modules.tools.clock_out import compress_and_index_session
+
+        renewal = asyncio.create_task(_renew_lease(job_path))
+        try:
+            outcome = await compress_and_index_session(
+                redacted_jsonl_path=Path(payload["redacted_jsonl_path"]),
+                session_data=payload["session_data"],
+                description=payload.get("description", ""),
+                project_root=project_root,
+                octave_path=octave_path,
+            )
+            error = None if outcome["compression_status"] == "success" else "compression failed"
+        except Exception as e:
+            # Job failures are recorded on the job, not raised
+            outcome = {"compression_status": "failed"}
+            error = str(e)
+        finally:
+            renewal.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await renewal
+
+        job["updated_at"] = _now().isoformat()
+        job["result"] = outcome
+        if error is None:
+            job["status"] = "succeeded"
+            job["last_error"] = None
+            logger.info(f"Compression job {job['job_id']} succeeded")
+        elif job["attempts"] >= int(job.get("max_attempts", MAX_ATTEMPTS)):
+            job["status"] = "failed"
+            job["last_error"] = error
+            logger.warning(f"Compression job {job['job_id']} failed permanently: {error}")
+        else:
+            delay = backoff_seconds(job["attempts"])
+            job["status"] = "queued"
+            job["last_error"] = error
+            job["next_attempt_at"] = datetime.fromtimestamp(time.time() + delay, UTC).isoformat()
+            logger.info(
+                f"Compression job {job['job_id']} attempt {job['attempts']} failed, "
+                f"retrying in {delay:.0f}s: {error}"
+            )
+        await asyncio.to_thread(_save_job, job_path, job)
+        return job
+    finally:
+        _release(job_path)
+
+
+async def run_due_jobs(project_root: Path) -> int:
+    """Run every job that is currently due for project_root.
+
+    Returns:
+        Number of job attempts made
+    """
+    ran = 0
+    for path in due_job_paths(project_root):
+        if await run_compression_job(path) is not None:
+            ran += 1
+    return ran
+
+
+class CompressionJobWorker:
+    """Asyncio worker that drains compression job queues for watched projects.
+
+    Usage (inside the MCP server event loop):
+        worker = CompressionJobWorker()
+        worker.watch(project_root)   # after clock_out enqueues a job
+        ...
+        await worker.stop()
+    """
+
+    def __init__(self, poll_seconds: float = WORKER_POLL_SECONDS) -> None:
+        self.poll_seconds = poll_seconds
+        self._roots: set[Path] = set()
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def watch(self, project_root: Path) -> None:
+        """Process jobs for project_root (starting the worker if needed)."""
+        self._roots.add(project_root.resolve())
+        self.start()
+        self._wake.set()
+
+    def start(self) -> None:
+        """Start the worker task on the running event loop (idempotent)."""
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name="hestai-compression-jobs"
+            )
+
+    async def stop(self) -> None:
+        """Cancel the worker task; in-flight jobs are retried on next start."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            next_wait = self.poll_seconds
+            for root in sorted(self._roots):
+                try:
+                    await run_due_jobs(root)
+                    wait = seconds_until_next_job(root)
+                except Exception as e:  # The worker must keep running
+                    logger.warning(f"Compression job worker error for {root}: {e}")
+                    continue
+                if wait is not None:
+                    next_wait = min(next_wait, wait)
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=next_wait)
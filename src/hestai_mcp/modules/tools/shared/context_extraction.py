@@ -5,14 +5,15 @@ Implements Feature 3: Extract DECISIONS/OUTCOMES/BLOCKERS from OCTAVE
 compression for updating PROJECT-CONTEXT.md via context_update tool.
 
 Design:
-- Parse OCTAVE sections with regex
+- Parse OCTAVE sections via the shared single-pass scan
 - Format for PROJECT-CONTEXT consumption
 - Extract only high-signal content (decisions, outcomes, blockers)
 - Preserve causal chains (BECAUSE statements)
 """
 
 import logging
-import re
+
+from hestai_mcp.modules.tools.shared.octave_scanner import scan_octave
 
 logger = logging.getLogger(__name__)
 
@@ -79,26 +80,11 @@ def _extract_section(octave_content: str, section_name: str) -> str | None:
         Formatted section content, or None if section not found
 
     Implementation:
-        Uses regex to find section between ::[ and ]
+        Reads the section's bracket-balanced items from the shared scan
         Preserves OCTAVE operators and formatting
         Converts to markdown list format for readability
     """
-    # Pattern: SECTION_NAME::[...content...]
-    # Handle both single-line and multi-line sections
-    pattern = rf"{section_name}::\[(.*?)\]"
-
-    match = re.search(pattern, octave_content, re.DOTALL)
-    if not match:
-        return None
-
-    section_content = match.group(1).strip()
-    if not section_content:
-        return None
-
-    # Convert OCTAVE list items to markdown
-    # Split on commas (OCTAVE list separator)
-    items = [item.strip() for item in section_content.split(",") if item.strip()]
-
+    items = scan_octave(octave_content).items(section_name)
     if not items:
         return None
 
@@ -0,0 +1,107 @@
+"""
+Context Packer - Token-budget-aware assembly of AI synthesis context.
+
+Replaces blunt head truncation of the combined context string: each section
+carries a priority, sections are admitted in priority order while they fit
+the token budget, and the first section that does not fit is cut at a line
+boundary (if enough budget remains to be useful). Output keeps the sections'
+reading order, so the prompt layout does not depend on what was dropped.
+
+Design:
+- Token estimates use the shared CHARS_PER_TOKEN heuristic (no tokenizer)
+- The header (role, focus) is always included
+- Pure function of its inputs (same sections + budget, same prompt)
+"""
+
+from dataclasses import dataclass, field
+
+from hestai_mcp.modules.tools.shared.distillation import CHARS_PER_TOKEN, estimate_tokens
+
+# Sections with less room than this are dropped rather than cut to a stub
+MIN_SECTION_CHARS = 200
+
+TRUNCATION_MARKER = "\n... [truncated]"
+
+SECTION_SEPARATOR = "\n\n"
+
+
+@dataclass(frozen=True)
+class ContextSection:
+    """One titled block of context with its packing priority."""
+
+    title: str
+    content: str
+    priority: int
+    order: int
+
+    def render(self, content: str | None = None) -> str:
+        """Render as '=== TITLE ===' followed by content."""
+        return f"=== {self.title} ===\n{self.content if content is None else content}"
+
+
+@dataclass
+class PackedContext:
+    """Packed context text plus what was kept, cut and dropped."""
+
+    text: str
+    budget_tokens: int
+    included: list[str] = field(default_factory=list)
+    truncated: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+
+    @property
+    def tokens(self) -> int:
+        """Estimated tokens of the packed text."""
+        return estimate_tokens(self.text)
+
+
+def pack_sections(header: str, sections: list[ContextSection], budget_tokens: int) -> PackedContext:
+    """
+    Pack sections into budget_tokens by priority, preserving reading order.
+
+    Args:
+        header: Text always placed first (counted against the budget)
+        sections: Candidate sections (empty content is skipped)
+        budget_tokens: Token budget for the whole packed text
+
+    Returns:
+        PackedContext with the prompt text and per-section outcome
+    """
+    result = PackedContext(text="", budget_tokens=budget_tokens)
+    remaining = budget_tokens * CHARS_PER_TOKEN - len(header)
+    chosen: list[tuple[ContextSection, str]] = []
+
+    for section in sorted(sections, key=lambda s: (-s.priority, s.order)):
+        if not section.content.strip():
+            continue
+        rendered = section.render()
+        cost = len(rendered) + (len(SECTION_SEPARATOR) if chosen else 0)
+        if cost <= remaining:
+            chosen.append((section, rendered))
+            result.included.append(section.title)
+            remaining -= cost
+            continue
+
+        overhead = cost - len(section.content) + len(TRUNCATION_MARKER)
+        room = remaining - overhead
+        if room >= MIN_SECTION_CHARS:
+            rendered = section.render(_cut_at_line(section.content, room) + TRUNCATION_MARKER)
+            chosen.append((section, rendered))
+            result.included.append(section.title)
+            result.truncated.append(section.title)
+            remaining -= len(rendered) + (len(SECTION_SEPARATOR) if len(chosen) > 1 else 0)
+        else:
+            result.dropped.append(section.title)
+
+    chosen.sort(key=lambda item: item[0].order)
+    result.text = header + SECTION_SEPARATOR.join(rendered for _section, rendered in chosen)
+    return result
+
+
+def _cut_at_line(text: str, limit: int) -> str:
+    """Cut text to at most limit chars, preferring the last line break."""
+    cut = text[:limit]
+    newline = cut.rfind("\n")
+    if newline >= limit // 2:
+        return cut[:newline]
+    return cut
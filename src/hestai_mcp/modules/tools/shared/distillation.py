@@ -0,0 +1,217 @@
+"""
+Transcript Distillation - Deterministic pre-compression shrinking of transcripts.
+
+Reduces the tokens sent to the compression model without changing what it is
+asked to produce. Built on ClaudeJsonlLens events, so JSONL envelopes
+(uuids, parent links, cwd, usage metadata) never reach the prompt.
+
+Rules:
+- User and assistant text is kept verbatim (the decisions live there)
+- Tool calls become one line: tool name plus a summary of its parameters
+- Tool outputs are truncated to MAX_TOOL_OUTPUT_CHARS
+- Repeated reads of the same file keep only the first call and output,
+  until an edit/write to that file makes the next read worth keeping
+- Model swaps are kept as one-line markers
+- Malformed lines (invalid JSON, broken records) are skipped and counted,
+  so one corrupt line never aborts compression
+
+Design:
+- Pure function of the transcript: same input, same output (cache friendly)
+- Streams events line by line; only the distilled lines are held in memory
+- Reports source vs distilled size so callers can log the reduction ratio
+"""
+
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from hestai_mcp.events.jsonl_archive import open_jsonl_text
+from hestai_mcp.events.jsonl_lens import (
+    AssistantMessage,
+    ClaudeJsonlLens,
+    HestAIEvent,
+    JsonlParseError,
+    ModelSwap,
+    ToolResult,
+    ToolUse,
+    UserMessage,
+)
+
+# Rough characters-per-token ratio used for budgeting (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+
+# Tool outputs longer than this are truncated
+MAX_TOOL_OUTPUT_CHARS = 500
+
+# Individual tool parameter values longer than this are truncated
+MAX_PARAM_VALUE_CHARS = 120
+
+# Tools whose repeated calls on the same target are collapsed
+READ_TOOLS = frozenset({"Read", "NotebookRead"})
+
+# Tools that change a file, so the next read of it is new information
+WRITE_TOOLS = frozenset({"Edit", "MultiEdit", "Write", "NotebookEdit"})
+
+# Parameters naming the file a read/write tool acts on
+PATH_PARAMETERS = ("file_path", "notebook_path")
+
+TRUNCATION_MARKER = " ... [truncated]"
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate token count from character length (CHARS_PER_TOKEN heuristic)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+@dataclass
+class DistilledTranscript:
+    """Distilled transcript lines plus size accounting."""
+
+    lines: list[str] = field(default_factory=list)
+    source_chars: int = 0
+    event_count: int = 0
+    truncated_outputs: int = 0
+    deduplicated_reads: int = 0
+    malformed_lines: int = 0
+
+    @property
+    def text(self) -> str:
+        """Distilled transcript as a single prompt string."""
+        return "\n".join(self.lines)
+
+    @property
+    def distilled_chars(self) -> int:
+        """Character length of the distilled text."""
+        return sum(len(line) for line in self.lines) + max(len(self.lines) - 1, 0)
+
+    @property
+    def source_tokens(self) -> int:
+        """Estimated tokens of the raw transcript."""
+        return math.ceil(self.source_chars / CHARS_PER_TOKEN)
+
+    @property
+    def distilled_tokens(self) -> int:
+        """Estimated tokens of the distilled transcript."""
+        return math.ceil(self.distilled_chars / CHARS_PER_TOKEN)
+
+    @property
+    def reduction_ratio(self) -> float:
+        """Fraction of estimated tokens removed (0.0 = none, 1.0 = all)."""
+        if self.source_tokens == 0:
+            return 0.0
+        return max(0.0, 1 - self.distilled_tokens / self.source_tokens)
+
+    def stats(self) -> dict[str, Any]:
+        """Summary suitable for logs and tool responses."""
+        return {
+            "source_tokens": self.source_tokens,
+            "distilled_tokens": self.distilled_tokens,
+            "reduction_ratio": round(self.reduction_ratio, 3),
+            "event_count": self.event_count,
+            "truncated_outputs": self.truncated_outputs,
+            "deduplicated_reads": self.deduplicated_reads,
+            "malformed_lines": self.malformed_lines,
+        }
+
+
+def distill_transcript(transcript_path: Path) -> DistilledTranscript:
+    """
+    Distill a Claude JSONL transcript into compact prompt lines.
+
+    Args:
+        transcript_path: Path to (redacted) JSONL transcript, plain or gzip
+
+    Returns:
+        DistilledTranscript with lines in chronological order
+
+    Raises:
+        FileNotFoundError: If transcript doesn't exist
+    """
+    if not transcript_path.exists():
+        raise FileNotFoundError(f"Transcript not found: {transcript_path}")
+
+    result = DistilledTranscript()
+    lens = ClaudeJsonlLens(strict=False)
+    # Read keys seen so far, grouped by the file they read
+    seen_reads: dict[str, set[str]] = {}
+    skipped_tool_ids: set[str] = set()
+
+    with open_jsonl_text(transcript_path) as f:
+        for raw_line in f:
+            # Count decompressed characters: st_size is the gzip size for archives
+            result.source_chars += len(raw_line)
+            try:
+                events = list(lens.parse_stream((raw_line,)))
+            except (JsonlParseError, AttributeError, KeyError, TypeError):
+                result.malformed_lines += 1
+                continue
+
+            for event in events:
+                result.event_count += 1
+
+                if isinstance(event, ToolUse) and event.tool_name in WRITE_TOOLS:
+                    seen_reads.pop(_target_path(event.parameters), None)
+
+                if isinstance(event, ToolUse) and event.tool_name in READ_TOOLS:
+                    read_key = json.dumps(event.parameters, sort_keys=True, default=str)
+                    reads = seen_reads.setdefault(_target_path(event.parameters), set())
+                    if read_key in reads:
+                        skipped_tool_ids.add(event.tool_id)
+                        result.deduplicated_reads += 1
+                        continue
+                    reads.add(read_key)
+
+                if isinstance(event, ToolResult):
+                    if event.tool_use_id in skipped_tool_ids:
+                        continue
+                    if len(event.output) > MAX_TOOL_OUTPUT_CHARS:
+                        result.truncated_outputs += 1
+
+                line = render_event(event)
+                if line:
+                    result.lines.append(line)
+
+    return result
+
+
+def render_event(event: HestAIEvent) -> str:
+    """Render a normalized transcript event as one compact prompt line."""
+    if isinstance(event, UserMessage):
+        return f"USER: {event.content.strip()}"
+    if isinstance(event, AssistantMessage):
+        return f"ASSISTANT: {event.content.strip()}"
+    if isinstance(event, ToolUse):
+        return f"TOOL_USE {event.tool_name}({summarize_parameters(event.parameters)})"
+    if isinstance(event, ToolResult):
+        marker = "TOOL_ERROR" if event.is_error else "TOOL_RESULT"
+        return f"{marker}: {_truncate(event.output.strip(), MAX_TOOL_OUTPUT_CHARS)}"
+    if isinstance(event, ModelSwap):
+        return f"MODEL: {event.model}"
+    return ""
+
+
+def summarize_parameters(parameters: dict[str, Any]) -> str:
+    """Summarize tool parameters as key=value pairs with long values truncated."""
+    parts = []
+    for key, value in parameters.items():
+        text = value if isinstance(value, str) else json.dumps(value, default=str)
+        parts.append(f"{key}={_truncate(text, MAX_PARAM_VALUE_CHARS)}")
+    return ", ".join(parts)
+
+
+def _target_path(parameters: dict[str, Any]) -> str:
+    """Return the file a read/write tool call acts on ("" if none is named)."""
+    for key in PATH_PARAMETERS:
+        value = parameters.get(key)
+        if isinstance(value, str):
+            return value
+    return ""
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Truncate text to limit characters, keeping a visible marker."""
+    if len(text) <= limit:
+        return text
+    return text[: limit - len(TRUNCATION_MARKER)] + TRUNCATION_MARKER
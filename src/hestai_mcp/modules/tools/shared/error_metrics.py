@@ -0,0 +1,503 @@
+"""
+Error Metrics - Indexed reader for RCCAFP records in error-metrics.jsonl.
+
+submit_rccafp_record() appends records; this module reads them back for
+Workbench dispatch and retrospectives (query_error_metrics MCP tool)
+without scanning the whole file.
+
+Design:
+- error-metrics.jsonl stays the source of truth (append-only, O_APPEND)
+- Each line carries a trailing "crc32" field over the bytes before it
+  (encode_record/decode_record); a line that fails its CRC or JSON parse is
+  torn, and a complete record glued after a torn fragment is recovered.
+  Lines without the field (written before CRCs) are accepted as-is
+- A SQLite sidecar (error-metrics.index.sqlite3) maps record_id,
+  session_id and timestamp to byte offsets in the JSONL; records are read
+  by seeking, never by scanning
+- Indexing is incremental: only bytes past the last indexed offset are
+  parsed, inside one IMMEDIATE transaction, so concurrent readers do not
+  double-count; a torn trailing line waits until it is complete
+- Aggregates are maintained as records are indexed: per-role totals and
+  escalations, per-day/per-role buckets for time windows, and normalized
+  root-cause counts, so queries cost O(roles/days/causes), not O(records)
+- A JSONL that shrank or was replaced is re-indexed from scratch
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+METRICS_FILE = "error-metrics.jsonl"
+INDEX_FILE = "error-metrics.index.sqlite3"
+
+# Bump when the schema changes; older sidecars are rebuilt on open
+SCHEMA_VERSION = 1
+
+# Characters of normalized root cause used to group repeats
+ROOT_CAUSE_KEY_CHARS = 200
+
+DEFAULT_RECORD_LIMIT = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    indexed_to INTEGER NOT NULL,
+    inode INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    record_id TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    session_id TEXT,
+    agent_role TEXT,
+    timestamp TEXT NOT NULL,
+    escalated INTEGER NOT NULL,
+    root_cause TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_session ON records (session_id);
+CREATE INDEX IF NOT EXISTS records_timestamp ON records (timestamp);
+CREATE TABLE IF NOT EXISTS role_stats (
+    role TEXT PRIMARY KEY,
+    total INTEGER NOT NULL,
+    escalated INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS daily_stats (
+    day TEXT NOT NULL,
+    role TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    escalated INTEGER NOT NULL,
+    PRIMARY KEY (day, role)
+);
+CREATE TABLE IF NOT EXISTS root_causes (
+    root_cause TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    last_record_id TEXT NOT NULL
+);
+"""
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+# Trailer appended to each serialized record: ,"crc32":"xxxxxxxx"}
+_CRC_FIELD = b',"crc32":"'
+_CRC_TRAILER_LENGTH = len(_CRC_FIELD) + 8 + len(b'"}')
+
+# Every record serializes with record_id first (compact separators)
+_RECORD_START = b'{"record_id":'
+
+# Role bucket for records written without an active session
+UNKNOWN_ROLE = "unknown"
+
+
+def root_cause_key(root_cause_analysis: str) -> str:
+    """Normalize a root cause for grouping (case, punctuation and spacing ignored)."""
+    return _NON_WORD.sub(" ", root_cause_analysis.lower()).strip()[:ROOT_CAUSE_KEY_CHARS]
+
+
+def encode_record(record: dict[str, Any]) -> bytes:
+    """
+    Serialize a record as one JSONL line with a CRC-32 trailer.
+
+    Args:
+        record: RCCAFP record (record_id first)
+
+    Returns:
+        UTF-8 line ending in a newline
+    """
+    body = json.dumps(record, separators=(",", ":")).encode("utf-8")[:-1]
+    return body + _CRC_FIELD + b"%08x" % zlib.crc32(body) + b'"}\n'
+
+
+def _decode(data: bytes) -> dict[str, Any] | None:
+    data = data.rstrip(b"\n")
+    crc_at = len(data) - _CRC_TRAILER_LENGTH
+    if crc_at >= 0 and data[crc_at:].startswith(_CRC_FIELD):
+        checksum = data[crc_at + len(_CRC_FIELD) : -2]
+        try:
+            if int(checksum, 16) != zlib.crc32(data[:crc_at]):
+                return None
+        except ValueError:
+            return None
+    try:
+        record = json.loads(data)
+    except ValueError:
+        return None
+    if not isinstance(record, dict) or "record_id" not in record:
+        return None
+    record.pop("crc32", None)
+    return record
+
+
+def decode_record(line: bytes) -> tuple[int, dict[str, Any]] | None:
+    """
+    Parse one JSONL line, verifying its CRC.
+
+    A writer that died mid-record leaves a fragment with no newline; the next
+    append then shares its line. The fragment is discarded and the complete
+    record after it is recovered.
+
+    Args:
+        line: Raw line (trailing newline optional)
+
+    Returns:
+        (byte offset of the record within line, record without its crc32
+        field), or None for blank, torn or corrupt lines
+    """
+    start = 0
+    while start != -1:
+        record = _decode(line[start:])
+        if record is not None:
+            return start, record
+        start = line.find(_RECORD_START, start + 1)
+    return None
+
+
+def _utc(value: str) -> str:
+    """ISO 8601 timestamp as a comparable UTC string (naive input is taken as UTC)."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC).isoformat()
+
+
+@contextmanager
+def _connect(state_dir: Path) -> Iterator[sqlite3.Connection]:
+    """Open the sidecar, creating or rebuilding the schema as needed."""
+    conn = sqlite3.connect(state_dir / INDEX_FILE, timeout=10.0, isolation_level=None)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            _reset(conn)
+        yield conn
+    finally:
+        conn.close()
+
+
+def _reset(conn: sqlite3.Connection) -> None:
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for table in ("meta", "records", "role_stats", "daily_stats", "root_causes"):
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+        for statement in _SCHEMA.split(";"):
+            if statement.strip():
+                conn.execute(statement)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _index_record(
+    conn: sqlite3.Connection, record: dict[str, Any], offset: int, length: int
+) -> None:
+    timestamp = _utc(str(record["timestamp"]))
+    role = str(record.get("agent_role") or UNKNOWN_ROLE)
+    escalated = 1 if record.get("escalation_required") else 0
+    cause = root_cause_key(str(record.get("root_cause_analysis", "")))
+    inserted = conn.execute(
+        "INSERT OR IGNORE INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            str(record["record_id"]),
+            offset,
+            length,
+            record.get("session_id"),
+            role,
+            timestamp,
+            escalated,
+            cause,
+        ),
+    ).rowcount
+    if not inserted:
+        return  # Duplicate record_id: aggregates already count it
+
+    conn.execute(
+        "INSERT INTO role_stats VALUES (?, 1, ?) ON CONFLICT (role) DO UPDATE SET "
+        "total = total + 1, escalated = escalated + excluded.escalated",
+        (role, escalated),
+    )
+    conn.execute(
+        "INSERT INTO daily_stats VALUES (?, ?, 1, ?) ON CONFLICT (day, role) DO UPDATE SET "
+        "total = total + 1, escalated = escalated + excluded.escalated",
+        (timestamp[:10], role, escalated),
+    )
+    if cause:
+        conn.execute(
+            "INSERT INTO root_causes VALUES (?, 1, ?, ?, ?) ON CONFLICT (root_cause) DO UPDATE "
+            "SET count = count + 1, first_seen = min(first_seen, excluded.first_seen), "
+            "last_seen = max(last_seen, excluded.last_seen), "
+            "last_record_id = CASE WHEN excluded.last_seen >= last_seen "
+            "THEN excluded.last_record_id ELSE last_record_id END",
+            (cause, timestamp, timestamp, str(record["record_id"])),
+        )
+
+
+def refresh_error_metrics_index(state_dir: Path) -> int:
+    """
+    Index records appended since the last refresh.
+
+    Args:
+        state_dir: .hestai/state directory holding error-metrics.jsonl
+
+    Returns:
+        Number of lines indexed by this call
+    """
+    metrics_path = state_dir / METRICS_FILE
+    try:
+        stat = metrics_path.stat()
+    except OSError:
+        return 0
+
+    with _connect(state_dir) as conn:
+        row = conn.execute("SELECT indexed_to, inode FROM meta").fetchone()
+        if row is not None and row[0] == stat.st_size and row[1] == stat.st_ino:
+            return 0  # Up to date (checked without taking the write lock)
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            with metrics_path.open("rb") as f:
+                # Re-stat under the write lock: a concurrent refresh may have
+                # indexed appends newer than the stat above, which would then
+                # look like a truncation
+                stat = os.fstat(f.fileno())
+                row = conn.execute("SELECT indexed_to, inode FROM meta").fetchone()
+                indexed_to = 0
+                if row is not None:
+                    indexed_to = row[0]
+                    if row[1] != stat.st_ino or stat.st_size < indexed_to:
+                        # Replaced or truncated: rebuild everything
+                        logger.info(f"Re-indexing {metrics_path} (file replaced or truncated)")
+                        for table in ("records", "role_stats", "daily_stats", "root_causes"):
+                            conn.execute(f"DELETE FROM {table}")
+                        indexed_to = 0
+
+                indexed = 0
+                offset = indexed_to
+                f.seek(offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # Record still being written
+                    decoded = decode_record(raw)
+                    if decoded is None:
+                        if raw.strip():
+                            logger.warning(f"Skipping torn RCCAFP record at byte {offset}")
+                    else:
+                        start, record = decoded
+                        try:
+                            _index_record(conn, record, offset + start, len(raw) - start)
+                        except (ValueError, KeyError, TypeError) as e:
+                            logger.warning(
+                                f"Skipping malformed RCCAFP record at byte {offset}: {e}"
+                            )
+                    offset += len(raw)
+                    indexed += 1
+
+            conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES (1, ?, ?)",
+                (offset, stat.st_ino),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    return indexed
+
+
+def _read_at(state_dir: Path, locations: list[tuple[int, int]]) -> list[dict[str, Any]]:
+    records: list[dict[str, Any]] = []
+    if not locations:
+        return records
+    with (state_dir / METRICS_FILE).open("rb") as f:
+        for offset, length in locations:
+            f.seek(offset)
+            record = _decode(f.read(length))
+            if record is not None:
+                records.append(record)
+    return records
+
+
+def get_record(state_dir: Path, record_id: str) -> dict[str, Any] | None:
+    """Look up one record by record_id (None if unknown)."""
+    refresh_error_metrics_index(state_dir)
+    with _connect(state_dir) as conn:
+        row = conn.execute(
+            "SELECT offset, length FROM records WHERE record_id = ?", (record_id,)
+        ).fetchone()
+    records = _read_at(state_dir, [row]) if row else []
+    return records[0] if records else None
+
+
+def find_records(
+    state_dir: Path,
+    session_id: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int = DEFAULT_RECORD_LIMIT,
+) -> list[dict[str, Any]]:
+    """
+    Records of a session and/or time window, newest first.
+
+    Args:
+        state_dir: .hestai/state directory
+        session_id: Only records of this session
+        since: Earliest timestamp (ISO 8601, inclusive)
+        until: Latest timestamp (ISO 8601, inclusive)
+        limit: Maximum records returned
+
+    Returns:
+        Full records read from error-metrics.jsonl
+
+    Raises:
+        ValueError: If since or until is not a valid ISO 8601 timestamp
+    """
+    where, params = _window(since, until)
+    if session_id is not None:
+        where.append("session_id = ?")
+        params.append(session_id)
+    clause = f"WHERE {' AND '.join(where)}" if where else ""
+
+    refresh_error_metrics_index(state_dir)
+    with _connect(state_dir) as conn:
+        rows = conn.execute(
+            f"SELECT offset, length FROM records {clause} "
+            "ORDER BY timestamp DESC, offset DESC LIMIT ?",
+            [*params, limit],
+        ).fetchall()
+    return _read_at(state_dir, rows)
+
+
+def _window(since: str | None, until: str | None) -> tuple[list[str], list[Any]]:
+    where: list[str] = []
+    params: list[Any] = []
+    if since is not None:
+        where.append("timestamp >= ?")
+        params.append(_utc(since))
+    if until is not None:
+        where.append("timestamp <= ?")
+        params.append(_utc(until))
+    return where, params
+
+
+def escalation_rate_by_role(
+    state_dir: Path,
+    since: str | None = None,
+    until: str | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Records, escalations and escalation rate per agent role.
+
+    Without a window the maintained per-role totals are returned directly.
+    Date-only bounds (YYYY-MM-DD) use the per-day buckets; other bounds are
+    answered from the timestamp index.
+
+    Args:
+        state_dir: .hestai/state directory
+        since: Earliest timestamp or date (inclusive)
+        until: Latest timestamp or date (inclusive)
+
+    Returns:
+        role -> {"total", "escalated", "rate"}
+
+    Raises:
+        ValueError: If since or until is not a valid ISO 8601 value
+    """
+    dates_only = all(bound is None or len(bound) == 10 for bound in (since, until))
+    params: list[Any] = []
+    if since is None and until is None:
+        query = "SELECT role, total, escalated FROM role_stats"
+    elif dates_only:
+        where = []
+        for bound, op in ((since, ">="), (until, "<=")):
+            if bound is not None:
+                where.append(f"day {op} ?")
+                params.append(datetime.fromisoformat(bound).date().isoformat())
+        query = (
+            "SELECT role, sum(total), sum(escalated) FROM daily_stats "
+            f"WHERE {' AND '.join(where)} GROUP BY role"
+        )
+    else:
+        conditions, params = _window(since, until)
+        query = (
+            "SELECT agent_role, count(*), sum(escalated) FROM records "
+            f"WHERE {' AND '.join(conditions)} GROUP BY agent_role"
+        )
+
+    refresh_error_metrics_index(state_dir)
+    with _connect(state_dir) as conn:
+        rows = conn.execute(query, params).fetchall()
+    return {
+        role: {"total": total, "escalated": escalated, "rate": escalated / total}
+        for role, total, escalated in rows
+        if total
+    }
+
+
+def repeat_root_causes(
+    state_dir: Path, min_count: int = 2, limit: int = 20
+) -> list[dict[str, Any]]:
+    """
+    Root causes recorded at least min_count times, most frequent first.
+
+    Returns:
+        dicts with root_cause (normalized), count, first_seen, last_seen and
+        last_record_id
+    """
+    refresh_error_metrics_index(state_dir)
+    with _connect(state_dir) as conn:
+        rows = conn.execute(
+            "SELECT root_cause, count, first_seen, last_seen, last_record_id FROM root_causes "
+            "WHERE count >= ? ORDER BY count DESC, last_seen DESC LIMIT ?",
+            (min_count, limit),
+        ).fetchall()
+    columns = ("root_cause", "count", "first_seen", "last_seen", "last_record_id")
+    return [dict(zip(columns, row, strict=True)) for row in rows]
+
+
+def query_error_metrics(
+    project_root: Path,
+    session_id: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int = DEFAULT_RECORD_LIMIT,
+    min_count: int = 2,
+) -> dict[str, Any]:
+    """
+    Read a project's RCCAFP records and aggregates (query_error_metrics MCP tool).
+
+    Args:
+        project_root: Project root directory
+        session_id: Only records of this session
+        since: Earliest timestamp or date (ISO 8601, inclusive)
+        until: Latest timestamp or date (ISO 8601, inclusive)
+        limit: Maximum records returned
+        min_count: Minimum occurrences for a repeat root cause
+
+    Returns:
+        dict with "records" (newest first), "count", "escalation_by_role"
+        (over the since/until window) and "repeat_root_causes"
+
+    Raises:
+        ValueError: If since or until is not a valid ISO 8601 value
+    """
+    state_dir = project_root / ".hestai" / "state"
+    if not (state_dir / METRICS_FILE).is_file():
+        return {"records": [], "count": 0, "escalation_by_role": {}, "repeat_root_causes": []}
+
+    records = find_records(state_dir, session_id=session_id, since=since, until=until, limit=limit)
+    return {
+        "records": records,
+        "count": len(records),
+        "escalation_by_role": escalation_rate_by_role(state_dir, since=since, until=until),
+        "repeat_root_causes": repeat_root_causes(state_dir, min_count=min_count),
+    }
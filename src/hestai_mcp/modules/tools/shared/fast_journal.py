@@ -0,0 +1,497 @@
+"""
+FAST Journal - Append-only event log behind the FAST layer snapshots.
+
+Every FAST layer change (focus set/cleared, checklist started/completed,
+blockers re-pointed/pruned) is appended as one JSON line to
+state/fast-journal.jsonl. The .oct.md files remain the read contract for
+agents and clock_in; they are compacted snapshots of the journal.
+
+Design:
+- Appends are O(1): one O_APPEND write per batch of events, then fsync
+- The first record is a baseline holding the snapshot texts the journal
+  started from, so the state at any past time can be rebuilt by replay
+- record_events() only appends by default and current_state() replays
+  pending events over the snapshots; the lifecycle writers (clock_in,
+  clock_out) pass compact=True, applying a batch in one render per file
+- Markers (baseline, compacted, external_edit) carry a hash of each
+  snapshot as written or last seen. A snapshot
+  that no longer matches is a hand edit: it is journaled as an external_edit
+  marker with the edited text, and pending events are re-journaled after it
+  (lifecycle events are idempotent), so replay matches what readers see
+- Appends, compaction and rotation hold an exclusive fcntl.flock on
+  state/.fast-journal.lock, so rotation never drops another process's append
+- Past MAX_JOURNAL_BYTES, compaction rotates the journal to a fresh baseline
+  (atomic rename; history before the new baseline is dropped)
+- Reads are incremental (in-process cache of parsed events by file offset,
+  guarded by a lock); a torn trailing line (crash mid-append) is ignored
+  until completed
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from hestai_mcp.modules.tools.shared.fast_state import (
+    BLOCKERS_FILE,
+    CHECKLIST_FILE,
+    CURRENT_FOCUS_FILE,
+    BlockersState,
+    ChecklistItem,
+    ChecklistState,
+    FastState,
+    FocusState,
+    load_fast_state,
+    save_fast_state,
+    write_if_changed,
+)
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILE = "fast-journal.jsonl"
+
+# Lock file serializing journal writers across processes
+LOCK_FILE = ".fast-journal.lock"
+
+# Bump when event payloads change incompatibly
+JOURNAL_FORMAT_VERSION = 1
+
+# Journal size that triggers rotation to a fresh baseline on compaction
+MAX_JOURNAL_BYTES = 1024 * 1024
+
+# Markers: records after which the snapshots are the base for pending events
+BASELINE = "baseline"
+COMPACTED = "compacted"
+EXTERNAL_EDIT = "external_edit"
+MARKERS = (BASELINE, COMPACTED, EXTERNAL_EDIT)
+
+# FastState field -> snapshot file
+SNAPSHOT_FILES = {
+    "focus": CURRENT_FOCUS_FILE,
+    "checklist": CHECKLIST_FILE,
+    "blockers": BLOCKERS_FILE,
+}
+
+
+@dataclass(frozen=True)
+class JournalEvent:
+    """One journal record."""
+
+    seq: int
+    ts: str
+    event: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        """Serialize as one compact JSON line (without newline)."""
+        return json.dumps(
+            {
+                "v": JOURNAL_FORMAT_VERSION,
+                "seq": self.seq,
+                "ts": self.ts,
+                "event": self.event,
+                "data": self.data,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+
+# Parsed journals: path -> (inode, bytes consumed, events)
+_journals: dict[Path, tuple[int, int, list[JournalEvent]]] = {}
+_journals_lock = threading.Lock()
+
+# Serializes journal writers within this process (flock covers other processes)
+_write_lock = threading.Lock()
+
+
+def clear_journal_cache() -> None:
+    """Drop all cached journal reads."""
+    with _journals_lock:
+        _journals.clear()
+
+
+@contextlib.contextmanager
+def _journal_lock(state_dir: Path) -> Iterator[None]:
+    """Hold the in-process writer lock and an exclusive flock on LOCK_FILE."""
+    with _write_lock:
+        try:
+            import fcntl
+        except ImportError:  # Windows: no advisory locks, in-process only
+            yield
+            return
+
+        fd = os.open(state_dir / LOCK_FILE, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+
+def focus_event(focus: FocusState) -> tuple[str, dict[str, Any]]:
+    """Event setting the focus model (active session or completed record)."""
+    return (
+        "focus",
+        {
+            "session_id": focus.session_id,
+            "role": focus.role,
+            "focus": focus.focus,
+            "branch": focus.branch,
+            "started": focus.started,
+            "completed": focus.completed,
+        },
+    )
+
+
+def checklist_started_event(
+    session_id: str, focus: str, carried_forward: list[ChecklistItem]
+) -> tuple[str, dict[str, Any]]:
+    """Event starting a session checklist with carried-forward items."""
+    return (
+        "checklist_started",
+        {
+            "session_id": session_id,
+            "focus": focus,
+            "carried_forward": [[item.name, item.status] for item in carried_forward],
+        },
+    )
+
+
+def checklist_completed_event(session_id: str) -> tuple[str, dict[str, Any]]:
+    """Event marking the checklist's session completed."""
+    return ("checklist_completed", {"session_id": session_id})
+
+
+def blockers_session_event(session_id: str) -> tuple[str, dict[str, Any]]:
+    """Event pointing blockers at a session (creating the document if needed)."""
+    return ("blockers_session", {"session_id": session_id})
+
+
+def blockers_pruned_event(session_id: str) -> tuple[str, dict[str, Any]]:
+    """Event dropping resolved blockers at session close."""
+    return ("blockers_pruned", {"session_id": session_id})
+
+
+def apply_event(state: FastState, event: JournalEvent) -> FastState:
+    """Return state with event applied (markers and unknown events are no-ops)."""
+    data = event.data
+    if event.event == BASELINE:
+        return _baseline_state(data)
+    if event.event == EXTERNAL_EDIT:
+        edited = {key: _parse_snapshot(key, text) for key, text in data["files"].items()}
+        return _replace(state, **edited)
+    if event.event == "focus":
+        return _replace(state, focus=FocusState(**data))
+    if event.event == "checklist_started":
+        carried = [ChecklistItem(name, status) for name, status in data["carried_forward"]]
+        checklist = ChecklistState.for_session(data["session_id"], data["focus"], carried)
+        return _replace(state, checklist=checklist)
+    if event.event == "checklist_completed" and state.checklist is not None:
+        return _replace(state, checklist=state.checklist.completed(data["session_id"]))
+    if event.event == "blockers_session":
+        if state.blockers is None:
+            return _replace(state, blockers=BlockersState.empty(data["session_id"]))
+        return _replace(state, blockers=state.blockers.with_session(data["session_id"]))
+    if event.event == "blockers_pruned" and state.blockers is not None:
+        return _replace(state, blockers=state.blockers.without_resolved())
+    return state
+
+
+def _replace(state: FastState, **changes: Any) -> FastState:
+    return FastState(
+        focus=changes.get("focus", state.focus),
+        checklist=changes.get("checklist", state.checklist),
+        blockers=changes.get("blockers", state.blockers),
+    )
+
+
+def _baseline_data(state: FastState, hashes: dict[str, str | None]) -> dict[str, Any]:
+    return {
+        "focus": state.focus.render() if state.focus else None,
+        "checklist": state.checklist.render() if state.checklist else None,
+        "blockers": state.blockers.render() if state.blockers else None,
+        "hashes": hashes,
+    }
+
+
+def _baseline_state(data: dict[str, Any]) -> FastState:
+    return FastState(
+        focus=_parse_snapshot("focus", data.get("focus")),
+        checklist=_parse_snapshot("checklist", data.get("checklist")),
+        blockers=_parse_snapshot("blockers", data.get("blockers")),
+    )
+
+
+def _parse_snapshot(key: str, text: str | None) -> Any:
+    """Parse one snapshot's text into its model (None stays None)."""
+    if text is None:
+        return None
+    parsers = {
+        "focus": FocusState.parse,
+        "checklist": ChecklistState.parse,
+        "blockers": BlockersState.parse,
+    }
+    return parsers[key](text)
+
+
+def _read_snapshots(state_dir: Path) -> dict[str, bytes | None]:
+    """Raw bytes of each snapshot file (None if absent or unreadable)."""
+    snapshots: dict[str, bytes | None] = {}
+    for key, name in SNAPSHOT_FILES.items():
+        try:
+            snapshots[key] = (state_dir / name).read_bytes()
+        except OSError:
+            snapshots[key] = None
+    return snapshots
+
+
+def _hashes(snapshots: dict[str, bytes | None]) -> dict[str, str | None]:
+    return {
+        key: hashlib.sha256(data).hexdigest() if data is not None else None
+        for key, data in snapshots.items()
+    }
+
+
+def snapshot_hashes(state_dir: Path) -> dict[str, str | None]:
+    """SHA-256 of each snapshot file as it is on disk (None if absent)."""
+    return _hashes(_read_snapshots(state_dir))
+
+
+def read_journal(state_dir: Path) -> list[JournalEvent]:
+    """
+    Return all complete journal events, reading only bytes appended since the last call.
+
+    Args:
+        state_dir: FAST layer state directory
+
+    Returns:
+        Events in append order (empty if there is no journal)
+    """
+    path = state_dir / JOURNAL_FILE
+    with _journals_lock:
+        return _read_journal_locked(path)
+
+
+def _read_journal_locked(path: Path) -> list[JournalEvent]:
+    try:
+        stat = path.stat()
+    except OSError:
+        _journals.pop(path, None)
+        return []
+    size = stat.st_size
+
+    inode, offset, events = _journals.get(path, (stat.st_ino, 0, []))
+    if inode != stat.st_ino or size < offset:
+        # Rotated (replaced by rename): start over
+        offset, events = 0, []
+    if size == offset:
+        return list(events)
+
+    with path.open("rb") as f:
+        f.seek(offset)
+        chunk = f.read(size - offset)
+
+    events = list(events)
+    complete, newline, _torn = chunk.rpartition(b"\n")
+    if newline:
+        for line in complete.split(b"\n"):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                events.append(
+                    JournalEvent(
+                        seq=int(record["seq"]),
+                        ts=str(record["ts"]),
+                        event=str(record["event"]),
+                        data=dict(record.get("data") or {}),
+                    )
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping malformed FAST journal line in {path}: {e}")
+        offset += len(complete) + 1
+
+    _journals[path] = (stat.st_ino, offset, events)
+    return list(events)
+
+
+def _pending(events: list[JournalEvent]) -> list[JournalEvent]:
+    """Events not yet reflected in the snapshots."""
+    for index in range(len(events) - 1, -1, -1):
+        if events[index].event in MARKERS:
+            return events[index + 1 :]
+    return events
+
+
+def _known_hashes(events: list[JournalEvent]) -> dict[str, Any] | None:
+    """Snapshot hashes recorded by the latest marker (None if none recorded them)."""
+    for event in reversed(events):
+        if event.event in MARKERS:
+            hashes = event.data.get("hashes")
+            return hashes if isinstance(hashes, dict) else None
+    return None
+
+
+def _journal_external_edits(state_dir: Path) -> list[JournalEvent]:
+    """
+    Journal snapshots edited outside the journal (caller holds the journal lock).
+
+    Returns:
+        The journal events, including any external_edit marker appended
+    """
+    events = read_journal(state_dir)
+    known = _known_hashes(events)
+    if known is None:
+        return events
+
+    snapshots = _read_snapshots(state_dir)
+    hashes = _hashes(snapshots)
+    changed = [key for key in SNAPSHOT_FILES if hashes[key] != known.get(key)]
+    if not changed:
+        return events
+
+    files = {
+        key: data.decode("utf-8") if (data := snapshots[key]) is not None else None
+        for key in changed
+    }
+    # The edited snapshots become the base; pending events are re-applied on top
+    pending = [(event.event, event.data) for event in _pending(events)]
+    _append(state_dir, [(EXTERNAL_EDIT, {"files": files, "hashes": hashes}), *pending])
+    logger.info(f"Journaled external edit of FAST snapshots {changed} in {state_dir}")
+    return read_journal(state_dir)
+
+
+def current_state(state_dir: Path) -> FastState:
+    """Snapshots with any not-yet-compacted journal events applied."""
+    state = load_fast_state(state_dir)
+    for event in _pending(read_journal(state_dir)):
+        state = apply_event(state, event)
+    return state
+
+
+def _append(state_dir: Path, records: list[tuple[str, dict[str, Any]]]) -> list[JournalEvent]:
+    """Append records as one write; returns the events written."""
+    journal = read_journal(state_dir)
+    next_seq = journal[-1].seq + 1 if journal else 1
+    now = datetime.now(UTC).isoformat()
+    events = [
+        JournalEvent(seq=next_seq + i, ts=now, event=name, data=data)
+        for i, (name, data) in enumerate(records)
+    ]
+    payload = "".join(event.to_json() + "\n" for event in events).encode("utf-8")
+
+    fd = os.open(state_dir / JOURNAL_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return events
+
+
+def record_events(
+    state_dir: Path,
+    records: list[tuple[str, dict[str, Any]]],
+    compact: bool = False,
+) -> FastState:
+    """
+    Append FAST layer events to the journal.
+
+    Args:
+        state_dir: FAST layer state directory
+        records: (event, data) pairs from the *_event helpers
+        compact: Whether to update the .oct.md snapshots now (otherwise they
+            are updated by the next compaction)
+
+    Returns:
+        The FAST state after the events
+    """
+    with _journal_lock(state_dir):
+        if not read_journal(state_dir):
+            # Start the history from the snapshots as they are now
+            baseline = _baseline_data(load_fast_state(state_dir), snapshot_hashes(state_dir))
+            _append(state_dir, [(BASELINE, baseline)])
+        else:
+            _journal_external_edits(state_dir)
+        _append(state_dir, records)
+        if compact:
+            return _compact_locked(state_dir)
+    return current_state(state_dir)
+
+
+def compact_fast_layer(state_dir: Path) -> FastState:
+    """
+    Write pending journal events into the .oct.md snapshots.
+
+    Rotates the journal to a single baseline record once it exceeds
+    MAX_JOURNAL_BYTES.
+
+    Returns:
+        The compacted FAST state
+    """
+    with _journal_lock(state_dir):
+        return _compact_locked(state_dir)
+
+
+def _compact_locked(state_dir: Path) -> FastState:
+    """compact_fast_layer body (caller holds the journal lock)."""
+    events = _journal_external_edits(state_dir)
+    pending = _pending(events)
+    state = current_state(state_dir)
+    if not pending:
+        return state
+
+    save_fast_state(state_dir, state)
+    hashes = snapshot_hashes(state_dir)
+    _append(state_dir, [(COMPACTED, {"through": pending[-1].seq, "hashes": hashes})])
+
+    path = state_dir / JOURNAL_FILE
+    if path.stat().st_size > MAX_JOURNAL_BYTES:
+        baseline = JournalEvent(
+            seq=pending[-1].seq + 2,
+            ts=datetime.now(UTC).isoformat(),
+            event=BASELINE,
+            data=_baseline_data(state, hashes),
+        )
+        write_if_changed(path, baseline.to_json() + "\n")
+        with _journals_lock:
+            _journals.pop(path, None)
+        logger.info(f"Rotated FAST journal {path}")
+    return state
+
+
+def fast_state_at(state_dir: Path, when: datetime) -> FastState | None:
+    """
+    Rebuild the FAST state as of a point in time.
+
+    Hand edits made since the last journal write are journaled first, so the
+    replay of "now" matches the snapshots on disk.
+
+    Args:
+        state_dir: FAST layer state directory
+        when: Timezone-aware point in time
+
+    Returns:
+        FastState at that time, or None if the journal does not reach back that far
+    """
+    if read_journal(state_dir):
+        with _journal_lock(state_dir):
+            _journal_external_edits(state_dir)
+
+    state: FastState | None = None
+    for event in read_journal(state_dir):
+        if datetime.fromisoformat(event.ts) > when:
+            break
+        if event.event == BASELINE:
+            state = _baseline_state(event.data)
+        elif state is not None:
+            state = apply_event(state, event)
+    return state
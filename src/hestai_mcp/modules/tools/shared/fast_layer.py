@@ -11,14 +11,30 @@ Files managed:
 - blockers.oct.md: Active blockers (preserved across sessions)
 
 Per ADR-0056: Velocity-Layered Fragments Architecture
+
+Changes are appended as events to state/fast-journal.jsonl (fast_journal)
+and compacted into the .oct.md snapshots, which are rendered from the typed
+models of fast_state and written atomically only when they change.
+Both clock_in and clock_out journal their events in one write and compact
+them at once, so the snapshots are current for every reader between sessions.
 """
 
 import logging
-import re
 import subprocess
 from datetime import UTC, datetime
 from pathlib import Path
 
+from hestai_mcp.modules.tools.shared.fast_journal import (
+    blockers_pruned_event,
+    blockers_session_event,
+    checklist_completed_event,
+    checklist_started_event,
+    current_state,
+    focus_event,
+    record_events,
+)
+from hestai_mcp.modules.tools.shared.fast_state import FocusState
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,6 +115,39 @@ def ensure_state_directory(working_dir: Path) -> Path:
     return state_dir
 
 
+def _session_focus(state_dir: Path, session_id: str, role: str, focus: str) -> FocusState:
+    """
+    Build the active-session focus model (sanitized, with the current branch).
+
+    Raises:
+        ValueError: If role or focus contain control characters (injection prevention).
+    """
+    # Sanitize inputs to prevent OCTAVE injection attacks
+    safe_role = sanitize_octave_scalar(role)
+    safe_focus = sanitize_octave_scalar(focus)
+
+    # Derive working_dir from state_dir (.hestai/state/context/state -> project root)
+    # state_dir is: working_dir / ".hestai" / "state" / "context" / "state"
+    working_dir = state_dir.parent.parent.parent.parent
+    branch = get_current_branch(working_dir=working_dir)
+
+    # Sanitize branch as well (could contain special chars from git)
+    safe_branch = sanitize_octave_scalar(branch)
+
+    return FocusState(
+        session_id=session_id,
+        role=safe_role,
+        focus=safe_focus,
+        branch=safe_branch,
+        started=datetime.now(UTC).isoformat(),
+    )
+
+
+def _completed_focus(session_id: str) -> FocusState:
+    """Focus model recording session_id as the last, completed session."""
+    return FocusState(session_id=session_id, completed=datetime.now(UTC).isoformat())
+
+
 def populate_current_focus(
     state_dir: Path,
     session_id: str,
@@ -124,36 +173,9 @@ def populate_current_focus(
     Raises:
         ValueError: If role or focus contain control characters (injection prevention).
     """
-    # Sanitize inputs to prevent OCTAVE injection attacks
-    safe_role = sanitize_octave_scalar(role)
-    safe_focus = sanitize_octave_scalar(focus)
-
-    # Derive working_dir from state_dir (.hestai/state/context/state -> project root)
-    # state_dir is: working_dir / ".hestai" / "state" / "context" / "state"
-    working_dir = state_dir.parent.parent.parent.parent
-    branch = get_current_branch(working_dir=working_dir)
-
-    # Sanitize branch as well (could contain special chars from git)
-    safe_branch = sanitize_octave_scalar(branch)
-
-    timestamp = datetime.now(UTC).isoformat()
-
-    content = f"""===CURRENT_FOCUS===
-META:
-  TYPE::SESSION_FOCUS
-  VELOCITY::HOURLY_DAILY
-
-SESSION:
-  ID::"{session_id}"
-  ROLE::{safe_role}
-  FOCUS::"{safe_focus}"
-  BRANCH::{safe_branch}
-  STARTED::"{timestamp}"
-
-===END===
-"""
-    current_focus_path = state_dir / "current-focus.oct.md"
-    current_focus_path.write_text(content)
+    record_events(
+        state_dir, [focus_event(_session_focus(state_dir, session_id, role, focus))], compact=True
+    )
     logger.info(f"Populated current-focus.oct.md for session {session_id}")
 
 
@@ -167,60 +189,14 @@ def populate_checklist(
 
     ADR-0056: Incomplete tasks from previous sessions should be preserved.
     """
-    checklist_path = state_dir / "checklist.oct.md"
-
-    # Check for existing checklist with incomplete items
-    carried_forward = _extract_incomplete_items(checklist_path)
-
-    # Build carried forward section if there are items
-    carried_forward_section = ""
-    if carried_forward:
-        carried_forward_section = "\nCARRIED_FORWARD:\n"
-        for item, status in carried_forward:
-            carried_forward_section += f"  {item}::{status}[from_previous_session]\n"
-
-    content = f"""===SESSION_CHECKLIST===
-META:
-  TYPE::FAST_CHECKLIST
-  VELOCITY::HOURLY_DAILY
-  SESSION::"{session_id}"
-
-CURRENT_TASK::"{focus}"
-
-ITEMS:
-  session_task::IN_PROGRESS
-{carried_forward_section}
-===END===
-"""
-    checklist_path.write_text(content)
+    previous = current_state(state_dir).checklist
+    carried_forward = previous.incomplete_items() if previous else []
+    record_events(
+        state_dir, [checklist_started_event(session_id, focus, carried_forward)], compact=True
+    )
     logger.info(f"Populated checklist.oct.md for session {session_id}")
 
 
-def _extract_incomplete_items(checklist_path: Path) -> list[tuple[str, str]]:
-    """
-    Extract incomplete items (PENDING, IN_PROGRESS) from existing checklist.
-
-    Returns:
-        List of (item_name, status) tuples
-    """
-    if not checklist_path.exists():
-        return []
-
-    content = checklist_path.read_text()
-    incomplete = []
-
-    # Match patterns like "  task_name::PENDING" or "  task_name::IN_PROGRESS"
-    pattern = r"^\s+(\w+)::(PENDING|IN_PROGRESS)"
-    for match in re.finditer(pattern, content, re.MULTILINE):
-        item_name = match.group(1)
-        status = match.group(2)
-        # Don't carry forward the generic session_task
-        if item_name != "session_task":
-            incomplete.append((item_name, status))
-
-    return incomplete
-
-
 def populate_blockers(
     state_dir: Path,
     session_id: str,
@@ -230,33 +206,11 @@ def populate_blockers(
 
     ADR-0056: Unresolved blockers should survive session transitions.
     """
-    blockers_path = state_dir / "blockers.oct.md"
-
-    if blockers_path.exists():
-        # Preserve existing content, just update session reference
-        content = blockers_path.read_text()
-        # Update the SESSION field if present
-        if 'SESSION::"' in content:
-            content = re.sub(
-                r'SESSION::"[^"]*"',
-                f'SESSION::"{session_id}"',
-                content,
-            )
-            blockers_path.write_text(content)
+    existed = current_state(state_dir).blockers is not None
+    record_events(state_dir, [blockers_session_event(session_id)], compact=True)
+    if existed:
         logger.info(f"Preserved existing blockers, updated session to {session_id}")
     else:
-        # Create new blockers file
-        content = f"""===BLOCKERS===
-META:
-  TYPE::FAST_BLOCKERS
-  VELOCITY::HOURLY_DAILY
-  SESSION::"{session_id}"
-
-ACTIVE:
-
-===END===
-"""
-        blockers_path.write_text(content)
         logger.info(f"Created blockers.oct.md for session {session_id}")
 
 
@@ -273,26 +227,10 @@ def clear_current_focus(
       ID::"{session_id}"
       COMPLETED::"{timestamp}"
     """
-    current_focus_path = state_dir / "current-focus.oct.md"
-    if not current_focus_path.exists():
+    if current_state(state_dir).focus is None:
         return
 
-    timestamp = datetime.now(UTC).isoformat()
-
-    content = f"""===CURRENT_FOCUS===
-META:
-  TYPE::SESSION_FOCUS
-  VELOCITY::HOURLY_DAILY
-
-SESSION::NONE
-
-LAST_SESSION:
-  ID::"{session_id}"
-  COMPLETED::"{timestamp}"
-
-===END===
-"""
-    current_focus_path.write_text(content)
+    record_events(state_dir, [focus_event(_completed_focus(session_id))], compact=True)
     logger.info(f"Cleared current focus for session {session_id}")
 
 
@@ -303,25 +241,13 @@ def update_checklist_on_close(
     """
     Update checklist on session close, preserving incomplete items.
 
-    ADR-0056: Incomplete tasks should be preserved for next session.
+    ADR-0056: Incomplete tasks should be preserved for next session
+    (they are carried forward on next clock_in).
     """
-    checklist_path = state_dir / "checklist.oct.md"
-    if not checklist_path.exists():
+    if current_state(state_dir).checklist is None:
         return
 
-    # Read and preserve the content (incomplete items will be carried forward
-    # on next clock_in)
-    content = checklist_path.read_text()
-
-    # Mark session as completed
-    if 'SESSION::"' in content:
-        content = re.sub(
-            r'SESSION::"[^"]*"',
-            f'SESSION::"{session_id}[COMPLETED]"',
-            content,
-        )
-        checklist_path.write_text(content)
-
+    record_events(state_dir, [checklist_completed_event(session_id)], compact=True)
     logger.info(f"Updated checklist for session {session_id} completion")
 
 
@@ -334,75 +260,14 @@ def persist_blockers_on_close(
 
     ADR-0056: Resolved blockers should be cleared, unresolved should persist.
 
-    This function uses indent-based block detection to properly handle blockers
-    with extra fields (OWNER::, LINKS::, PRIORITY::, etc.) beyond the basic
-    DESCRIPTION::, SINCE::, STATUS:: fields.
+    Blockers are parsed with indent-based block detection (see BlockersState),
+    so blockers with extra fields (OWNER::, LINKS::, PRIORITY::, etc.) beyond
+    the basic DESCRIPTION::, SINCE::, STATUS:: fields are removed whole.
     """
-    blockers_path = state_dir / "blockers.oct.md"
-    if not blockers_path.exists():
+    if current_state(state_dir).blockers is None:
         return
 
-    content = blockers_path.read_text()
-    lines = content.split("\n")
-    filtered_lines: list[str] = []
-    current_blocker_lines: list[str] = []
-    blocker_indent: int | None = None
-
-    def _get_indent(line: str) -> int:
-        """Get the indentation level of a line."""
-        return len(line) - len(line.lstrip())
-
-    def _finalize_blocker(blocker_lines: list[str], output: list[str]) -> None:
-        """Check if blocker should be kept and add to output if unresolved."""
-        if not blocker_lines:
-            return
-        blocker_text = "\n".join(blocker_lines)
-        if "STATUS::RESOLVED" not in blocker_text:
-            output.extend(blocker_lines)
-
-    for line in lines:
-        # Detect start of a blocker entry (e.g., "  blocker_001:")
-        blocker_match = re.match(r"^(\s+)(blocker_\d+):", line)
-
-        if blocker_match:
-            # Finalize any previous blocker before starting a new one
-            _finalize_blocker(current_blocker_lines, filtered_lines)
-
-            # Start accumulating new blocker
-            current_blocker_lines = [line]
-            blocker_indent = _get_indent(line)
-
-        elif current_blocker_lines and blocker_indent is not None:
-            # We're inside a blocker block
-            current_line_indent = _get_indent(line)
-
-            # Check if this line is still part of the blocker block:
-            # - Indented more than the blocker header (child content)
-            # - Empty line (could be formatting within block)
-            # - Or a line at exactly blocker_indent + some indentation for fields
-            if line.strip() == "":
-                # Empty line - could be end of block or just spacing
-                # Look ahead would be complex, so we include it in current blocker
-                # and let the next non-empty line determine if we're still in block
-                current_blocker_lines.append(line)
-            elif current_line_indent > blocker_indent:
-                # More indented than blocker header = still in blocker
-                current_blocker_lines.append(line)
-            else:
-                # Same or less indent = blocker block ended
-                _finalize_blocker(current_blocker_lines, filtered_lines)
-                current_blocker_lines = []
-                blocker_indent = None
-                filtered_lines.append(line)
-        else:
-            # Not in a blocker block
-            filtered_lines.append(line)
-
-    # Handle last blocker if any
-    _finalize_blocker(current_blocker_lines, filtered_lines)
-
-    new_content = "\n".join(filtered_lines)
-    blockers_path.write_text(new_content)
+    record_events(state_dir, [blockers_pruned_event(session_id)], compact=True)
     logger.info(f"Persisted unresolved blockers, cleared resolved for session {session_id}")
 
 
@@ -415,12 +280,23 @@ def update_fast_layer_on_clock_in(
     """
     Update all FAST layer files during clock_in.
 
-    Consolidated function called by clock_in tool.
+    Consolidated function called by clock_in tool: the session's events are
+    appended to the FAST journal in one write, then compacted into the
+    .oct.md snapshots (one render and write per file).
     """
     state_dir = ensure_state_directory(working_dir)
-    populate_current_focus(state_dir, session_id, role, focus)
-    populate_checklist(state_dir, session_id, focus)
-    populate_blockers(state_dir, session_id)
+    previous = current_state(state_dir)
+    carried_forward = previous.checklist.incomplete_items() if previous.checklist else []
+    record_events(
+        state_dir,
+        [
+            focus_event(_session_focus(state_dir, session_id, role, focus)),
+            checklist_started_event(session_id, focus, carried_forward),
+            blockers_session_event(session_id),
+        ],
+        compact=True,
+    )
+    logger.info(f"Updated FAST layer for session {session_id}")
 
 
 def update_fast_layer_on_clock_out(
@@ -430,16 +306,27 @@ def update_fast_layer_on_clock_out(
     """
     Update all FAST layer files during clock_out.
 
-    Consolidated function called by clock_out tool.
+    Consolidated function called by clock_out tool: the close events are
+    journaled in one write and compacted, so the snapshots never show the
+    closed session as active. Files written by clock_in in this process are
+    not re-parsed (model cache by mtime).
     """
     state_dir = working_dir / ".hestai" / "state" / "context" / "state"
     if not state_dir.exists():
         logger.info("State directory does not exist, skipping FAST layer update")
         return
 
-    clear_current_focus(state_dir, session_id)
-    update_checklist_on_close(state_dir, session_id)
-    persist_blockers_on_close(state_dir, session_id)
+    previous = current_state(state_dir)
+    records = []
+    if previous.focus is not None:
+        records.append(focus_event(_completed_focus(session_id)))
+    if previous.checklist is not None:
+        records.append(checklist_completed_event(session_id))
+    if previous.blockers is not None:
+        records.append(blockers_pruned_event(session_id))
+    if records:
+        record_events(state_dir, records, compact=True)
+    logger.info(f"Closed FAST layer for session {session_id}")
 
 
 # AI Synthesis - Using Layered Constitutional Injection pattern
@@ -495,6 +382,9 @@ REQUIRED_OCTAVE_FIELDS = [
     "FRESHNESS_WARNING::",
 ]
 
+# Give up on AI synthesis (and use the fallback) if no token arrives in time
+SYNTHESIS_FIRST_TOKEN_TIMEOUT_SECONDS = 5.0
+
 
 def _validate_octave_synthesis(response: str) -> bool:
     """
@@ -517,21 +407,28 @@ async def synthesize_fast_layer_with_ai(
     role: str,
     focus: str,
     context_summary: str,
+    working_dir: Path | None = None,
 ) -> dict[str, str]:
     """
     Synthesize FAST layer content using AI (SS-I2 async, SS-I6 fallback).
 
     Per North Star Section 5 STEP_5+6:
     1. Creates a CompletionRequest with synthesis prompt
-    2. Calls AIClient.complete_text()
+    2. Streams AIClient.complete_text_streaming() with a first-token deadline,
+       keeping partial output that already has every required OCTAVE field
     3. Parses AI response into synthesis result
     4. Falls back to template if AI fails (SS-I6)
 
+    With working_dir, valid AI results are shared through synthesis_cache:
+    identical prompts for the same project (until PROJECT-CONTEXT or git HEAD
+    changes) reuse one LLM call, including concurrent clock_ins.
+
     Args:
         session_id: Current session ID
         role: Agent role (e.g., "implementation-lead")
         focus: Resolved focus (e.g., "issue-56")
         context_summary: Summary of available context
+        working_dir: Project root; enables the synthesis cache when given
 
     Returns:
         Dict with "synthesis" and "source" keys:
@@ -566,9 +463,35 @@ async def synthesize_fast_layer_with_ai(
             timeout_seconds=15,  # Quick timeout to not block session start
         )
 
-        # Call AI using async context manager with explicit tier
-        async with AIClient(config) as client:
-            ai_response = await client.complete_text(request, tier=tier)
+        async def request_synthesis() -> dict[str, str]:
+            # Call AI using async context manager with explicit tier
+            async with AIClient(config) as client:
+                ai_response = await client.complete_text_streaming(
+                    request,
+                    tier=tier,
+                    first_token_timeout=SYNTHESIS_FIRST_TOKEN_TIMEOUT_SECONDS,
+                    accept_partial=_validate_octave_synthesis,
+                )
+            return {"synthesis": ai_response, "source": "ai"}
+
+        if working_dir is None:
+            result = await request_synthesis()
+        else:
+            from hestai_mcp.modules.tools.shared.synthesis_cache import synthesis_cache
+
+            tier_config = config.get_tier_config(tier)
+            cache_key = synthesis_cache.key_for(
+                request.system_prompt,
+                request.user_prompt,
+                f"{tier_config.provider}/{tier_config.model}",
+                working_dir,
+            )
+            result = await synthesis_cache.get_or_compute(
+                cache_key,
+                request_synthesis,
+                should_cache=lambda r: _validate_octave_synthesis(r["synthesis"]),
+            )
+        ai_response = result["synthesis"]
 
         logger.info(f"AI synthesis completed for session {session_id}")
 
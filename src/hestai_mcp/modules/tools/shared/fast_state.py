@@ -0,0 +1,477 @@
+"""
+FAST State - Typed in-memory model of the FAST layer files.
+
+The FAST layer (.hestai/state/context/state/) holds three session-velocity
+files. Instead of each operation re-reading a file and patching it with its
+own regex, every file is parsed once into a typed model, lifecycle events
+transform the models in memory, and each file is rendered and written once.
+
+Models:
+- FocusState: current-focus.oct.md (active session or LAST_SESSION record)
+- ChecklistState: checklist.oct.md (session, current task, status items)
+- BlockersState: blockers.oct.md (blockers with arbitrary fields, plus all
+  surrounding text, so unknown content survives a round trip byte-for-byte)
+
+Writes go through write_if_changed(): content is rendered in memory, compared
+with what is on disk, and only written (temp file + fsync + rename) when it
+differs. Readers never see a torn file and unchanged files do not wake file
+watchers.
+
+Caching:
+- Parsed models are cached per file by (mtime_ns, size)
+- store() refreshes the cache with the model it wrote, so clock_out reuses
+  what clock_in already parsed instead of reading the files again
+"""
+
+import contextlib
+import os
+import re
+import stat
+import threading
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, TypeVar
+
+CURRENT_FOCUS_FILE = "current-focus.oct.md"
+CHECKLIST_FILE = "checklist.oct.md"
+BLOCKERS_FILE = "blockers.oct.md"
+
+# Checklist statuses carried forward to the next session
+INCOMPLETE_STATUSES = ("PENDING", "IN_PROGRESS")
+
+# The per-session task is recreated each clock_in, never carried forward
+SESSION_TASK = "session_task"
+
+_SESSION_FIELD = re.compile(r'SESSION::"[^"]*"')
+_QUOTED_FIELD = re.compile(r'^\s+(\w+)::"(.*)"\s*$')
+_PLAIN_FIELD = re.compile(r"^\s+(\w+)::(.*?)\s*$")
+_CHECKLIST_ITEM = re.compile(r"^\s+(\w+)::([A-Z][A-Z_]*)")
+_SECTION_HEADER = re.compile(r"^(\w+):\s*$")
+_BLOCKER_HEADER = re.compile(r"^(\s+)(blocker_\d+):")
+
+T = TypeVar("T")
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """
+    Atomically write content to path unless the file already holds it.
+
+    The temp file is created next to path (same filesystem, so the rename is
+    atomic), given path's existing permission bits (default permissions for
+    a new file), fsynced, then renamed over path.
+
+    Args:
+        path: Destination file
+        content: Full file content
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass  # Missing or unreadable: write it
+
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # A new file keeps the umask-derived default. os.chmod on the
+            # path, not os.fchmod: Windows lacks fchmod before Python 3.13
+            with contextlib.suppress(FileNotFoundError):
+                os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return True
+
+
+@dataclass(frozen=True)
+class FocusState:
+    """Parsed current-focus.oct.md."""
+
+    session_id: str | None
+    role: str | None = None
+    focus: str | None = None
+    branch: str | None = None
+    started: str | None = None
+    completed: str | None = None
+
+    @property
+    def active(self) -> bool:
+        """Whether a session currently holds the focus."""
+        return self.started is not None and self.completed is None
+
+    @classmethod
+    def parse(cls, content: str) -> "FocusState":
+        """Parse current-focus content (values are kept as written)."""
+        fields: dict[str, str] = {}
+        for line in content.splitlines():
+            match = _QUOTED_FIELD.match(line) or _PLAIN_FIELD.match(line)
+            if match:
+                fields.setdefault(match.group(1), match.group(2))
+        return cls(
+            session_id=fields.get("ID"),
+            role=fields.get("ROLE"),
+            focus=fields.get("FOCUS"),
+            branch=fields.get("BRANCH"),
+            started=fields.get("STARTED"),
+            completed=fields.get("COMPLETED"),
+        )
+
+    def render(self) -> str:
+        """Render as current-focus.oct.md (ADR-0056 format)."""
+        if not self.active:
+            return f"""===CURRENT_FOCUS===
+META:
+  TYPE::SESSION_FOCUS
+  VELOCITY::HOURLY_DAILY
+
+SESSION::NONE
+
+LAST_SESSION:
+  ID::"{self.session_id}"
+  COMPLETED::"{self.completed}"
+
+===END===
+"""
+        return f"""===CURRENT_FOCUS===
+META:
+  TYPE::SESSION_FOCUS
+  VELOCITY::HOURLY_DAILY
+
+SESSION:
+  ID::"{self.session_id}"
+  ROLE::{self.role}
+  FOCUS::"{self.focus}"
+  BRANCH::{self.branch}
+  STARTED::"{self.started}"
+
+===END===
+"""
+
+
+@dataclass(frozen=True)
+class ChecklistItem:
+    """One NAME::STATUS checklist entry."""
+
+    name: str
+    status: str
+
+
+@dataclass(frozen=True)
+class ChecklistState:
+    """Parsed checklist.oct.md; text is the document as read or rendered."""
+
+    text: str
+    session: str | None
+    current_task: str | None
+    items: tuple[ChecklistItem, ...]
+
+    @classmethod
+    def parse(cls, content: str) -> "ChecklistState":
+        """Parse checklist content; status items are read outside META."""
+        session_match = re.search(r'SESSION::"([^"]*)"', content)
+        task_match = re.search(r'^CURRENT_TASK::"(.*)"\s*$', content, re.MULTILINE)
+        items: list[ChecklistItem] = []
+        section = None
+        for line in content.splitlines():
+            header = _SECTION_HEADER.match(line)
+            if header:
+                section = header.group(1)
+                continue
+            match = _CHECKLIST_ITEM.match(line)
+            if match and section != "META":
+                items.append(ChecklistItem(match.group(1), match.group(2)))
+        return cls(
+            text=content,
+            session=session_match.group(1) if session_match else None,
+            current_task=task_match.group(1) if task_match else None,
+            items=tuple(items),
+        )
+
+    @classmethod
+    def for_session(
+        cls, session_id: str, focus: str, carried_forward: list[ChecklistItem]
+    ) -> "ChecklistState":
+        """Fresh checklist for a session, with earlier incomplete items carried forward."""
+        carried_section = ""
+        if carried_forward:
+            carried_section = "\nCARRIED_FORWARD:\n" + "".join(
+                f"  {item.name}::{item.status}[from_previous_session]\n" for item in carried_forward
+            )
+        text = f"""===SESSION_CHECKLIST===
+META:
+  TYPE::FAST_CHECKLIST
+  VELOCITY::HOURLY_DAILY
+  SESSION::"{session_id}"
+
+CURRENT_TASK::"{focus}"
+
+ITEMS:
+  {SESSION_TASK}::IN_PROGRESS
+{carried_section}
+===END===
+"""
+        return cls(
+            text=text,
+            session=session_id,
+            current_task=focus,
+            items=(ChecklistItem(SESSION_TASK, "IN_PROGRESS"), *carried_forward),
+        )
+
+    def incomplete_items(self) -> list[ChecklistItem]:
+        """Items to carry into the next session (the session task excluded)."""
+        return [
+            item
+            for item in self.items
+            if item.status in INCOMPLETE_STATUSES and item.name != SESSION_TASK
+        ]
+
+    def completed(self, session_id: str) -> "ChecklistState":
+        """Mark the checklist's session as completed (no-op without a SESSION field)."""
+        if self.session is None:
+            return self
+        marker = f"{session_id}[COMPLETED]"
+        return replace(
+            self, text=_SESSION_FIELD.sub(f'SESSION::"{marker}"', self.text), session=marker
+        )
+
+    def render(self) -> str:
+        """Render as checklist.oct.md."""
+        return self.text
+
+
+@dataclass(frozen=True)
+class Blocker:
+    """One blocker_NNN block, kept as its original lines."""
+
+    name: str
+    lines: tuple[str, ...]
+
+    @property
+    def fields(self) -> dict[str, str]:
+        """KEY::VALUE fields of the blocker (quotes stripped)."""
+        fields: dict[str, str] = {}
+        for line in self.lines[1:]:
+            match = _QUOTED_FIELD.match(line) or _PLAIN_FIELD.match(line)
+            if match:
+                fields.setdefault(match.group(1), match.group(2))
+        return fields
+
+    @property
+    def resolved(self) -> bool:
+        """Whether the blocker is marked STATUS::RESOLVED."""
+        return "STATUS::RESOLVED" in "\n".join(self.lines)
+
+
+@dataclass(frozen=True)
+class BlockersState:
+    """Parsed blockers.oct.md as text segments interleaved with blockers."""
+
+    segments: tuple[str | Blocker, ...]
+
+    @classmethod
+    def parse(cls, content: str) -> "BlockersState":
+        """
+        Parse blockers content.
+
+        A blocker starts at an indented "blocker_NNN:" line and extends over
+        more-indented and blank lines; everything else is kept as text.
+        """
+        segments: list[str | Blocker] = []
+        current: list[str] = []
+        indent: int | None = None
+
+        def flush() -> None:
+            if current:
+                header = _BLOCKER_HEADER.match(current[0])
+                name = header.group(2) if header else ""
+                segments.append(Blocker(name=name, lines=tuple(current)))
+                current.clear()
+
+        for line in content.split("\n"):
+            header = _BLOCKER_HEADER.match(line)
+            if header:
+                flush()
+                current.append(line)
+                indent = len(header.group(1))
+            elif (
+                current
+                and indent is not None
+                and (line.strip() == "" or len(line) - len(line.lstrip()) > indent)
+            ):
+                current.append(line)
+            else:
+                flush()
+                indent = None
+                segments.append(line)
+        flush()
+        return cls(segments=tuple(segments))
+
+    @classmethod
+    def empty(cls, session_id: str) -> "BlockersState":
+        """New blockers document with no active blockers."""
+        return cls.parse(f"""===BLOCKERS===
+META:
+  TYPE::FAST_BLOCKERS
+  VELOCITY::HOURLY_DAILY
+  SESSION::"{session_id}"
+
+ACTIVE:
+
+===END===
+""")
+
+    @property
+    def blockers(self) -> list[Blocker]:
+        """All blockers in document order."""
+        return [segment for segment in self.segments if isinstance(segment, Blocker)]
+
+    def unresolved(self) -> list[Blocker]:
+        """Blockers not marked resolved."""
+        return [blocker for blocker in self.blockers if not blocker.resolved]
+
+    def with_session(self, session_id: str) -> "BlockersState":
+        """Point every SESSION field at session_id."""
+        new_field = f'SESSION::"{session_id}"'
+        segments: list[str | Blocker] = []
+        for segment in self.segments:
+            if isinstance(segment, Blocker):
+                lines = tuple(_SESSION_FIELD.sub(new_field, line) for line in segment.lines)
+                segments.append(replace(segment, lines=lines))
+            else:
+                segments.append(_SESSION_FIELD.sub(new_field, segment))
+        return replace(self, segments=tuple(segments))
+
+    def without_resolved(self) -> "BlockersState":
+        """Drop resolved blockers (with all their fields), keep everything else."""
+        return replace(
+            self,
+            segments=tuple(
+                segment
+                for segment in self.segments
+                if not (isinstance(segment, Blocker) and segment.resolved)
+            ),
+        )
+
+    def render(self) -> str:
+        """Render as blockers.oct.md."""
+        lines: list[str] = []
+        for segment in self.segments:
+            if isinstance(segment, Blocker):
+                lines.extend(segment.lines)
+            else:
+                lines.append(segment)
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class FastState:
+    """All FAST layer files of one project (None where a file is absent)."""
+
+    focus: FocusState | None
+    checklist: ChecklistState | None
+    blockers: BlockersState | None
+
+
+# Parsed models: path -> (mtime_ns, size, model)
+_parsed: dict[Path, tuple[int, int, Any]] = {}
+# Guards _parsed: tools load and store from asyncio.to_thread workers
+_parsed_lock = threading.Lock()
+
+
+def clear_fast_state_cache() -> None:
+    """Drop all cached models."""
+    with _parsed_lock:
+        _parsed.clear()
+
+
+def _load(path: Path, parse: Callable[[str], T]) -> T | None:
+    """Load path with parse, reusing the cached model while the file is unchanged."""
+    try:
+        stat = path.stat()
+    except OSError:
+        with _parsed_lock:
+            _parsed.pop(path, None)
+        return None
+
+    with _parsed_lock:
+        cached = _parsed.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        model: T = cached[2]
+        return model
+
+    try:
+        content = path.read_text()
+    except OSError:
+        return None
+    model = parse(content)
+    with _parsed_lock:
+        _parsed[path] = (stat.st_mtime_ns, stat.st_size, model)
+    return model
+
+
+def load_focus(state_dir: Path) -> FocusState | None:
+    """Parsed current-focus.oct.md, or None if absent."""
+    return _load(state_dir / CURRENT_FOCUS_FILE, FocusState.parse)
+
+
+def load_checklist(state_dir: Path) -> ChecklistState | None:
+    """Parsed checklist.oct.md, or None if absent."""
+    return _load(state_dir / CHECKLIST_FILE, ChecklistState.parse)
+
+
+def load_blockers(state_dir: Path) -> BlockersState | None:
+    """Parsed blockers.oct.md, or None if absent."""
+    return _load(state_dir / BLOCKERS_FILE, BlockersState.parse)
+
+
+def load_fast_state(state_dir: Path) -> FastState:
+    """Parse (or reuse cached models of) all FAST layer files."""
+    return FastState(
+        focus=load_focus(state_dir),
+        checklist=load_checklist(state_dir),
+        blockers=load_blockers(state_dir),
+    )
+
+
+def store(path: Path, model: FocusState | ChecklistState | BlockersState) -> bool:
+    """
+    Render model to path (atomically, only if changed) and cache it.
+
+    Args:
+        path: FAST layer file
+        model: Model to render
+
+    Returns:
+        True if the file was written
+    """
+    written = write_if_changed(path, model.render())
+    try:
+        stat = path.stat()
+    except OSError:
+        with _parsed_lock:
+            _parsed.pop(path, None)
+    else:
+        with _parsed_lock:
+            _parsed[path] = (stat.st_mtime_ns, stat.st_size, model)
+    return written
+
+
+def save_fast_state(state_dir: Path, state: FastState) -> None:
+    """Render and store every present model of state."""
+    if state.focus is not None:
+        store(state_dir / CURRENT_FOCUS_FILE, state.focus)
+    if state.checklist is not None:
+        store(state_dir / CHECKLIST_FILE, state.checklist)
+    if state.blockers is not None:
+        store(state_dir / BLOCKERS_FILE, state.blockers)
@@ -0,0 +1,430 @@
+"""
+Knowledge Store - Optional SQLite FTS5 search over archived session knowledge.
+
+Indexes decisions, blockers, learnings and outcomes from OCTAVE compressions
+into state/sessions/archive/knowledge.sqlite3 for ranked full-text search.
+
+Design:
+- Opt-in via HESTAI_KNOWLEDGE_STORE=1; requires sqlite3 built with FTS5
+  (graceful degradation: unavailable means clock_out simply skips it)
+- learnings-index.jsonl stays the source of truth; the database is a
+  derived index that can be deleted and rebuilt with backfill_knowledge_store()
+- Populated at clock_out from extract_learnings_keys() and
+  extract_context_from_octave(); re-indexing a session replaces its rows
+- Inserts are batched: one transaction per call, however many sessions
+- Search ranks with bm25() and filters by kind, role, focus and time range;
+  times are compared in UTC (naive timestamps are local time)
+- Exposed as the search_knowledge MCP tool (query_knowledge_store), whose
+  backfill flag rebuilds the store from the existing archives first
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from hestai_mcp.modules.tools.shared.context_extraction import extract_context_from_octave
+from hestai_mcp.modules.tools.shared.learnings_index import (
+    LEARNINGS_INDEX_FILE,
+    archive_session_id,
+    extract_learnings_keys,
+)
+
+logger = logging.getLogger(__name__)
+
+KNOWLEDGE_DB_FILE = "knowledge.sqlite3"
+
+# Bump when the schema changes; older databases are rebuilt on open
+SCHEMA_VERSION = 2
+
+KINDS = ("decision", "blocker", "learning", "outcome")
+
+DEFAULT_SEARCH_LIMIT = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    utc TEXT,
+    role TEXT NOT NULL,
+    focus TEXT NOT NULL,
+    octave_path TEXT
+);
+CREATE INDEX IF NOT EXISTS sessions_utc ON sessions (utc);
+CREATE VIRTUAL TABLE IF NOT EXISTS knowledge USING fts5 (
+    content,
+    kind UNINDEXED,
+    session_id UNINDEXED,
+    tokenize = 'unicode61'
+);
+"""
+
+# Section headings of extract_context_from_octave() output -> kind
+_CONTEXT_KINDS = {"DECISIONS": "decision", "OUTCOMES": "outcome", "BLOCKERS": "blocker"}
+
+# Archive names are {YYYY-MM-DD}-{focus}-{session_id}.oct.md
+_ARCHIVE_DATE = re.compile(r"^(\d{4}-\d{2}-\d{2})-")
+
+_fts5_available: bool | None = None
+
+
+def fts5_available() -> bool:
+    """Whether this Python's sqlite3 supports FTS5 (checked once)."""
+    global _fts5_available
+    if _fts5_available is None:
+        try:
+            with closing(sqlite3.connect(":memory:")) as conn:
+                conn.execute("CREATE VIRTUAL TABLE probe USING fts5 (content)")
+            _fts5_available = True
+        except sqlite3.Error:
+            _fts5_available = False
+    return _fts5_available
+
+
+def knowledge_store_enabled() -> bool:
+    """Whether HESTAI_KNOWLEDGE_STORE opts in and FTS5 is available."""
+    enabled = os.environ.get("HESTAI_KNOWLEDGE_STORE", "").strip().lower()
+    return enabled in ("1", "true", "yes") and fts5_available()
+
+
+def _utc(value: str, end_of_day: bool = False) -> str:
+    """
+    ISO 8601 timestamp or date as a comparable UTC string.
+
+    Naive values are local time, as clock_out writes them; a date-only value
+    is midnight, or the last instant of that day when end_of_day is set.
+    """
+    parsed = datetime.fromisoformat(value)
+    if end_of_day and len(value) == 10:
+        parsed += timedelta(days=1, microseconds=-1)
+    if parsed.tzinfo is None:
+        parsed = parsed.astimezone()
+    return parsed.astimezone(UTC).isoformat()
+
+
+@contextmanager
+def _connect(db_path: Path) -> Iterator[sqlite3.Connection]:
+    """Open the store, creating or rebuilding the schema as needed."""
+    conn = sqlite3.connect(db_path, timeout=10.0)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS knowledge")
+                conn.execute("DROP TABLE IF EXISTS sessions")
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        yield conn
+    finally:
+        conn.close()
+
+
+def knowledge_rows(octave_content: str) -> list[tuple[str, str]]:
+    """
+    Extract (kind, content) rows from an OCTAVE compression.
+
+    Decisions, blockers and learnings come from extract_learnings_keys();
+    outcomes (and any decisions/blockers only present as sections) from
+    extract_context_from_octave(). Duplicates are dropped.
+
+    Args:
+        octave_content: OCTAVE formatted session compression
+
+    Returns:
+        Rows in extraction order
+    """
+    keys = extract_learnings_keys(octave_content)
+    rows = [("decision", text) for text in keys["decisions"]]
+    rows += [("blocker", text) for text in keys["blockers"]]
+    rows += [("learning", text) for text in keys["learnings"]]
+
+    kind = None
+    for line in (extract_context_from_octave(octave_content) or "").splitlines():
+        heading = line.rstrip(":")
+        if heading in _CONTEXT_KINDS:
+            kind = _CONTEXT_KINDS[heading]
+        elif kind and line.startswith("- ") and line[2:].strip():
+            rows.append((kind, line[2:].strip()))
+
+    seen: set[tuple[str, str]] = set()
+    unique = []
+    for row in rows:
+        if row not in seen:
+            seen.add(row)
+            unique.append(row)
+    return unique
+
+
+def index_sessions(
+    db_path: Path,
+    sessions: Iterable[tuple[dict[str, Any], str, Path | None]],
+) -> int:
+    """
+    Index sessions in a single transaction.
+
+    Args:
+        db_path: Knowledge store database
+        sessions: (session metadata, OCTAVE content, OCTAVE path) triples;
+            metadata uses the learnings-index.jsonl field names
+
+    Returns:
+        Number of knowledge rows written
+    """
+    written = 0
+    with _connect(db_path) as conn, conn:
+        for session, octave_content, octave_path in sessions:
+            session_id = str(session.get("session_id", "unknown"))
+            timestamp = str(session.get("timestamp", ""))
+            try:
+                utc: str | None = _utc(timestamp)
+            except ValueError:
+                utc = None  # Unknown time: matched only without since/until
+            conn.execute("DELETE FROM knowledge WHERE session_id = ?", (session_id,))
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    session_id,
+                    timestamp,
+                    utc,
+                    str(session.get("role", "unknown")),
+                    str(session.get("focus", "general")),
+                    str(octave_path) if octave_path else None,
+                ),
+            )
+            rows = knowledge_rows(octave_content)
+            conn.executemany(
+                "INSERT INTO knowledge (content, kind, session_id) VALUES (?, ?, ?)",
+                [(content, kind, session_id) for kind, content in rows],
+            )
+            written += len(rows)
+    return written
+
+
+def index_session(
+    archive_dir: Path,
+    session_data: dict[str, Any],
+    octave_content: str,
+    octave_path: Path | None = None,
+) -> None:
+    """
+    Add one session to the archive's knowledge store (clock_out hook).
+
+    Graceful degradation: failures are logged, never raised.
+
+    Args:
+        archive_dir: Session archive directory
+        session_data: Session metadata (session_id, role, focus, ...)
+        octave_content: The session's OCTAVE compression
+        octave_path: Where the compression was saved
+    """
+    session = {"timestamp": datetime.now().isoformat(), **session_data}
+    try:
+        count = index_sessions(
+            archive_dir / KNOWLEDGE_DB_FILE, [(session, octave_content, octave_path)]
+        )
+        logger.info(f"Indexed {count} knowledge rows for session {session.get('session_id')}")
+    except Exception as e:
+        # Non-blocking: the store is derived data, never fail clock_out over it
+        logger.warning(f"Failed to update knowledge store: {e}")
+
+
+def backfill_knowledge_store(archive_dir: Path) -> dict[str, int]:
+    """
+    Rebuild the knowledge store from existing *.oct.md archives.
+
+    Session metadata comes from learnings-index.jsonl where an entry's
+    session_id matches the archive name; otherwise it is derived from the
+    file name ({date}-{focus}-{session_id}.oct.md).
+
+    Args:
+        archive_dir: Session archive directory
+
+    Returns:
+        dict with "sessions" and "rows" indexed
+    """
+    counts = {"sessions": 0, "rows": 0}
+    metadata: dict[str, dict[str, Any]] = {}
+    index_path = archive_dir / LEARNINGS_INDEX_FILE
+    if index_path.exists():
+        with index_path.open() as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                metadata[str(entry.get("session_id"))] = entry
+
+    session_ids = set(metadata)
+
+    def sessions() -> Iterator[tuple[dict[str, Any], str, Path | None]]:
+        for octave_path in sorted(archive_dir.glob("*.oct.md")):
+            stem = octave_path.name.removesuffix(".oct.md")
+            session_id = archive_session_id(stem, session_ids)
+            if session_id is not None:
+                session = metadata[session_id]
+            else:
+                date = _ARCHIVE_DATE.match(stem)
+                session = {
+                    "session_id": stem,
+                    "timestamp": date.group(1) if date else "",
+                }
+            try:
+                octave_content = octave_path.read_text()
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Skipping unreadable archive {octave_path}: {e}")
+                continue
+            counts["sessions"] += 1
+            yield session, octave_content, octave_path
+
+    counts["rows"] = index_sessions(archive_dir / KNOWLEDGE_DB_FILE, sessions())
+    return counts
+
+
+def search_knowledge(
+    archive_dir: Path,
+    query: str,
+    kinds: Iterable[str] | None = None,
+    role: str | None = None,
+    focus: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+) -> list[dict[str, Any]]:
+    """
+    Ranked full-text search over the archive's knowledge store.
+
+    Args:
+        archive_dir: Session archive directory
+        query: Search terms; every term must match (quoted as FTS5 strings,
+            so user input is never interpreted as query syntax)
+        kinds: Restrict to these kinds (decision, blocker, learning, outcome)
+        role: Filter by session role (case-insensitive)
+        focus: Filter by session focus (case-insensitive)
+        since: Earliest session timestamp or date (ISO 8601, inclusive)
+        until: Latest session timestamp or date (ISO 8601, inclusive)
+        limit: Maximum results
+
+    Returns:
+        Best matches first: dicts with kind, content, snippet, rank and the
+        session's session_id, timestamp, role, focus and octave_path
+        (empty when the store does not exist)
+
+    Raises:
+        ValueError: If since or until is not a valid ISO 8601 value
+    """
+    db_path = archive_dir / KNOWLEDGE_DB_FILE
+    terms = [term for term in query.split() if term]
+    if not terms or not db_path.exists():
+        return []
+
+    match = " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+    sql = [
+        "SELECT k.kind, k.content, snippet(knowledge, 0, '[', ']', '...', 12),",
+        "bm25(knowledge), s.session_id, s.timestamp, s.role, s.focus, s.octave_path",
+        "FROM knowledge AS k JOIN sessions AS s ON s.session_id = k.session_id",
+        "WHERE knowledge MATCH ?",
+    ]
+    params: list[Any] = [match]
+    if kinds is not None:
+        kinds = list(kinds)
+        sql.append(f"AND k.kind IN ({', '.join('?' for _ in kinds)})")
+        params += kinds
+    if role:
+        sql.append("AND lower(s.role) = lower(?)")
+        params.append(role)
+    if focus:
+        sql.append("AND lower(s.focus) = lower(?)")
+        params.append(focus)
+    if since:
+        sql.append("AND s.utc >= ?")
+        params.append(_utc(since))
+    if until:
+        sql.append("AND s.utc <= ?")
+        params.append(_utc(until, end_of_day=True))
+    sql.append("ORDER BY bm25(knowledge) LIMIT ?")
+    params.append(limit)
+
+    with _connect(db_path) as conn:
+        rows = conn.execute(" ".join(sql), params).fetchall()
+    columns = (
+        "kind",
+        "content",
+        "snippet",
+        "rank",
+        "session_id",
+        "timestamp",
+        "role",
+        "focus",
+        "octave_path",
+    )
+    return [dict(zip(columns, row, strict=True)) for row in rows]
+
+
+def query_knowledge_store(
+    project_root: Path,
+    query: str,
+    kinds: Iterable[str] | None = None,
+    role: str | None = None,
+    focus: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    backfill: bool = False,
+) -> dict[str, Any]:
+    """
+    Search a project's knowledge store (search_knowledge MCP tool).
+
+    Args:
+        project_root: Project root directory
+        query: Search terms (all must match)
+        kinds: Restrict to these kinds (decision, blocker, learning, outcome)
+        role: Filter by session role
+        focus: Filter by session focus
+        since: Earliest session timestamp or date (ISO 8601, inclusive)
+        until: Latest session timestamp or date (ISO 8601, inclusive)
+        limit: Maximum results
+        backfill: Rebuild the store from the archived *.oct.md files first
+
+    Returns:
+        dict with "results" (best first), "count", "enabled" (whether
+        clock_out populates the store) and, when backfilled, "backfilled"
+        session/row counts
+
+    Raises:
+        ValueError: If kinds contains an unknown kind, since or until is not
+            valid ISO 8601, or sqlite3 lacks FTS5
+    """
+    if kinds is not None:
+        kinds = list(kinds)
+        unknown = sorted(set(kinds) - set(KINDS))
+        if unknown:
+            raise ValueError(f"Unknown knowledge kinds {unknown}; expected {list(KINDS)}")
+    if not fts5_available():
+        raise ValueError("Knowledge store unavailable: sqlite3 is built without FTS5")
+
+    archive_dir = project_root / ".hestai" / "state" / "sessions" / "archive"
+    result: dict[str, Any] = {}
+    if backfill and archive_dir.is_dir():
+        result["backfilled"] = backfill_knowledge_store(archive_dir)
+    results = search_knowledge(
+        archive_dir,
+        query,
+        kinds=kinds,
+        role=role,
+        focus=focus,
+        since=since,
+        until=until,
+        limit=limit,
+    )
+    return {
+        "results": results,
+        "count": len(results),
+        "enabled": knowledge_store_enabled(),
+        **result,
+    }
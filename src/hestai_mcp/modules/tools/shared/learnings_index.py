@@ -8,18 +8,49 @@ Design:
 - Extract structured keys from OCTAVE content
 - Create JSONL entries with session metadata
 - Atomic append to learnings-index.jsonl
-- Enable future search/retrieval of session wisdom
+- Search via an inverted index kept alongside the JSONL
+
+Query engine:
+- learnings-index.postings.jsonl holds one record per indexed entry: its byte
+  offset in the JSONL, timestamp, role, focus and keyword tokens, plus the
+  JSONL inode it was built from
+- The postings file is maintained incrementally: only JSONL bytes past the
+  last indexed offset are tokenized (entries written by older versions are
+  picked up the same way)
+- A JSONL that was replaced (new inode) or truncated (smaller than the
+  indexed offset) invalidates the postings; they are rebuilt from scratch
+- In memory, tokens/roles/focuses map to entry offsets and timestamps are
+  kept sorted for range bisection; matching entries are read by seeking to
+  their offsets, so queries never scan the JSONL
 """
 
+import bisect
+import contextlib
+import heapq
 import json
 import logging
 import re
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from hestai_mcp.modules.tools.shared.octave_scanner import scan_octave
+
 logger = logging.getLogger(__name__)
 
+LEARNINGS_INDEX_FILE = "learnings-index.jsonl"
+POSTINGS_FILE = "learnings-index.postings.jsonl"
+
+# Entry fields whose text is searchable by keyword
+SEARCHABLE_FIELDS = ("focus", "decisions", "blockers", "learnings")
+
+DEFAULT_QUERY_LIMIT = 20
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+_DECISION_KEY = re.compile(r"DECISION_\d+")
+
 
 def extract_learnings_keys(octave_content: str) -> dict[str, list[str]]:
     """
@@ -48,25 +79,18 @@ def extract_learnings_keys(octave_content: str) -> dict[str, list[str]]:
     """
     keys: dict[str, list[str]] = {"decisions": [], "blockers": [], "learnings": []}
 
-    # Extract DECISION_N patterns
-    decision_pattern = r"DECISION_\d+::(.*?)(?=DECISION_\d+::|$)"
-    decision_matches = re.findall(decision_pattern, octave_content, re.DOTALL)
-    keys["decisions"] = [d.strip() for d in decision_matches if d.strip()]
+    scan = scan_octave(octave_content)
+
+    # Extract DECISION_N assignments (value runs to the end of its list item)
+    keys["decisions"] = [d for d in scan.values(_DECISION_KEY) if d]
 
     # Extract blocker patterns (blocker_name⊗status[details])
     blocker_pattern = r"(\w+)⊗(resolved|blocked)\[([^\]]+)\]"
     blocker_matches = re.findall(blocker_pattern, octave_content)
     keys["blockers"] = [f"{name}⊗{status}[{details}]" for name, status, details in blocker_matches]
 
-    # Extract learnings from LEARNINGS section
-    learnings_section_pattern = r"LEARNINGS::\[(.*?)\]"
-    learnings_match = re.search(learnings_section_pattern, octave_content, re.DOTALL)
-
-    if learnings_match:
-        learnings_content = learnings_match.group(1).strip()
-        # Split on commas (OCTAVE list separator)
-        learning_items = [item.strip() for item in learnings_content.split(",")]
-        keys["learnings"] = [item for item in learning_items if item]
+    # Extract learnings from LEARNINGS section (bracket-balanced list items)
+    keys["learnings"] = scan.items("LEARNINGS")
 
     return keys
 
@@ -102,7 +126,7 @@ def append_to_learnings_index(
         }
     """
     # Create learnings index path
-    index_path = archive_dir / "learnings-index.jsonl"
+    index_path = archive_dir / LEARNINGS_INDEX_FILE
 
     # Build index entry
     index_entry = {
@@ -123,6 +147,318 @@ def append_to_learnings_index(
 
         logger.info(f"Appended learnings index for session {session_data.get('session_id')}")
 
+        # Index the new entry now so the next query does not have to
+        get_learnings_index(archive_dir).refresh()
+
     except Exception as e:
         # Non-blocking: Log warning but don't fail clock_out
         logger.warning(f"Failed to append to learnings index: {e}")
+
+
+def archive_session_id(stem: str, session_ids: set[str]) -> str | None:
+    """The session id ending an archive name ({date}-{focus}-{session_id}), if known."""
+    parts = stem.split("-")
+    for start in range(1, len(parts)):
+        candidate = "-".join(parts[start:])
+        if candidate in session_ids:
+            return candidate
+    return None
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens of text (single characters dropped)."""
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if len(token) > 1]
+
+
+def _entry_tokens(entry: dict[str, Any]) -> set[str]:
+    tokens: set[str] = set()
+    for field_name in SEARCHABLE_FIELDS:
+        value = entry.get(field_name)
+        for text in value if isinstance(value, list) else [value]:
+            if isinstance(text, str):
+                tokens.update(tokenize(text))
+    return tokens
+
+
+def _sortable_time(value: str | datetime) -> datetime:
+    """Parse a timestamp, normalizing aware values to naive local time."""
+    parsed = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+@dataclass
+class LearningsIndex:
+    """Inverted index over one archive's learnings-index.jsonl."""
+
+    archive_dir: Path
+    # JSONL inode and bytes covered by postings
+    inode: int | None = None
+    indexed_to: int = 0
+    # Postings inode and bytes already loaded
+    postings_inode: int | None = None
+    postings_read_to: int = 0
+    tokens: dict[str, set[int]] = field(default_factory=dict)
+    roles: dict[str, set[int]] = field(default_factory=dict)
+    focuses: dict[str, set[int]] = field(default_factory=dict)
+    times: dict[int, datetime] = field(default_factory=dict)
+    # (timestamp, offset) pairs kept sorted for range bisection
+    timeline: list[tuple[datetime, int]] = field(default_factory=list)
+
+    @property
+    def index_path(self) -> Path:
+        """The learnings JSONL."""
+        return self.archive_dir / LEARNINGS_INDEX_FILE
+
+    @property
+    def postings_path(self) -> Path:
+        """The postings sidecar."""
+        return self.archive_dir / POSTINGS_FILE
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def refresh(self) -> None:
+        """Load new postings, then index any JSONL entries not yet in them."""
+        try:
+            stat = self.index_path.stat()
+        except OSError:
+            self._clear()
+            return
+        if self.inode is not None and (stat.st_ino != self.inode or stat.st_size < self.indexed_to):
+            self._rebuild()
+        self.inode = stat.st_ino
+        self._load_postings(stat.st_ino, stat.st_size)
+        self._index_tail(stat.st_size)
+
+    def _clear(self) -> None:
+        """Forget everything loaded or indexed in memory."""
+        self.inode = self.postings_inode = None
+        self.indexed_to = self.postings_read_to = 0
+        self.tokens.clear()
+        self.roles.clear()
+        self.focuses.clear()
+        self.times.clear()
+        self.timeline.clear()
+
+    def _rebuild(self) -> None:
+        """Drop postings built from a replaced or truncated JSONL."""
+        logger.info(f"Re-indexing {self.index_path} (file replaced or truncated)")
+        self._clear()
+        with contextlib.suppress(FileNotFoundError):
+            self.postings_path.unlink()
+
+    def _add(self, record: dict[str, Any]) -> None:
+        offset = int(record["o"])
+        if offset in self.times:
+            return  # Indexed concurrently by another process
+        try:
+            timestamp = _sortable_time(str(record["ts"]))
+        except ValueError:
+            timestamp = datetime.min
+        self.times[offset] = timestamp
+        bisect.insort(self.timeline, (timestamp, offset))
+        for token in record["t"]:
+            self.tokens.setdefault(token, set()).add(offset)
+        self.roles.setdefault(str(record["r"]).lower(), set()).add(offset)
+        self.focuses.setdefault(str(record["f"]).lower(), set()).add(offset)
+
+    def _load_postings(self, inode: int, jsonl_size: int) -> None:
+        try:
+            postings_stat = self.postings_path.stat()
+        except OSError:
+            return
+        size = postings_stat.st_size
+        if self.postings_inode is not None and (
+            postings_stat.st_ino != self.postings_inode or size < self.postings_read_to
+        ):
+            # Rebuilt by another process: reload from the start
+            self._clear()
+            self.inode = inode
+        self.postings_inode = postings_stat.st_ino
+        if size <= self.postings_read_to:
+            return
+        with self.postings_path.open("rb") as f:
+            f.seek(self.postings_read_to)
+            chunk = f.read(size - self.postings_read_to)
+        complete, newline, _torn = chunk.rpartition(b"\n")
+        if not newline:
+            return
+        for line in complete.split(b"\n"):
+            try:
+                record = json.loads(line)
+                if record.get("i") != inode or int(record["e"]) > jsonl_size:
+                    # Built from a JSONL that has since been replaced or truncated
+                    self._rebuild()
+                    self.inode = inode
+                    return
+                self._add(record)
+                self.indexed_to = max(self.indexed_to, int(record["e"]))
+            except (ValueError, KeyError, TypeError):
+                continue
+        self.postings_read_to += len(complete) + 1
+
+    def _index_tail(self, size: int) -> None:
+        if size <= self.indexed_to:
+            return
+
+        postings: list[str] = []
+        offset = self.indexed_to
+        with self.index_path.open("rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Entry still being written
+                end = offset + len(raw)
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    offset = end
+                    continue
+                record = {
+                    "i": self.inode,
+                    "o": offset,
+                    "e": end,
+                    "ts": str(entry.get("timestamp", "")),
+                    "r": str(entry.get("role", "unknown")),
+                    "f": str(entry.get("focus", "general")),
+                    "t": sorted(_entry_tokens(entry)),
+                }
+                self._add(record)
+                postings.append(json.dumps(record, ensure_ascii=False))
+                offset = end
+
+        if postings:
+            with self.postings_path.open("a", encoding="utf-8") as out:
+                out.write("\n".join(postings) + "\n")
+            # Our own appends need not be re-read
+            postings_stat = self.postings_path.stat()
+            self.postings_inode = postings_stat.st_ino
+            self.postings_read_to = postings_stat.st_size
+        self.indexed_to = offset
+
+    def query(
+        self,
+        keywords: str | None = None,
+        role: str | None = None,
+        focus: str | None = None,
+        since: str | datetime | None = None,
+        until: str | datetime | None = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+    ) -> list[dict[str, Any]]:
+        """
+        Find entries matching every given filter, newest first.
+
+        Args:
+            keywords: Whitespace-separated terms; all must match (case-insensitive).
+                Keywords without a searchable term (single characters,
+                punctuation) match nothing
+            role: Exact role (case-insensitive)
+            focus: Exact focus (case-insensitive)
+            since: Earliest timestamp (inclusive, ISO 8601)
+            until: Latest timestamp (inclusive, ISO 8601)
+            limit: Maximum entries returned
+
+        Returns:
+            Matching JSONL entries
+
+        Raises:
+            ValueError: If since or until is not a valid ISO 8601 timestamp
+        """
+        self.refresh()
+        low = _sortable_time(since) if since is not None else None
+        high = _sortable_time(until) if until is not None else None
+
+        terms = set(tokenize(keywords or ""))
+        if keywords and keywords.strip() and not terms:
+            return []
+        postings: list[set[int]] = [self.tokens.get(token, set()) for token in terms]
+        if role:
+            postings.append(self.roles.get(role.lower(), set()))
+        if focus:
+            postings.append(self.focuses.get(focus.lower(), set()))
+
+        if not postings:
+            # Time-only query: walk the timeline backwards from the upper bound
+            start = len(self.timeline)
+            if high is not None:
+                start = bisect.bisect_right(self.timeline, (high, float("inf")))
+            stop = bisect.bisect_left(self.timeline, (low, -1)) if low is not None else 0
+            window = self.timeline[max(stop, start - max(limit, 0)) : start]
+            return self._read_entries([offset for _ts, offset in reversed(window)])
+
+        # Intersect smallest posting list first
+        postings.sort(key=len)
+        matches = set(postings[0])
+        for posting in postings[1:]:
+            matches &= posting
+        if low is not None or high is not None:
+            matches = {
+                offset
+                for offset in matches
+                if (low is None or self.times[offset] >= low)
+                and (high is None or self.times[offset] <= high)
+            }
+        newest = heapq.nlargest(max(limit, 0), matches, key=lambda o: (self.times[o], o))
+        return self._read_entries(newest)
+
+    def _read_entries(self, offsets: list[int]) -> list[dict[str, Any]]:
+        entries: list[dict[str, Any]] = []
+        if not offsets:
+            return entries
+        with self.index_path.open("rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                try:
+                    entries.append(json.loads(f.readline()))
+                except ValueError:
+                    continue
+        return entries
+
+
+# One index per archive directory, kept for the life of the process
+_indexes: dict[Path, LearningsIndex] = {}
+
+
+def get_learnings_index(archive_dir: Path) -> LearningsIndex:
+    """Return the process-wide index for archive_dir."""
+    index = _indexes.get(archive_dir)
+    if index is None:
+        index = _indexes[archive_dir] = LearningsIndex(archive_dir)
+    return index
+
+
+def query_learnings(
+    project_root: Path,
+    keywords: str | None = None,
+    role: str | None = None,
+    focus: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int = DEFAULT_QUERY_LIMIT,
+) -> dict[str, Any]:
+    """
+    Search a project's learnings index.
+
+    Args:
+        project_root: Project root directory
+        keywords: Whitespace-separated terms (all must match)
+        role: Filter by agent role
+        focus: Filter by session focus
+        since: Earliest timestamp (ISO 8601)
+        until: Latest timestamp (ISO 8601)
+        limit: Maximum entries returned
+
+    Returns:
+        dict with "entries" (newest first), "count" and "indexed" (total entries)
+
+    Raises:
+        ValueError: If since or until is not a valid ISO 8601 timestamp
+    """
+    archive_dir = project_root / ".hestai" / "state" / "sessions" / "archive"
+    index = get_learnings_index(archive_dir)
+    entries = index.query(
+        keywords=keywords, role=role, focus=focus, since=since, until=until, limit=limit
+    )
+    return {"entries": entries, "count": len(entries), "indexed": len(index)}
@@ -0,0 +1,177 @@
+"""
+OCTAVE Scanner - Single-pass structure scan shared by the compression consumers.
+
+Context extraction, learnings indexing and claim verification all read the
+same OCTAVE compression. scan_octave() tokenizes it once into named lists
+(bracket-balanced, comma-separated items) and KEY::value assignments; the
+result is cached so each consumer reuses the same scan.
+
+Design:
+- One left-to-right pass over structural tokens ([ ] , " newline KEY::),
+  so cost is linear in document size (no lazy DOTALL backtracking)
+- Items split only on commas at the list's own depth and outside double
+  quotes: "a, b" and BECAUSE[x, y] stay inside one item (a quote left open
+  at end of line is closed there)
+- An assignment's value runs to the end of its list item, or to the end of
+  the line at top level
+- Lists still open at end of input are closed there (truncated LLM output
+  keeps the items it has); repeated names keep the first occurrence
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+# Structural tokens; the KEY before "::" is recovered by walking back
+_TOKEN = re.compile(r'::|[\[\],"\n]')
+
+_KEY_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+_IDENTIFIER_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz") | _KEY_CHARS
+
+# Distinct documents kept scanned (clock_out handles one compression at a time)
+SCAN_CACHE_SIZE = 8
+
+
+@dataclass(frozen=True)
+class OctaveScan:
+    """Lists and assignments of one OCTAVE document."""
+
+    content: str = field(default="", repr=False)
+    # First occurrence of each NAME::[...] -> stripped, non-empty items
+    lists: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    # Every KEY::value in document order as (key, value start, value end);
+    # values are sliced on demand so unterminated input stays linear
+    assignments: tuple[tuple[str, int, int], ...] = ()
+
+    def items(self, name: str) -> list[str]:
+        """Items of list name (empty if absent)."""
+        return list(self.lists.get(name, ()))
+
+    def values(self, key_pattern: re.Pattern[str]) -> list[str]:
+        """Stripped values of assignments whose key fully matches key_pattern."""
+        return [
+            self.content[start:end].strip()
+            for key, start, end in self.assignments
+            if key_pattern.fullmatch(key)
+        ]
+
+
+@dataclass
+class _Frame:
+    """An open bracket: its list name (None if anonymous) and item boundaries."""
+
+    name: str | None
+    opened: int
+    item_start: int
+    items: list[str] = field(default_factory=list)
+
+
+@lru_cache(maxsize=SCAN_CACHE_SIZE)
+def scan_octave(content: str) -> OctaveScan:
+    """
+    Scan an OCTAVE document once.
+
+    Args:
+        content: OCTAVE text
+
+    Returns:
+        OctaveScan with named lists and assignments
+    """
+    lists: dict[str, tuple[str, ...]] = {}
+    # Where each kept list opened (nested/unterminated repeats keep the first)
+    opened: dict[str, int] = {}
+    assignments: list[tuple[int, str, int]] = []
+    stack: list[_Frame] = []
+    # Open assignments: (depth, key, value start)
+    pending: list[tuple[int, str, int]] = []
+    in_quotes = False
+    # Key whose "::" ended exactly here (a following "[" names a list)
+    key_end, key_name = -1, ""
+
+    def close_assignments(depth: int, end: int) -> None:
+        while pending and pending[-1][0] >= depth:
+            _depth, key, start = pending.pop()
+            assignments.append((start, key, end))
+
+    def end_item(frame: _Frame, end: int) -> None:
+        if frame.name is None:
+            return  # Anonymous brackets (BECAUSE[...]) only affect depth
+        item = content[frame.item_start : end].strip()
+        if item:
+            frame.items.append(item)
+
+    def keep(frame: _Frame) -> None:
+        name = frame.name
+        if name is not None and (name not in lists or frame.opened < opened[name]):
+            lists[name] = tuple(frame.items)
+            opened[name] = frame.opened
+
+    for match in _TOKEN.finditer(content):
+        position = match.start()
+        char = content[position]
+        if in_quotes:
+            if char == '"':
+                in_quotes = False
+                continue
+            if char != "\n":
+                continue
+            in_quotes = False  # Strings do not span lines; recover from a stray quote
+
+        if char == ",":
+            if stack:
+                frame = stack[-1]
+                if pending and pending[-1][0] >= len(stack):
+                    close_assignments(len(stack), position)
+                end_item(frame, position)
+                frame.item_start = position + 1
+        elif char == "\n":
+            if pending and not stack:
+                close_assignments(0, position)
+        elif char == ":":
+            start = position
+            while start and content[start - 1] in _KEY_CHARS:
+                start -= 1
+            if (
+                start < position
+                and "A" <= content[start] <= "Z"
+                and not (start and content[start - 1] in _IDENTIFIER_CHARS)
+            ):
+                key_end, key_name = match.end(), content[start:position]
+                pending.append((len(stack), key_name, key_end))
+        elif char == "[":
+            name = key_name if position == key_end else None
+            stack.append(_Frame(name, position, position + 1))
+        elif char == "]":
+            if not stack:
+                continue  # Stray closing bracket
+            close_assignments(len(stack), position)
+            frame = stack.pop()
+            end_item(frame, position)
+            keep(frame)
+        else:
+            in_quotes = True
+
+    # Close lists left open at end of input, innermost first. Each one's last
+    # item ends at the line where the list nested in it opened, so repeated
+    # cut-off sections stay separate (and linear to slice).
+    end = len(content)
+    child_opened = end
+    while stack:
+        close_assignments(len(stack), end)
+        frame = stack.pop()
+        cut = end
+        if child_opened < end:
+            cut = content.rfind("\n", frame.item_start, child_opened)
+            if cut == -1:
+                cut = child_opened
+        end_item(frame, cut)
+        keep(frame)
+        child_opened = frame.opened
+    close_assignments(0, end)
+
+    assignments.sort()
+    return OctaveScan(
+        content=content,
+        lists=lists,
+        assignments=tuple((key, start, end) for start, key, end in assignments),
+    )
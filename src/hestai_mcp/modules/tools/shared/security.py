@@ -5,12 +5,27 @@ Provides RedactionEngine class for detecting and redacting sensitive data
 from session transcripts before archival to prevent credential leakage.
 
 Fail-closed design: If redaction fails, archival is blocked.
+
+Large transcripts are redacted in parallel: newline-aligned chunks are fanned
+out to a process pool and written back in order to a temp file that is
+atomically renamed over the destination on success. The pool never forks the
+(multi-threaded) server process; workers start from a forkserver or spawn.
 """
 
+import logging
+import multiprocessing
+import os
 import re
+import tempfile
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from re import Pattern
 
+logger = logging.getLogger(__name__)
+
 
 class RedactionEngine:
     """
@@ -64,6 +79,16 @@ class RedactionEngine:
         ),
     }
 
+    # Transcripts at or above this size are redacted in a process pool.
+    # Below it, process startup costs more than the regex work it saves.
+    PARALLEL_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+    # Approximate size (in characters) of each newline-aligned chunk
+    PARALLEL_CHUNK_CHARS = 1024 * 1024
+
+    # Upper bound on worker processes for parallel redaction
+    PARALLEL_MAX_WORKERS = 8
+
     @classmethod
     def redact_content(cls, text: str) -> str:
         """
@@ -75,12 +100,7 @@ class RedactionEngine:
         Returns:
             Text with secrets replaced by redaction markers
         """
-        result = text
-
-        for _pattern_name, (pattern, replacement) in cls.PATTERNS.items():
-            result = pattern.sub(replacement, result)
-
-        return result
+        return _apply_patterns(text, cls.PATTERNS)
 
     @classmethod
     def copy_and_redact(cls, src: Path, dst: Path) -> None:
@@ -89,6 +109,9 @@ class RedactionEngine:
 
         Stream-based processing for memory efficiency with large files.
         Processes line-by-line to avoid loading entire file into memory.
+        Sources at or above PARALLEL_THRESHOLD_BYTES are redacted in a
+        process pool (see _copy_and_redact_parallel); smaller sources use
+        the in-process path.
         Fail-closed: raises exception if source doesn't exist or redaction fails.
         If redaction fails, destination file is not created (or deleted if partially written).
 
@@ -104,6 +127,15 @@ class RedactionEngine:
         if not src.exists():
             raise FileNotFoundError(f"Source file not found: {src}")
 
+        if src.stat().st_size >= cls.PARALLEL_THRESHOLD_BYTES:
+            try:
+                cls._copy_and_redact_parallel(src, dst)
+                return
+            except BrokenProcessPool as e:
+                # Pool could not start or a worker died (e.g. sandboxed host).
+                # Redaction itself did not fail, so the in-process path is safe.
+                logger.warning(f"Parallel redaction unavailable, using in-process path: {e}")
+
         # Stream line-by-line for memory efficiency (HIGH-1)
         # This prevents loading multi-MB session files entirely into memory
         # Fail-closed: if redaction fails, clean up partial output
@@ -120,3 +152,112 @@ class RedactionEngine:
             if dst.exists():
                 dst.unlink()
             raise
+
+    @classmethod
+    def _copy_and_redact_parallel(cls, src: Path, dst: Path) -> None:
+        """
+        Redact src into dst using a process pool, preserving line order.
+
+        Newline-aligned chunks are submitted to worker processes and their
+        results are written back strictly in submission order. At most
+        2 x workers chunks are in flight, so memory stays bounded regardless
+        of transcript size. Output goes to a temp file in dst's directory
+        which is fsynced and renamed over dst only after every chunk
+        succeeded - readers never observe a partially redacted archive.
+
+        Workers are started with forkserver (or spawn where unavailable):
+        this runs inside a threaded asyncio server, and forking it could
+        copy locks held by other threads into the child. Fresh workers
+        re-import this module, so cls.PATTERNS is handed to them through
+        the pool initializer to keep subclass/patched patterns intact.
+
+        Args:
+            src: Source file path
+            dst: Destination file path
+
+        Raises:
+            BrokenProcessPool: If the pool cannot run (caller falls back)
+            Exception: If redaction fails (destination not created)
+        """
+        workers = max(1, min(os.cpu_count() or 1, cls.PARALLEL_MAX_WORKERS))
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{dst.name}.", suffix=".tmp", dir=dst.parent)
+        tmp_path = Path(tmp_name)
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_pool_context(),
+            initializer=_init_redaction_worker,
+            initargs=(cls.PATTERNS,),
+        )
+        try:
+            with (
+                open(src, encoding="utf-8") as src_file,
+                os.fdopen(fd, "w", encoding="utf-8") as dst_file,
+            ):
+                pending: deque[Future[str]] = deque()
+                for chunk in _iter_line_chunks(src_file, cls.PARALLEL_CHUNK_CHARS):
+                    pending.append(pool.submit(_redact_lines, chunk))
+                    if len(pending) >= workers * 2:
+                        dst_file.write(pending.popleft().result())
+                while pending:
+                    dst_file.write(pending.popleft().result())
+                dst_file.flush()
+                os.fsync(dst_file.fileno())
+            os.replace(tmp_path, dst)
+        except BaseException:
+            # Fail-closed: never leave the temp file behind
+            tmp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _apply_patterns(text: str, patterns: dict[str, tuple[Pattern[str], str]]) -> str:
+    """Apply every (pattern, replacement) pair to text in definition order."""
+    result = text
+    for _pattern_name, (pattern, replacement) in patterns.items():
+        result = pattern.sub(replacement, result)
+    return result
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Return a start method that never forks the calling process."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+# Patterns installed by _init_redaction_worker in each pool worker
+_worker_patterns: dict[str, tuple[Pattern[str], str]] | None = None
+
+
+def _init_redaction_worker(patterns: dict[str, tuple[Pattern[str], str]]) -> None:
+    """Pool initializer: install the submitting engine's patterns."""
+    global _worker_patterns
+    _worker_patterns = patterns
+
+
+def _iter_line_chunks(lines: Iterable[str], chunk_chars: int) -> Iterator[list[str]]:
+    """Group lines into newline-aligned chunks of roughly chunk_chars characters."""
+    chunk: list[str] = []
+    size = 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line)
+        if size >= chunk_chars:
+            yield chunk
+            chunk = []
+            size = 0
+    if chunk:
+        yield chunk
+
+
+def _redact_lines(lines: list[str]) -> str:
+    """
+    Redact a chunk line-by-line (process pool worker).
+
+    Lines are redacted individually rather than as one joined string so that
+    anchored patterns (db_password's end-of-string lookahead) behave exactly
+    as they do in the in-process path.
+    """
+    patterns = _worker_patterns if _worker_patterns is not None else RedactionEngine.PATTERNS
+    return "".join(_apply_patterns(line, patterns) for line in lines)
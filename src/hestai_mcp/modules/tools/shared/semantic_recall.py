@@ -0,0 +1,465 @@
+"""
+Semantic Recall - Local vector index of prior LEARNINGS and DECISIONS.
+
+clock_in surfaces the few archived learnings/decisions most relevant to the
+current role and focus instead of loading whole context files.
+
+Design:
+- CPU-only and dependency-free: texts are embedded by feature hashing
+  (word unigrams + bigrams, signed buckets), L2-normalized and quantized to
+  int8, so vectors live in a flat file of DIMENSIONS bytes per item
+- Sources: learnings-index.jsonl entries (incrementally, past the last
+  indexed byte offset) and archived .oct.md files that have no JSONL entry
+  (backfilled at clock_out only; clock_in just embeds new JSONL entries)
+- Updates hold an exclusive fcntl.flock on recall.lock and re-read the items
+  under it; items already present (same source and text) are skipped, so
+  concurrent clock_outs never embed an entry twice. Item loads take the same
+  in-process lock, so searches racing an update never load a line twice
+- Vector rows are aligned to committed item lines (counted as they are read)
+- JSONL items record the learnings-index.jsonl inode; a replaced or truncated
+  JSONL (new inode, or smaller than the indexed offset) rebuilds the index
+- recall-vectors.i8 is appended before recall-items.jsonl; item lines are
+  the commit record, so vectors past the last complete item (a crash between
+  the two appends) are truncated on the next update
+- Queries memory-map the vector file and score brute force; the query
+  vector is sparse, so each item costs one multiply per non-zero query
+  bucket rather than a full DIMENSIONS-wide dot product
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import math
+import mmap
+import os
+import re
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from hestai_mcp.modules.tools.shared.learnings_index import (
+    LEARNINGS_INDEX_FILE,
+    archive_session_id,
+    extract_learnings_keys,
+)
+
+logger = logging.getLogger(__name__)
+
+VECTORS_FILE = "recall-vectors.i8"
+ITEMS_FILE = "recall-items.jsonl"
+LOCK_FILE = "recall.lock"
+
+# Embedding width (bytes per stored vector)
+DIMENSIONS = 256
+
+DEFAULT_RECALL_LIMIT = 5
+
+# Score bonuses for items from sessions with the same role / focus
+ROLE_BOOST = 0.1
+FOCUS_BOOST = 0.2
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# JSONL entry field -> recalled item kind
+_RECALLED_KINDS = {"decisions": "decision", "learnings": "learning"}
+
+
+def _features(text: str) -> list[str]:
+    words = [word for word in _WORD_PATTERN.findall(text.lower()) if len(word) > 1]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:], strict=False)]
+
+
+def embed(text: str) -> dict[int, float]:
+    """
+    Sparse unit-length hashed embedding of text.
+
+    Args:
+        text: Text to embed
+
+    Returns:
+        Non-zero buckets (bucket -> weight); empty for text without words
+    """
+    vector: dict[int, float] = {}
+    for feature in _features(text):
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=4).digest()
+        bucket = int.from_bytes(digest[:2], "little") % DIMENSIONS
+        sign = 1.0 if digest[2] & 1 else -1.0
+        vector[bucket] = vector.get(bucket, 0.0) + sign
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    return {bucket: weight / norm for bucket, weight in vector.items() if weight} if norm else {}
+
+
+def _item_key(item: dict[str, Any]) -> tuple[Any, Any]:
+    """Identity of an item: its source (JSONL end offset or archive name) and text."""
+    return item.get("e", item.get("octave")), item.get("text")
+
+
+# Serializes updates and item loads within this process (flock covers other
+# processes); reentrant because updates load items while holding it
+_update_lock = threading.RLock()
+
+
+@contextlib.contextmanager
+def _recall_lock(archive_dir: Path) -> Iterator[None]:
+    """Hold the in-process update lock and an exclusive flock on LOCK_FILE."""
+    with _update_lock:
+        try:
+            import fcntl
+        except ImportError:  # Windows: no advisory locks, in-process only
+            yield
+            return
+
+        fd = os.open(archive_dir / LOCK_FILE, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+
+def quantize(vector: dict[int, float]) -> bytes:
+    """Dense int8 encoding of a unit vector (weights scaled by 127)."""
+    dense = bytearray(DIMENSIONS)
+    for bucket, weight in vector.items():
+        dense[bucket] = round(weight * 127) & 0xFF
+    return bytes(dense)
+
+
+@dataclass
+class RecallIndex:
+    """Vector index over one session archive directory."""
+
+    archive_dir: Path
+    # learnings-index.jsonl inode and bytes already embedded
+    source_inode: int | None = None
+    indexed_to: int = 0
+    # Item file inode, bytes loaded and complete lines (= vector rows) loaded
+    items_inode: int | None = None
+    items_read_to: int = 0
+    committed_rows: int = 0
+    items: list[dict[str, Any]] = field(default_factory=list)
+    item_keys: set[tuple[Any, Any]] = field(default_factory=set)
+    # Archives embedded, or known to be covered by a JSONL entry
+    octave_files: set[str] = field(default_factory=set)
+    session_ids: set[str] = field(default_factory=set)
+
+    @property
+    def vectors_path(self) -> Path:
+        """The int8 vector file."""
+        return self.archive_dir / VECTORS_FILE
+
+    @property
+    def items_path(self) -> Path:
+        """The item metadata JSONL."""
+        return self.archive_dir / ITEMS_FILE
+
+    def _reset(self) -> None:
+        """Forget everything loaded or indexed in memory."""
+        self.source_inode = self.items_inode = None
+        self.indexed_to = self.items_read_to = self.committed_rows = 0
+        self.items = []
+        self.item_keys = set()
+        self.octave_files = set()
+        self.session_ids = set()
+
+    def _load_items(self) -> None:
+        with _update_lock:
+            try:
+                stat = self.items_path.stat()
+            except OSError:
+                if self.items_inode is not None:
+                    self._reset()  # Deleted since it was loaded
+                return
+            if self.items_inode is not None and (
+                stat.st_ino != self.items_inode or stat.st_size < self.items_read_to
+            ):
+                self._reset()  # Rebuilt by another process: reload from the start
+            self.items_inode = stat.st_ino
+            size = stat.st_size
+            if size <= self.items_read_to:
+                return
+            with self.items_path.open("rb") as f:
+                f.seek(self.items_read_to)
+                chunk = f.read(size - self.items_read_to)
+            complete, newline, _torn = chunk.rpartition(b"\n")
+            if not newline:
+                return
+            for line in complete.split(b"\n"):
+                try:
+                    self._track(json.loads(line))
+                except ValueError:
+                    # Keep row numbering aligned with the vector file
+                    self.items.append({})
+                self.committed_rows += 1
+            self.items_read_to += len(complete) + 1
+
+    def _track(self, item: dict[str, Any]) -> None:
+        self.items.append(item)
+        self.item_keys.add(_item_key(item))
+        self.session_ids.add(str(item.get("session_id")))
+        if "e" in item:
+            self.indexed_to = max(self.indexed_to, int(item["e"]))
+            self.source_inode = item.get("i")
+        if "octave" in item:
+            self.octave_files.add(str(item["octave"]))
+
+    def update(self, backfill_archives: bool = True) -> int:
+        """
+        Embed learnings/decisions not yet in the index.
+
+        Args:
+            backfill_archives: Also embed .oct.md archives without a JSONL
+                entry (a directory scan; clock_in skips it)
+
+        Returns:
+            Number of items added
+        """
+        with _recall_lock(self.archive_dir):
+            return self._update_locked(backfill_archives)
+
+    def _update_locked(self, backfill_archives: bool) -> int:
+        # Pick up items committed by other processes before choosing new ones
+        self._load_items()
+        if self._source_replaced():
+            self._rebuild()
+        candidates, indexed_to = self._new_jsonl_items()
+        if backfill_archives:
+            candidates += self._new_octave_items()
+        new_items = []
+        keys = set(self.item_keys)
+        for item in candidates:
+            key = _item_key(item)
+            if key not in keys:
+                keys.add(key)
+                new_items.append(item)
+        if not new_items:
+            self.indexed_to = max(self.indexed_to, indexed_to)
+            return 0
+
+        # Items embed with their focus so same-focus queries share features
+        vectors = b"".join(quantize(embed(f"{item['focus']} {item['text']}")) for item in new_items)
+        expected = self.committed_rows * DIMENSIONS
+        with self.vectors_path.open("ab") as f:
+            if f.tell() != expected:
+                # Drop vectors of items that were never committed
+                f.truncate(expected)
+            f.write(vectors)
+            f.flush()
+            os.fsync(f.fileno())
+        with self.items_path.open("a", encoding="utf-8") as f:
+            for item in new_items:
+                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        self._load_items()
+        self.indexed_to = max(self.indexed_to, indexed_to)
+        return len(new_items)
+
+    def _source_replaced(self) -> bool:
+        """Whether learnings-index.jsonl was replaced or truncated since indexing."""
+        if not self.indexed_to:
+            return False
+        try:
+            stat = (self.archive_dir / LEARNINGS_INDEX_FILE).stat()
+        except OSError:
+            return True
+        return stat.st_ino != self.source_inode or stat.st_size < self.indexed_to
+
+    def _rebuild(self) -> None:
+        """Empty the vector and item files so everything is embedded again."""
+        logger.info(f"Rebuilding recall index in {self.archive_dir} (learnings index replaced)")
+        for path in (self.items_path, self.vectors_path):
+            # Replace rather than unlink, so the new file cannot reuse the old
+            # inode and indexes in other processes notice the rebuild
+            empty = path.with_name(f"{path.name}.tmp")
+            empty.write_bytes(b"")
+            os.replace(empty, path)
+        self._reset()
+
+    def _new_jsonl_items(self) -> tuple[list[dict[str, Any]], int]:
+        """Items from JSONL entries past indexed_to, and the offset read up to."""
+        path = self.archive_dir / LEARNINGS_INDEX_FILE
+        try:
+            stat = path.stat()
+        except OSError:
+            return [], self.indexed_to
+        self.source_inode = stat.st_ino
+        size = stat.st_size
+        if size <= self.indexed_to:
+            return [], self.indexed_to
+
+        new_items: list[dict[str, Any]] = []
+        offset = self.indexed_to
+        with path.open("rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Entry still being written
+                end = offset + len(raw)
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    entry = {}
+                meta = {
+                    "session_id": str(entry.get("session_id", "unknown")),
+                    "role": str(entry.get("role", "unknown")),
+                    "focus": str(entry.get("focus", "general")),
+                    "timestamp": str(entry.get("timestamp", "")),
+                }
+                texts = [
+                    (kind, text)
+                    for field_name, kind in _RECALLED_KINDS.items()
+                    for text in entry.get(field_name) or []
+                    if isinstance(text, str) and text.strip()
+                ]
+                for kind, text in texts:
+                    new_items.append(
+                        {**meta, "kind": kind, "text": text.strip(), "e": end, "i": stat.st_ino}
+                    )
+                self.session_ids.add(meta["session_id"])
+                offset = end
+        return new_items, offset
+
+    def _new_octave_items(self) -> list[dict[str, Any]]:
+        new_items: list[dict[str, Any]] = []
+        for octave_path in sorted(self.archive_dir.glob("*.oct.md")):
+            name = octave_path.name
+            if name in self.octave_files:
+                continue  # Already embedded, or covered by its JSONL entry
+            stem = name.removesuffix(".oct.md")
+            if archive_session_id(stem, self.session_ids) is not None:
+                self.octave_files.add(name)
+                continue
+            try:
+                keys = extract_learnings_keys(octave_path.read_text())
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Skipping unreadable archive {octave_path}: {e}")
+                continue
+            self.octave_files.add(name)
+            meta = {"session_id": stem, "role": "unknown", "focus": "general", "timestamp": ""}
+            for field_name, kind in _RECALLED_KINDS.items():
+                for text in keys[field_name]:
+                    new_items.append({**meta, "kind": kind, "text": text, "octave": name})
+        return new_items
+
+    def search(
+        self,
+        query: str,
+        role: str | None = None,
+        focus: str | None = None,
+        limit: int = DEFAULT_RECALL_LIMIT,
+    ) -> list[dict[str, Any]]:
+        """
+        Most similar items to query, boosted for matching role/focus.
+
+        Args:
+            query: Free text (clock_in uses role and focus)
+            role: Role whose items get ROLE_BOOST
+            focus: Focus whose items get FOCUS_BOOST
+            limit: Maximum items returned
+
+        Returns:
+            Items (kind, text, session_id, role, focus, timestamp, score),
+            best first; only items sharing at least one feature with query
+        """
+        self._load_items()
+        query_vector = embed(query)
+        if not query_vector or not self.items:
+            return []
+
+        scored: list[tuple[float, int]] = []
+        rows = len(self.items)
+        with self.vectors_path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size < rows * DIMENSIONS:
+                rows = os.fstat(f.fileno()).st_size // DIMENSIONS
+            if rows == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                vectors = memoryview(mapped).cast("b")
+                try:
+                    terms = list(query_vector.items())
+                    for row in range(rows):
+                        base = row * DIMENSIONS
+                        similarity = sum(vectors[base + b] * w for b, w in terms) / 127
+                        if similarity <= 0:
+                            continue
+                        item = self.items[row]
+                        if role and item.get("role") == role:
+                            similarity += ROLE_BOOST
+                        if focus and item.get("focus") == focus:
+                            similarity += FOCUS_BOOST
+                        scored.append((similarity, row))
+                finally:
+                    vectors.release()
+
+        scored.sort(reverse=True)
+        results = []
+        for score, row in scored[: max(limit, 0)]:
+            item = self.items[row]
+            results.append(
+                {
+                    "kind": item.get("kind"),
+                    "text": item.get("text"),
+                    "session_id": item.get("session_id"),
+                    "role": item.get("role"),
+                    "focus": item.get("focus"),
+                    "timestamp": item.get("timestamp"),
+                    "score": round(score, 3),
+                }
+            )
+        return results
+
+
+# One index per archive directory for the process lifetime
+_indexes: dict[Path, RecallIndex] = {}
+
+
+def get_recall_index(archive_dir: Path) -> RecallIndex:
+    """Return the process-wide recall index for an archive directory."""
+    index = _indexes.get(archive_dir)
+    if index is None:
+        index = _indexes[archive_dir] = RecallIndex(archive_dir)
+    return index
+
+
+def update_recall_index(archive_dir: Path) -> None:
+    """
+    Embed newly archived learnings (clock_out hook).
+
+    Graceful degradation: failures are logged, never raised.
+    """
+    try:
+        added = get_recall_index(archive_dir).update()
+        if added:
+            logger.info(f"Added {added} items to recall index in {archive_dir}")
+    except Exception as e:
+        # Non-blocking: recall is an optimization, never fail clock_out over it
+        logger.warning(f"Failed to update recall index: {e}")
+
+
+def recall_relevant(
+    project_root: Path,
+    role: str,
+    focus: str,
+    limit: int = DEFAULT_RECALL_LIMIT,
+) -> list[dict[str, Any]]:
+    """
+    Prior learnings/decisions most relevant to a role and focus (clock_in).
+
+    Args:
+        project_root: Project root directory
+        role: Agent role
+        focus: Resolved session focus
+        limit: Maximum items returned
+
+    Returns:
+        Relevant items, best first (empty when nothing is archived)
+    """
+    archive_dir = project_root / ".hestai" / "state" / "sessions" / "archive"
+    if not archive_dir.is_dir():
+        return []
+    index = get_recall_index(archive_dir)
+    # Archives without JSONL entries are backfilled by clock_out, not here
+    index.update(backfill_archives=False)
+    return index.search(f"{role} {focus}", role=role, focus=focus, limit=limit)
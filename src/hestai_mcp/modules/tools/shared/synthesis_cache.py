@@ -0,0 +1,246 @@
+"""
+Synthesis Cache - In-process response cache for clock_in AI synthesis.
+
+Agents clocking in on the same role and focus within minutes of each other
+build byte-identical synthesis prompts. Each successful AI synthesis is cached
+under a key derived from everything that determines its output (system
+prompt, user prompt, provider/model) plus a project validity token, so a
+burst of N clock_ins makes one LLM call instead of N.
+
+Design:
+- Key: sha256 of prompts, model, project root and validity token
+- Validity token: PROJECT-CONTEXT.oct.md mtime/size and git HEAD commit, so
+  editing the context or committing invalidates entries automatically
+- Bounded by TTL and LRU (OrderedDict, oldest evicted past max_entries)
+- Single-flight: concurrent misses on one key share a single in-flight call;
+  if the leading caller is cancelled, waiters retry (one of them leads)
+- Only results accepted by the caller are stored (fallbacks are not cached)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# How long a cached synthesis stays valid
+SYNTHESIS_CACHE_TTL_SECONDS = 600.0
+
+# Entries kept before least recently used ones are evicted
+SYNTHESIS_CACHE_MAX_ENTRIES = 128
+
+# Bump when the key derivation changes
+CACHE_FORMAT_VERSION = 1
+
+
+def _find_git_dir(start: Path) -> Path | None:
+    """Locate the git directory for start (handles worktree .git files)."""
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if content.startswith("gitdir:"):
+                git_dir = Path(content[len("gitdir:") :].strip())
+                return git_dir if git_dir.is_absolute() else (directory / git_dir).resolve()
+            return None
+    return None
+
+
+def read_git_head(working_dir: Path) -> str | None:
+    """
+    Resolve the HEAD commit by reading git's files (no subprocess).
+
+    Args:
+        working_dir: Directory inside the repository or worktree
+
+    Returns:
+        HEAD commit sha, the symbolic ref if it cannot be resolved, or None
+        if working_dir is not in a git repository
+    """
+    git_dir = _find_git_dir(working_dir)
+    if git_dir is None:
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not head.startswith("ref:"):
+        return head  # Detached HEAD
+
+    ref = head[len("ref:") :].strip()
+    # Linked worktrees keep branch refs in the common git dir
+    common_dir = git_dir
+    try:
+        common = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+        common_dir = (git_dir / common).resolve()
+    except OSError:
+        pass
+
+    for base in (git_dir, common_dir):
+        try:
+            return (base / ref).read_text(encoding="utf-8").strip()
+        except OSError:
+            continue
+    try:
+        for line in (common_dir / "packed-refs").read_text(encoding="utf-8").splitlines():
+            sha, _, name = line.partition(" ")
+            if name == ref:
+                return sha
+    except OSError:
+        pass
+    return ref  # Unborn branch: still distinguishes branches
+
+
+def project_validity_token(working_dir: Path) -> str:
+    """Token that changes whenever PROJECT-CONTEXT or git HEAD changes."""
+    context_path = working_dir / ".hestai" / "state" / "context" / "PROJECT-CONTEXT.oct.md"
+    try:
+        stat = context_path.stat()
+        context_part = f"{stat.st_mtime_ns}:{stat.st_size}"
+    except OSError:
+        context_part = "missing"
+    return f"{context_part}|{read_git_head(working_dir) or 'no-git'}"
+
+
+class SynthesisCache:
+    """TTL + LRU cache of synthesis results with single-flight misses."""
+
+    def __init__(
+        self,
+        max_entries: int = SYNTHESIS_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = SYNTHESIS_CACHE_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Entries kept before LRU eviction
+            ttl_seconds: Age after which an entry is treated as a miss
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, dict[str, str]]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Future[dict[str, str]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(system_prompt: str, user_prompt: str, model: str, working_dir: Path) -> str:
+        """Derive the cache key for one synthesis request in one project."""
+        payload = json.dumps(
+            {
+                "version": CACHE_FORMAT_VERSION,
+                "system_prompt": system_prompt,
+                "user_prompt": user_prompt,
+                "model": model,
+                "project": str(working_dir),
+                "validity": project_validity_token(working_dir),
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict[str, str] | None:
+        """Return a fresh cached result (a copy) or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return dict(result)
+
+    def put(self, key: str, result: dict[str, str]) -> None:
+        """Store result under key, evicting least recently used entries."""
+        self._entries[key] = (time.monotonic(), dict(result))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries (in-flight calls are unaffected)."""
+        self._entries.clear()
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[dict[str, str]]],
+        should_cache: Callable[[dict[str, str]], bool],
+    ) -> dict[str, str]:
+        """
+        Return the cached result for key, or compute it once for all callers.
+
+        Args:
+            key: Cache key from key_for
+            compute: Coroutine factory producing the result on a miss
+            should_cache: Whether a computed result may be stored
+
+        Returns:
+            Result dict (callers receive their own copy)
+        """
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                break
+            try:
+                result = await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise  # This caller was cancelled
+                continue  # The leading caller was cancelled: compute again
+            self.hits += 1
+            return dict(result)
+
+        self.misses += 1
+        future: asyncio.Future[dict[str, str]] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await compute()
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise; mark retrieved so an unwaited future does not warn
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            if should_cache(result):
+                self.put(key, result)
+            return dict(result)
+        finally:
+            self._in_flight.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and current size."""
+        lookups = self.hits + self.misses
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+
+
+# Process-wide cache shared by all clock_in calls in this server
+synthesis_cache = SynthesisCache()
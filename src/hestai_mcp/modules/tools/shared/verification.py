@@ -9,15 +9,90 @@ Security boundaries:
 - Markdown links must resolve
 - No path traversal in file references
 - No absolute paths to sensitive directories
+
+Path checks are batched per verification: references are deduplicated,
+parent directories are resolved once, and unique paths are checked in a
+small thread pool, so cost tracks the number of unique paths.
 """
 
 import logging
+import os
 import re
+import stat
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from hestai_mcp.modules.tools.shared.octave_scanner import scan_octave
+
 logger = logging.getLogger(__name__)
 
+# Threads used to check referenced paths
+PATH_CHECK_WORKERS = 8
+
+# Fewer unique paths than this are checked inline (pool startup costs more)
+PATH_CHECK_POOL_THRESHOLD = 16
+
+_FILES_MODIFIED_ITEM = re.compile(r'["\']([^"\']+)["\']|([^,\s]+)')
+_MARKDOWN_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
+
+class _PathCache:
+    """
+    Containment and existence of working_dir-relative paths for one verification.
+
+    working_dir is resolved once; each parent directory is resolved once and
+    shared by its entries, so a path costs one lstat unless it is a symlink.
+    """
+
+    def __init__(self, working_dir: Path) -> None:
+        self.working_dir = working_dir
+        self.root = working_dir.resolve()
+        self._dirs: dict[Path, Path] = {}
+        self._results: dict[str, tuple[bool, bool]] = {}
+
+    def prefetch(self, relative_paths: Iterable[str]) -> None:
+        """Check unique, not yet cached paths (in a thread pool when there are many)."""
+        pending = list(dict.fromkeys(p for p in relative_paths if p not in self._results))
+        if len(pending) < PATH_CHECK_POOL_THRESHOLD:
+            for relative in pending:
+                self._results[relative] = self._check(relative)
+            return
+        with ThreadPoolExecutor(max_workers=PATH_CHECK_WORKERS) as pool:
+            for relative, result in zip(pending, pool.map(self._check, pending), strict=True):
+                self._results[relative] = result
+
+    def check(self, relative: str) -> tuple[bool, bool]:
+        """(contained in working_dir, exists) for a relative path."""
+        result = self._results.get(relative)
+        if result is None:
+            result = self._results[relative] = self._check(relative)
+        return result
+
+    def _resolve_dir(self, directory: Path) -> Path:
+        resolved = self._dirs.get(directory)
+        if resolved is None:
+            resolved = self._dirs[directory] = directory.resolve()
+        return resolved
+
+    def _check(self, relative: str) -> tuple[bool, bool]:
+        path = self.working_dir / relative
+        if path.name in ("", ".."):
+            resolved = path.resolve()
+            return resolved.is_relative_to(self.root), resolved.exists()
+
+        candidate = self._resolve_dir(path.parent) / path.name
+        try:
+            mode = os.lstat(candidate).st_mode
+        except OSError:
+            return candidate.is_relative_to(self.root), False
+        if stat.S_ISLNK(mode):
+            # Symlinks are followed like Path.resolve() would
+            resolved = candidate.resolve()
+            return resolved.is_relative_to(self.root), resolved.exists()
+        return candidate.is_relative_to(self.root), True
+
 
 def verify_context_claims(octave_content: str, working_dir: Path) -> dict[str, Any]:
     """
@@ -46,12 +121,20 @@ def verify_context_claims(octave_content: str, working_dir: Path) -> dict[str, A
     issues: list[str] = []
     warnings: list[str] = []
 
+    # Check every referenced path once, up front
+    paths = _PathCache(working_dir)
+    paths.prefetch(
+        reference
+        for reference in (*_files_modified(octave_content), *_link_paths(octave_content))
+        if not Path(reference).is_absolute()
+    )
+
     # Check 1: Verify FILES_MODIFIED references
-    file_issues = _verify_files_modified(octave_content, working_dir)
+    file_issues = _verify_files_modified(octave_content, working_dir, paths)
     issues.extend(file_issues)
 
     # Check 2: Verify markdown links
-    link_issues = _verify_markdown_links(octave_content, working_dir)
+    link_issues = _verify_markdown_links(octave_content, working_dir, paths)
     issues.extend(link_issues)
 
     # Check 3: Path traversal detection
@@ -65,7 +148,19 @@ def verify_context_claims(octave_content: str, working_dir: Path) -> dict[str, A
     return {"passed": len(issues) == 0, "issues": issues, "warnings": warnings}
 
 
-def _verify_files_modified(octave_content: str, working_dir: Path) -> list[str]:
+def _files_modified(octave_content: str) -> list[str]:
+    """Paths listed in FILES_MODIFIED (quotes removed, blanks dropped)."""
+    # FILES_MODIFIED items from the shared scan (no section is fine)
+    items = scan_octave(octave_content).items("FILES_MODIFIED")
+    file_paths = [
+        (f[0] or f[1]).strip() for item in items for f in _FILES_MODIFIED_ITEM.findall(item)
+    ]
+    return [file_path for file_path in file_paths if file_path]
+
+
+def _verify_files_modified(
+    octave_content: str, working_dir: Path, paths: _PathCache | None = None
+) -> list[str]:
     """
     Verify that files mentioned in FILES_MODIFIED exist and are within working_dir.
 
@@ -74,43 +169,22 @@ def _verify_files_modified(octave_content: str, working_dir: Path) -> list[str]:
     Security: Rejects absolute paths and enforces repo-relative containment.
     """
     issues: list[str] = []
-    working_dir_resolved = working_dir.resolve()
-
-    # Extract FILES_MODIFIED section
-    pattern = r"FILES_MODIFIED::\[(.*?)\]"
-    match = re.search(pattern, octave_content, re.DOTALL)
-
-    if not match:
-        # No FILES_MODIFIED section is fine
-        return issues
-
-    files_section = match.group(1).strip()
-
-    # Parse file paths (comma-separated, may have quotes)
-    file_paths = re.findall(r'["\']([^"\']+)["\']|([^,\s]+)', files_section)
-    file_paths = [f[0] or f[1] for f in file_paths if f[0] or f[1]]
-
-    for file_path_str in file_paths:
-        file_path_str = file_path_str.strip()
-        if not file_path_str:
-            continue
-
-        file_path = Path(file_path_str)
+    paths = paths or _PathCache(working_dir)
 
+    for file_path_str in _files_modified(octave_content):
         # SECURITY: Reject absolute paths
-        if file_path.is_absolute():
+        if Path(file_path_str).is_absolute():
             issues.append(f"Absolute path not allowed: {file_path_str}")
             continue
 
-        # Resolve relative to working_dir
-        resolved = (working_dir / file_path).resolve()
+        contained, exists = paths.check(file_path_str)
 
         # SECURITY: Enforce repo-relative containment
-        if not resolved.is_relative_to(working_dir_resolved):
+        if not contained:
             issues.append(f"Path traversal attempt: {file_path_str}")
             continue
 
-        if not resolved.exists():
+        if not exists:
             issues.append(f"FILES_MODIFIED references non-existent file: {file_path_str}")
 
     return issues
@@ -134,7 +208,18 @@ def _normalize_link_destination(dest: str) -> str:
     return dest
 
 
-def _verify_markdown_links(octave_content: str, working_dir: Path) -> list[str]:
+def _link_paths(octave_content: str) -> list[str]:
+    """Normalized destinations of local markdown links."""
+    return [
+        _normalize_link_destination(link_path)
+        for _link_text, link_path in _MARKDOWN_LINK.findall(octave_content)
+        if not link_path.startswith(("http://", "https://", "#"))
+    ]
+
+
+def _verify_markdown_links(
+    octave_content: str, working_dir: Path, paths: _PathCache | None = None
+) -> list[str]:
     """
     Verify markdown links [text](path) resolve to real files within working_dir.
 
@@ -143,13 +228,9 @@ def _verify_markdown_links(octave_content: str, working_dir: Path) -> list[str]:
     Security: Rejects absolute paths and enforces repo-relative containment.
     """
     issues = []
-    working_dir_resolved = working_dir.resolve()
-
-    # Pattern: [text](path) where path is not http(s)://
-    pattern = r"\[([^\]]+)\]\(([^)]+)\)"
-    matches = re.findall(pattern, octave_content)
+    paths = paths or _PathCache(working_dir)
 
-    for link_text, link_path in matches:
+    for link_text, link_path in _MARKDOWN_LINK.findall(octave_content):
         # Skip external links
         if link_path.startswith(("http://", "https://", "#")):
             continue
@@ -157,22 +238,19 @@ def _verify_markdown_links(octave_content: str, working_dir: Path) -> list[str]:
         # Normalize the link destination (handles file:// URIs and angle brackets)
         link_path = _normalize_link_destination(link_path)
 
-        file_path = Path(link_path)
-
         # SECURITY: Reject absolute paths
-        if file_path.is_absolute():
+        if Path(link_path).is_absolute():
             issues.append(f"Absolute path not allowed in markdown link: [{link_text}]({link_path})")
             continue
 
-        # Resolve relative to working_dir
-        resolved = (working_dir / file_path).resolve()
+        contained, exists = paths.check(link_path)
 
         # SECURITY: Enforce repo-relative containment
-        if not resolved.is_relative_to(working_dir_resolved):
+        if not contained:
             issues.append(f"Path traversal in markdown link: [{link_text}]({link_path})")
             continue
 
-        if not resolved.exists():
+        if not exists:
             issues.append(f"Markdown link [{link_text}]({link_path}) references non-existent file")
 
     return issues
@@ -11,7 +11,12 @@ Workbench's responsibility.
 
 Safety:
 - Path validation: canonicalizes working_dir, rejects traversal.
-- Append safety: O_APPEND mode for atomic writes under PIPE_BUF (4096 bytes).
+- Append safety: each record is one O_APPEND write with a CRC-32 trailer.
+  Records over PIPE_BUF (4096 bytes) are additionally written under an
+  exclusive fcntl.flock, which serializes large writers (NFS) and lets them
+  newline-terminate a fragment left by a writer that died mid-record.
+  Records under PIPE_BUF take no lock. Readers verify the CRC and skip torn
+  lines (shared/error_metrics.py).
 - Directory creation: ensures .hestai/state/ exists.
 """
 
@@ -23,9 +28,36 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from hestai_mcp.modules.tools.shared.error_metrics import encode_record
+
 logger = logging.getLogger(__name__)
 
 
+# O_APPEND writes up to PIPE_BUF are atomic on POSIX; larger records also
+# take the append lock
+PIPE_BUF = 4096
+
+
+def _lock_for_large_append(fd: int, encoded: bytes) -> bytes:
+    """Take the exclusive append lock and isolate any torn trailing fragment.
+
+    The lock is released when fd is closed.
+
+    Returns:
+        encoded, prefixed with a newline if the file does not end in one.
+    """
+    try:
+        import fcntl
+    except ImportError:  # Windows: no advisory locks, O_APPEND only
+        return encoded
+
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    size = os.fstat(fd).st_size
+    if size and os.pread(fd, 1, size - 1) != b"\n":
+        return b"\n" + encoded
+    return encoded
+
+
 def _validate_working_dir(working_dir: str) -> tuple[Path | None, str | None]:
     """Canonicalize and validate working_dir.
 
@@ -285,37 +317,29 @@ async def submit_rccafp_record(
 
     # Step 6: Append to error-metrics.jsonl with O_APPEND for atomic writes
     metrics_path = state_dir / "error-metrics.jsonl"
-    json_line = json.dumps(record, separators=(",", ":")) + "\n"
-    encoded = json_line.encode("utf-8")
-
-    # PIPE_BUF size guard: O_APPEND writes under PIPE_BUF (4096 bytes) are
-    # guaranteed atomic on POSIX — short writes cannot happen. Reject records
-    # that exceed this limit rather than attempting unsafe ftruncate recovery.
-    pipe_buf = 4096
-    if len(encoded) > pipe_buf:
-        return {
-            "success": False,
-            "error": (
-                f"RCCAFP record too large for atomic write: "
-                f"{len(encoded)} bytes exceeds PIPE_BUF ({pipe_buf})"
-            ),
-        }
+    encoded = encode_record(record)
+    large = len(encoded) > PIPE_BUF
 
     try:
-        fd = os.open(str(metrics_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        # Large records read the file's last byte under the lock
+        access = os.O_RDWR if large else os.O_WRONLY
+        fd = os.open(str(metrics_path), access | os.O_APPEND | os.O_CREAT, 0o644)
     except OSError as e:
         return {"success": False, "error": f"Failed to write RCCAFP record: {e}"}
 
     try:
+        if large:
+            encoded = _lock_for_large_append(fd, encoded)
         written = os.write(fd, encoded)
 
-        # Defensive: short writes should not occur for sub-PIPE_BUF O_APPEND,
-        # but detect and report if they do (without attempting ftruncate which
-        # is unsafe under concurrent O_APPEND writers).
+        # Defensive: a single O_APPEND write to a regular file only comes up
+        # short on errors such as a full disk. Report it without attempting
+        # ftruncate (unsafe under concurrent O_APPEND writers); readers skip
+        # the torn fragment by its CRC.
         if written < len(encoded):
             logger.error(
                 "Unexpected short write for RCCAFP record %s: %d/%d bytes "
-                "(sub-PIPE_BUF O_APPEND should be atomic)",
+                "(O_APPEND writes should be complete)",
                 record_id,
                 written,
                 len(encoded),
@@ -9,8 +9,11 @@ This keeps local TDD loops lightweight while preserving packaging behavior.
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
+
 
 def pytest_configure() -> None:
     repo_root = Path(__file__).resolve().parents[1]
@@ -21,3 +24,13 @@ def pytest_configure() -> None:
 
     src = repo_root / "src"
     sys.path.insert(0, str(src))
+
+
+@pytest.fixture(autouse=True)
+def _isolate_api_key_cache() -> Iterator[None]:
+    """Keep cached keyring lookups from leaking between tests."""
+    from hestai_mcp.modules.services.ai.config import clear_api_key_cache
+
+    clear_api_key_cache()
+    yield
+    clear_api_key_cache()
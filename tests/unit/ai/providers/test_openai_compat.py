@@ -357,6 +357,72 @@ class TestCompleteText:
             await provider.complete_text(request, "sk-test-key", mock_client)
 
 
+@pytest.mark.unit
+class TestStreamText:
+    """Test server-sent event streaming completion."""
+
+    @staticmethod
+    def _sse_client(body: str, status: int = 200, captured: list | None = None):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if captured is not None:
+                captured.append(request)
+            return httpx.Response(
+                status, content=body.encode(), headers={"content-type": "text/event-stream"}
+            )
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    @pytest.mark.asyncio
+    async def test_yields_content_deltas_until_done(self):
+        """Parses data: events, skipping comments, empty deltas and [DONE]."""
+        provider = OpenAICompatProvider("openai", "https://api.openai.com/v1")
+        body = (
+            ": keep-alive\n\n"
+            'data: {"choices": [{"delta": {"role": "assistant"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "FOCUS::"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "issue-56"}}]}\n\n'
+            "data: [DONE]\n\n"
+            'data: {"choices": [{"delta": {"content": "ignored"}}]}\n\n'
+        )
+        captured: list[httpx.Request] = []
+        request = CompletionRequest(system_prompt="s", user_prompt="u", timeout_seconds=7)
+
+        async with self._sse_client(body, captured=captured) as client:
+            chunks = [c async for c in provider.stream_text(request, "sk-test-key", client)]
+
+        assert chunks == ["FOCUS::", "issue-56"]
+        sent = captured[0]
+        assert b'"stream": true' in sent.content or b'"stream":true' in sent.content
+        assert sent.headers["Authorization"] == "Bearer sk-test-key"
+        assert sent.extensions["timeout"]["read"] == 7
+
+    @pytest.mark.asyncio
+    async def test_raises_on_http_error(self):
+        """Raises httpx.HTTPStatusError before yielding on non-200 response."""
+        provider = OpenAICompatProvider("openai", "https://api.openai.com/v1")
+        request = CompletionRequest(system_prompt="s", user_prompt="u")
+
+        async with self._sse_client("", status=503) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                async for _chunk in provider.stream_text(request, "sk-test-key", client):
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_base_provider_default_yields_whole_completion(self):
+        """Providers without streaming support yield complete_text as one chunk."""
+        provider = OpenAICompatProvider("openai", "https://api.openai.com/v1")
+        request = CompletionRequest(system_prompt="s", user_prompt="u")
+
+        with patch.object(OpenAICompatProvider, "complete_text", AsyncMock(return_value="whole")):
+            from hestai_mcp.modules.services.ai.providers.base import BaseProvider
+
+            chunks = [
+                c async for c in BaseProvider.stream_text(provider, request, "key", AsyncMock())
+            ]
+
+        assert chunks == ["whole"]
+
+
 # =============================================================================
 # PHASE 3: Provider initialization tests
 # =============================================================================
@@ -457,6 +457,27 @@ class TestAIClientFullCallChain:
                 "isinstance checks failing would indicate the mock is broken."
             )
 
+    @pytest.mark.asyncio
+    async def test_rejected_api_key_clears_cached_key(
+        self, mock_httpx_async_response, monkeypatch, openai_tiered_config
+    ):
+        """A 401 drops the provider's cached keyring key so a new key is picked up."""
+        from unittest.mock import MagicMock
+
+        from hestai_mcp.modules.services.ai import config as config_module
+
+        mock_httpx_async_response.configure_response("unauthorized", 401)
+        get_password = MagicMock(side_effect=["revoked-key", "rotated-key"])
+        monkeypatch.setattr("keyring.get_password", get_password)
+        request = CompletionRequest(system_prompt="s", user_prompt="u")
+
+        async with AIClient(config=openai_tiered_config) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.complete_text(request)
+
+        assert "openai" not in config_module._keyring_cache
+        assert await config_module.async_resolve_api_key("openai") == "rotated-key"
+
     @pytest.mark.asyncio
     async def test_request_headers_contain_authorization(
         self, mock_httpx_async_response, monkeypatch, openai_tiered_config
@@ -541,6 +562,19 @@ class TestAIClientFullCallChain:
         body_content = intercepted_request.content.decode("utf-8")
         assert "gpt-4o-mini" in body_content, "Tier model should override request model"
 
+    @pytest.mark.asyncio
+    async def test_request_timeout_reaches_provider(self, mock_httpx_async_response, monkeypatch):
+        """The request's timeout_seconds survives the tier model override."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        config = TieredAIConfig(tiers={"synthesis": TierConfig(provider="openai", model="m")})
+        request = CompletionRequest(system_prompt="s", user_prompt="u", timeout_seconds=3)
+
+        async with AIClient(config=config) as client:
+            await client.complete_text(request)
+
+        intercepted_request = mock_httpx_async_response.requests_made[0]
+        assert intercepted_request.extensions["timeout"]["read"] == 3
+
 
 @pytest.mark.unit
 class TestUnsupportedProvider:
@@ -684,3 +718,415 @@ class TestIsRetryableError:
         error = httpx.HTTPStatusError("Client Error", request=request, response=response)
 
         assert client._is_retryable_error(error) is False
+
+
+@pytest.mark.unit
+class TestSharedHttpClient:
+    """Test the server-scoped pooled HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_aiclient_borrows_shared_client(self):
+        """AIClient reuses the shared pool and leaves it open on exit."""
+        from hestai_mcp.modules.services.ai.client import (
+            close_shared_http_client,
+            start_shared_http_client,
+        )
+
+        shared = await start_shared_http_client()
+        try:
+            async with AIClient() as first:
+                assert first._async_client is shared
+            async with AIClient() as second:
+                assert second._async_client is shared
+            assert not shared.is_closed
+        finally:
+            await close_shared_http_client()
+
+        assert shared.is_closed
+
+    @pytest.mark.asyncio
+    async def test_start_is_idempotent(self):
+        """Starting twice returns the same open client."""
+        from hestai_mcp.modules.services.ai.client import (
+            close_shared_http_client,
+            start_shared_http_client,
+        )
+
+        try:
+            assert await start_shared_http_client() is await start_shared_http_client()
+        finally:
+            await close_shared_http_client()
+
+    @pytest.mark.asyncio
+    async def test_private_client_without_shared_pool(self):
+        """Without a shared pool, AIClient creates and closes its own client."""
+        async with AIClient() as client:
+            own = client._async_client
+            assert own is not None
+
+        assert own.is_closed
+        assert client._async_client is None
+
+    def test_http2_only_when_h2_installed(self, monkeypatch):
+        """HTTP/2 is enabled only when the optional h2 package is importable."""
+        from hestai_mcp.modules.services.ai import client as client_module
+
+        monkeypatch.setattr(client_module.importlib.util, "find_spec", lambda name: None)
+
+        assert client_module._http2_available() is False
+
+
+def _resilient_config(**overrides):
+    """Two-provider config with synthesis -> analysis fallback."""
+    from hestai_mcp.modules.services.ai.config import HedgingConfig, RetryConfig
+
+    data = {
+        "tiers": {
+            "synthesis": TierConfig(provider="openrouter", model="fast-model"),
+            "analysis": TierConfig(provider="openai", model="backup-model"),
+        },
+        "default_tier": "synthesis",
+        "fallbacks": {"synthesis": ["analysis"]},
+        "retry": RetryConfig(max_attempts=1, backoff_base_seconds=0),
+        "hedging": HedgingConfig(enabled=False, delay_seconds=0.05),
+    }
+    data.update(overrides)
+    return TieredAIConfig(**data)
+
+
+def _scripted_tiers(monkeypatch, script):
+    """Replace per-tier attempts with scripted coroutines; returns the call log."""
+    calls: list[str] = []
+
+    async def fake_complete_tier(self, request, client, tier):
+        calls.append(tier)
+        return await script[tier](len([c for c in calls if c == tier]))
+
+    monkeypatch.setattr(AIClient, "_complete_tier", fake_complete_tier)
+    return calls
+
+
+async def _ok(text):
+    return text
+
+
+@pytest.mark.unit
+class TestFallbackChain:
+    """Test retry and fallback across tiers/providers."""
+
+    @pytest.mark.asyncio
+    async def test_retryable_error_falls_back_to_next_tier(self, monkeypatch):
+        """A timeout on the primary tier falls through to the fallback tier."""
+
+        async def primary(_n):
+            raise httpx.ConnectTimeout("slow")
+
+        calls = _scripted_tiers(
+            monkeypatch, {"synthesis": primary, "analysis": lambda _n: _ok("backup")}
+        )
+
+        async with AIClient(_resilient_config()) as client:
+            result = await client.complete_text(
+                CompletionRequest(system_prompt="s", user_prompt="u")
+            )
+
+        assert result == "backup"
+        assert calls == ["synthesis", "analysis"]
+
+    @pytest.mark.asyncio
+    async def test_complete_text_with_tier_reports_answering_tier(self, monkeypatch):
+        """Callers can tell a fallback answer from a primary one."""
+
+        async def primary(_n):
+            raise httpx.ConnectTimeout("slow")
+
+        _scripted_tiers(monkeypatch, {"synthesis": primary, "analysis": lambda _n: _ok("backup")})
+
+        async with AIClient(_resilient_config()) as client:
+            result = await client.complete_text_with_tier(
+                CompletionRequest(system_prompt="s", user_prompt="u")
+            )
+
+        assert result == ("backup", "analysis")
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_does_not_fall_back(self, monkeypatch):
+        """Auth/validation errors surface immediately."""
+
+        async def primary(_n):
+            raise ValueError("No API key available")
+
+        calls = _scripted_tiers(
+            monkeypatch, {"synthesis": primary, "analysis": lambda _n: _ok("backup")}
+        )
+
+        async with AIClient(_resilient_config()) as client:
+            with pytest.raises(ValueError):
+                await client.complete_text(CompletionRequest(system_prompt="s", user_prompt="u"))
+
+        assert calls == ["synthesis"]
+
+    @pytest.mark.asyncio
+    async def test_retries_with_backoff_before_falling_back(self, monkeypatch):
+        """Retryable errors are retried up to max_attempts on the same tier."""
+        from hestai_mcp.modules.services.ai.config import RetryConfig
+
+        async def flaky(n):
+            if n < 3:
+                raise httpx.ReadTimeout("slow")
+            return "third time"
+
+        calls = _scripted_tiers(
+            monkeypatch, {"synthesis": flaky, "analysis": lambda _n: _ok("backup")}
+        )
+        config = _resilient_config(retry=RetryConfig(max_attempts=3, backoff_base_seconds=0))
+
+        async with AIClient(config) as client:
+            result = await client.complete_text(
+                CompletionRequest(system_prompt="s", user_prompt="u")
+            )
+
+        assert result == "third time"
+        assert calls == ["synthesis"] * 3
+
+    @pytest.mark.asyncio
+    async def test_exhausted_chain_raises_last_error(self, monkeypatch):
+        """When every tier fails retryably, the last error is raised."""
+
+        async def primary(_n):
+            raise httpx.ConnectError("down")
+
+        async def backup(_n):
+            raise httpx.ReadTimeout("also down")
+
+        _scripted_tiers(monkeypatch, {"synthesis": primary, "analysis": backup})
+
+        async with AIClient(_resilient_config()) as client:
+            with pytest.raises(httpx.ReadTimeout):
+                await client.complete_text(CompletionRequest(system_prompt="s", user_prompt="u"))
+
+
+@pytest.mark.unit
+class TestHedgedRequests:
+    """Test hedged requests against a slow primary tier."""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged(self, monkeypatch):
+        """The fallback answers first once the hedge delay passes."""
+        import asyncio
+
+        from hestai_mcp.modules.services.ai.config import HedgingConfig
+
+        cancelled = []
+
+        async def slow(_n):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "primary"
+
+        calls = _scripted_tiers(
+            monkeypatch, {"synthesis": slow, "analysis": lambda _n: _ok("hedge")}
+        )
+        config = _resilient_config(hedging=HedgingConfig(enabled=True, delay_seconds=0.05))
+
+        async with AIClient(config) as client:
+            result = await client.complete_text(
+                CompletionRequest(system_prompt="s", user_prompt="u")
+            )
+
+        assert result == "hedge"
+        assert calls == ["synthesis", "analysis"]
+        assert cancelled == [True]
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self, monkeypatch):
+        """No backup request is sent when the primary beats the threshold."""
+        from hestai_mcp.modules.services.ai.config import HedgingConfig
+
+        calls = _scripted_tiers(
+            monkeypatch,
+            {"synthesis": lambda _n: _ok("primary"), "analysis": lambda _n: _ok("hedge")},
+        )
+        config = _resilient_config(hedging=HedgingConfig(enabled=True, delay_seconds=1))
+
+        async with AIClient(config) as client:
+            result = await client.complete_text(
+                CompletionRequest(system_prompt="s", user_prompt="u")
+            )
+
+        assert result == "primary"
+        assert calls == ["synthesis"]
+
+    def test_hedge_delay_uses_observed_percentile(self, monkeypatch):
+        """After min_samples calls the threshold is the observed p95 latency."""
+        from collections import deque
+
+        from hestai_mcp.modules.services.ai import client as client_module
+        from hestai_mcp.modules.services.ai.config import HedgingConfig
+
+        config = _resilient_config(
+            hedging=HedgingConfig(enabled=True, delay_seconds=9, min_samples=20)
+        )
+        ai_client = AIClient(config)
+        tier = config.get_tier_config("synthesis")
+        monkeypatch.setattr(client_module, "_latency_samples", {})
+
+        assert ai_client._hedge_delay(tier) == 9
+
+        client_module._latency_samples["openrouter/fast-model"] = deque(
+            [i / 100 for i in range(1, 101)]
+        )
+
+        assert ai_client._hedge_delay(tier) == pytest.approx(0.96)
+
+
+def _streaming_providers(monkeypatch, streams):
+    """Serve provider streams from scripted async generators keyed by provider."""
+    from unittest.mock import MagicMock
+
+    monkeypatch.setenv("OPENROUTER_API_KEY", "fake-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "fake-key")
+    calls: list[str] = []
+
+    def fake_get_provider(self, provider_name):
+        provider = MagicMock()
+
+        def stream_text(request, api_key, client):
+            calls.append(provider_name)
+            return streams[provider_name](request)
+
+        provider.stream_text = stream_text
+        return provider
+
+    monkeypatch.setattr(AIClient, "_get_provider", fake_get_provider)
+    return calls
+
+
+@pytest.mark.unit
+class TestStreamingCompletion:
+    """Test complete_text_streaming deadlines, fallback and partial output."""
+
+    @pytest.mark.asyncio
+    async def test_joins_streamed_chunks(self, monkeypatch):
+        """Chunks are concatenated and the tier model replaces the request model."""
+        seen: list[CompletionRequest] = []
+
+        async def stream(request):
+            seen.append(request)
+            for chunk in ("FOCUS::", "x"):
+                yield chunk
+
+        _streaming_providers(monkeypatch, {"openrouter": stream})
+
+        async with AIClient(_resilient_config()) as client:
+            result = await client.complete_text_streaming(
+                CompletionRequest(system_prompt="s", user_prompt="u", timeout_seconds=9)
+            )
+
+        assert result == "FOCUS::x"
+        assert seen[0].model == "fast-model"
+        assert seen[0].timeout_seconds == 9
+
+    @pytest.mark.asyncio
+    async def test_missed_first_token_deadline_falls_back(self, monkeypatch):
+        """A primary with no first token in time is abandoned for the fallback tier."""
+        import asyncio
+
+        async def silent(_request):
+            await asyncio.sleep(5)
+            yield "late"
+
+        async def backup(_request):
+            yield "backup"
+
+        calls = _streaming_providers(monkeypatch, {"openrouter": silent, "openai": backup})
+
+        async with AIClient(_resilient_config()) as client:
+            result = await client.complete_text_streaming(
+                CompletionRequest(system_prompt="s", user_prompt="u"),
+                first_token_timeout=0.05,
+            )
+
+        assert result == "backup"
+        assert calls == ["openrouter", "openai"]
+
+    @pytest.mark.asyncio
+    async def test_stream_establishment_is_retried(self, monkeypatch):
+        """Retryable failures before the first chunk use config.retry before falling back."""
+        from hestai_mcp.modules.services.ai.config import RetryConfig
+
+        attempts = []
+
+        async def flaky(_request):
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise httpx.ConnectError("refused")
+            yield "third time"
+
+        async def backup(_request):
+            yield "backup"
+
+        calls = _streaming_providers(monkeypatch, {"openrouter": flaky, "openai": backup})
+        config = _resilient_config(retry=RetryConfig(max_attempts=3, backoff_base_seconds=0))
+
+        async with AIClient(config) as client:
+            result = await client.complete_text_streaming(
+                CompletionRequest(system_prompt="s", user_prompt="u")
+            )
+
+        assert result == "third time"
+        assert calls == ["openrouter"] * 3
+
+    @pytest.mark.asyncio
+    async def test_accepts_partial_output_on_deadline(self, monkeypatch):
+        """Text satisfying accept_partial is returned when the stream stalls."""
+        import asyncio
+
+        async def stalls(_request):
+            yield "FOCUS::a\n"
+            yield "PHASE::B2"
+            await asyncio.sleep(5)
+            yield "never"
+
+        _streaming_providers(monkeypatch, {"openrouter": stalls})
+        request = CompletionRequest(system_prompt="s", user_prompt="u", timeout_seconds=1)
+
+        async with AIClient(_resilient_config()) as client:
+            result = await asyncio.wait_for(
+                client.complete_text_streaming(
+                    request, accept_partial=lambda text: "PHASE::" in text
+                ),
+                timeout=3,
+            )
+
+        assert result == "FOCUS::a\nPHASE::B2"
+
+    @pytest.mark.asyncio
+    async def test_rejected_partial_output_raises(self, monkeypatch):
+        """Mid-stream failures propagate when partial text is not acceptable."""
+
+        async def breaks(_request):
+            yield "FOCUS::a"
+            raise httpx.ReadError("connection reset")
+
+        calls = _streaming_providers(monkeypatch, {"openrouter": breaks})
+
+        async with AIClient(_resilient_config()) as client:
+            with pytest.raises(httpx.ReadError):
+                await client.complete_text_streaming(
+                    CompletionRequest(system_prompt="s", user_prompt="u"),
+                    accept_partial=lambda text: "PHASE::" in text,
+                )
+
+        assert calls == ["openrouter"]
+
+    @pytest.mark.asyncio
+    async def test_requires_context_manager(self):
+        """complete_text_streaming outside 'async with' raises RuntimeError."""
+        with pytest.raises(RuntimeError):
+            await AIClient(_resilient_config()).complete_text_streaming(
+                CompletionRequest(system_prompt="s", user_prompt="u")
+            )
@@ -167,6 +167,62 @@ class TestLoadConfigYaml:
         assert config.timeouts.connect_seconds == 10
 
 
+@pytest.mark.unit
+class TestLoadConfigSnapshot:
+    """Test load_config YAML snapshot caching."""
+
+    @pytest.fixture
+    def yaml_file(self, monkeypatch, tmp_path):
+        from hestai_mcp.modules.services.ai.config import clear_config_cache
+
+        clear_config_cache()
+        yaml_file = tmp_path / "ai.yaml"
+        yaml_file.write_text(
+            yaml.dump({"tiers": {"synthesis": {"provider": "openai", "model": "gpt-4o-mini"}}})
+        )
+        monkeypatch.setattr("hestai_mcp.ai.config.get_yaml_config_path", lambda: yaml_file)
+        yield yaml_file
+        clear_config_cache()
+
+    def test_unchanged_file_is_not_reparsed(self, yaml_file, monkeypatch):
+        """A second load with the same mtime/size serves the snapshot."""
+        calls = []
+        real_safe_load = yaml.safe_load
+        monkeypatch.setattr(
+            "hestai_mcp.ai.config.yaml.safe_load",
+            lambda text: calls.append(text) or real_safe_load(text),
+        )
+
+        first = load_config()
+        second = load_config()
+
+        assert len(calls) == 1
+        assert first == second
+        # Callers get private copies
+        assert first is not second
+
+    def test_modified_file_is_reloaded(self, yaml_file):
+        """Changing the file (mtime/size) reloads the config."""
+        import os
+
+        assert load_config().tiers["synthesis"].model == "gpt-4o-mini"
+
+        yaml_file.write_text(
+            yaml.dump({"tiers": {"synthesis": {"provider": "openai", "model": "gpt-4o"}}})
+        )
+        stat = yaml_file.stat()
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_config().tiers["synthesis"].model == "gpt-4o"
+
+    def test_mutating_result_does_not_leak(self, yaml_file):
+        """Mutating a returned config does not affect later loads."""
+        config = load_config()
+        config.tiers["synthesis"].model = "mutated"
+
+        assert load_config().tiers["synthesis"].model == "gpt-4o-mini"
+
+
 @pytest.mark.unit
 class TestLoadConfigDefaults:
     """Test load_config default behavior when no config files exist."""
@@ -287,6 +343,86 @@ class TestResolveApiKey:
 
         assert result == "env-fallback-key"
 
+    async def test_async_resolve_key_caches_keyring_lookup(self, monkeypatch):
+        """Repeated resolutions within the TTL do not hit the keyring again."""
+        from hestai_mcp.modules.services.ai.config import async_resolve_api_key
+
+        mock_get_password = MagicMock(return_value="keyring-secret-key")
+        monkeypatch.setattr("keyring.get_password", mock_get_password)
+
+        assert await async_resolve_api_key("openai") == "keyring-secret-key"
+        assert await async_resolve_api_key("openai") == "keyring-secret-key"
+
+        mock_get_password.assert_called_once()
+
+    async def test_cached_keyring_miss_still_reads_env(self, monkeypatch):
+        """A cached 'no keyring key' keeps the live environment fallback."""
+        from hestai_mcp.modules.services.ai.config import async_resolve_api_key
+
+        mock_get_password = MagicMock(return_value=None)
+        monkeypatch.setattr("keyring.get_password", mock_get_password)
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+        assert await async_resolve_api_key("openai") is None
+        monkeypatch.setenv("OPENAI_API_KEY", "env-key")
+        assert await async_resolve_api_key("openai") == "env-key"
+
+        mock_get_password.assert_called_once()
+
+    async def test_keyring_miss_is_cached_until_cleared(self, monkeypatch):
+        """A keyring miss is reused for the full TTL; clearing the cache picks up an added key."""
+        from hestai_mcp.modules.services.ai import config as config_module
+
+        mock_get_password = MagicMock(side_effect=[None, "added-later"])
+        monkeypatch.setattr("keyring.get_password", mock_get_password)
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+        assert await config_module.async_resolve_api_key("openai") is None
+        assert await config_module.async_resolve_api_key("openai") is None
+        mock_get_password.assert_called_once()
+
+        config_module.clear_api_key_cache("openai")
+        assert await config_module.async_resolve_api_key("openai") == "added-later"
+
+    async def test_cache_expires_and_can_be_cleared(self, monkeypatch):
+        """Entries are re-read after the TTL or explicit invalidation."""
+        from hestai_mcp.modules.services.ai import config as config_module
+
+        mock_get_password = MagicMock(side_effect=["old-key", "new-key", "newest-key"])
+        monkeypatch.setattr("keyring.get_password", mock_get_password)
+
+        assert await config_module.async_resolve_api_key("openai") == "old-key"
+        config_module.clear_api_key_cache("openai")
+        assert await config_module.async_resolve_api_key("openai") == "new-key"
+
+        monkeypatch.setattr(config_module, "API_KEY_CACHE_TTL_SECONDS", 0.0)
+        config_module.clear_api_key_cache()
+        assert await config_module.async_resolve_api_key("openai") == "newest-key"
+
+    async def test_prewarm_resolves_each_configured_provider_once(self, monkeypatch):
+        """Prewarm looks up every tier provider and reports which have keys."""
+        from hestai_mcp.modules.services.ai.config import async_resolve_api_key, prewarm_api_keys
+
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        mock_get_password = MagicMock(
+            side_effect=lambda _service, account: "k" if account == "openrouter-key" else None
+        )
+        monkeypatch.setattr("keyring.get_password", mock_get_password)
+        config = TieredAIConfig(
+            tiers={
+                "synthesis": TierConfig(provider="openrouter", model="a"),
+                "analysis": TierConfig(provider="openai", model="b"),
+                "critical": TierConfig(provider="openrouter", model="c"),
+            }
+        )
+
+        found = await prewarm_api_keys(config)
+        await async_resolve_api_key("openrouter")
+
+        assert found == {"openai": False, "openrouter": True}
+        assert mock_get_password.call_count == 2
+
     def test_resolve_key_no_keyring_falls_back_to_env(self, monkeypatch):
         """When keyring.get_password raises NoKeyringError, fall back to env."""
         monkeypatch.setenv("OPENROUTER_API_KEY", "env-api-key-12345")
@@ -548,3 +684,36 @@ class TestValidationErrorFallback:
         assert "synthesis" in config.tiers
         assert "analysis" in config.tiers
         assert "critical" in config.tiers
+
+
+@pytest.mark.unit
+class TestFallbackChainConfig:
+    """Test fallback chain configuration and validation."""
+
+    def _tiers(self):
+        return {
+            "synthesis": TierConfig(provider="openrouter", model="a"),
+            "analysis": TierConfig(provider="openai", model="b"),
+        }
+
+    def test_chain_starts_with_requested_tier(self):
+        """Fallback chain lists the tier first, then its fallbacks, deduplicated."""
+        config = TieredAIConfig(
+            tiers=self._tiers(), fallbacks={"synthesis": ["analysis", "synthesis"]}
+        )
+
+        assert config.get_fallback_chain() == ["synthesis", "analysis"]
+        assert config.get_fallback_chain("analysis") == ["analysis"]
+
+    def test_fallback_to_unknown_tier_raises(self):
+        """Fallbacks must reference configured tiers."""
+        with pytest.raises(ValidationError, match="unknown tier 'critical'"):
+            TieredAIConfig(tiers=self._tiers(), fallbacks={"synthesis": ["critical"]})
+
+    def test_resilience_defaults_are_off(self):
+        """Retries, fallbacks and hedging are opt-in."""
+        config = TieredAIConfig()
+
+        assert config.fallbacks == {}
+        assert config.retry.max_attempts == 1
+        assert config.hedging.enabled is False
@@ -5,12 +5,15 @@ and synthesizes phase-specific constraints for agent context injection.
 """
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from hestai_mcp.core.governance.state import context_steward
 from hestai_mcp.core.governance.state.context_steward import (
     ContextSteward,
     PhaseConstraints,
+    clear_workflow_cache,
 )
 
 
@@ -168,3 +171,62 @@ B2_HEPHAESTUS_FORGE::CODE_CONSTRUCTION
         assert constraints.phase == "B1"
         # Before fix: this returns empty string "" because _section_to_simple_value ignores non-block assignments
         assert "Top Level Purpose" in constraints.purpose
+
+
+class TestCompiledWorkflow:
+    """Test the process-wide compiled workflow index."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        clear_workflow_cache()
+        yield
+        clear_workflow_cache()
+
+    def test_workflow_parsed_once_per_content_hash(self, mock_workflow_file):
+        """Separate stewards over one unchanged file share a single parse."""
+        with patch.object(context_steward, "parse", wraps=context_steward.parse) as parse_spy:
+            first = ContextSteward(workflow_path=mock_workflow_file).synthesize_active_state("B1")
+            second = ContextSteward(workflow_path=mock_workflow_file).synthesize_active_state("D0")
+            assert parse_spy.call_count == 1
+
+            # A copy with identical content hits the same compiled index
+            copy_file = mock_workflow_file.with_name("COPY.oct.md")
+            copy_file.write_text(mock_workflow_file.read_text())
+            ContextSteward(workflow_path=copy_file).synthesize_active_state("B1")
+            assert parse_spy.call_count == 1
+
+            mock_workflow_file.write_text(
+                mock_workflow_file.read_text().replace("Complete ideation", "Revised ideation")
+            )
+            revised = ContextSteward(workflow_path=mock_workflow_file).synthesize_active_state("D0")
+            assert parse_spy.call_count == 2
+
+        assert first.phase == "B1"
+        assert second.deliverables == ["Complete ideation session"]
+        assert revised.deliverables == ["Revised ideation session"]
+
+    def test_index_precomputes_every_phase(self, mock_workflow_file):
+        """All phases are indexed up front; callers get independent copies."""
+        steward = ContextSteward(workflow_path=mock_workflow_file)
+        compiled = steward.compile()
+
+        assert set(compiled.phases) == {"D0", "B1"}
+        constraints = steward.synthesize_active_state("B1")
+        constraints.deliverables.append("mutated")
+        assert "mutated" not in steward.synthesize_active_state("B1").deliverables
+
+    def test_render_active_state_is_cached(self, mock_workflow_file):
+        """The rendered constraints document is built once per phase."""
+        steward = ContextSteward(workflow_path=mock_workflow_file)
+
+        rendered = steward.render_active_state("B1")
+
+        assert rendered.startswith("===PHASE_CONSTRAINTS===")
+        assert "  PHASE::B1\n" in rendered
+        assert "RACI::R[planning_specialists]→A[critical-engineer]" in rendered
+        assert steward.compile().rendered["B1"] is rendered
+        assert (
+            ContextSteward(workflow_path=mock_workflow_file).render_active_state("B1") is rendered
+        )
+        with pytest.raises(ValueError, match="Phase B9 not found"):
+            steward.render_active_state("B9")
@@ -0,0 +1,132 @@
+"""Tests for the parsed, cached North Star model.
+
+Test Coverage:
+- OCTAVE parsing of IMMUTABLES and SCOPE_BOUNDARIES via octave-mcp
+- Text fallback for markdown North Stars ("### I1: TITLE" headings)
+- Re-parse only when the file changes (mtime/size)
+- Cached candidate discovery with .oct.md preference and -SUMMARY exclusion
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hestai_mcp.core.governance.state import north_star as module
+from hestai_mcp.core.governance.state.north_star import (
+    find_north_star_file,
+    load_north_star,
+)
+
+OCTAVE_NORTH_STAR = """===NORTH_STAR===
+IMMUTABLES::[
+  I3::DUAL_LAYER_AUTHORITY,
+  I4::FRESHNESS_VERIFICATION
+]
+
+SCOPE_BOUNDARIES::[
+  IS::[persistent_memory_system, structural_governance_engine],
+  IS_NOT::[SaaS_product]
+]
+===END===
+"""
+
+MARKDOWN_NORTH_STAR = """# Product North Star
+
+## IMMUTABLES (6 Total)
+
+### I1: PERSISTENT COGNITIVE CONTINUITY
+**PRINCIPLE:** context survives sessions
+
+### I2: STRUCTURAL-INTEGRITY-PRIORITY
+**PRINCIPLE:** structure first
+
+### I6: UNIVERSAL SCOPE
+"""
+
+
+@pytest.mark.unit
+class TestLoadNorthStar:
+    """Test model construction from OCTAVE and markdown documents."""
+
+    def test_octave_document_is_parsed(self, tmp_path: Path):
+        """IMMUTABLES and SCOPE_BOUNDARIES come from the octave-mcp AST."""
+        path = tmp_path / "000-PROJECT-NORTH-STAR.oct.md"
+        path.write_text(OCTAVE_NORTH_STAR)
+
+        north_star = load_north_star(path)
+
+        assert north_star is not None
+        assert north_star.source == "octave"
+        assert north_star.immutables == {
+            "I3": "DUAL_LAYER_AUTHORITY",
+            "I4": "FRESHNESS_VERIFICATION",
+        }
+        assert north_star.immutable("I4") == "FRESHNESS_VERIFICATION"
+        assert "persistent_memory_system" in (north_star.scope_boundaries or "")
+        summary = north_star.constraints_summary() or ""
+        assert "KEY IMMUTABLES:\nI3::DUAL_LAYER_AUTHORITY\nI4::FRESHNESS_VERIFICATION" in summary
+
+    def test_markdown_headings_are_recognized(self, tmp_path: Path):
+        """Markdown North Stars fall back to the line scan."""
+        path = tmp_path / "000-PROJECT-NORTH-STAR.md"
+        path.write_text(MARKDOWN_NORTH_STAR)
+
+        north_star = load_north_star(path)
+
+        assert north_star is not None
+        assert north_star.source == "text"
+        assert north_star.immutable_refs() == [
+            "I1::PERSISTENT_COGNITIVE_CONTINUITY",
+            "I2::STRUCTURAL_INTEGRITY_PRIORITY",
+            "I6::UNIVERSAL_SCOPE",
+        ]
+        assert north_star.scope_boundaries is None
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path: Path):
+        """Repeated loads reuse the model until the file changes."""
+        path = tmp_path / "000-PROJECT-NORTH-STAR.oct.md"
+        path.write_text(OCTAVE_NORTH_STAR)
+
+        with patch.object(module, "parse", wraps=module.parse) as parse_spy:
+            first = load_north_star(path)
+            assert load_north_star(path) is first
+            assert parse_spy.call_count == 1
+
+            path.write_text(OCTAVE_NORTH_STAR.replace("I4::", "I5::"))
+            changed = load_north_star(path)
+
+        assert parse_spy.call_count == 2
+        assert changed is not None
+        assert changed.immutable("I5") == "FRESHNESS_VERIFICATION"
+
+    def test_missing_file_returns_none(self, tmp_path: Path):
+        """Unreadable paths have no model."""
+        assert load_north_star(tmp_path / "missing.md") is None
+
+
+@pytest.mark.unit
+class TestFindNorthStarFile:
+    """Test cached North Star discovery."""
+
+    def test_prefers_octave_and_skips_summary(self, tmp_path: Path):
+        """.oct.md wins over .md; -SUMMARY files are never chosen."""
+        directory = tmp_path / ".hestai" / "north-star"
+        directory.mkdir(parents=True)
+        (directory / "000-A-NORTH-STAR-SUMMARY.oct.md").write_text("")
+        (directory / "000-A-NORTH-STAR.md").write_text("")
+        assert find_north_star_file(tmp_path) == directory / "000-A-NORTH-STAR.md"
+
+        # Adding a file changes the directory mtime and refreshes the listing
+        (directory / "000-B-NORTH-STAR.oct.md").write_text("")
+        assert find_north_star_file(tmp_path) == directory / "000-B-NORTH-STAR.oct.md"
+
+    def test_falls_back_to_legacy_workflow_dir(self, tmp_path: Path):
+        """The legacy workflow/ directory is used when north-star/ has no match."""
+        (tmp_path / ".hestai" / "north-star").mkdir(parents=True)
+        legacy = tmp_path / ".hestai" / "workflow"
+        legacy.mkdir()
+        (legacy / "000-A-NORTH-STAR.md").write_text("")
+
+        assert find_north_star_file(tmp_path) == legacy / "000-A-NORTH-STAR.md"
+        assert find_north_star_file(tmp_path / "elsewhere") is None
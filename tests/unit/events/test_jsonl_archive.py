@@ -0,0 +1,169 @@
+"""
+Tests for the compressed JSONL archive format (framed gzip + sidecar index).
+
+Test Coverage:
+- Round trip: framed archive decompresses to the original lines
+- Sidecar index: frame offsets allow single-line random access
+- Degradation: readers work without the sidecar
+- ClaudeJsonlLens transparently parses compressed archives
+- Atomicity: failed writes leave no partial files
+"""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from hestai_mcp.events import ClaudeJsonlLens, UserMessage
+from hestai_mcp.events.jsonl_archive import (
+    index_path_for,
+    is_compressed_archive,
+    iter_jsonl_lines,
+    load_archive_index,
+    read_jsonl_line,
+    write_jsonl_archive,
+)
+
+
+def _write_transcript(path: Path, count: int) -> list[str]:
+    lines = [
+        json.dumps(
+            {
+                "type": "user",
+                "message": {"role": "user", "content": [{"type": "text", "text": f"msg {i}"}]},
+            }
+        )
+        for i in range(count)
+    ]
+    path.write_text("".join(line + "\n" for line in lines))
+    return lines
+
+
+@pytest.mark.unit
+class TestWriteJsonlArchive:
+    """Test framed gzip archive writing."""
+
+    def test_round_trip_with_standard_gzip(self, tmp_path: Path):
+        """Multi-member output is readable by plain gzip as one stream."""
+        src = tmp_path / "session.jsonl"
+        lines = _write_transcript(src, 25)
+        dst = tmp_path / "session.jsonl.gz"
+
+        write_jsonl_archive(src, dst, frame_lines=4)
+
+        assert gzip.decompress(dst.read_bytes()).decode("utf-8") == src.read_text()
+        assert is_compressed_archive(dst)
+        assert not is_compressed_archive(src)
+        assert list(iter_jsonl_lines(dst)) == lines
+
+    def test_sidecar_records_independent_frames(self, tmp_path: Path):
+        """Each indexed frame decompresses on its own to whole lines."""
+        src = tmp_path / "session.jsonl"
+        lines = _write_transcript(src, 10)
+        dst = tmp_path / "session.jsonl.gz"
+
+        index = write_jsonl_archive(src, dst, frame_lines=4)
+
+        assert index_path_for(dst).exists()
+        assert index.line_count == 10
+        assert [frame[0] for frame in index.frames] == [0, 4, 8]
+        raw = dst.read_bytes()
+        first_line, offset, length = index.frames[1]
+        frame_lines = gzip.decompress(raw[offset : offset + length]).decode().splitlines()
+        assert frame_lines == lines[4:8]
+        assert load_archive_index(dst) == index
+
+    def test_missing_trailing_newline_does_not_merge_frames(self, tmp_path: Path):
+        """A final record without newline stays a separate line."""
+        src = tmp_path / "session.jsonl"
+        src.write_text('{"a": 1}\n{"b": 2}')
+        dst = tmp_path / "session.jsonl.gz"
+
+        write_jsonl_archive(src, dst, frame_lines=1)
+
+        assert list(iter_jsonl_lines(dst)) == ['{"a": 1}', '{"b": 2}']
+
+    def test_failed_write_leaves_no_partial_files(self, tmp_path: Path):
+        """Errors during compression clean up temp files."""
+        from unittest.mock import patch
+
+        src = tmp_path / "session.jsonl"
+        _write_transcript(src, 5)
+        dst = tmp_path / "session.jsonl.gz"
+
+        with (
+            patch("hestai_mcp.events.jsonl_archive.gzip.compress", side_effect=OSError("disk")),
+            pytest.raises(OSError, match="disk"),
+        ):
+            write_jsonl_archive(src, dst)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["session.jsonl"]
+
+    def test_rejects_non_positive_frame_size(self, tmp_path: Path):
+        """frame_lines must be positive."""
+        src = tmp_path / "session.jsonl"
+        _write_transcript(src, 1)
+
+        with pytest.raises(ValueError, match="frame_lines"):
+            write_jsonl_archive(src, tmp_path / "out.jsonl.gz", frame_lines=0)
+
+
+@pytest.mark.unit
+class TestRandomAccess:
+    """Test single-line reads and offset iteration."""
+
+    def test_read_single_line_via_index(self, tmp_path: Path):
+        """read_jsonl_line returns the requested line."""
+        src = tmp_path / "session.jsonl"
+        lines = _write_transcript(src, 30)
+        dst = tmp_path / "session.jsonl.gz"
+        write_jsonl_archive(src, dst, frame_lines=7)
+
+        assert read_jsonl_line(dst, 0) == lines[0]
+        assert read_jsonl_line(dst, 13) == lines[13]
+        assert read_jsonl_line(dst, 29) == lines[29]
+        with pytest.raises(IndexError):
+            read_jsonl_line(dst, 30)
+
+    def test_read_single_line_without_index(self, tmp_path: Path):
+        """Without the sidecar, reads degrade to a sequential scan."""
+        src = tmp_path / "session.jsonl"
+        lines = _write_transcript(src, 12)
+        dst = tmp_path / "session.jsonl.gz"
+        write_jsonl_archive(src, dst, frame_lines=5)
+        index_path_for(dst).unlink()
+
+        assert load_archive_index(dst) is None
+        assert read_jsonl_line(dst, 11) == lines[11]
+        with pytest.raises(IndexError):
+            read_jsonl_line(dst, 12)
+
+    def test_iterate_from_offset(self, tmp_path: Path):
+        """iter_jsonl_lines(start=N) yields lines N.. for plain and compressed files."""
+        src = tmp_path / "session.jsonl"
+        lines = _write_transcript(src, 20)
+        dst = tmp_path / "session.jsonl.gz"
+        write_jsonl_archive(src, dst, frame_lines=6)
+
+        assert list(iter_jsonl_lines(dst, start=9)) == lines[9:]
+        assert list(iter_jsonl_lines(src, start=9)) == lines[9:]
+
+
+@pytest.mark.unit
+class TestLensReadsCompressedArchives:
+    """ClaudeJsonlLens accepts compressed archives transparently."""
+
+    def test_parse_file_accepts_gzip_archive(self, tmp_path: Path):
+        """Events parsed from .jsonl.gz match the plain file."""
+        src = tmp_path / "session.jsonl"
+        _write_transcript(src, 9)
+        dst = tmp_path / "session.jsonl.gz"
+        write_jsonl_archive(src, dst, frame_lines=2)
+
+        plain_events = list(ClaudeJsonlLens().parse_file(src))
+        compressed_events = list(ClaudeJsonlLens().parse_file(dst))
+
+        assert compressed_events == plain_events
+        assert all(isinstance(e, UserMessage) for e in compressed_events)
+        assert compressed_events[8].content == "msg 8"
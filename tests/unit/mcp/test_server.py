@@ -643,20 +643,26 @@ class TestListTools:
         assert mock_validate.call_count >= 1
 
     @pytest.mark.asyncio
-    async def test_returns_five_tools(self):
-        """Returns exactly five tools (clock_in, clock_out, bind, submit_review, submit_rccafp_record)."""
+    async def test_returns_nine_tools(self):
+        """Returns exactly nine tools (clock_in, clock_out, compression_job_status,
+        query_learnings, search_knowledge, bind, submit_review, submit_rccafp_record,
+        query_error_metrics)."""
         from hestai_mcp.mcp.server import list_tools
 
         tools = await list_tools()
 
-        assert len(tools) == 5
+        assert len(tools) == 9
         tool_names = {t.name for t in tools}
         assert tool_names == {
             "clock_in",
             "clock_out",
+            "compression_job_status",
+            "query_learnings",
+            "search_knowledge",
             "bind",
             "submit_review",
             "submit_rccafp_record",
+            "query_error_metrics",
         }
 
 
@@ -805,6 +811,153 @@ class TestCallTool:
         call_kwargs = mock_clock_out.call_args
         assert call_kwargs.kwargs["project_root"] == project
 
+    @pytest.mark.asyncio
+    async def test_deferred_clock_out_starts_job_worker(self, tmp_path: Path):
+        """A clock_out that queues a compression job hands the project to the worker."""
+        from hestai_mcp.mcp import server
+        from hestai_mcp.mcp.server import call_tool
+
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / ".git").mkdir()
+        session_dir = project / ".hestai" / "state" / "sessions" / "active" / "defer-123"
+        session_dir.mkdir(parents=True)
+        (session_dir / "session.json").write_text(
+            json.dumps({"session_id": "defer-123", "working_dir": str(project)})
+        )
+
+        with (
+            patch("hestai_mcp.mcp.server.clock_out", new_callable=AsyncMock) as mock_clock_out,
+            patch.object(server.compression_worker, "watch") as mock_watch,
+        ):
+            mock_clock_out.return_value = {
+                "status": "success",
+                "session_id": "defer-123",
+                "compression_status": "deferred",
+                "compression_job_id": "compress-abc",
+            }
+            await call_tool(
+                "clock_out",
+                {
+                    "session_id": "defer-123",
+                    "working_dir": str(project),
+                    "defer_compression": True,
+                },
+            )
+
+        assert mock_clock_out.call_args.kwargs["defer_compression"] is True
+        mock_watch.assert_called_once_with(project)
+
+    @pytest.mark.asyncio
+    async def test_routes_compression_job_status(self, tmp_path: Path):
+        """compression_job_status reports queued jobs for the project."""
+        from hestai_mcp.mcp import server
+        from hestai_mcp.mcp.server import call_tool
+        from hestai_mcp.modules.tools.shared.compression_jobs import enqueue_compression_job
+
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / ".git").mkdir()
+        job = enqueue_compression_job(
+            project_root=project,
+            redacted_jsonl_path=project / "a.jsonl",
+            session_data={"session_id": "s1"},
+            description="",
+            octave_path=project / "a.oct.md",
+        )
+
+        with patch.object(server.compression_worker, "watch") as mock_watch:
+            result = await call_tool(
+                "compression_job_status",
+                {"working_dir": str(project), "job_id": job["job_id"]},
+            )
+
+        response_data = json.loads(result[0].text)
+        assert response_data["counts"] == {"queued": 1}
+        assert response_data["jobs"][0]["job_id"] == job["job_id"]
+        # Unfinished jobs are resumed by this server process
+        mock_watch.assert_called_once_with(project)
+
+    @pytest.mark.asyncio
+    async def test_routes_query_learnings(self, tmp_path: Path):
+        """query_learnings searches the project's archived learnings."""
+        from hestai_mcp.mcp.server import call_tool
+        from hestai_mcp.modules.tools.shared.learnings_index import append_to_learnings_index
+
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / ".git").mkdir()
+        archive = project / ".hestai" / "state" / "sessions" / "archive"
+        archive.mkdir(parents=True)
+        append_to_learnings_index(
+            {"session_id": "s1", "role": "implementation-lead"},
+            {"decisions": [], "blockers": [], "learnings": ["cache parsed ASTs"]},
+            archive,
+        )
+
+        result = await call_tool(
+            "query_learnings",
+            {"working_dir": str(project), "keywords": "cache", "role": "implementation-lead"},
+        )
+
+        response_data = json.loads(result[0].text)
+        assert response_data["count"] == 1
+        assert response_data["entries"][0]["session_id"] == "s1"
+
+    @pytest.mark.asyncio
+    async def test_routes_search_knowledge_with_backfill(self, tmp_path: Path):
+        """search_knowledge can backfill the store from archives, then search it."""
+        from hestai_mcp.mcp.server import call_tool
+        from hestai_mcp.modules.tools.shared.knowledge_store import fts5_available
+
+        if not fts5_available():
+            pytest.skip("sqlite3 built without FTS5")
+
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / ".git").mkdir()
+        archive = project / ".hestai" / "state" / "sessions" / "archive"
+        archive.mkdir(parents=True)
+        (archive / "2026-01-01-issue-1-s1.oct.md").write_text("LEARNINGS::[cache parsed ASTs]")
+
+        result = await call_tool(
+            "search_knowledge",
+            {"working_dir": str(project), "query": "cache", "backfill": True},
+        )
+
+        response_data = json.loads(result[0].text)
+        assert response_data["backfilled"] == {"sessions": 1, "rows": 1}
+        assert response_data["count"] == 1
+        assert response_data["results"][0]["content"] == "cache parsed ASTs"
+
+    @pytest.mark.asyncio
+    async def test_routes_query_error_metrics(self, tmp_path: Path):
+        """query_error_metrics reads back records written by submit_rccafp_record."""
+        from hestai_mcp.mcp.server import call_tool
+
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / ".git").mkdir()
+        (project / ".hestai" / "state").mkdir(parents=True)
+        await call_tool(
+            "submit_rccafp_record",
+            {
+                "working_dir": str(project),
+                "context_summary": "pagination",
+                "root_cause_analysis": "Off-by-one",
+                "fix_attempt_1": "adjusted limit",
+                "escalation_required": True,
+                "future_proofing_rule": "boundary tests",
+            },
+        )
+
+        result = await call_tool("query_error_metrics", {"working_dir": str(project)})
+
+        response_data = json.loads(result[0].text)
+        assert response_data["count"] == 1
+        assert response_data["records"][0]["root_cause_analysis"] == "Off-by-one"
+        assert response_data["escalation_by_role"]["unknown"]["rate"] == 1.0
+
     @pytest.mark.asyncio
     async def test_clock_out_schema_includes_working_dir(self):
         """clock_out tool schema includes optional working_dir parameter."""
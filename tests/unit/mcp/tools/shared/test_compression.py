@@ -4,12 +4,14 @@ Tests for clock_out OCTAVE compression features (Features 2-5).
 Test Coverage:
 - Feature 2: OCTAVE compression (compress_to_octave)
 - Feature 3: Context extraction (extract_context_from_octave)
-- Feature 4: Verification claims (verify_context_claims)
+- Feature 4: Verification claims (verify_context_claims) and its batched path checks
 - Feature 5: Learnings index (extract_learnings_keys, append_to_learnings_index)
+- Map-reduce compression for transcripts larger than the model context
 """
 
 import json
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -44,6 +46,274 @@ class TestOctaveCompression:
         assert "LEARNINGS" in prompt
 
 
+def _write_transcript(path: Path, turns: int, text_size: int = 200) -> Path:
+    """Write a Claude-format JSONL transcript with alternating user/assistant turns."""
+    lines = []
+    for i in range(turns):
+        if i % 2 == 0:
+            record = {
+                "type": "user",
+                "message": {"role": "user", "content": f"user-{i} " + "u" * text_size},
+            }
+        else:
+            record = {
+                "type": "assistant",
+                "message": {
+                    "role": "assistant",
+                    "model": "test-model",
+                    "content": [{"type": "text", "text": f"assistant-{i} " + "a" * text_size}],
+                },
+            }
+        lines.append(json.dumps(record))
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def _mock_ai_client(side_effect):
+    """Build a patched AIClient whose complete_text uses side_effect."""
+    mock_client = MagicMock()
+    mock_client.complete_text = AsyncMock(side_effect=side_effect)
+
+    async def complete_text_with_tier(request, tier=None):
+        return await mock_client.complete_text(request), "synthesis"
+
+    mock_client.complete_text_with_tier = AsyncMock(side_effect=complete_text_with_tier)
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=None)
+    return mock_client
+
+
+@pytest.mark.unit
+class TestMapReduceCompression:
+    """Test map-reduce compression of transcripts larger than the model context."""
+
+    @pytest.fixture
+    def small_limits(self, monkeypatch):
+        """Shrink token limits so small fixtures exercise the map-reduce path."""
+        from hestai_mcp.modules.tools.shared import compression
+
+        monkeypatch.setattr(compression, "SINGLE_PASS_TOKEN_LIMIT", 500)
+        monkeypatch.setattr(compression, "MAP_WINDOW_TOKENS", 300)
+
+    def test_split_into_windows_respects_budget_and_order(self):
+        """Windows stay within budget and preserve line order."""
+        from hestai_mcp.modules.tools.shared.compression import (
+            CHARS_PER_TOKEN,
+            split_into_windows,
+        )
+
+        lines = [f"line-{i} " + "x" * 90 for i in range(50)]
+        windows = split_into_windows(lines, window_tokens=100)
+
+        assert len(windows) > 1
+        assert all(len(w) <= 100 * CHARS_PER_TOKEN for w in windows)
+        assert "\n".join(windows).split("\n") == lines
+
+    def test_split_into_windows_truncates_oversized_line(self):
+        """A single line larger than the budget is truncated, not dropped."""
+        from hestai_mcp.modules.tools.shared.compression import (
+            CHARS_PER_TOKEN,
+            split_into_windows,
+        )
+
+        windows = split_into_windows(["small", "y" * 5000, "tail"], window_tokens=100)
+
+        assert windows[0] == "small"
+        assert len(windows[1]) == 100 * CHARS_PER_TOKEN
+        assert windows[1].endswith("[truncated]")
+        assert windows[2] == "tail"
+
+    @pytest.mark.asyncio
+    async def test_small_transcript_uses_single_pass(self, tmp_path: Path):
+        """Transcripts under the limit make exactly one completion call."""
+        from hestai_mcp.modules.tools.shared.compression import compress_to_octave
+
+        transcript = _write_transcript(tmp_path / "t.jsonl", turns=4)
+        mock_client = _mock_ai_client(["===SESSION_COMPRESSION===\nsingle"])
+
+        with patch(
+            "hestai_mcp.modules.tools.shared.compression.AIClient", return_value=mock_client
+        ):
+            result = await compress_to_octave(transcript, {"session_id": "s1"})
+
+        assert result == "===SESSION_COMPRESSION===\nsingle"
+        assert mock_client.complete_text.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_model_receives_distilled_transcript(self, tmp_path: Path):
+        """The prompt carries distilled lines, not raw JSONL, and stats are reported."""
+        from hestai_mcp.modules.tools.shared.compression import compress_session_transcript
+
+        transcript = _write_transcript(tmp_path / "t.jsonl", turns=4)
+        mock_client = _mock_ai_client(["===SESSION_COMPRESSION===\nsingle"])
+
+        with patch(
+            "hestai_mcp.modules.tools.shared.compression.AIClient", return_value=mock_client
+        ):
+            result = await compress_session_transcript(transcript, {"session_id": "s1"})
+
+        request = mock_client.complete_text.await_args.args[0]
+        assert "USER: user-0 " in request.user_prompt
+        assert '"type": "user"' not in request.user_prompt
+        assert result.content == "===SESSION_COMPRESSION===\nsingle"
+        assert result.stats["strategy"] == "single_pass"
+        assert 0 < result.stats["reduction_ratio"] < 1
+
+    @pytest.mark.asyncio
+    async def test_cache_replays_completed_calls(self, tmp_path: Path, small_limits):
+        """A second run over the same transcript is served entirely from cache."""
+        from hestai_mcp.modules.tools.shared.compression import compress_session_transcript
+
+        transcript = _write_transcript(tmp_path / "t.jsonl", turns=20)
+        cache_dir = tmp_path / "cache"
+        mock_client = _mock_ai_client(lambda request: "octave")
+        mock_client.config.get_tier_config.return_value = MagicMock(
+            provider="openrouter", model="test-model"
+        )
+
+        with patch(
+            "hestai_mcp.modules.tools.shared.compression.AIClient", return_value=mock_client
+        ):
+            first = await compress_session_transcript(
+                transcript, {"session_id": "s1"}, cache_dir=cache_dir
+            )
+            calls = mock_client.complete_text.await_count
+            second = await compress_session_transcript(
+                transcript, {"session_id": "s1"}, cache_dir=cache_dir
+            )
+
+        assert first.content == second.content == "octave"
+        assert mock_client.complete_text.await_count == calls
+        assert first.stats["cache_hits"] == 0
+        assert first.stats["cache_misses"] == calls
+        assert second.stats["cache_hits"] == calls
+        assert second.stats["cache_hit_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_fallback_results_are_not_cached(self, tmp_path: Path):
+        """A completion served by a fallback tier is returned but never stored."""
+        from hestai_mcp.modules.tools.shared.compression import compress_session_transcript
+
+        transcript = _write_transcript(tmp_path / "t.jsonl", turns=4)
+        cache_dir = tmp_path / "cache"
+        mock_client = _mock_ai_client(lambda request: "degraded")
+        tiers = {
+            None: MagicMock(provider="openrouter", model="primary-model"),
+            "analysis": MagicMock(provider="openai", model="backup-model"),
+        }
+        mock_client.config.get_tier_config.side_effect = lambda tier=None: tiers[tier]
+
+        async def served_by_fallback(request, tier=None):
+            return await mock_client.complete_text(request), "analysis"
+
+        mock_client.complete_text_with_tier = AsyncMock(side_effect=served_by_fallback)
+
+        with patch(
+            "hestai_mcp.modules.tools.shared.compression.AIClient", return_value=mock_client
+        ):
+            first = await compress_session_transcript(
+                transcript, {"session_id": "s1"}, cache_dir=cache_dir
+            )
+            second = await compress_session_transcript(
+                transcript, {"session_id": "s1"}, cache_dir=cache_dir
+            )
+
+        assert first.content == second.content == "degraded"
+        assert mock_client.complete_text.await_count == 2
+        assert second.stats["cache_hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_large_transcript_maps_windows_then_reduces(self, tmp_path: Path, small_limits):
+        """Large transcripts are compressed per window and merged by a reduce pass."""
+        from hestai_mcp.modules.tools.shared.compression import compress_to_octave
+
+        transcript = _write_transcript(tmp_path / "t.jsonl", turns=20)
+        requests = []
+
+        async def complete(request):
+            requests.append(request)
+            if request.user_prompt.startswith("Partial Session Compressions"):
+                return "===SESSION_COMPRESSION===\nmerged"
+            return f"partial-{len(requests)}"
+
+        mock_client = _mock_ai_client(complete)
+
+        with patch(
+            "hestai_mcp.modules.tools.shared.compression.AIClient", return_value=mock_client
+        ):
+            result = await compress_to_octave(transcript, {"session_id": "s1"}, "summary")
+
+        assert result == "===SESSION_COMPRESSION===\nmerged"
+        map_requests = [r for r in requests if "window" in r.user_prompt.split("\n", 1)[0]]
+        reduce_requests = [r for r in requests if r not in map_requests]
+        assert len(map_requests) > 1
+        assert len(reduce_requests) >= 1
+        # Every transcript turn reaches some map window, in order
+        map_text = "\n".join(r.user_prompt for r in map_requests)
+        positions = [map_text.index(f"-{i} ") for i in range(20)]
+        assert positions == sorted(positions)
+        assert "MERGE_RULES" in reduce_requests[-1].system_prompt
+        # One client (one connection pool) for the whole run
+        assert mock_client.__aenter__.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_map_phase_respects_concurrency_limit(
+        self, tmp_path: Path, small_limits, monkeypatch
+    ):
+        """No more than MAP_CONCURRENCY window calls are in flight at once."""
+        import asyncio
+
+        from hestai_mcp.modules.tools.shared import compression
+
+        monkeypatch.setattr(compression, "MAP_CONCURRENCY", 2)
+        transcript = _write_transcript(tmp_path / "t.jsonl", turns=30)
+        in_flight = 0
+        peak = 0
+
+        async def complete(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "partial"
+
+        mock_client = _mock_ai_client(complete)
+
+        with patch(
+            "hestai_mcp.modules.tools.shared.compression.AIClient", return_value=mock_client
+        ):
+            await compression.compress_to_octave(transcript, {"session_id": "s1"})
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_map_failure_degrades_to_none(self, tmp_path: Path, small_limits):
+        """A failed window compression returns None (graceful degradation)."""
+        from hestai_mcp.modules.tools.shared.compression import compress_to_octave
+
+        transcript = _write_transcript(tmp_path / "t.jsonl", turns=20)
+        mock_client = _mock_ai_client(RuntimeError("provider down"))
+
+        with patch(
+            "hestai_mcp.modules.tools.shared.compression.AIClient", return_value=mock_client
+        ):
+            result = await compress_to_octave(transcript, {"session_id": "s1"})
+
+        assert result is None
+
+    def test_group_partials_always_shrinks(self):
+        """Each reduce round merges at least two partials per group."""
+        from hestai_mcp.modules.tools.shared.compression import _group_partials
+
+        partials = ["p" * 4000 for _ in range(5)]
+        groups = _group_partials(partials, group_tokens=100)
+
+        assert sum(len(g) for g in groups) == 5
+        assert all(len(g) >= 2 for g in groups)
+        assert len(groups) < 5
+
+
 @pytest.mark.unit
 class TestContextExtraction:
     """Test Feature 3: Context extraction from OCTAVE content."""
@@ -230,6 +500,77 @@ LEARNINGS::[
         )
 
 
+@pytest.mark.unit
+class TestVerificationPathCache:
+    """Test batched, deduplicated path checks in verification."""
+
+    def test_duplicate_references_are_checked_once(self, tmp_path: Path):
+        """Each unique path is stat'ed once across FILES_MODIFIED and links."""
+        from hestai_mcp.modules.tools.shared import verification
+
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("")
+        octave_content = (
+            'FILES_MODIFIED::["src/a.py", "src/a.py", "src/missing.py"]\n'
+            "see [a](src/a.py) and [again](src/a.py)\n"
+        )
+
+        checked: list[str] = []
+        real_check = verification._PathCache._check
+
+        def counting_check(self, relative):
+            checked.append(relative)
+            return real_check(self, relative)
+
+        with patch.object(verification._PathCache, "_check", counting_check):
+            result = verification.verify_context_claims(octave_content, tmp_path)
+
+        assert sorted(checked) == ["src/a.py", "src/missing.py"]
+        assert result["issues"] == ["FILES_MODIFIED references non-existent file: src/missing.py"]
+
+    def test_many_paths_use_pool_and_share_parent_resolution(self, tmp_path: Path):
+        """Hundreds of files resolve their parent directory once."""
+        from hestai_mcp.modules.tools.shared import verification
+
+        (tmp_path / "src").mkdir()
+        names = [f"src/file_{i}.py" for i in range(200)]
+        for name in names:
+            (tmp_path / name).write_text("")
+        octave_content = "FILES_MODIFIED::[" + ", ".join(names) + ", src/absent.py]"
+        cache = verification._PathCache(tmp_path)
+
+        with patch.object(
+            verification, "ThreadPoolExecutor", wraps=verification.ThreadPoolExecutor
+        ) as pool:
+            cache.prefetch(verification._files_modified(octave_content))
+
+        pool.assert_called_once()
+        assert list(cache._dirs) == [tmp_path / "src"]
+        assert cache.check("src/file_7.py") == (True, True)
+        assert cache.check("src/absent.py") == (True, False)
+
+    def test_symlinks_and_parent_references_are_contained(self, tmp_path: Path):
+        """Symlinks leaving working_dir and .. segments count as traversal."""
+        from hestai_mcp.modules.tools.shared.verification import verify_context_claims
+
+        project = tmp_path / "project"
+        (project / "src").mkdir(parents=True)
+        (tmp_path / "outside.py").write_text("")
+        (project / "src" / "escape.py").symlink_to(tmp_path / "outside.py")
+        (project / "src" / "inner.py").write_text("")
+        (project / "src" / "alias.py").symlink_to(project / "src" / "inner.py")
+
+        result = verify_context_claims(
+            "FILES_MODIFIED::[src/escape.py, src/alias.py, src/../../outside.py, src/..]",
+            project,
+        )
+
+        assert result["issues"] == [
+            "Path traversal attempt: src/escape.py",
+            "Path traversal attempt: src/../../outside.py",
+        ]
+
+
 @pytest.mark.unit
 class TestLearningsIndex:
     """Test Feature 5: Learnings index extraction and appending."""
@@ -0,0 +1,94 @@
+"""
+Tests for the persistent compression result cache.
+
+Test Coverage:
+- Key derivation (content, model and temperature sensitivity)
+- Round-trip and hit/miss accounting
+- LRU size eviction
+- Non-blocking failure on unwritable cache
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+
+def _request(user_prompt: str = "transcript", temperature: float = 0.7):
+    from hestai_mcp.modules.services.ai.providers.base import CompletionRequest
+
+    return CompletionRequest(
+        system_prompt="protocol", user_prompt=user_prompt, temperature=temperature
+    )
+
+
+@pytest.mark.unit
+class TestCompressionCacheKey:
+    """Test cache key derivation."""
+
+    def test_key_is_stable(self):
+        """Identical requests produce identical keys."""
+        from hestai_mcp.modules.tools.shared.compression_cache import CompressionCache
+
+        assert CompressionCache.key_for(_request(), "m") == CompressionCache.key_for(
+            _request(), "m"
+        )
+
+    def test_key_changes_with_inputs(self):
+        """Transcript, model and temperature all change the key."""
+        from hestai_mcp.modules.tools.shared.compression_cache import CompressionCache
+
+        base = CompressionCache.key_for(_request(), "m")
+
+        assert CompressionCache.key_for(_request(user_prompt="other"), "m") != base
+        assert CompressionCache.key_for(_request(), "other-model") != base
+        assert CompressionCache.key_for(_request(temperature=0.1), "m") != base
+
+
+@pytest.mark.unit
+class TestCompressionCache:
+    """Test cache storage, accounting and eviction."""
+
+    def test_round_trip_counts_hits_and_misses(self, tmp_path: Path):
+        """A miss, a put and a hit are reflected in stats."""
+        from hestai_mcp.modules.tools.shared.compression_cache import CompressionCache
+
+        cache = CompressionCache(tmp_path / "cache")
+
+        assert cache.get("abc") is None
+        cache.put("abc", "===SESSION_COMPRESSION===")
+        assert cache.get("abc") == "===SESSION_COMPRESSION==="
+
+        assert cache.stats() == {"cache_hits": 1, "cache_misses": 1, "cache_hit_rate": 0.5}
+
+    def test_evicts_least_recently_used(self, tmp_path: Path):
+        """Oldest entries are evicted once the size bound is exceeded."""
+        from hestai_mcp.modules.tools.shared.compression_cache import CompressionCache
+
+        cache_dir = tmp_path / "cache"
+        cache = CompressionCache(cache_dir, max_bytes=250)
+
+        cache.put("old", "o" * 100)
+        cache.put("recent", "r" * 100)
+        os.utime(cache_dir / "old.txt", (1_000, 1_000))
+        os.utime(cache_dir / "recent.txt", (2_000, 2_000))
+        # A hit refreshes "old", making "recent" the least recently used
+        assert cache.get("old") is not None
+
+        cache.put("new", "n" * 100)
+
+        assert (cache_dir / "old.txt").exists()
+        assert (cache_dir / "new.txt").exists()
+        assert not (cache_dir / "recent.txt").exists()
+
+    def test_unwritable_cache_is_non_blocking(self, tmp_path: Path):
+        """Write failures are logged, not raised."""
+        from hestai_mcp.modules.tools.shared.compression_cache import CompressionCache
+
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("file")
+        cache = CompressionCache(blocker / "cache")
+
+        cache.put("abc", "content")
+
+        assert cache.get("abc") is None
@@ -0,0 +1,257 @@
+"""
+Tests for the durable deferred-compression job queue.
+
+Test Coverage:
+- Enqueue and status reporting
+- Job execution: success, retry with backoff, permanent failure
+- Claim locking, lease renewal and stale lease recovery
+- Async worker draining a watched project
+"""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+STAGE = "hestai_mcp.modules.tools.clock_out.compress_and_index_session"
+
+
+@pytest.fixture
+def queued_job(tmp_path: Path):
+    """Enqueue one compression job in a fresh project."""
+    from hestai_mcp.modules.tools.shared.compression_jobs import enqueue_compression_job, jobs_dir
+
+    archive = tmp_path / "archive"
+    archive.mkdir()
+    job = enqueue_compression_job(
+        project_root=tmp_path,
+        redacted_jsonl_path=archive / "s1-redacted.jsonl",
+        session_data={"session_id": "s1", "role": "test"},
+        description="summary",
+        octave_path=archive / "s1.oct.md",
+    )
+    return tmp_path, job, jobs_dir(tmp_path) / f"{job['job_id']}.json"
+
+
+@pytest.mark.unit
+class TestEnqueueAndStatus:
+    """Test job creation and status queries."""
+
+    def test_enqueue_writes_durable_record(self, queued_job):
+        """Job record is persisted under .hestai/state/jobs as queued."""
+        _root, job, job_path = queued_job
+
+        record = json.loads(job_path.read_text())
+        assert record["status"] == "queued"
+        assert record["attempts"] == 0
+        assert record["session_id"] == "s1"
+        assert record["payload"]["description"] == "summary"
+        assert job["job_id"].startswith("compress-")
+
+    def test_status_by_job_and_session(self, queued_job):
+        """Status lookups omit payloads and count jobs per status."""
+        from hestai_mcp.modules.tools.shared.compression_jobs import get_compression_job_status
+
+        root, job, _ = queued_job
+
+        by_job = get_compression_job_status(root, job_id=job["job_id"])
+        by_session = get_compression_job_status(root, session_id="s1")
+        other = get_compression_job_status(root, session_id="other")
+
+        assert by_job["counts"] == {"queued": 1}
+        assert "payload" not in by_job["jobs"][0]
+        assert by_session["jobs"][0]["job_id"] == job["job_id"]
+        assert other == {"jobs": [], "counts": {}}
+
+    def test_status_rejects_path_traversal(self, tmp_path: Path):
+        """job_id cannot escape the jobs directory."""
+        from hestai_mcp.modules.tools.shared.compression_jobs import get_compression_job_status
+
+        with pytest.raises(ValueError, match="Invalid job_id"):
+            get_compression_job_status(tmp_path, job_id="../../secrets")
+
+
+@pytest.mark.unit
+class TestRunCompressionJob:
+    """Test single job attempts."""
+
+    @pytest.mark.asyncio
+    async def test_success_records_result(self, queued_job):
+        """A successful stage marks the job succeeded and stores the outcome."""
+        from hestai_mcp.modules.tools.shared.compression_jobs import run_compression_job
+
+        root, _job, job_path = queued_job
+        outcome = {"compression_status": "success", "octave_path": "x.oct.md"}
+
+        with patch(STAGE, new_callable=AsyncMock, return_value=outcome) as stage:
+            job = await run_compression_job(job_path)
+
+        assert job is not None
+        assert job["status"] == "succeeded"
+        assert job["attempts"] == 1
+        assert job["result"] == outcome
+        assert stage.await_args.kwargs["project_root"] == root
+        assert stage.await_args.kwargs["description"] == "summary"
+        assert not job_path.with_suffix(".lock").exists()
+
+    @pytest.mark.asyncio
+    async def test_failure_requeues_with_backoff(self, queued_job):
+        """A failed attempt is re-queued for later with the error recorded."""
+        from datetime import UTC, datetime
+
+        from hestai_mcp.modules.tools.shared.compression_jobs import run_compression_job
+
+        _root, _job, job_path = queued_job
+
+        with patch(STAGE, new_callable=AsyncMock, side_effect=RuntimeError("provider down")):
+            job = await run_compression_job(job_path)
+
+        assert job is not None
+        assert job["status"] == "queued"
+        assert job["last_error"] == "provider down"
+        assert datetime.fromisoformat(job["next_attempt_at"]) > datetime.now(UTC)
+
+    @pytest.mark.asyncio
+    async def test_exhausted_attempts_mark_failed(self, queued_job):
+        """The last allowed attempt failing marks the job failed."""
+        from hestai_mcp.modules.tools.shared.compression_jobs import run_compression_job
+
+        _root, _job, job_path = queued_job
+        record = json.loads(job_path.read_text())
+        record["attempts"] = record["max_attempts"] - 1
+        job_path.write_text(json.dumps(record))
+
+        with patch(STAGE, new_callable=AsyncMock, return_value={"compression_status": "failed"}):
+            job = await run_compression_job(job_path)
+
+        assert job is not None
+        assert job["status"] == "failed"
+        assert job["last_error"] == "compression failed"
+
+    @pytest.mark.asyncio
+    async def test_claimed_job_is_skipped(self, queued_job):
+        """A job locked by another worker is not run."""
+        from hestai_mcp.modules.tools.shared.compression_jobs import run_compression_job
+
+        _root, _job, job_path = queued_job
+        job_path.with_suffix(".lock").write_text("12345")
+
+        with patch(STAGE, new_callable=AsyncMock) as stage:
+            assert await run_compression_job(job_path) is None
+
+        stage.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stale_claim_is_reclaimed(self, queued_job):
+        """A lock older than the lease (crashed worker) is taken over."""
+        from hestai_mcp.modules.tools.shared.compression_jobs import (
+            LEASE_SECONDS,
+            run_compression_job,
+        )
+
+        _root, _job, job_path = queued_job
+        lock = job_path.with_suffix(".lock")
+        lock.write_text("12345")
+        stale = time.time() - LEASE_SECONDS - 1
+        os.utime(lock, (stale, stale))
+
+        with patch(STAGE, new_callable=AsyncMock, return_value={"compression_status": "success"}):
+            job = await run_compression_job(job_path)
+
+        assert job is not None
+        assert job["status"] == "succeeded"
+
+    @pytest.mark.asyncio
+    async def test_running_job_renews_its_lease(self, queued_job):
+        """A job running longer than the renew interval keeps its claim fresh."""
+        from hestai_mcp.modules.tools.shared import compression_jobs
+
+        _root, _job, job_path = queued_job
+        lock = job_path.with_suffix(".lock")
+        ages: list[float] = []
+
+        async def slow_stage(**_kwargs):
+            # Age the claim as if the job had run for most of a lease
+            old = time.time() - compression_jobs.LEASE_SECONDS + 1
+            os.utime(lock, (old, old))
+            await asyncio.sleep(0.1)
+            ages.append(compression_jobs._lock_age(job_path))
+            return {"compression_status": "success"}
+
+        with (
+            patch.object(compression_jobs, "LEASE_RENEW_SECONDS", 0.01),
+            patch(STAGE, side_effect=slow_stage),
+        ):
+            job = await compression_jobs.run_compression_job(job_path)
+
+        assert job is not None
+        assert job["status"] == "succeeded"
+        assert ages[0] < 5
+        # The claim is released and its renewal task stopped
+        assert not lock.exists()
+        assert not [t for t in asyncio.all_tasks() if t.get_coro().__name__ == "_renew_lease"]
+
+    def test_stale_claim_is_reclaimed_only_once(self, queued_job):
+        """A worker that saw the stale lock before another reclaimed it backs off."""
+        from hestai_mcp.modules.tools.shared import compression_jobs
+
+        _root, _job, job_path = queued_job
+        lock = job_path.with_suffix(".lock")
+        lock.write_text("12345")
+        stale = time.time() - compression_jobs.LEASE_SECONDS - 1
+        os.utime(lock, (stale, stale))
+
+        assert compression_jobs._claim(job_path)  # worker A reclaims
+        fresh_lock = lock.read_text()
+
+        # Worker B observed the old stale lock just before A's reclaim
+        real_age = compression_jobs._lock_age
+        ages = iter([compression_jobs.LEASE_SECONDS + 1])
+        with patch.object(
+            compression_jobs, "_lock_age", side_effect=lambda p: next(ages, None) or real_age(p)
+        ):
+            assert not compression_jobs._claim(job_path)
+
+        assert lock.read_text() == fresh_lock
+
+    def test_backoff_grows_and_caps(self):
+        """Backoff doubles per attempt (with jitter) and is capped."""
+        from hestai_mcp.modules.tools.shared.compression_jobs import (
+            BACKOFF_BASE_SECONDS,
+            BACKOFF_MAX_SECONDS,
+            backoff_seconds,
+        )
+
+        assert BACKOFF_BASE_SECONDS / 2 <= backoff_seconds(1) <= BACKOFF_BASE_SECONDS
+        assert BACKOFF_BASE_SECONDS <= backoff_seconds(2) <= BACKOFF_BASE_SECONDS * 2
+        assert backoff_seconds(50) <= BACKOFF_MAX_SECONDS
+
+
+@pytest.mark.unit
+class TestCompressionJobWorker:
+    """Test the in-process async worker."""
+
+    @pytest.mark.asyncio
+    async def test_worker_drains_watched_project(self, queued_job):
+        """Watching a project runs its due jobs in the background."""
+        from hestai_mcp.modules.tools.shared.compression_jobs import CompressionJobWorker
+
+        root, _job, job_path = queued_job
+        worker = CompressionJobWorker(poll_seconds=0.05)
+
+        with patch(STAGE, new_callable=AsyncMock, return_value={"compression_status": "success"}):
+            worker.watch(root)
+            try:
+                for _ in range(100):
+                    if json.loads(job_path.read_text())["status"] == "succeeded":
+                        break
+                    await asyncio.sleep(0.01)
+            finally:
+                await worker.stop()
+
+        assert json.loads(job_path.read_text())["status"] == "succeeded"
+        assert not worker.running
@@ -0,0 +1,81 @@
+"""
+Tests for the token-budget-aware context packer.
+
+Test Coverage:
+- Everything fits: all sections in reading order
+- Priority decides what survives a tight budget
+- Line-boundary truncation and dropping of sections without useful room
+- Budget accounting (packed text stays within the budget)
+"""
+
+import pytest
+
+
+def _section(title: str, content: str, priority: int, order: int):
+    from hestai_mcp.modules.tools.shared.context_packer import ContextSection
+
+    return ContextSection(title=title, content=content, priority=priority, order=order)
+
+
+@pytest.mark.unit
+class TestPackSections:
+    """Test pack_sections."""
+
+    def test_all_sections_fit_in_reading_order(self):
+        """With ample budget every section is included, ordered by 'order'."""
+        from hestai_mcp.modules.tools.shared.context_packer import pack_sections
+
+        sections = [
+            _section("LOW", "low content", priority=1, order=0),
+            _section("HIGH", "high content", priority=9, order=1),
+        ]
+
+        packed = pack_sections("HEADER\n", sections, budget_tokens=1000)
+
+        assert packed.text == "HEADER\n=== LOW ===\nlow content\n\n=== HIGH ===\nhigh content"
+        assert packed.included == ["HIGH", "LOW"]
+        assert packed.truncated == [] and packed.dropped == []
+
+    def test_high_priority_section_survives_tight_budget(self):
+        """A large low-priority section is cut so the high-priority one stays whole."""
+        from hestai_mcp.modules.tools.shared.context_packer import pack_sections
+
+        bulky = "\n".join(f"line {i} " + "x" * 40 for i in range(200))
+        sections = [
+            _section("PROJECT", bulky, priority=70, order=0),
+            _section("CONSTRAINTS", "I3::HUMAN_PRIMACY", priority=80, order=1),
+        ]
+
+        packed = pack_sections("HEADER\n", sections, budget_tokens=250)
+
+        assert "I3::HUMAN_PRIMACY" in packed.text
+        assert packed.truncated == ["PROJECT"]
+        assert packed.text.index("=== PROJECT ===") < packed.text.index("=== CONSTRAINTS ===")
+        assert len(packed.text) <= 250 * 4
+        # Cut lands on a line boundary before the marker
+        body = packed.text.split("=== PROJECT ===\n")[1].split("\n... [truncated]")[0]
+        assert body.splitlines()[-1].endswith("x" * 40)
+
+    def test_section_without_useful_room_is_dropped(self):
+        """Sections that would be cut below MIN_SECTION_CHARS are dropped."""
+        from hestai_mcp.modules.tools.shared.context_packer import pack_sections
+
+        sections = [
+            _section("FIRST", "a" * 350, priority=9, order=0),
+            _section("SECOND", "b" * 1000, priority=1, order=1),
+        ]
+
+        packed = pack_sections("", sections, budget_tokens=100)
+
+        assert packed.included == ["FIRST"]
+        assert packed.dropped == ["SECOND"]
+        assert "b" not in packed.text
+
+    def test_empty_sections_are_skipped(self):
+        """Whitespace-only sections are not rendered."""
+        from hestai_mcp.modules.tools.shared.context_packer import pack_sections
+
+        packed = pack_sections("H\n", [_section("EMPTY", "  \n", 5, 0)], budget_tokens=100)
+
+        assert packed.text == "H\n"
+        assert packed.included == []
@@ -0,0 +1,247 @@
+"""
+Tests for deterministic transcript distillation before OCTAVE compression.
+
+Test Coverage:
+- Envelope stripping (only text, tool names and parameter summaries survive)
+- Tool output truncation
+- Repeated file read deduplication (reset by edits/writes)
+- Reduction ratio reporting
+- Malformed lines skipped and counted
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+def _write_records(path: Path, records: list[dict]) -> Path:
+    path.write_text("\n".join(json.dumps(r) for r in records) + "\n")
+    return path
+
+
+def _user(text: str) -> dict:
+    return {
+        "type": "user",
+        "uuid": "0f8e3c1a-envelope-uuid",
+        "cwd": "/home/dev/project",
+        "message": {"role": "user", "content": [{"type": "text", "text": text}]},
+    }
+
+
+def _read(tool_id: str, file_path: str) -> dict:
+    return {"type": "tool_use", "id": tool_id, "name": "Read", "input": {"file_path": file_path}}
+
+
+def _result(tool_id: str, output: str, is_error: bool = False) -> dict:
+    return {
+        "type": "tool_result",
+        "tool_use_id": tool_id,
+        "is_error": is_error,
+        "content": [{"type": "text", "text": output}],
+    }
+
+
+@pytest.mark.unit
+class TestDistillTranscript:
+    """Test distill_transcript() rules and accounting."""
+
+    def test_keeps_text_and_strips_envelopes(self, tmp_path: Path):
+        """User/assistant text is kept; envelope metadata is not."""
+        from hestai_mcp.modules.tools.shared.distillation import distill_transcript
+
+        transcript = _write_records(
+            tmp_path / "t.jsonl",
+            [
+                _user("Please fix the parser"),
+                {
+                    "type": "assistant",
+                    "message": {
+                        "role": "assistant",
+                        "model": "claude-test",
+                        "usage": {"input_tokens": 1234},
+                        "content": [{"type": "text", "text": "Fixed it"}],
+                    },
+                },
+            ],
+        )
+
+        distilled = distill_transcript(transcript)
+
+        assert distilled.lines == [
+            "USER: Please fix the parser",
+            "MODEL: claude-test",
+            "ASSISTANT: Fixed it",
+        ]
+        assert "envelope-uuid" not in distilled.text
+        assert "input_tokens" not in distilled.text
+
+    def test_truncates_long_tool_output(self, tmp_path: Path):
+        """Tool outputs beyond MAX_TOOL_OUTPUT_CHARS are truncated with a marker."""
+        from hestai_mcp.modules.tools.shared.distillation import (
+            MAX_TOOL_OUTPUT_CHARS,
+            distill_transcript,
+        )
+
+        transcript = _write_records(
+            tmp_path / "t.jsonl",
+            [
+                {"type": "tool_use", "id": "t1", "name": "Bash", "input": {"command": "ls"}},
+                _result("t1", "x" * 10_000),
+            ],
+        )
+
+        distilled = distill_transcript(transcript)
+
+        assert distilled.lines[0] == "TOOL_USE Bash(command=ls)"
+        assert distilled.lines[1].startswith("TOOL_RESULT: xxx")
+        assert distilled.lines[1].endswith("[truncated]")
+        assert len(distilled.lines[1]) == len("TOOL_RESULT: ") + MAX_TOOL_OUTPUT_CHARS
+        assert distilled.truncated_outputs == 1
+
+    def test_deduplicates_repeated_reads(self, tmp_path: Path):
+        """A second Read of the same file drops both the call and its output."""
+        from hestai_mcp.modules.tools.shared.distillation import distill_transcript
+
+        transcript = _write_records(
+            tmp_path / "t.jsonl",
+            [
+                _read("r1", "src/app.py"),
+                _result("r1", "print('v1')"),
+                _read("r2", "src/app.py"),
+                _result("r2", "print('v1')"),
+                _read("r3", "src/other.py"),
+                _result("r3", "pass"),
+            ],
+        )
+
+        distilled = distill_transcript(transcript)
+
+        assert distilled.lines == [
+            "TOOL_USE Read(file_path=src/app.py)",
+            "TOOL_RESULT: print('v1')",
+            "TOOL_USE Read(file_path=src/other.py)",
+            "TOOL_RESULT: pass",
+        ]
+        assert distilled.deduplicated_reads == 1
+
+    def test_keeps_reread_after_edit(self, tmp_path: Path):
+        """A Read after an Edit/Write of the same file is new content and is kept."""
+        from hestai_mcp.modules.tools.shared.distillation import distill_transcript
+
+        edit = {
+            "type": "tool_use",
+            "id": "e1",
+            "name": "Edit",
+            "input": {"file_path": "src/app.py", "old_string": "v1", "new_string": "v2"},
+        }
+        transcript = _write_records(
+            tmp_path / "t.jsonl",
+            [
+                _read("r1", "src/app.py"),
+                _result("r1", "print('v1')"),
+                edit,
+                _result("e1", "ok"),
+                _read("r2", "src/app.py"),
+                _result("r2", "print('v2')"),
+                _read("r3", "src/app.py"),
+                _result("r3", "print('v2')"),
+            ],
+        )
+
+        distilled = distill_transcript(transcript)
+
+        assert distilled.lines.count("TOOL_USE Read(file_path=src/app.py)") == 2
+        assert "TOOL_RESULT: print('v2')" in distilled.lines
+        assert distilled.deduplicated_reads == 1
+
+    def test_source_size_counts_decompressed_characters(self, tmp_path: Path):
+        """Compressed archives report the same source size as their plain JSONL."""
+        from hestai_mcp.events.jsonl_archive import write_jsonl_archive
+        from hestai_mcp.modules.tools.shared.distillation import distill_transcript
+
+        plain = _write_records(
+            tmp_path / "t.jsonl", [_user("q" * 50), _read("r1", "f.py"), _result("r1", "x" * 5000)]
+        )
+        archive = tmp_path / "t.jsonl.gz"
+        write_jsonl_archive(plain, archive)
+
+        assert archive.stat().st_size < plain.stat().st_size
+        assert distill_transcript(archive).source_chars == len(plain.read_text())
+        assert distill_transcript(archive).stats() == distill_transcript(plain).stats()
+
+    def test_keeps_tool_errors(self, tmp_path: Path):
+        """Failed tool calls stay visible as TOOL_ERROR lines."""
+        from hestai_mcp.modules.tools.shared.distillation import distill_transcript
+
+        transcript = _write_records(
+            tmp_path / "t.jsonl", [_result("t1", "permission denied", is_error=True)]
+        )
+
+        assert distill_transcript(transcript).lines == ["TOOL_ERROR: permission denied"]
+
+    def test_skips_and_counts_malformed_lines(self, tmp_path: Path):
+        """A corrupt line is skipped; the rest of the transcript is still distilled."""
+        from hestai_mcp.modules.tools.shared.distillation import distill_transcript
+
+        transcript = tmp_path / "t.jsonl"
+        transcript.write_text(
+            json.dumps(_user("before"))
+            + "\n"
+            + '{"type": "user", "message": {"role": "us'
+            + "\n42\n"
+            + json.dumps(_user("after"))
+            + "\n"
+        )
+
+        distilled = distill_transcript(transcript)
+
+        assert distilled.lines == ["USER: before", "USER: after"]
+        assert distilled.malformed_lines == 2
+        assert distilled.stats()["malformed_lines"] == 2
+
+    def test_summarizes_long_parameters(self):
+        """Long and non-string parameter values are summarized."""
+        from hestai_mcp.modules.tools.shared.distillation import (
+            MAX_PARAM_VALUE_CHARS,
+            summarize_parameters,
+        )
+
+        summary = summarize_parameters({"content": "c" * 1000, "limit": 50, "flags": ["-a"]})
+
+        content, limit, flags = summary.split(", ")
+        assert len(content) == len("content=") + MAX_PARAM_VALUE_CHARS
+        assert limit == "limit=50"
+        assert flags == 'flags=["-a"]'
+
+    def test_reports_reduction_ratio(self, tmp_path: Path):
+        """Stats report estimated source/distilled tokens and their ratio."""
+        from hestai_mcp.modules.tools.shared.distillation import distill_transcript
+
+        transcript = _write_records(
+            tmp_path / "t.jsonl",
+            [_user("short question"), _read("r1", "big.py"), _result("r1", "y" * 20_000)],
+        )
+
+        stats = distill_transcript(transcript).stats()
+
+        assert stats["source_tokens"] > stats["distilled_tokens"] > 0
+        assert 0.9 < stats["reduction_ratio"] <= 1.0
+        assert stats["event_count"] == 3
+
+    def test_is_deterministic(self, tmp_path: Path):
+        """Same transcript always distills to the same text."""
+        from hestai_mcp.modules.tools.shared.distillation import distill_transcript
+
+        transcript = _write_records(
+            tmp_path / "t.jsonl", [_user("a"), _read("r1", "f.py"), _result("r1", "z" * 900)]
+        )
+
+        assert distill_transcript(transcript).text == distill_transcript(transcript).text
+
+    def test_missing_transcript_raises(self, tmp_path: Path):
+        """Missing transcript raises FileNotFoundError."""
+        from hestai_mcp.modules.tools.shared.distillation import distill_transcript
+
+        with pytest.raises(FileNotFoundError):
+            distill_transcript(tmp_path / "missing.jsonl")
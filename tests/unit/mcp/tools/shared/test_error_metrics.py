@@ -0,0 +1,326 @@
+"""
+Tests for the indexed RCCAFP error-metrics reader.
+
+Test Coverage:
+- Lookup by record_id and session/time filters via byte offsets
+- Incremental refresh (only appended bytes parsed, torn lines deferred)
+- Rebuild when error-metrics.jsonl is truncated, not when a stat is stale
+- CRC trailers: corrupt lines skipped, records after torn fragments recovered
+- Escalation rate by role (no window, date window, timestamp window)
+- Repeated root causes grouped after normalization
+- query_error_metrics project-level wrapper
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from hestai_mcp.modules.tools.shared import error_metrics
+
+
+@pytest.fixture()
+def state_dir(tmp_path: Path) -> Path:
+    state = tmp_path / ".hestai" / "state"
+    state.mkdir(parents=True)
+    return state
+
+
+def _record(record_id: str, **overrides) -> dict:
+    return {
+        "record_id": record_id,
+        "timestamp": "2026-03-01T10:00:00+00:00",
+        "session_id": "s1",
+        "agent_role": "implementation-lead",
+        "context_summary": "pagination",
+        "root_cause_analysis": "Off-by-one in cursor query",
+        "fix_attempt_1": "adjusted limit",
+        "escalation_required": False,
+        "future_proofing_rule": "boundary tests",
+        **overrides,
+    }
+
+
+def _append(state_dir: Path, *records: dict) -> None:
+    with (state_dir / error_metrics.METRICS_FILE).open("a") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+@pytest.mark.unit
+class TestRecordLookup:
+    """Test record retrieval through the offset index."""
+
+    def test_get_record_by_id(self, state_dir):
+        """A record is read back by record_id."""
+        _append(state_dir, _record("r1"), _record("r2", context_summary="second"))
+
+        record = error_metrics.get_record(state_dir, "r2")
+
+        assert record is not None
+        assert record["context_summary"] == "second"
+        assert error_metrics.get_record(state_dir, "missing") is None
+
+    def test_missing_metrics_file(self, state_dir):
+        """No JSONL means no records and nothing indexed."""
+        assert error_metrics.refresh_error_metrics_index(state_dir) == 0
+        assert error_metrics.get_record(state_dir, "r1") is None
+
+    def test_find_records_by_session_and_window(self, state_dir):
+        """Session and time filters combine; results are newest first."""
+        _append(
+            state_dir,
+            _record("r1", timestamp="2026-03-01T10:00:00+00:00"),
+            _record("r2", timestamp="2026-03-02T10:00:00+00:00"),
+            _record("r3", timestamp="2026-03-03T10:00:00+00:00", session_id="s2"),
+        )
+
+        session = error_metrics.find_records(state_dir, session_id="s1")
+        window = error_metrics.find_records(state_dir, since="2026-03-02T00:00:00Z")
+
+        assert [r["record_id"] for r in session] == ["r2", "r1"]
+        assert [r["record_id"] for r in window] == ["r3", "r2"]
+
+    def test_offsets_normalized_to_utc(self, state_dir):
+        """Timestamps with offsets compare in UTC."""
+        _append(state_dir, _record("r1", timestamp="2026-03-01T23:30:00-02:00"))
+
+        assert error_metrics.find_records(state_dir, since="2026-03-02T01:00:00+00:00")
+        assert not error_metrics.find_records(state_dir, until="2026-03-02T01:00:00+00:00")
+
+    def test_invalid_bound_raises(self, state_dir):
+        """An unparseable bound is rejected."""
+        with pytest.raises(ValueError):
+            error_metrics.find_records(state_dir, since="yesterday")
+
+    async def test_reads_submitted_record(self, tmp_path):
+        """Records written by submit_rccafp_record are indexed."""
+        from hestai_mcp.modules.tools.submit_rccafp import submit_rccafp_record
+
+        (tmp_path / ".git").mkdir()
+        state = tmp_path / ".hestai" / "state"
+        state.mkdir(parents=True)
+        result = await submit_rccafp_record(
+            working_dir=str(tmp_path),
+            context_summary="pagination",
+            root_cause_analysis="Off-by-one",
+            fix_attempt_1="adjusted limit",
+            escalation_required=True,
+            future_proofing_rule="boundary tests",
+        )
+
+        record = error_metrics.get_record(state, result["record_id"])
+
+        assert record is not None
+        assert record["escalation_required"] is True
+
+
+@pytest.mark.unit
+class TestIncrementalRefresh:
+    """Test that refreshes only parse appended bytes."""
+
+    def test_only_new_lines_indexed(self, state_dir):
+        """A second refresh indexes just the appended records."""
+        _append(state_dir, _record("r1"), _record("r2"))
+        assert error_metrics.refresh_error_metrics_index(state_dir) == 2
+        assert error_metrics.refresh_error_metrics_index(state_dir) == 0
+
+        _append(state_dir, _record("r3"))
+
+        assert error_metrics.refresh_error_metrics_index(state_dir) == 1
+        assert error_metrics.get_record(state_dir, "r3") is not None
+
+    def test_torn_line_waits(self, state_dir):
+        """A trailing line without newline is indexed once completed."""
+        _append(state_dir, _record("r1"))
+        torn = json.dumps(_record("r2"))
+        with (state_dir / error_metrics.METRICS_FILE).open("a") as f:
+            f.write(torn[:20])
+
+        assert error_metrics.refresh_error_metrics_index(state_dir) == 1
+        assert error_metrics.get_record(state_dir, "r2") is None
+
+        with (state_dir / error_metrics.METRICS_FILE).open("a") as f:
+            f.write(torn[20:] + "\n")
+
+        assert error_metrics.get_record(state_dir, "r2") is not None
+
+    def test_malformed_line_skipped(self, state_dir):
+        """Malformed lines are skipped without blocking later records."""
+        with (state_dir / error_metrics.METRICS_FILE).open("a") as f:
+            f.write("not json\n")
+        _append(state_dir, _record("r1"))
+
+        assert error_metrics.get_record(state_dir, "r1") is not None
+
+    def test_duplicate_record_counted_once(self, state_dir):
+        """A repeated record_id does not inflate aggregates."""
+        _append(state_dir, _record("r1"), _record("r1"))
+
+        rates = error_metrics.escalation_rate_by_role(state_dir)
+
+        assert rates["implementation-lead"]["total"] == 1
+
+    def test_truncated_file_reindexed(self, state_dir):
+        """A JSONL that shrank is indexed again from the start."""
+        _append(state_dir, _record("r1"), _record("r2"), _record("r3"))
+        error_metrics.refresh_error_metrics_index(state_dir)
+
+        (state_dir / error_metrics.METRICS_FILE).write_text(json.dumps(_record("r9")) + "\n")
+
+        assert error_metrics.get_record(state_dir, "r1") is None
+        assert error_metrics.get_record(state_dir, "r9") is not None
+        rates = error_metrics.escalation_rate_by_role(state_dir)
+        assert rates["implementation-lead"]["total"] == 1
+
+    def test_stale_stat_not_mistaken_for_truncation(self, state_dir, monkeypatch):
+        """A refresh that lost the race to a newer one indexes nothing more."""
+        _append(state_dir, _record("r1"))
+        error_metrics.refresh_error_metrics_index(state_dir)
+        _append(state_dir, _record("r2"))
+
+        connect = error_metrics._connect
+        raced = []
+
+        def racing_connect(path):
+            # Between the caller's stat and its transaction, another process
+            # appends and indexes past the caller's stale file size
+            if not raced:
+                raced.append(True)
+                _append(state_dir, _record("r3"))
+                assert error_metrics.refresh_error_metrics_index(state_dir) == 2
+            return connect(path)
+
+        monkeypatch.setattr(error_metrics, "_connect", racing_connect)
+
+        assert error_metrics.refresh_error_metrics_index(state_dir) == 0
+        rates = error_metrics.escalation_rate_by_role(state_dir)
+        assert rates["implementation-lead"]["total"] == 3
+
+
+@pytest.mark.unit
+class TestRecordFraming:
+    """Test CRC trailers and torn-line detection."""
+
+    def test_round_trip(self):
+        """encode_record output decodes to the same record."""
+        record = _record("r1", root_cause_analysis="Traceback:\n  ü" * 500)
+
+        line = error_metrics.encode_record(record)
+
+        assert line.endswith(b'"}\n')
+        assert line.count(b"\n") == 1
+        assert error_metrics.decode_record(line) == (0, record)
+
+    def test_corrupt_line_rejected(self, state_dir):
+        """A line whose CRC does not match is skipped."""
+        line = error_metrics.encode_record(_record("r1"))
+        corrupt = line.replace(b"cursor", b"cursed")
+        (state_dir / error_metrics.METRICS_FILE).write_bytes(corrupt)
+
+        assert error_metrics.decode_record(corrupt) is None
+        assert error_metrics.get_record(state_dir, "r1") is None
+
+    def test_record_after_torn_fragment_recovered(self, state_dir):
+        """A complete record sharing a line with a torn fragment is indexed."""
+        torn = error_metrics.encode_record(_record("r1"))[:60]
+        (state_dir / error_metrics.METRICS_FILE).write_bytes(
+            torn + error_metrics.encode_record(_record("r2")) + b"\n"
+        )
+
+        assert error_metrics.get_record(state_dir, "r1") is None
+        record = error_metrics.get_record(state_dir, "r2")
+        assert record is not None
+        assert "crc32" not in record
+        assert error_metrics.refresh_error_metrics_index(state_dir) == 0
+
+
+@pytest.mark.unit
+class TestAggregates:
+    """Test maintained escalation and root-cause aggregates."""
+
+    @pytest.fixture()
+    def populated(self, state_dir):
+        _append(
+            state_dir,
+            _record("r1", timestamp="2026-03-01T09:00:00+00:00", escalation_required=True),
+            _record("r2", timestamp="2026-03-01T18:00:00+00:00"),
+            _record("r3", timestamp="2026-03-02T09:00:00+00:00", agent_role="critical-engineer"),
+            _record("r4", timestamp="2026-03-03T09:00:00+00:00", agent_role=None),
+        )
+        return state_dir
+
+    def test_rate_without_window(self, populated):
+        """All records count; records without a role fall under unknown."""
+        rates = error_metrics.escalation_rate_by_role(populated)
+
+        assert rates["implementation-lead"] == {"total": 2, "escalated": 1, "rate": 0.5}
+        assert rates["critical-engineer"]["rate"] == 0.0
+        assert rates[error_metrics.UNKNOWN_ROLE]["total"] == 1
+
+    def test_rate_with_date_window(self, populated):
+        """Date-only bounds select whole days."""
+        rates = error_metrics.escalation_rate_by_role(
+            populated, since="2026-03-01", until="2026-03-02"
+        )
+
+        assert set(rates) == {"implementation-lead", "critical-engineer"}
+        assert rates["implementation-lead"]["total"] == 2
+
+    def test_rate_with_timestamp_window(self, populated):
+        """Timestamp bounds select individual records."""
+        rates = error_metrics.escalation_rate_by_role(
+            populated, since="2026-03-01T12:00:00Z", until="2026-03-02T12:00:00Z"
+        )
+
+        assert rates["implementation-lead"] == {"total": 1, "escalated": 0, "rate": 0.0}
+        assert rates["critical-engineer"]["total"] == 1
+
+    def test_repeat_root_causes_normalized(self, state_dir):
+        """Causes differing only in case and punctuation are grouped."""
+        _append(
+            state_dir,
+            _record("r1", root_cause_analysis="Off-by-one in cursor query"),
+            _record("r2", root_cause_analysis="off by one in cursor query."),
+            _record("r3", root_cause_analysis="Stale cache entry"),
+        )
+
+        repeats = error_metrics.repeat_root_causes(state_dir)
+
+        assert len(repeats) == 1
+        assert repeats[0]["root_cause"] == "off by one in cursor query"
+        assert repeats[0]["count"] == 2
+        assert repeats[0]["last_record_id"] == "r2"
+        assert len(error_metrics.repeat_root_causes(state_dir, min_count=1)) == 2
+
+
+@pytest.mark.unit
+class TestQueryErrorMetrics:
+    """Test the project-level reader behind the query_error_metrics tool."""
+
+    def test_records_and_aggregates(self, tmp_path, state_dir):
+        """Records, escalation rates and repeat causes come back together."""
+        _append(
+            state_dir,
+            _record("r1", escalation_required=True),
+            _record("r2", session_id="s2"),
+        )
+
+        result = error_metrics.query_error_metrics(tmp_path, session_id="s1")
+
+        assert [r["record_id"] for r in result["records"]] == ["r1"]
+        assert result["count"] == 1
+        assert result["escalation_by_role"]["implementation-lead"]["escalated"] == 1
+        assert result["repeat_root_causes"][0]["count"] == 2
+
+    def test_no_metrics_file(self, tmp_path):
+        """A project without RCCAFP records returns an empty result."""
+        result = error_metrics.query_error_metrics(tmp_path)
+
+        assert result == {
+            "records": [],
+            "count": 0,
+            "escalation_by_role": {},
+            "repeat_root_causes": [],
+        }
+        assert not (tmp_path / ".hestai").exists()
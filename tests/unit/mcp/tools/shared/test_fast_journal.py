@@ -0,0 +1,234 @@
+"""
+Tests for the append-only FAST layer journal.
+
+Test Coverage:
+- Lifecycle events appended once per batch and compacted into snapshots
+- Deferred compaction (compact=False) and on-demand compact_fast_layer
+- Hand edits of the snapshots journaled as external_edit markers
+- Point-in-time state rebuild from the journal
+- Torn trailing lines and size-based rotation under the journal lock
+"""
+
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+T0 = datetime(2026, 1, 1, 9, 0, tzinfo=UTC)
+
+
+class _Clock(datetime):
+    """datetime whose now() is controlled by the test."""
+
+    current = T0
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+def _state_dir(project: Path) -> Path:
+    return project / ".hestai" / "state" / "context" / "state"
+
+
+def _events(state_dir: Path) -> list[str]:
+    lines = (state_dir / "fast-journal.jsonl").read_text().splitlines()
+    return [json.loads(line)["event"] for line in lines]
+
+
+@pytest.mark.unit
+class TestFastJournalLifecycle:
+    """Test journaling of clock_in/clock_out."""
+
+    def test_clock_in_and_out_append_and_compact(self, tmp_path: Path):
+        """Each lifecycle batch is journaled and compacted into the snapshots."""
+        from hestai_mcp.modules.tools.shared.fast_layer import (
+            update_fast_layer_on_clock_in,
+            update_fast_layer_on_clock_out,
+        )
+
+        with patch(
+            "hestai_mcp.modules.tools.shared.fast_layer.get_current_branch",
+            return_value="main",
+        ):
+            update_fast_layer_on_clock_in(tmp_path, "s1", "impl", "issue-1")
+        update_fast_layer_on_clock_out(tmp_path, "s1")
+
+        state_dir = _state_dir(tmp_path)
+        assert _events(state_dir) == [
+            "baseline",
+            "focus",
+            "checklist_started",
+            "blockers_session",
+            "compacted",
+            "focus",
+            "checklist_completed",
+            "blockers_pruned",
+            "compacted",
+        ]
+        assert "SESSION::NONE" in (state_dir / "current-focus.oct.md").read_text()
+        assert 'SESSION::"s1[COMPLETED]"' in (state_dir / "checklist.oct.md").read_text()
+
+    def test_deferred_events_apply_on_compaction(self, tmp_path: Path):
+        """compact=False appends only; readers of current_state still see the change."""
+        from hestai_mcp.modules.tools.shared.fast_journal import (
+            blockers_session_event,
+            compact_fast_layer,
+            current_state,
+            record_events,
+        )
+
+        record_events(tmp_path, [blockers_session_event("s1")], compact=True)
+        record_events(tmp_path, [blockers_session_event("s2")])
+
+        blockers_path = tmp_path / "blockers.oct.md"
+        assert 'SESSION::"s1"' in blockers_path.read_text()
+        blockers = current_state(tmp_path).blockers
+        assert blockers is not None
+        assert 'SESSION::"s2"' in blockers.render()
+
+        compact_fast_layer(tmp_path)
+        assert 'SESSION::"s2"' in blockers_path.read_text()
+
+    def test_hand_edit_is_journaled_before_pending_events(self, tmp_path: Path):
+        """A snapshot edited by hand is kept, with deferred events re-applied on top."""
+        from hestai_mcp.modules.tools.shared.fast_journal import (
+            blockers_pruned_event,
+            blockers_session_event,
+            compact_fast_layer,
+            record_events,
+        )
+
+        record_events(tmp_path, [blockers_session_event("s1")], compact=True)
+        blockers_path = tmp_path / "blockers.oct.md"
+        blockers_path.write_text(
+            blockers_path.read_text().replace(
+                "ACTIVE:",
+                "ACTIVE:\n  blocker_001:\n"
+                '    DESCRIPTION::"Fixed issue"\n'
+                "    STATUS::RESOLVED\n"
+                "  blocker_002:\n"
+                '    DESCRIPTION::"Still pending"\n'
+                "    STATUS::UNRESOLVED",
+            )
+        )
+        record_events(tmp_path, [blockers_pruned_event("s1")])
+        compact_fast_layer(tmp_path)
+
+        assert _events(tmp_path)[-3:] == ["external_edit", "blockers_pruned", "compacted"]
+        content = blockers_path.read_text()
+        assert 'DESCRIPTION::"Still pending"' in content
+        assert 'DESCRIPTION::"Fixed issue"' not in content
+
+
+@pytest.mark.unit
+class TestFastJournalHistory:
+    """Test replay, torn lines and rotation."""
+
+    def test_state_can_be_rebuilt_at_a_past_time(self, tmp_path: Path, monkeypatch):
+        """fast_state_at replays the journal up to the requested time."""
+        from hestai_mcp.modules.tools.shared import fast_journal
+        from hestai_mcp.modules.tools.shared.fast_journal import (
+            checklist_completed_event,
+            checklist_started_event,
+            fast_state_at,
+            record_events,
+        )
+
+        monkeypatch.setattr(fast_journal, "datetime", _Clock)
+        _Clock.current = T0
+        record_events(tmp_path, [checklist_started_event("s1", "issue-1", [])])
+        _Clock.current = T0 + timedelta(hours=1)
+        record_events(tmp_path, [checklist_completed_event("s1")])
+
+        during = fast_state_at(tmp_path, T0 + timedelta(minutes=30))
+        after = fast_state_at(tmp_path, T0 + timedelta(hours=2))
+
+        assert fast_state_at(tmp_path, T0 - timedelta(minutes=1)) is None
+        assert during is not None and during.checklist is not None
+        assert during.checklist.session == "s1"
+        assert after is not None and after.checklist is not None
+        assert after.checklist.session == "s1[COMPLETED]"
+
+    def test_torn_trailing_line_is_ignored(self, tmp_path: Path):
+        """A partially written last line is skipped until it is completed."""
+        from hestai_mcp.modules.tools.shared.fast_journal import (
+            blockers_session_event,
+            read_journal,
+            record_events,
+        )
+
+        record_events(tmp_path, [blockers_session_event("s1")])
+        count = len(read_journal(tmp_path))
+        with (tmp_path / "fast-journal.jsonl").open("a") as f:
+            f.write('{"v":1,"seq":99,"ts":"2026-01-01T00:00:00+00:00","event":"foc')
+
+        assert len(read_journal(tmp_path)) == count
+
+    def test_hand_edit_is_visible_to_fast_state_at(self, tmp_path: Path):
+        """Replaying to now matches a snapshot edited by hand since the last write."""
+        from hestai_mcp.modules.tools.shared.fast_journal import (
+            blockers_session_event,
+            fast_state_at,
+            record_events,
+        )
+
+        record_events(tmp_path, [blockers_session_event("s1")], compact=True)
+        blockers_path = tmp_path / "blockers.oct.md"
+        blockers_path.write_text(
+            blockers_path.read_text().replace(
+                "ACTIVE:", 'ACTIVE:\n  blocker_001:\n    DESCRIPTION::"Manual"'
+            )
+        )
+
+        state = fast_state_at(tmp_path, datetime.now(UTC) + timedelta(minutes=1))
+
+        assert state is not None and state.blockers is not None
+        assert 'DESCRIPTION::"Manual"' in state.blockers.render()
+        assert _events(tmp_path)[-1] == "external_edit"
+
+    def test_large_journal_rotates_to_baseline(self, tmp_path: Path, monkeypatch):
+        """Past MAX_JOURNAL_BYTES, compaction leaves a single baseline record."""
+        from hestai_mcp.modules.tools.shared import fast_journal
+
+        monkeypatch.setattr(fast_journal, "MAX_JOURNAL_BYTES", 200)
+        fast_journal.record_events(
+            tmp_path, [fast_journal.blockers_session_event("s1")], compact=True
+        )
+
+        assert _events(tmp_path) == ["baseline"]
+        state = fast_journal.current_state(tmp_path)
+        assert state.blockers is not None
+        assert 'SESSION::"s1"' in state.blockers.render()
+
+    def test_rotation_keeps_appends_made_under_the_lock(self, tmp_path: Path, monkeypatch):
+        """An append waiting on the journal lock lands after rotation, not in the old file."""
+        import threading
+
+        from hestai_mcp.modules.tools.shared import fast_journal
+
+        monkeypatch.setattr(fast_journal, "MAX_JOURNAL_BYTES", 200)
+        fast_journal.record_events(tmp_path, [fast_journal.blockers_session_event("s1")])
+
+        rotating = threading.Event()
+        original = fast_journal.write_if_changed
+
+        def slow_rotation(path, content):
+            rotating.set()
+            # Give the concurrent writer time to reach the lock
+            threading.Event().wait(0.1)
+            return original(path, content)
+
+        monkeypatch.setattr(fast_journal, "write_if_changed", slow_rotation)
+        compactor = threading.Thread(target=fast_journal.compact_fast_layer, args=(tmp_path,))
+        compactor.start()
+        assert rotating.wait(5)
+        fast_journal.record_events(tmp_path, [fast_journal.blockers_session_event("s2")])
+        compactor.join()
+
+        assert _events(tmp_path) == ["baseline", "blockers_session"]
+        state = fast_journal.current_state(tmp_path)
+        assert state.blockers is not None
+        assert 'SESSION::"s2"' in state.blockers.render()
@@ -0,0 +1,151 @@
+"""
+Tests for the typed FAST layer state model.
+
+Test Coverage:
+- Blocker parsing with arbitrary fields and byte-for-byte round trips
+- Checklist item parsing and carry-forward selection
+- Focus parsing of active and completed sessions
+- Parse caching by mtime across a clock_in/clock_out cycle
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+BLOCKERS = """===BLOCKERS===
+META:
+  TYPE::FAST_BLOCKERS
+  SESSION::"s0"
+
+ACTIVE:
+  blocker_001:
+    DESCRIPTION::"Flaky CI"
+    OWNER::infra
+
+    STATUS::RESOLVED
+  blocker_002:
+    DESCRIPTION::"Waiting on review"
+    STATUS::UNRESOLVED
+    LINKS::[PR#12]
+NOTES::"kept verbatim"
+===END===
+"""
+
+
+@pytest.mark.unit
+class TestBlockersState:
+    """Test blockers.oct.md parsing and transforms."""
+
+    def test_round_trip_is_byte_identical(self):
+        """Parsing then rendering reproduces the document exactly."""
+        from hestai_mcp.modules.tools.shared.fast_state import BlockersState
+
+        assert BlockersState.parse(BLOCKERS).render() == BLOCKERS
+
+    def test_blockers_expose_arbitrary_fields(self):
+        """Every KEY::VALUE line of a blocker is available as a field."""
+        from hestai_mcp.modules.tools.shared.fast_state import BlockersState
+
+        blockers = BlockersState.parse(BLOCKERS).blockers
+
+        assert [b.name for b in blockers] == ["blocker_001", "blocker_002"]
+        assert blockers[0].fields["OWNER"] == "infra"
+        assert blockers[0].resolved
+        assert blockers[1].fields == {
+            "DESCRIPTION": "Waiting on review",
+            "STATUS": "UNRESOLVED",
+            "LINKS": "[PR#12]",
+        }
+
+    def test_without_resolved_and_with_session(self):
+        """Resolved blockers are removed whole; SESSION fields are re-pointed."""
+        from hestai_mcp.modules.tools.shared.fast_state import BlockersState
+
+        rendered = BlockersState.parse(BLOCKERS).without_resolved().with_session("s1").render()
+
+        assert "blocker_001" not in rendered
+        assert "OWNER::infra" not in rendered
+        assert "LINKS::[PR#12]" in rendered
+        assert 'NOTES::"kept verbatim"' in rendered
+        assert 'SESSION::"s1"' in rendered
+
+
+@pytest.mark.unit
+class TestChecklistAndFocusState:
+    """Test checklist and focus models."""
+
+    def test_incomplete_items_are_carried_forward(self):
+        """PENDING/IN_PROGRESS items (not the session task) carry forward."""
+        from hestai_mcp.modules.tools.shared.fast_state import ChecklistState
+
+        previous = ChecklistState.parse(
+            '===SESSION_CHECKLIST===\nMETA:\n  SESSION::"s0"\n\nITEMS:\n'
+            "  session_task::IN_PROGRESS\n  write_tests::PENDING\n  lint::DONE\n===END===\n"
+        )
+        checklist = ChecklistState.for_session("s1", "issue-1", previous.incomplete_items())
+
+        assert previous.session == "s0"
+        assert [i.name for i in previous.incomplete_items()] == ["write_tests"]
+        assert ChecklistState.parse(checklist.render()) == checklist
+        assert "write_tests::PENDING[from_previous_session]" in checklist.render()
+        assert checklist.completed("s1").session == "s1[COMPLETED]"
+
+    def test_focus_round_trip(self):
+        """Active and completed focus documents parse back to the same model."""
+        from hestai_mcp.modules.tools.shared.fast_state import FocusState
+
+        active = FocusState("s1", "impl", "issue-1", "main", "2026-01-01T00:00:00+00:00")
+        done = FocusState("s1", completed="2026-01-01T01:00:00+00:00")
+
+        assert active.active and not done.active
+        assert FocusState.parse(active.render()) == active
+        assert FocusState.parse(done.render()) == done
+
+
+@pytest.mark.unit
+class TestFastStateCache:
+    """Test single parse per lifecycle via the mtime cache."""
+
+    def test_clock_out_reuses_models_written_by_clock_in(self, tmp_path: Path):
+        """Files written by clock_in are not re-read or re-parsed by clock_out."""
+        from hestai_mcp.modules.tools.shared import fast_state
+        from hestai_mcp.modules.tools.shared.fast_layer import (
+            update_fast_layer_on_clock_in,
+            update_fast_layer_on_clock_out,
+        )
+
+        with patch(
+            "hestai_mcp.modules.tools.shared.fast_layer.get_current_branch",
+            return_value="main",
+        ):
+            update_fast_layer_on_clock_in(tmp_path, "s1", "impl", "issue-1")
+
+        with (
+            patch.object(fast_state.BlockersState, "parse") as parse_blockers,
+            patch.object(fast_state.ChecklistState, "parse") as parse_checklist,
+            patch.object(fast_state.FocusState, "parse") as parse_focus,
+        ):
+            update_fast_layer_on_clock_out(tmp_path, "s1")
+
+        assert parse_blockers.call_count == 0
+        assert parse_checklist.call_count == 0
+        assert parse_focus.call_count == 0
+
+        state_dir = tmp_path / ".hestai" / "state" / "context" / "state"
+        assert "SESSION::NONE" in (state_dir / "current-focus.oct.md").read_text()
+        assert 'SESSION::"s1[COMPLETED]"' in (state_dir / "checklist.oct.md").read_text()
+
+    def test_external_edit_is_reparsed(self, tmp_path: Path):
+        """A file changed on disk is parsed again."""
+        from hestai_mcp.modules.tools.shared.fast_state import load_blockers
+
+        (tmp_path / "blockers.oct.md").write_text(BLOCKERS)
+        first = load_blockers(tmp_path)
+        assert load_blockers(tmp_path) is first
+
+        (tmp_path / "blockers.oct.md").write_text(BLOCKERS.replace("UNRESOLVED", "RESOLVED"))
+        edited = load_blockers(tmp_path)
+
+        assert edited is not None
+        assert edited.unresolved() == []
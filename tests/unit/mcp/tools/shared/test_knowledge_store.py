@@ -0,0 +1,233 @@
+"""
+Tests for the optional SQLite FTS5 knowledge store.
+
+Test Coverage:
+- Row extraction from extract_learnings_keys() and extract_context_from_octave()
+- Ranked search with kind/role/focus/time filters (times compared in UTC)
+- Re-indexing a session replaces its rows
+- Backfill from existing archives with learnings-index.jsonl metadata
+- Project-level search (search_knowledge tool) with optional backfill
+- Opt-in via HESTAI_KNOWLEDGE_STORE
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hestai_mcp.modules.tools.shared import knowledge_store
+
+pytestmark = pytest.mark.skipif(
+    not knowledge_store.fts5_available(), reason="sqlite3 built without FTS5"
+)
+
+OCTAVE = """===SESSION===
+DECISIONS::[
+  DECISION_1::BECAUSE[parse per call]→cache compiled workflow→fewer parses
+]
+OUTCOMES::[
+  parse_time_reduced[sqlite cache warm]
+]
+flaky_ci⊗resolved[pinned sqlite version]
+LEARNINGS::[fsync before rename, journal appends beat rewrites]
+===END===
+"""
+
+
+def _session(session_id: str, role: str = "implementation-lead", **extra) -> dict:
+    return {
+        "session_id": session_id,
+        "timestamp": "2026-01-01T09:00:00",
+        "role": role,
+        "focus": "issue-1",
+        **extra,
+    }
+
+
+@pytest.mark.unit
+class TestKnowledgeRows:
+    """Test extraction of searchable rows."""
+
+    def test_rows_cover_all_kinds(self):
+        """Decisions, blockers, learnings and outcomes are extracted once each."""
+        rows = knowledge_store.knowledge_rows(OCTAVE)
+        kinds = [kind for kind, _content in rows]
+
+        assert {"decision", "blocker", "learning", "outcome"} <= set(kinds)
+        assert ("learning", "fsync before rename") in rows
+        assert ("blocker", "flaky_ci⊗resolved[pinned sqlite version]") in rows
+        assert len(rows) == len(set(rows))
+
+
+@pytest.mark.unit
+class TestSearchKnowledge:
+    """Test ranked search and filters."""
+
+    def test_search_filters_and_ranks(self, tmp_path: Path):
+        """Matches are ranked; kind/role/focus/time filters narrow them."""
+        db_path = tmp_path / knowledge_store.KNOWLEDGE_DB_FILE
+        knowledge_store.index_sessions(
+            db_path,
+            [
+                (_session("s1"), OCTAVE, tmp_path / "s1.oct.md"),
+                (
+                    _session("s2", role="critical-engineer", timestamp="2026-02-01T00:00:00"),
+                    "LEARNINGS::[sqlite sqlite sqlite everywhere]",
+                    None,
+                ),
+            ],
+        )
+
+        results = knowledge_store.search_knowledge(tmp_path, "sqlite")
+        assert results[0]["session_id"] == "s2"
+        assert {r["session_id"] for r in results} == {"s1", "s2"}
+        assert "[sqlite]" in results[0]["snippet"]
+
+        blockers = knowledge_store.search_knowledge(tmp_path, "sqlite", kinds=["blocker"])
+        assert [r["content"] for r in blockers] == ["flaky_ci⊗resolved[pinned sqlite version]"]
+        assert blockers[0]["octave_path"] == str(tmp_path / "s1.oct.md")
+
+        lead = knowledge_store.search_knowledge(tmp_path, "sqlite", role="Implementation-Lead")
+        assert {r["session_id"] for r in lead} == {"s1"}
+        recent = knowledge_store.search_knowledge(tmp_path, "sqlite", since="2026-01-15")
+        assert [r["session_id"] for r in recent] == ["s2"]
+        assert knowledge_store.search_knowledge(tmp_path, "sqlite", focus="other") == []
+
+    def test_time_filters_compare_in_utc(self, tmp_path: Path):
+        """Naive, offset and date-only bounds and timestamps are compared in UTC."""
+        db_path = tmp_path / knowledge_store.KNOWLEDGE_DB_FILE
+        knowledge_store.index_sessions(
+            db_path,
+            [
+                (_session("late", timestamp="2026-03-01T23:30:00-02:00"), OCTAVE, None),
+                (_session("day", timestamp="2026-03-01T12:00:00+00:00"), OCTAVE, None),
+                (_session("undated", timestamp=""), OCTAVE, None),
+            ],
+        )
+
+        def ids(**bounds):
+            results = knowledge_store.search_knowledge(tmp_path, "fsync", **bounds)
+            return {r["session_id"] for r in results}
+
+        assert ids() == {"late", "day", "undated"}
+        assert ids(since="2026-03-02T01:00:00+00:00") == {"late"}
+        assert ids(until="2026-03-01T13:30:00+01:30") == {"day"}
+        assert ids(since="2026-03-01T00:00:00Z", until="2026-03-01T23:59:59Z") == {"day"}
+        # A date-only until covers that whole (local) day
+        local_day = datetime.fromisoformat("2026-03-01T12:00:00+00:00").astimezone()
+        assert "day" in ids(until=local_day.date().isoformat())
+        with pytest.raises(ValueError):
+            ids(since="last week")
+
+    def test_query_syntax_is_not_interpreted(self, tmp_path: Path):
+        """FTS5 operators in user input are treated as plain terms."""
+        db_path = tmp_path / knowledge_store.KNOWLEDGE_DB_FILE
+        knowledge_store.index_sessions(db_path, [(_session("s1"), OCTAVE, None)])
+
+        assert knowledge_store.search_knowledge(tmp_path, 'fsync" OR "x') == []
+        assert knowledge_store.search_knowledge(tmp_path, "NOT") == []
+        best = knowledge_store.search_knowledge(tmp_path, "fsync rename")[0]
+        assert best["content"] == "fsync before rename"
+
+    def test_missing_store_returns_nothing(self, tmp_path: Path):
+        """Searching before anything is indexed is not an error."""
+        assert knowledge_store.search_knowledge(tmp_path, "anything") == []
+
+    def test_reindex_replaces_session_rows(self, tmp_path: Path):
+        """Indexing the same session again does not duplicate rows."""
+        knowledge_store.index_session(tmp_path, _session("s1"), OCTAVE)
+        knowledge_store.index_session(tmp_path, _session("s1"), "LEARNINGS::[only this]")
+
+        assert knowledge_store.search_knowledge(tmp_path, "fsync") == []
+        assert len(knowledge_store.search_knowledge(tmp_path, "only")) == 1
+
+    def test_index_session_never_raises(self, tmp_path: Path):
+        """Any indexing failure is logged, so clock_out's compression status is unaffected."""
+        with patch.object(knowledge_store, "knowledge_rows", side_effect=RuntimeError("boom")):
+            knowledge_store.index_session(tmp_path, _session("s1"), OCTAVE)
+
+        assert knowledge_store.search_knowledge(tmp_path, "fsync") == []
+
+
+@pytest.mark.unit
+class TestBackfill:
+    """Test rebuilding from archives."""
+
+    def test_backfill_uses_learnings_index_metadata(self, tmp_path: Path):
+        """Archives are matched to JSONL entries by session id suffix."""
+        (tmp_path / "2026-01-01-issue-1-abc123.oct.md").write_text(OCTAVE)
+        (tmp_path / "2026-01-05-general-orphan.oct.md").write_text("LEARNINGS::[orphaned wisdom]")
+        (tmp_path / "learnings-index.jsonl").write_text(
+            json.dumps(_session("abc123", role="holistic-orchestrator")) + "\n"
+        )
+
+        counts = knowledge_store.backfill_knowledge_store(tmp_path)
+
+        assert counts["sessions"] == 2
+        assert counts["rows"] > 2
+        matched = knowledge_store.search_knowledge(tmp_path, "fsync")
+        assert matched[0]["session_id"] == "abc123"
+        assert matched[0]["role"] == "holistic-orchestrator"
+        orphan = knowledge_store.search_knowledge(tmp_path, "orphaned")
+        assert orphan[0]["session_id"] == "2026-01-05-general-orphan"
+        assert orphan[0]["timestamp"] == "2026-01-05"
+
+    def test_backfill_matches_hyphenated_session_ids(self, tmp_path: Path):
+        """The full hyphenated session id wins over a shorter id it ends with."""
+        session_id = "1b4e28ba-2fa1-11d2-883f-0016a4c6e1a3"
+        (tmp_path / f"2026-01-01-my-focus-{session_id}.oct.md").write_text(OCTAVE)
+        (tmp_path / "learnings-index.jsonl").write_text(
+            json.dumps(_session("0016a4c6e1a3", role="wrong-match"))
+            + "\n"
+            + json.dumps(_session(session_id, role="holistic-orchestrator"))
+            + "\n"
+        )
+
+        knowledge_store.backfill_knowledge_store(tmp_path)
+
+        matched = knowledge_store.search_knowledge(tmp_path, "fsync")
+        assert {r["session_id"] for r in matched} == {session_id}
+        assert matched[0]["role"] == "holistic-orchestrator"
+
+
+@pytest.mark.unit
+class TestQueryKnowledgeStore:
+    """Test the project-level entry point behind the search_knowledge tool."""
+
+    def test_backfill_then_search(self, tmp_path: Path, monkeypatch):
+        """backfill=True indexes existing archives before searching."""
+        monkeypatch.delenv("HESTAI_KNOWLEDGE_STORE", raising=False)
+        archive = tmp_path / ".hestai" / "state" / "sessions" / "archive"
+        archive.mkdir(parents=True)
+        (archive / "2026-01-01-issue-1-abc123.oct.md").write_text(OCTAVE)
+
+        before = knowledge_store.query_knowledge_store(tmp_path, "fsync")
+        assert before["count"] == 0
+        assert "backfilled" not in before
+
+        result = knowledge_store.query_knowledge_store(
+            tmp_path, "fsync", kinds=["learning"], backfill=True
+        )
+        assert result["backfilled"]["sessions"] == 1
+        assert result["enabled"] is False
+        assert [r["content"] for r in result["results"]] == ["fsync before rename"]
+
+    def test_unknown_kind_is_rejected(self, tmp_path: Path):
+        """kinds are validated against KINDS."""
+        with pytest.raises(ValueError, match="Unknown knowledge kinds"):
+            knowledge_store.query_knowledge_store(tmp_path, "fsync", kinds=["decisions"])
+
+
+@pytest.mark.unit
+class TestOptIn:
+    """Test the HESTAI_KNOWLEDGE_STORE switch."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """The store is only used when explicitly enabled."""
+        monkeypatch.delenv("HESTAI_KNOWLEDGE_STORE", raising=False)
+        assert not knowledge_store.knowledge_store_enabled()
+
+        monkeypatch.setenv("HESTAI_KNOWLEDGE_STORE", "1")
+        assert knowledge_store.knowledge_store_enabled()
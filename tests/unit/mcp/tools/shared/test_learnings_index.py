@@ -0,0 +1,233 @@
+"""
+Tests for the learnings index query engine.
+
+Test Coverage:
+- Keyword search (all terms must match) over decisions/blockers/learnings
+- Role, focus and time-range filters, newest first
+- Incremental indexing of entries appended after the postings file
+- Entries written before the postings file existed
+- Rebuild of the postings when the JSONL is replaced or truncated
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+ENTRIES = [
+    {
+        "timestamp": "2026-01-01T09:00:00",
+        "session_id": "s1",
+        "role": "implementation-lead",
+        "focus": "issue-1",
+        "decisions": ["DECISION_1::cache parsed workflow"],
+        "blockers": [],
+        "learnings": ["fsync before rename"],
+    },
+    {
+        "timestamp": "2026-01-02T09:00:00",
+        "session_id": "s2",
+        "role": "critical-engineer",
+        "focus": "issue-2",
+        "decisions": [],
+        "blockers": ["flaky_ci⊗resolved[retry cache]"],
+        "learnings": [],
+    },
+    {
+        "timestamp": "2026-01-03T09:00:00",
+        "session_id": "s3",
+        "role": "implementation-lead",
+        "focus": "issue-2",
+        "decisions": [],
+        "blockers": [],
+        "learnings": ["cache invalidation by mtime"],
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_indexes():
+    from hestai_mcp.modules.tools.shared import learnings_index
+
+    learnings_index._indexes.clear()
+    yield
+    learnings_index._indexes.clear()
+
+
+def _write_legacy(archive: Path) -> None:
+    """Write entries the way older versions did (no postings file)."""
+    with (archive / "learnings-index.jsonl").open("a") as f:
+        for entry in ENTRIES:
+            f.write(json.dumps(entry) + "\n")
+
+
+def _ids(result: dict) -> list[str]:
+    return [entry["session_id"] for entry in result["entries"]]
+
+
+@pytest.mark.unit
+class TestLearningsQuery:
+    """Test filters and ordering."""
+
+    def test_keywords_must_all_match(self, tmp_path: Path):
+        """Every keyword must appear in the entry's searchable text."""
+        from hestai_mcp.modules.tools.shared.learnings_index import get_learnings_index
+
+        _write_legacy(tmp_path)
+        index = get_learnings_index(tmp_path)
+
+        assert [e["session_id"] for e in index.query(keywords="cache")] == ["s3", "s2", "s1"]
+        assert [e["session_id"] for e in index.query(keywords="Cache MTIME")] == ["s3"]
+        assert index.query(keywords="cache nonexistent") == []
+
+    def test_keywords_without_terms_match_nothing(self, tmp_path: Path):
+        """Keywords that tokenize to nothing do not fall back to an unfiltered query."""
+        from hestai_mcp.modules.tools.shared.learnings_index import get_learnings_index
+
+        _write_legacy(tmp_path)
+        index = get_learnings_index(tmp_path)
+
+        assert index.query(keywords="C") == []
+        assert index.query(keywords="a !!") == []
+        assert len(index.query(keywords="  ")) == 3
+
+    def test_role_focus_and_time_filters(self, tmp_path: Path):
+        """Filters combine; time bounds are inclusive."""
+        from hestai_mcp.modules.tools.shared.learnings_index import get_learnings_index
+
+        _write_legacy(tmp_path)
+        index = get_learnings_index(tmp_path)
+
+        lead = index.query(role="Implementation-Lead")
+        assert [e["session_id"] for e in lead] == ["s3", "s1"]
+        assert [
+            e["session_id"] for e in index.query(focus="issue-2", role="critical-engineer")
+        ] == ["s2"]
+        window = index.query(since="2026-01-02T09:00:00", until="2026-01-03T00:00:00")
+        assert [e["session_id"] for e in window] == ["s2"]
+        cached = index.query(keywords="cache", since="2026-01-02T00:00:00", limit=1)
+        assert [e["session_id"] for e in cached] == ["s3"]
+        assert [e["session_id"] for e in index.query(limit=2)] == ["s3", "s2"]
+
+    def test_invalid_time_raises(self, tmp_path: Path):
+        """Unparseable bounds are rejected."""
+        from hestai_mcp.modules.tools.shared.learnings_index import get_learnings_index
+
+        with pytest.raises(ValueError):
+            get_learnings_index(tmp_path).query(since="yesterday")
+
+
+@pytest.mark.unit
+class TestIncrementalIndexing:
+    """Test that only new JSONL bytes are tokenized."""
+
+    def test_append_indexes_new_entry_only(self, tmp_path: Path):
+        """append_to_learnings_index extends the postings without re-reading old entries."""
+        from hestai_mcp.modules.tools.shared import learnings_index
+        from hestai_mcp.modules.tools.shared.learnings_index import (
+            append_to_learnings_index,
+            query_learnings,
+        )
+
+        archive = tmp_path / ".hestai" / "state" / "sessions" / "archive"
+        archive.mkdir(parents=True)
+        _write_legacy(archive)
+        assert query_learnings(tmp_path)["indexed"] == 3
+
+        with patch.object(
+            learnings_index, "_entry_tokens", wraps=learnings_index._entry_tokens
+        ) as spy:
+            append_to_learnings_index(
+                {"session_id": "s4", "role": "holistic-orchestrator", "focus": "issue-4"},
+                {"decisions": [], "blockers": [], "learnings": ["journal appends"]},
+                archive,
+            )
+        assert spy.call_count == 1
+
+        result = query_learnings(tmp_path, keywords="journal")
+        assert _ids(result) == ["s4"]
+        assert result["indexed"] == 4
+        postings = (archive / "learnings-index.postings.jsonl").read_text().splitlines()
+        assert len(postings) == 4
+
+    def test_postings_are_reused_by_a_new_process(self, tmp_path: Path):
+        """A fresh index loads postings instead of re-tokenizing the JSONL."""
+        from hestai_mcp.modules.tools.shared import learnings_index
+
+        _write_legacy(tmp_path)
+        learnings_index.get_learnings_index(tmp_path).refresh()
+        learnings_index._indexes.clear()
+
+        with patch.object(learnings_index, "_entry_tokens") as spy:
+            results = learnings_index.get_learnings_index(tmp_path).query(keywords="fsync")
+
+        spy.assert_not_called()
+        assert [e["session_id"] for e in results] == ["s1"]
+
+    def test_torn_trailing_entry_waits_until_complete(self, tmp_path: Path):
+        """A partially written JSONL line is indexed once it is finished."""
+        from hestai_mcp.modules.tools.shared.learnings_index import get_learnings_index
+
+        _write_legacy(tmp_path)
+        path = tmp_path / "learnings-index.jsonl"
+        line = json.dumps({**ENTRIES[0], "session_id": "s5", "learnings": ["torn write"]})
+        with path.open("a") as f:
+            f.write(line[:20])
+        index = get_learnings_index(tmp_path)
+        assert index.query(keywords="torn") == []
+
+        with path.open("a") as f:
+            f.write(line[20:] + "\n")
+        assert [e["session_id"] for e in index.query(keywords="torn")] == ["s5"]
+
+
+@pytest.mark.unit
+class TestPostingsInvalidation:
+    """Test that postings never point into a different JSONL."""
+
+    def test_replaced_jsonl_is_reindexed(self, tmp_path: Path):
+        """A JSONL replaced by rename (new inode) rebuilds the postings."""
+        from hestai_mcp.modules.tools.shared.learnings_index import get_learnings_index
+
+        _write_legacy(tmp_path)
+        index = get_learnings_index(tmp_path)
+        assert len(index.query(keywords="cache")) == 3
+
+        replacement = tmp_path / "replacement.jsonl"
+        replacement.write_text(json.dumps({**ENTRIES[0], "session_id": "s9"}) + "\n")
+        replacement.replace(tmp_path / "learnings-index.jsonl")
+
+        assert [e["session_id"] for e in index.query(keywords="cache")] == ["s9"]
+        assert len(index) == 1
+        postings = (tmp_path / "learnings-index.postings.jsonl").read_text().splitlines()
+        assert len(postings) == 1
+
+    def test_truncated_jsonl_is_reindexed(self, tmp_path: Path):
+        """A JSONL shorter than the indexed offset rebuilds the postings."""
+        from hestai_mcp.modules.tools.shared.learnings_index import get_learnings_index
+
+        _write_legacy(tmp_path)
+        index = get_learnings_index(tmp_path)
+        index.refresh()
+
+        path = tmp_path / "learnings-index.jsonl"
+        with path.open("r+") as f:
+            f.truncate(len(json.dumps(ENTRIES[0])) + 1)
+
+        assert [e["session_id"] for e in index.query(keywords="cache")] == ["s1"]
+
+    def test_new_process_ignores_postings_of_a_replaced_jsonl(self, tmp_path: Path):
+        """Postings recorded against another inode are discarded on load."""
+        from hestai_mcp.modules.tools.shared import learnings_index
+
+        _write_legacy(tmp_path)
+        learnings_index.get_learnings_index(tmp_path).refresh()
+        learnings_index._indexes.clear()
+
+        replacement = tmp_path / "replacement.jsonl"
+        replacement.write_text(json.dumps({**ENTRIES[1], "session_id": "s9"}) + "\n")
+        replacement.replace(tmp_path / "learnings-index.jsonl")
+
+        results = learnings_index.get_learnings_index(tmp_path).query(keywords="flaky")
+        assert [e["session_id"] for e in results] == ["s9"]
@@ -0,0 +1,110 @@
+"""
+Tests for the shared single-pass OCTAVE scanner.
+
+Test Coverage:
+- Bracket-balanced list items (nested brackets and quoted commas stay whole)
+- KEY::value assignments ending at their list item or line
+- Unterminated lists and stray quotes
+- One scan shared by extraction, learnings and verification
+- Linear time on repeated unterminated sections
+"""
+
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from hestai_mcp.modules.tools.shared.octave_scanner import scan_octave
+
+COMPRESSION = """===SESSION_COMPRESSION===
+DECISIONS::[
+  DECISION_1::BECAUSE[latency, cost]→cache_scan→one_pass,
+  DECISION_2::BECAUSE[evidence]→choice→outcome
+]
+LEARNINGS::["commas, inside quotes", nested[a, b]→kept_whole, plain]
+FILES_MODIFIED::["src/a.py", "src/b.py"]
+PHASE::B2
+===END_SESSION_COMPRESSION===
+"""
+
+
+@pytest.mark.unit
+class TestScanOctave:
+    """Test list and assignment structure."""
+
+    def test_items_are_bracket_balanced(self):
+        """Commas inside nested brackets or quotes do not split items."""
+        scan = scan_octave(COMPRESSION)
+
+        assert scan.items("LEARNINGS") == [
+            '"commas, inside quotes"',
+            "nested[a, b]→kept_whole",
+            "plain",
+        ]
+        assert scan.items("DECISIONS")[0] == (
+            "DECISION_1::BECAUSE[latency, cost]→cache_scan→one_pass"
+        )
+        assert scan.items("MISSING") == []
+
+    def test_assignment_values(self):
+        """Values end at their list item, or at end of line at top level."""
+        scan = scan_octave(COMPRESSION)
+
+        assert scan.values(re.compile(r"DECISION_\d+")) == [
+            "BECAUSE[latency, cost]→cache_scan→one_pass",
+            "BECAUSE[evidence]→choice→outcome",
+        ]
+        assert scan.values(re.compile("PHASE")) == ["B2"]
+        # Lower-case prefixes are not keys
+        assert scan_octave("xDECISION_1::no").values(re.compile(r"DECISION_\d+")) == []
+
+    def test_unterminated_list_and_stray_quote(self):
+        """Open lists close at end of input; a stray quote ends with its line."""
+        scan = scan_octave('OUTCOMES::[done, "half\nLEARNINGS::[one, two')
+
+        # The open OUTCOMES item ends where the nested open list's line starts
+        assert scan.items("OUTCOMES") == ["done", '"half']
+        assert scan.items("LEARNINGS") == ["one", "two"]
+
+
+@pytest.mark.unit
+class TestSharedScan:
+    """Test that the three consumers share one scan."""
+
+    def test_consumers_scan_once(self, tmp_path: Path):
+        """Extraction, learnings and verification reuse the cached scan."""
+        from hestai_mcp.modules.tools.shared.context_extraction import (
+            extract_context_from_octave,
+        )
+        from hestai_mcp.modules.tools.shared.learnings_index import extract_learnings_keys
+        from hestai_mcp.modules.tools.shared.verification import verify_context_claims
+
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("")
+        (tmp_path / "src" / "b.py").write_text("")
+        scan_octave.cache_clear()
+
+        verification = verify_context_claims(COMPRESSION, tmp_path)
+        context = extract_context_from_octave(COMPRESSION) or ""
+        keys = extract_learnings_keys(COMPRESSION)
+
+        assert scan_octave.cache_info().misses == 1
+        assert verification["passed"] is True
+        assert "- DECISION_1::BECAUSE[latency, cost]→cache_scan→one_pass" in context
+        assert len(keys["decisions"]) == 2
+        assert keys["learnings"][1] == "nested[a, b]→kept_whole"
+
+    def test_repeated_unterminated_sections_stay_linear(self):
+        """Concatenated cut-off partials do not trigger rescans to end of input."""
+        from hestai_mcp.modules.tools.shared.learnings_index import extract_learnings_keys
+
+        document = "".join(f"LEARNINGS::[\n  lesson_{i}, wisdom_{i}\n" for i in range(20000))
+
+        started = time.perf_counter()
+        keys = extract_learnings_keys(document)
+        elapsed = time.perf_counter() - started
+
+        # Like the legacy pattern, the first LEARNINGS list wins
+        assert keys["learnings"] == ["lesson_0", "wisdom_0"]
+        assert elapsed < 2.0
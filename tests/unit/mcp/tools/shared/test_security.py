@@ -168,3 +168,138 @@ class TestCopyAndRedact:
         assert "sk-1234567890abcdefghij456" not in result
         assert "[REDACTED_API_KEY]" in result
         assert "Line 999: Normal content" in result
+
+
+@pytest.mark.unit
+class TestParallelRedaction:
+    """Test chunked process-pool redaction for large transcripts."""
+
+    @pytest.fixture
+    def force_parallel(self, monkeypatch):
+        """Route every file through the parallel path with tiny chunks."""
+        from hestai_mcp.modules.tools.shared.security import RedactionEngine
+
+        monkeypatch.setattr(RedactionEngine, "PARALLEL_THRESHOLD_BYTES", 1)
+        monkeypatch.setattr(RedactionEngine, "PARALLEL_CHUNK_CHARS", 256)
+        monkeypatch.setattr(RedactionEngine, "PARALLEL_MAX_WORKERS", 2)
+
+    def test_parallel_output_matches_in_process_output(self, tmp_path: Path, force_parallel):
+        """Chunked redaction produces byte-identical output to the line-by-line path."""
+        from hestai_mcp.modules.tools.shared.security import RedactionEngine
+
+        lines = [f"Line {i}: Normal content\n" for i in range(500)]
+        lines[10] = "Line 10: key sk-1234567890abcdefghij456\n"
+        lines[250] = "Line 250: postgresql://user:pw@localhost/db\n"
+        lines[251] = "Line 251: mail me at someone@example.com\n"
+        lines[499] = "Line 499: Bearer abc.def-ghi\n"
+        src = tmp_path / "large.jsonl"
+        src.write_text("".join(lines))
+
+        dst = tmp_path / "archive.jsonl"
+        RedactionEngine.copy_and_redact(src, dst)
+
+        expected = "".join(RedactionEngine.redact_content(line) for line in lines)
+        assert dst.read_text() == expected
+        assert "sk-1234567890abcdefghij456" not in expected
+
+    def test_parallel_preserves_chunk_order(self, tmp_path: Path, force_parallel):
+        """Chunks are written back in source order."""
+        from hestai_mcp.modules.tools.shared.security import RedactionEngine
+
+        src = tmp_path / "ordered.jsonl"
+        src.write_text("".join(f"{i}\n" for i in range(5000)))
+        dst = tmp_path / "archive.jsonl"
+
+        RedactionEngine.copy_and_redact(src, dst)
+
+        assert dst.read_text().splitlines() == [str(i) for i in range(5000)]
+
+    def test_parallel_failure_leaves_no_output(self, tmp_path: Path, force_parallel):
+        """A failure mid-stream removes the temp file and never creates dst."""
+        from hestai_mcp.modules.tools.shared.security import RedactionEngine
+
+        src = tmp_path / "broken.jsonl"
+        src.write_bytes(b"ok line\n" * 200 + b"\xff\xfe invalid utf-8\n")
+        dst = tmp_path / "archive.jsonl"
+
+        with pytest.raises(UnicodeDecodeError):
+            RedactionEngine.copy_and_redact(src, dst)
+
+        assert not dst.exists()
+        assert [p.name for p in tmp_path.iterdir()] == ["broken.jsonl"]
+
+    def test_pool_never_forks_server_process(self, tmp_path: Path, force_parallel):
+        """Workers start via forkserver/spawn, never fork, in a threaded server."""
+        from unittest.mock import patch
+
+        from hestai_mcp.modules.tools.shared import security
+        from hestai_mcp.modules.tools.shared.security import RedactionEngine
+
+        src = tmp_path / "source.jsonl"
+        src.write_text("line\n" * 100)
+        dst = tmp_path / "archive.jsonl"
+
+        with patch.object(
+            security, "ProcessPoolExecutor", wraps=security.ProcessPoolExecutor
+        ) as pool_cls:
+            RedactionEngine.copy_and_redact(src, dst)
+
+        context = pool_cls.call_args.kwargs["mp_context"]
+        assert context.get_start_method() in ("forkserver", "spawn")
+        assert dst.read_text() == "line\n" * 100
+
+    def test_parallel_workers_use_submitting_engine_patterns(
+        self, tmp_path: Path, force_parallel, monkeypatch
+    ):
+        """Freshly started workers receive cls.PATTERNS rather than re-importing defaults."""
+        import re
+
+        from hestai_mcp.modules.tools.shared.security import RedactionEngine
+
+        patterns = dict(RedactionEngine.PATTERNS)
+        patterns["ticket"] = (re.compile(r"TICKET-\d+"), "[REDACTED_TICKET]")
+        monkeypatch.setattr(RedactionEngine, "PATTERNS", patterns)
+
+        src = tmp_path / "source.jsonl"
+        src.write_text("see TICKET-42 and sk-1234567890abcdefghij456\n" * 50)
+        dst = tmp_path / "archive.jsonl"
+
+        RedactionEngine.copy_and_redact(src, dst)
+
+        assert dst.read_text() == "see [REDACTED_TICKET] and [REDACTED_API_KEY]\n" * 50
+
+    def test_small_files_use_in_process_path(self, tmp_path: Path):
+        """Files below the threshold never start a process pool."""
+        from unittest.mock import patch
+
+        from hestai_mcp.modules.tools.shared.security import RedactionEngine
+
+        src = tmp_path / "small.jsonl"
+        src.write_text("tiny\n")
+        dst = tmp_path / "archive.jsonl"
+
+        with patch.object(RedactionEngine, "_copy_and_redact_parallel") as parallel:
+            RedactionEngine.copy_and_redact(src, dst)
+
+        parallel.assert_not_called()
+        assert dst.read_text() == "tiny\n"
+
+    def test_broken_pool_falls_back_to_in_process(self, tmp_path: Path, force_parallel):
+        """If the process pool cannot run, redaction still completes in-process."""
+        from concurrent.futures.process import BrokenProcessPool
+        from unittest.mock import patch
+
+        from hestai_mcp.modules.tools.shared.security import RedactionEngine
+
+        src = tmp_path / "source.jsonl"
+        src.write_text("key sk-1234567890abcdefghij456\n")
+        dst = tmp_path / "archive.jsonl"
+
+        with patch.object(
+            RedactionEngine,
+            "_copy_and_redact_parallel",
+            side_effect=BrokenProcessPool("no fork"),
+        ):
+            RedactionEngine.copy_and_redact(src, dst)
+
+        assert dst.read_text() == "key [REDACTED_API_KEY]\n"
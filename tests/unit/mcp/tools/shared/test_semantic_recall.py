@@ -0,0 +1,263 @@
+"""
+Tests for local semantic recall of archived learnings and decisions.
+
+Test Coverage:
+- Hashed int8 embeddings (deterministic, unit length, sparse)
+- Ranking by similarity with role/focus boosts
+- Incremental updates from learnings-index.jsonl and un-indexed .oct.md archives
+- Recovery from vectors appended without their items (crash between appends)
+- Concurrent updates embed each item once; searches racing updates stay aligned
+- Rebuild when learnings-index.jsonl is replaced or truncated
+- Archive backfill only at clock_out; failures never raise from the hook
+"""
+
+import json
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hestai_mcp.modules.tools.shared import semantic_recall
+from hestai_mcp.modules.tools.shared.semantic_recall import (
+    DIMENSIONS,
+    RecallIndex,
+    embed,
+    quantize,
+)
+
+
+def _append(archive: Path, session_id: str, role: str, focus: str, **keys) -> None:
+    entry = {"session_id": session_id, "role": role, "focus": focus, "timestamp": "t"}
+    with (archive / "learnings-index.jsonl").open("a") as f:
+        f.write(json.dumps({**entry, **keys}) + "\n")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_indexes():
+    semantic_recall._indexes.clear()
+    yield
+    semantic_recall._indexes.clear()
+
+
+@pytest.mark.unit
+class TestEmbedding:
+    """Test the hashed embedding."""
+
+    def test_embedding_is_deterministic_unit_and_quantized(self):
+        """Same text, same vector; norm 1; int8 bytes of DIMENSIONS width."""
+        vector = embed("Cache the compiled workflow")
+
+        assert vector == embed("cache the compiled WORKFLOW")
+        assert sum(w * w for w in vector.values()) == pytest.approx(1.0)
+        assert len(quantize(vector)) == DIMENSIONS
+        assert embed("a !") == {}
+
+
+@pytest.mark.unit
+class TestRecallIndex:
+    """Test incremental indexing and search."""
+
+    def test_search_ranks_related_items_first(self, tmp_path: Path):
+        """Lexically related items outrank unrelated ones; boosts break ties."""
+        _append(
+            tmp_path,
+            "s1",
+            "implementation-lead",
+            "issue-7",
+            learnings=["fsync the journal before rename"],
+            decisions=["DECISION_1::cache workflow parse"],
+        )
+        _append(
+            tmp_path,
+            "s2",
+            "critical-engineer",
+            "issue-9",
+            learnings=["journal rotation needs fsync too", "unrelated gardening tip"],
+        )
+        index = RecallIndex(tmp_path)
+        assert index.update() == 4
+
+        results = index.search("journal fsync", role="critical-engineer")
+        assert [r["session_id"] for r in results[:2]] == ["s2", "s1"]
+        assert all("gardening" not in r["text"] for r in results)
+
+        by_focus = index.search("issue-7", focus="issue-7")
+        assert [r["session_id"] for r in by_focus[:2]] == ["s1", "s1"]
+        assert {r["kind"] for r in by_focus[:2]} == {"learning", "decision"}
+
+    def test_update_is_incremental(self, tmp_path: Path):
+        """Only entries appended since the last update are embedded."""
+        _append(tmp_path, "s1", "r", "f", learnings=["first lesson"])
+        index = RecallIndex(tmp_path)
+        assert index.update() == 1
+        assert index.update() == 0
+
+        _append(tmp_path, "s2", "r", "f", learnings=["second lesson"])
+        assert index.update() == 1
+        assert (tmp_path / "recall-vectors.i8").stat().st_size == 2 * DIMENSIONS
+
+        # A new process loads the items instead of re-embedding
+        reloaded = RecallIndex(tmp_path)
+        assert reloaded.update() == 0
+        assert reloaded.search("second")[0]["session_id"] == "s2"
+
+    def test_unindexed_octave_archives_are_included(self, tmp_path: Path):
+        """.oct.md archives without a JSONL entry are embedded once."""
+        _append(tmp_path, "abc", "r", "f", learnings=["from jsonl"])
+        (tmp_path / "2026-01-01-f-abc.oct.md").write_text("LEARNINGS::[duplicate of jsonl]")
+        (tmp_path / "2026-01-01-f-legacy.oct.md").write_text("LEARNINGS::[legacy archive wisdom]")
+        index = RecallIndex(tmp_path)
+
+        assert index.update() == 2
+        assert index.update() == 0
+        assert index.search("legacy wisdom")[0]["session_id"] == "2026-01-01-f-legacy"
+        assert index.search("duplicate") == []
+
+    def test_archive_session_id_is_parsed_from_the_name(self, tmp_path: Path):
+        """Hyphenated session ids are matched; covered names are not checked again."""
+        session_id = "1b4e28ba-2fa1-11d2-883f-0016a4c6e1a3"
+        _append(tmp_path, session_id, "r", "f", learnings=["from jsonl"])
+        name = f"2026-01-01-my-focus-{session_id}.oct.md"
+        (tmp_path / name).write_text("LEARNINGS::[duplicate of jsonl]")
+        index = RecallIndex(tmp_path)
+
+        assert index.update() == 1
+        assert name in index.octave_files
+        with patch.object(semantic_recall, "archive_session_id") as lookup:
+            assert index.update() == 0
+        lookup.assert_not_called()
+
+    def test_concurrent_updates_embed_each_item_once(self, tmp_path: Path):
+        """Indexes of the same archive updating at once never duplicate items."""
+        for n in range(20):
+            _append(tmp_path, f"s{n}", "r", "f", learnings=[f"lesson {n}"])
+        indexes = [RecallIndex(tmp_path) for _ in range(4)]
+        added: list[int] = []
+
+        threads = [threading.Thread(target=lambda i=i: added.append(i.update())) for i in indexes]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(added) == 20
+        assert (tmp_path / "recall-vectors.i8").stat().st_size == 20 * DIMENSIONS
+        assert len((tmp_path / "recall-items.jsonl").read_text().splitlines()) == 20
+
+    def test_orphan_vectors_are_truncated(self, tmp_path: Path):
+        """Vectors written without their item lines are dropped on the next update."""
+        _append(tmp_path, "s1", "r", "f", learnings=["kept lesson"])
+        RecallIndex(tmp_path).update()
+        with (tmp_path / "recall-vectors.i8").open("ab") as f:
+            f.write(b"\x01" * DIMENSIONS)
+
+        _append(tmp_path, "s2", "r", "f", learnings=["next lesson"])
+        index = RecallIndex(tmp_path)
+        assert index.update() == 1
+
+        assert (tmp_path / "recall-vectors.i8").stat().st_size == 2 * DIMENSIONS
+        assert index.search("next lesson")[0]["session_id"] == "s2"
+
+    def test_vector_rows_follow_committed_item_lines(self, tmp_path: Path):
+        """Items held in memory but never committed do not pad the vector file."""
+        _append(tmp_path, "s1", "r", "f", learnings=["first lesson"])
+        index = RecallIndex(tmp_path)
+        index.update()
+        index.items.append({"text": "loaded twice"})
+
+        _append(tmp_path, "s2", "r", "f", learnings=["second lesson"])
+        assert index.update() == 1
+
+        assert (tmp_path / "recall-vectors.i8").stat().st_size == 2 * DIMENSIONS
+        assert RecallIndex(tmp_path).search("second lesson")[0]["session_id"] == "s2"
+
+    def test_search_racing_update_loads_each_item_once(self, tmp_path: Path):
+        """Searches on the update's own index never load committed lines twice."""
+        index = RecallIndex(tmp_path)
+        stop = threading.Event()
+
+        def search_loop():
+            while not stop.is_set():
+                index.search("lesson")
+
+        searcher = threading.Thread(target=search_loop)
+        searcher.start()
+        try:
+            for n in range(30):
+                _append(tmp_path, f"s{n}", "r", "f", learnings=[f"lesson {n}"])
+                index.update()
+        finally:
+            stop.set()
+            searcher.join()
+
+        assert len(index.items) == 30
+        assert (tmp_path / "recall-vectors.i8").stat().st_size == 30 * DIMENSIONS
+
+    def test_replaced_learnings_index_rebuilds(self, tmp_path: Path):
+        """A learnings index replaced by rename is embedded again from scratch."""
+        _append(tmp_path, "s1", "r", "f", learnings=["old lesson"])
+        index = RecallIndex(tmp_path)
+        assert index.update() == 1
+        other = RecallIndex(tmp_path)
+        assert other.search("lesson")
+
+        replacement = tmp_path / "replacement"
+        replacement.mkdir()
+        _append(replacement, "s2", "r", "f", learnings=["new lesson"])
+        (replacement / "learnings-index.jsonl").replace(tmp_path / "learnings-index.jsonl")
+
+        assert index.update() == 1
+        assert [r["session_id"] for r in index.search("lesson")] == ["s2"]
+        assert (tmp_path / "recall-vectors.i8").stat().st_size == DIMENSIONS
+        # An index loaded before the rebuild reloads the new files
+        assert [r["session_id"] for r in other.search("lesson")] == ["s2"]
+
+    def test_truncated_learnings_index_rebuilds(self, tmp_path: Path):
+        """A learnings index shorter than the indexed offset is re-embedded."""
+        _append(tmp_path, "s1", "r", "f", learnings=["first lesson"])
+        _append(tmp_path, "s2", "r", "f", learnings=["second lesson"])
+        index = RecallIndex(tmp_path)
+        assert index.update() == 2
+
+        (tmp_path / "learnings-index.jsonl").write_text("")
+        _append(tmp_path, "s3", "r", "f", learnings=["third lesson"])
+
+        assert index.update() == 1
+        assert [r["session_id"] for r in index.search("lesson")] == ["s3"]
+
+
+@pytest.mark.unit
+class TestRecallRelevant:
+    """Test the clock_in entry point."""
+
+    def test_recall_for_role_and_focus(self, tmp_path: Path):
+        """Items from the same focus are surfaced; no archive means no items."""
+        assert semantic_recall.recall_relevant(tmp_path, "implementation-lead", "issue-7") == []
+
+        archive = tmp_path / ".hestai" / "state" / "sessions" / "archive"
+        archive.mkdir(parents=True)
+        _append(archive, "s1", "implementation-lead", "issue-7", learnings=["pin sqlite"])
+        _append(archive, "s2", "implementation-lead", "issue-8", learnings=["other thing"])
+
+        results = semantic_recall.recall_relevant(tmp_path, "implementation-lead", "issue-7")
+
+        assert results[0]["text"] == "pin sqlite"
+        assert all(r["score"] < results[0]["score"] for r in results[1:])
+
+    def test_clock_in_does_not_backfill_archives(self, tmp_path: Path):
+        """Archives without JSONL entries are embedded by the clock_out hook only."""
+        archive = tmp_path / ".hestai" / "state" / "sessions" / "archive"
+        archive.mkdir(parents=True)
+        (archive / "2026-01-01-issue-7-legacy.oct.md").write_text("LEARNINGS::[pin sqlite]")
+
+        assert semantic_recall.recall_relevant(tmp_path, "implementation-lead", "issue-7") == []
+
+        semantic_recall.update_recall_index(archive)
+        results = semantic_recall.recall_relevant(tmp_path, "implementation-lead", "pin sqlite")
+        assert results[0]["session_id"] == "2026-01-01-issue-7-legacy"
+
+    def test_update_hook_never_raises(self, tmp_path: Path):
+        """Any update failure is logged, so clock_out's compression status is unaffected."""
+        with patch.object(RecallIndex, "update", side_effect=RuntimeError("boom")):
+            semantic_recall.update_recall_index(tmp_path)
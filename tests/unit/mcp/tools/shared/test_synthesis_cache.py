@@ -0,0 +1,288 @@
+"""
+Tests for the in-process clock_in synthesis cache.
+
+Test Coverage:
+- git HEAD resolution from files (branch refs, packed refs, detached, worktrees)
+- Key invalidation on PROJECT-CONTEXT and git HEAD changes
+- TTL expiry and LRU eviction
+- Single-flight sharing of concurrent misses (and recovery from a cancelled leader)
+- Integration with synthesize_fast_layer_with_ai
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+VALID_SYNTHESIS = """CONTEXT_FILES::[]
+FOCUS::issue-1
+PHASE::B2
+BLOCKERS::[]
+TASKS::[]
+FRESHNESS_WARNING::NONE"""
+
+
+def _make_repo(root: Path, sha: str = SHA_A) -> Path:
+    git_dir = root / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "refs" / "heads" / "main").write_text(f"{sha}\n")
+    return git_dir
+
+
+@pytest.mark.unit
+class TestReadGitHead:
+    """Test file-based git HEAD resolution."""
+
+    def test_reads_branch_ref(self, tmp_path: Path):
+        """HEAD pointing at a loose branch ref resolves to its sha."""
+        from hestai_mcp.modules.tools.shared.synthesis_cache import read_git_head
+
+        _make_repo(tmp_path)
+
+        assert read_git_head(tmp_path) == SHA_A
+        assert read_git_head(tmp_path / "sub" / "dir") == SHA_A
+
+    def test_reads_packed_ref_and_detached_head(self, tmp_path: Path):
+        """Packed refs and detached HEADs are both resolved."""
+        from hestai_mcp.modules.tools.shared.synthesis_cache import read_git_head
+
+        git_dir = _make_repo(tmp_path)
+        (git_dir / "refs" / "heads" / "main").unlink()
+        (git_dir / "packed-refs").write_text(f"# pack-refs\n{SHA_B} refs/heads/main\n")
+        assert read_git_head(tmp_path) == SHA_B
+
+        (git_dir / "HEAD").write_text(f"{SHA_A}\n")
+        assert read_git_head(tmp_path) == SHA_A
+
+    def test_reads_linked_worktree(self, tmp_path: Path):
+        """A worktree's .git file leads to its HEAD and the common refs."""
+        from hestai_mcp.modules.tools.shared.synthesis_cache import read_git_head
+
+        main_git = _make_repo(tmp_path / "main")
+        wt_git = main_git / "worktrees" / "feature"
+        wt_git.mkdir(parents=True)
+        (wt_git / "HEAD").write_text("ref: refs/heads/main\n")
+        (wt_git / "commondir").write_text("../..\n")
+        worktree = tmp_path / "feature"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {wt_git}\n")
+
+        assert read_git_head(worktree) == SHA_A
+
+    def test_outside_repository_returns_none(self, tmp_path: Path):
+        """Directories without git metadata have no HEAD."""
+        from hestai_mcp.modules.tools.shared.synthesis_cache import read_git_head
+
+        assert read_git_head(tmp_path) is None
+
+
+@pytest.mark.unit
+class TestSynthesisCacheKey:
+    """Test key derivation and automatic invalidation."""
+
+    def test_key_changes_with_project_context_and_head(self, tmp_path: Path):
+        """Editing PROJECT-CONTEXT or moving HEAD produces a new key."""
+        from hestai_mcp.modules.tools.shared.synthesis_cache import SynthesisCache
+
+        git_dir = _make_repo(tmp_path)
+        context = tmp_path / ".hestai" / "state" / "context" / "PROJECT-CONTEXT.oct.md"
+        context.parent.mkdir(parents=True)
+        context.write_text("PHASE::B1")
+
+        first = SynthesisCache.key_for("sys", "user", "openrouter/m", tmp_path)
+        assert SynthesisCache.key_for("sys", "user", "openrouter/m", tmp_path) == first
+        assert SynthesisCache.key_for("sys", "user", "openai/m", tmp_path) != first
+
+        context.write_text("PHASE::B2 and more")
+        second = SynthesisCache.key_for("sys", "user", "openrouter/m", tmp_path)
+        assert second != first
+
+        (git_dir / "refs" / "heads" / "main").write_text(f"{SHA_B}\n")
+        assert SynthesisCache.key_for("sys", "user", "openrouter/m", tmp_path) != second
+
+
+@pytest.mark.unit
+class TestSynthesisCacheBounds:
+    """Test TTL and LRU bounds."""
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        """Entries older than ttl_seconds are misses."""
+        from hestai_mcp.modules.tools.shared import synthesis_cache as module
+
+        now = [1000.0]
+        monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+        cache = module.SynthesisCache(ttl_seconds=60)
+        cache.put("k", {"synthesis": "s", "source": "ai"})
+
+        now[0] += 59
+        assert cache.get("k") == {"synthesis": "s", "source": "ai"}
+        now[0] += 2
+        assert cache.get("k") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Past max_entries, the least recently read entry goes first."""
+        from hestai_mcp.modules.tools.shared.synthesis_cache import SynthesisCache
+
+        cache = SynthesisCache(max_entries=2)
+        cache.put("a", {"synthesis": "a"})
+        cache.put("b", {"synthesis": "b"})
+        cache.get("a")
+        cache.put("c", {"synthesis": "c"})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+
+@pytest.mark.unit
+class TestSynthesisCacheSingleFlight:
+    """Test get_or_compute."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self):
+        """A burst of identical requests computes once."""
+        from hestai_mcp.modules.tools.shared.synthesis_cache import SynthesisCache
+
+        cache = SynthesisCache()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"synthesis": "s", "source": "ai"}
+
+        results = await asyncio.gather(
+            *(cache.get_or_compute("k", compute, lambda _r: True) for _ in range(5))
+        )
+        again = await cache.get_or_compute("k", compute, lambda _r: True)
+
+        assert calls == 1
+        assert all(r == {"synthesis": "s", "source": "ai"} for r in [*results, again])
+        assert cache.stats()["cache_misses"] == 1
+        assert cache.stats()["cache_hits"] == 5
+
+    @pytest.mark.asyncio
+    async def test_rejected_results_and_errors_are_not_cached(self):
+        """Results failing should_cache and exceptions are recomputed next time."""
+        from hestai_mcp.modules.tools.shared.synthesis_cache import SynthesisCache
+
+        cache = SynthesisCache()
+        compute = AsyncMock(
+            side_effect=[RuntimeError("boom"), {"source": "fallback"}, {"source": "ai"}]
+        )
+
+        def accept(r):
+            return r["source"] == "ai"
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_compute("k", compute, accept)
+        assert (await cache.get_or_compute("k", compute, accept))["source"] == "fallback"
+        assert (await cache.get_or_compute("k", compute, accept))["source"] == "ai"
+        assert (await cache.get_or_compute("k", compute, accept))["source"] == "ai"
+
+        assert compute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_lets_waiters_compute(self):
+        """Cancelling the leading caller does not cancel callers waiting on it."""
+        from hestai_mcp.modules.tools.shared.synthesis_cache import SynthesisCache
+
+        cache = SynthesisCache()
+        started = asyncio.Event()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            started.set()
+            await asyncio.sleep(0.05)
+            return {"synthesis": "s", "source": "ai"}
+
+        leader = asyncio.create_task(cache.get_or_compute("k", compute, lambda _r: True))
+        await started.wait()
+        waiter = asyncio.create_task(cache.get_or_compute("k", compute, lambda _r: True))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == {"synthesis": "s", "source": "ai"}
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_cancelled(self):
+        """A waiter cancelled itself still sees CancelledError; the leader is unaffected."""
+        from hestai_mcp.modules.tools.shared.synthesis_cache import SynthesisCache
+
+        cache = SynthesisCache()
+        started = asyncio.Event()
+
+        async def compute():
+            started.set()
+            await asyncio.sleep(0.05)
+            return {"synthesis": "s", "source": "ai"}
+
+        leader = asyncio.create_task(cache.get_or_compute("k", compute, lambda _r: True))
+        await started.wait()
+        waiter = asyncio.create_task(cache.get_or_compute("k", compute, lambda _r: True))
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert (await leader)["source"] == "ai"
+
+
+@pytest.mark.unit
+class TestSynthesizeWithCache:
+    """Test synthesize_fast_layer_with_ai with a working_dir."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_clock_in_reuses_ai_result(self, tmp_path: Path, monkeypatch):
+        """Identical synthesis requests for one project make one AI call."""
+        from hestai_mcp.modules.tools.shared import synthesis_cache as module
+        from hestai_mcp.modules.tools.shared.fast_layer import synthesize_fast_layer_with_ai
+
+        monkeypatch.setattr(module, "synthesis_cache", module.SynthesisCache())
+        _make_repo(tmp_path)
+
+        with (
+            patch("hestai_mcp.ai.client.AIClient") as mock_ai_client_cls,
+            patch("hestai_mcp.ai.config.load_config") as mock_load_config,
+        ):
+            mock_load_config.return_value = MagicMock()
+            mock_client = AsyncMock()
+            mock_client.complete_text_streaming = AsyncMock(return_value=VALID_SYNTHESIS)
+            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client.__aexit__ = AsyncMock(return_value=None)
+            mock_ai_client_cls.return_value = mock_client
+
+            results = [
+                await synthesize_fast_layer_with_ai(
+                    session_id=f"s{i}",
+                    role="implementation-lead",
+                    focus="issue-1",
+                    context_summary="same context",
+                    working_dir=tmp_path,
+                )
+                for i in range(3)
+            ]
+
+            # A new commit invalidates the cached synthesis
+            (tmp_path / ".git" / "refs" / "heads" / "main").write_text(f"{SHA_B}\n")
+            await synthesize_fast_layer_with_ai(
+                session_id="s3",
+                role="implementation-lead",
+                focus="issue-1",
+                context_summary="same context",
+                working_dir=tmp_path,
+            )
+
+        assert all(r == {"synthesis": VALID_SYNTHESIS, "source": "ai"} for r in results)
+        assert mock_client.complete_text_streaming.await_count == 2
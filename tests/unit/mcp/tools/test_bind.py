@@ -452,6 +452,32 @@ def test_execute_bind_extracts_cognition_and_archetypes(tmp_path, monkeypatch):
     assert result["archetypes"] == "HERMES{speed}"
 
 
+@pytest.mark.unit
+def test_execute_bind_includes_north_star_immutables(tmp_path, monkeypatch):
+    """Verifies North Star immutables are surfaced for the TENSION step."""
+    monkeypatch.chdir(tmp_path)
+    agents_dir = tmp_path / ".hestai-sys" / "library" / "agents"
+    agents_dir.mkdir(parents=True)
+    (agents_dir / "test-role.oct.md").write_text("COGNITION::ETHOS\n")
+    north_star_dir = tmp_path / ".hestai" / "north-star"
+    north_star_dir.mkdir(parents=True)
+    (north_star_dir / "000-PROJECT-NORTH-STAR.md").write_text(
+        "### I1: PERSISTENT COGNITIVE CONTINUITY\n### I4: FRESHNESS VERIFICATION\n"
+    )
+
+    from hestai_mcp.modules.tools.bind import execute_bind
+
+    result = execute_bind("test-role", working_dir=str(tmp_path))
+    assert result["north_star_immutables"] == [
+        "I1::PERSISTENT_COGNITIVE_CONTINUITY",
+        "I4::FRESHNESS_VERIFICATION",
+    ]
+
+    # No North Star: empty list, not an error
+    result = execute_bind("test-role", working_dir=str(agents_dir))
+    assert result["north_star_immutables"] == []
+
+
 # ---------------------------------------------------------------------------
 # main() CLI entry point
 # ---------------------------------------------------------------------------
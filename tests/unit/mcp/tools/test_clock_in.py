@@ -934,6 +934,173 @@ class TestClockInWithAIIntegration:
             assert "test-focus" in synthesis, "Fallback should include actual focus value"
 
 
+@pytest.mark.unit
+class TestClockInAsyncConcurrency:
+    """
+    Test clock_in_async overlaps AI synthesis with independent filesystem work.
+    """
+
+    @pytest.mark.asyncio
+    async def test_llm_call_overlaps_semantic_recall(self, mock_hestai_structure: Path):
+        """Latency approaches max(LLM, recall) rather than their sum."""
+        import asyncio
+        import time
+        from unittest.mock import patch
+
+        from hestai_mcp.modules.tools.clock_in import clock_in_async
+
+        async def slow_synthesis(**kwargs):
+            await asyncio.sleep(0.3)
+            return {"synthesis": "AI", "source": "ai"}
+
+        def slow_recall(*args):
+            time.sleep(0.3)
+            return []
+
+        with (
+            patch(
+                "hestai_mcp.modules.tools.shared.fast_layer.synthesize_fast_layer_with_ai",
+                side_effect=slow_synthesis,
+            ),
+            patch(
+                "hestai_mcp.modules.tools.clock_in._recall_learnings",
+                side_effect=slow_recall,
+            ),
+        ):
+            started = time.perf_counter()
+            result = await clock_in_async(
+                role="implementation-lead",
+                working_dir=str(mock_hestai_structure),
+                focus="test-focus",
+            )
+            elapsed = time.perf_counter() - started
+
+        assert result["ai_synthesis"]["source"] == "ai"
+        assert elapsed < 0.55
+
+    @pytest.mark.asyncio
+    async def test_summary_is_built_after_fast_layer_writes(self, mock_hestai_structure: Path):
+        """The context summary reads this session's FAST files, not the previous session's."""
+        import importlib
+        from unittest.mock import AsyncMock, patch
+
+        clock_in_module = importlib.import_module("hestai_mcp.modules.tools.clock_in")
+        order: list[str] = []
+        real_summary = clock_in_module.build_rich_context_summary
+
+        def tracking_summary(**kwargs):
+            order.append("summary")
+            return real_summary(**kwargs)
+
+        with (
+            patch.object(clock_in_module, "build_rich_context_summary", tracking_summary),
+            patch(
+                "hestai_mcp.modules.tools.shared.fast_layer.update_fast_layer_on_clock_in",
+                side_effect=lambda *args: order.append("fast_layer"),
+            ),
+            patch(
+                "hestai_mcp.modules.tools.shared.fast_layer.synthesize_fast_layer_with_ai",
+                new_callable=AsyncMock,
+                return_value={"synthesis": "AI", "source": "ai"},
+            ),
+        ):
+            await clock_in_module.clock_in_async(
+                role="implementation-lead",
+                working_dir=str(mock_hestai_structure),
+                focus="test-focus",
+            )
+
+        assert order == ["fast_layer", "summary"]
+
+    @pytest.mark.asyncio
+    async def test_fast_layer_failure_skips_synthesis(self, mock_hestai_structure: Path):
+        """A FAST layer error propagates before any LLM call is made."""
+        from unittest.mock import AsyncMock, patch
+
+        from hestai_mcp.modules.tools.clock_in import clock_in_async
+
+        with (
+            patch(
+                "hestai_mcp.modules.tools.shared.fast_layer.synthesize_fast_layer_with_ai",
+                new_callable=AsyncMock,
+            ) as synthesis,
+            patch(
+                "hestai_mcp.modules.tools.shared.fast_layer.update_fast_layer_on_clock_in",
+                side_effect=ValueError("control characters"),
+            ),
+            pytest.raises(ValueError),
+        ):
+            await clock_in_async(
+                role="implementation-lead",
+                working_dir=str(mock_hestai_structure),
+                focus="test-focus",
+            )
+
+        synthesis.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_session_record_failure_cancels_synthesis(self, mock_hestai_structure: Path):
+        """A session record error propagates and the in-flight LLM call is cancelled."""
+        import asyncio
+        import time
+        from unittest.mock import patch
+
+        from hestai_mcp.modules.tools.clock_in import clock_in_async
+
+        cancelled = asyncio.Event()
+
+        async def hanging_synthesis(**kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return {}
+
+        def failing_record(*args):
+            time.sleep(0.1)  # let the LLM call start
+            raise OSError("disk full")
+
+        with (
+            patch(
+                "hestai_mcp.modules.tools.shared.fast_layer.synthesize_fast_layer_with_ai",
+                side_effect=hanging_synthesis,
+            ),
+            patch(
+                "hestai_mcp.modules.tools.clock_in._write_session_record",
+                side_effect=failing_record,
+            ),
+            pytest.raises(OSError),
+        ):
+            await clock_in_async(
+                role="implementation-lead",
+                working_dir=str(mock_hestai_structure),
+                focus="test-focus",
+            )
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_disabled_synthesis_skips_summary(self, mock_hestai_structure: Path):
+        """With enable_ai_synthesis=False no summary is built and no synthesis returned."""
+        import importlib
+        from unittest.mock import patch
+
+        clock_in_module = importlib.import_module("hestai_mcp.modules.tools.clock_in")
+
+        with patch.object(clock_in_module, "build_rich_context_summary") as mock_summary:
+            result = await clock_in_module.clock_in_async(
+                role="implementation-lead",
+                working_dir=str(mock_hestai_structure),
+                focus="test-focus",
+                enable_ai_synthesis=False,
+            )
+
+        mock_summary.assert_not_called()
+        assert "ai_synthesis" not in result
+        assert "context_paths" in result
+
+
 @pytest.mark.unit
 class TestRichContextSummary:
     """
@@ -1108,6 +1275,58 @@ ACTIVE:
         assert len(summary) <= MAX_TOTAL_CONTEXT_CHARS + 50  # Allow for truncation message
         assert "truncated" in summary.lower()
 
+    def test_build_rich_context_keeps_north_star_when_context_is_large(
+        self, mock_hestai_structure: Path
+    ):
+        """
+        North Star constraints outrank PROJECT-CONTEXT when the budget is tight.
+        """
+        from hestai_mcp.modules.tools.clock_in import build_rich_context_summary
+
+        project_context = (
+            mock_hestai_structure / ".hestai" / "state" / "context" / "PROJECT-CONTEXT.oct.md"
+        )
+        project_context.write_text("\n".join(f"LINE_{i}::" + "Y" * 60 for i in range(300)))
+        north_star_dir = mock_hestai_structure / ".hestai" / "north-star"
+        north_star_dir.mkdir(parents=True, exist_ok=True)
+        (north_star_dir / "000-PROJECT-NORTH-STAR.md").write_text(
+            "IMMUTABLES:\nI1::TDD_DISCIPLINE\nI3::HUMAN_PRIMACY\n"
+        )
+
+        summary = build_rich_context_summary(
+            working_dir=mock_hestai_structure,
+            context_paths=[],
+            role="implementation-lead",
+            focus="test-focus",
+            budget_tokens=400,
+        )
+
+        assert "I3::HUMAN_PRIMACY" in summary
+        assert "[truncated]" in summary
+        assert len(summary) <= 400 * 4
+
+    def test_build_rich_context_includes_carried_checklist(self, mock_hestai_structure: Path):
+        """
+        Checklist items from the FAST layer are part of the context.
+        """
+        from hestai_mcp.modules.tools.clock_in import build_rich_context_summary
+
+        state_dir = mock_hestai_structure / ".hestai" / "state" / "context" / "state"
+        state_dir.mkdir(parents=True, exist_ok=True)
+        (state_dir / "checklist.oct.md").write_text(
+            "===SESSION_CHECKLIST===\nITEMS:\n  write_tests::PENDING\n===END===\n"
+        )
+
+        summary = build_rich_context_summary(
+            working_dir=mock_hestai_structure,
+            context_paths=[],
+            role="implementation-lead",
+            focus="test-focus",
+        )
+
+        assert "=== CHECKLIST ===" in summary
+        assert "write_tests::PENDING" in summary
+
 
 @pytest.mark.unit
 class TestFreshnessCheck:
@@ -971,3 +971,189 @@ class TestSessionDuration:
 
         assert result["status"] == "success"
         assert "duration_seconds" not in result
+
+
+@pytest.mark.unit
+class TestCompressedArchive:
+    """Test opt-in framed gzip archive (HESTAI_ARCHIVE_COMPRESSION=gzip)."""
+
+    @pytest.fixture
+    def session_setup(self, tmp_path: Path):
+        """Create an active session with a small transcript."""
+        active_dir = tmp_path / ".hestai" / "state" / "sessions" / "active"
+        active_dir.mkdir(parents=True)
+
+        session_id = "compressed-archive-test"
+        session_dir = active_dir / session_id
+        session_dir.mkdir()
+
+        jsonl_path = tmp_path / "session.jsonl"
+        jsonl_path.write_text(
+            json.dumps(
+                {
+                    "type": "user",
+                    "message": {
+                        "role": "user",
+                        "content": [{"type": "text", "text": "key sk-1234567890abcdefghij123"}],
+                    },
+                }
+            )
+            + "\n"
+        )
+
+        session_data = {
+            "session_id": session_id,
+            "role": "test",
+            "focus": "test",
+            "transcript_path": str(jsonl_path),
+            "working_dir": str(tmp_path),
+        }
+        (session_dir / "session.json").write_text(json.dumps(session_data))
+        return tmp_path, session_id
+
+    @pytest.mark.asyncio
+    async def test_writes_gzip_archive_with_index_when_enabled(self, session_setup, monkeypatch):
+        """Redacted transcript is stored as .jsonl.gz + .idx, plain file removed."""
+        from hestai_mcp.events import ClaudeJsonlLens, UserMessage
+        from hestai_mcp.events.jsonl_archive import index_path_for, is_compressed_archive
+        from hestai_mcp.modules.tools.clock_out import clock_out
+
+        monkeypatch.setenv("HESTAI_ARCHIVE_COMPRESSION", "gzip")
+        tmp_path, session_id = session_setup
+
+        result = await clock_out(session_id=session_id, description="", project_root=tmp_path)
+
+        archive_path = Path(result["redacted_jsonl_path"])
+        assert archive_path.name.endswith("-redacted.jsonl.gz")
+        assert is_compressed_archive(archive_path)
+        assert index_path_for(archive_path).exists()
+        assert not archive_path.with_suffix("").exists()
+
+        events = list(ClaudeJsonlLens().parse_file(archive_path))
+        assert isinstance(events[0], UserMessage)
+        assert "[REDACTED_API_KEY]" in events[0].content
+
+    @pytest.mark.asyncio
+    async def test_keeps_plain_jsonl_by_default(self, session_setup, monkeypatch):
+        """Without the opt-in, archives stay plain JSONL."""
+        from hestai_mcp.modules.tools.clock_out import clock_out
+
+        monkeypatch.delenv("HESTAI_ARCHIVE_COMPRESSION", raising=False)
+        tmp_path, session_id = session_setup
+
+        result = await clock_out(session_id=session_id, description="", project_root=tmp_path)
+
+        assert result["redacted_jsonl_path"].endswith("-redacted.jsonl")
+
+    @pytest.mark.asyncio
+    async def test_compression_failure_keeps_plain_archive(self, session_setup, monkeypatch):
+        """Archive compression failure is non-blocking."""
+        from unittest.mock import patch
+
+        from hestai_mcp.modules.tools.clock_out import clock_out
+
+        monkeypatch.setenv("HESTAI_ARCHIVE_COMPRESSION", "gzip")
+        tmp_path, session_id = session_setup
+
+        with patch(
+            "hestai_mcp.events.jsonl_archive.write_jsonl_archive",
+            side_effect=OSError("disk full"),
+        ):
+            result = await clock_out(session_id=session_id, description="", project_root=tmp_path)
+
+        assert result["status"] == "success"
+        assert result["redacted_jsonl_path"].endswith("-redacted.jsonl")
+        assert Path(result["redacted_jsonl_path"]).exists()
+
+
+@pytest.mark.unit
+class TestCompressionStats:
+    """Test distillation statistics in the clock_out response."""
+
+    @pytest.mark.asyncio
+    async def test_response_reports_reduction_ratio(self, tmp_path: Path):
+        """compression_stats carries token estimates even when the AI call fails."""
+        from hestai_mcp.modules.tools.clock_out import clock_out
+
+        active_dir = tmp_path / ".hestai" / "state" / "sessions" / "active"
+        session_dir = active_dir / "stats-test"
+        session_dir.mkdir(parents=True)
+
+        jsonl_path = tmp_path / "session.jsonl"
+        records = [
+            {"type": "user", "message": {"role": "user", "content": "read the file"}},
+            {"type": "tool_use", "id": "r1", "name": "Read", "input": {"file_path": "a.py"}},
+            {
+                "type": "tool_result",
+                "tool_use_id": "r1",
+                "content": [{"type": "text", "text": "x" * 5000}],
+            },
+        ]
+        jsonl_path.write_text("\n".join(json.dumps(r) for r in records) + "\n")
+        (session_dir / "session.json").write_text(
+            json.dumps(
+                {
+                    "session_id": "stats-test",
+                    "role": "test",
+                    "focus": "test",
+                    "transcript_path": str(jsonl_path),
+                    "working_dir": str(tmp_path),
+                }
+            )
+        )
+
+        result = await clock_out(session_id="stats-test", description="", project_root=tmp_path)
+
+        stats = result["compression_stats"]
+        assert stats["source_tokens"] > stats["distilled_tokens"]
+        assert stats["reduction_ratio"] > 0.5
+        # No API key in tests: the single completion is a cache miss that fails
+        assert stats["cache_hits"] == 0
+        assert stats["cache_misses"] == 1
+
+
+@pytest.mark.unit
+class TestDeferredCompression:
+    """Test deferred compression via the durable job queue."""
+
+    @pytest.mark.asyncio
+    async def test_defer_enqueues_job_without_compressing(self, tmp_path: Path, monkeypatch):
+        """Deferred clock_out archives, queues a job and skips the LLM stage."""
+        from unittest.mock import patch
+
+        from hestai_mcp.modules.tools.clock_out import clock_out
+        from hestai_mcp.modules.tools.shared.compression_jobs import get_compression_job_status
+
+        session_dir = tmp_path / ".hestai" / "state" / "sessions" / "active" / "defer-test"
+        session_dir.mkdir(parents=True)
+        jsonl_path = tmp_path / "session.jsonl"
+        jsonl_path.write_text(
+            json.dumps({"type": "user", "message": {"role": "user", "content": "hello"}}) + "\n"
+        )
+        (session_dir / "session.json").write_text(
+            json.dumps(
+                {
+                    "session_id": "defer-test",
+                    "role": "test",
+                    "focus": "test",
+                    "transcript_path": str(jsonl_path),
+                    "working_dir": str(tmp_path),
+                }
+            )
+        )
+        monkeypatch.setenv("HESTAI_DEFER_COMPRESSION", "true")
+
+        with patch(
+            "hestai_mcp.modules.tools.shared.compression.compress_session_transcript",
+            side_effect=AssertionError("compression must not run inline"),
+        ):
+            result = await clock_out(session_id="defer-test", description="", project_root=tmp_path)
+
+        assert result["compression_status"] == "deferred"
+        assert "octave_path" not in result
+        assert Path(result["redacted_jsonl_path"]).exists()
+        assert not session_dir.exists()
+
+        status = get_compression_job_status(tmp_path, job_id=result["compression_job_id"])
+        assert status["counts"] == {"queued": 1}
+        assert status["jobs"][0]["session_id"] == "defer-test"
@@ -449,6 +449,79 @@ ACTIVE:
         assert "PRIORITY::LOW" in result_content
 
 
+@pytest.mark.unit
+class TestAtomicWriteIfChanged:
+    """
+    Test skip-unchanged, atomic FAST layer writes.
+
+    Unchanged content must not touch the file (no watcher wake-ups), and
+    changed content replaces it via rename so readers never see a torn file.
+    """
+
+    def test_write_if_changed_skips_identical_content(self, tmp_path: Path):
+        """Identical content leaves the file (and its mtime) untouched."""
+        from hestai_mcp.modules.tools.shared.fast_state import write_if_changed
+
+        path = tmp_path / "blockers.oct.md"
+        assert write_if_changed(path, "===BLOCKERS===\n") is True
+        before = path.stat().st_mtime_ns
+
+        assert write_if_changed(path, "===BLOCKERS===\n") is False
+        assert path.stat().st_mtime_ns == before
+
+        assert write_if_changed(path, "===BLOCKERS===\nACTIVE:\n") is True
+        assert path.read_text() == "===BLOCKERS===\nACTIVE:\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["blockers.oct.md"]
+
+    def test_write_if_changed_replaces_via_rename(self, tmp_path: Path):
+        """Changed content lands in a new inode; failures leave no temp files."""
+        from unittest.mock import patch
+
+        from hestai_mcp.modules.tools.shared import fast_state
+
+        path = tmp_path / "checklist.oct.md"
+        path.write_text("old")
+        old_inode = path.stat().st_ino
+
+        fast_state.write_if_changed(path, "new")
+        assert path.stat().st_ino != old_inode
+
+        with (
+            patch.object(fast_state.os, "replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            fast_state.write_if_changed(path, "newer")
+        assert path.read_text() == "new"
+        assert [p.name for p in tmp_path.iterdir()] == ["checklist.oct.md"]
+
+    def test_write_if_changed_preserves_existing_mode(self, tmp_path: Path):
+        """Rewriting a file keeps its permission bits instead of the umask default."""
+        import stat
+
+        from hestai_mcp.modules.tools.shared.fast_state import write_if_changed
+
+        path = tmp_path / "current-focus.oct.md"
+        path.write_text("old")
+        path.chmod(0o600)
+
+        assert write_if_changed(path, "new") is True
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    def test_populate_blockers_skips_unchanged_file(self, tmp_path: Path):
+        """Re-populating blockers for the same session does not rewrite the file."""
+        from hestai_mcp.modules.tools.shared.fast_layer import populate_blockers
+
+        populate_blockers(tmp_path, "session-1")
+        blockers_path = tmp_path / "blockers.oct.md"
+        before = blockers_path.stat().st_mtime_ns
+
+        populate_blockers(tmp_path, "session-1")
+        assert blockers_path.stat().st_mtime_ns == before
+
+        populate_blockers(tmp_path, "session-2")
+        assert 'SESSION::"session-2"' in blockers_path.read_text()
+
+
 @pytest.mark.unit
 class TestAISynthesisIntegration:
     """
@@ -456,7 +529,7 @@ class TestAISynthesisIntegration:
 
     The synthesize_fast_layer_with_ai function:
     1. Creates a CompletionRequest with synthesis prompt
-    2. Calls AIClient.complete_text()
+    2. Streams AIClient.complete_text_streaming()
     3. Parses AI response into synthesis result
     4. Falls back to template if AI fails (SS-I6)
     """
@@ -490,9 +563,9 @@ FRESHNESS_WARNING::NONE"""
             mock_config = mock_load_config.return_value
             mock_config.get_operation_tier = MagicMock(return_value="fast")
 
-            # Mock the async context manager and complete_text
+            # Mock the async context manager and complete_text_streaming
             mock_client = AsyncMock()
-            mock_client.complete_text = AsyncMock(return_value=mock_ai_response)
+            mock_client.complete_text_streaming = AsyncMock(return_value=mock_ai_response)
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
             mock_ai_client_cls.return_value = mock_client
@@ -526,9 +599,9 @@ FRESHNESS_WARNING::NONE"""
             # Mock config loading
             mock_load_config.return_value = MagicMock()
 
-            # Simulate AI failure during complete_text
+            # Simulate AI failure during complete_text_streaming
             mock_client = AsyncMock()
-            mock_client.complete_text = AsyncMock(side_effect=Exception("AI unavailable"))
+            mock_client.complete_text_streaming = AsyncMock(side_effect=Exception("AI unavailable"))
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
             mock_ai_client_cls.return_value = mock_client
@@ -592,7 +665,7 @@ FRESHNESS_WARNING::NONE"""
             mock_load_config.return_value = MagicMock()
 
             mock_client = AsyncMock()
-            mock_client.complete_text = AsyncMock(return_value="AI synthesis result")
+            mock_client.complete_text_streaming = AsyncMock(return_value="AI synthesis result")
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
             mock_ai_client_cls.return_value = mock_client
@@ -637,7 +710,7 @@ FRESHNESS_WARNING::NONE"""
 
             # Force AI failure to trigger fallback
             mock_client = AsyncMock()
-            mock_client.complete_text = AsyncMock(side_effect=Exception("AI unavailable"))
+            mock_client.complete_text_streaming = AsyncMock(side_effect=Exception("AI unavailable"))
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
             mock_ai_client_cls.return_value = mock_client
@@ -726,7 +799,7 @@ This is an incomplete response that lacks required fields."""
             mock_config.get_operation_tier = MagicMock(return_value="fast")
 
             mock_client = AsyncMock()
-            mock_client.complete_text = AsyncMock(return_value=incomplete_ai_response)
+            mock_client.complete_text_streaming = AsyncMock(return_value=incomplete_ai_response)
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
             mock_ai_client_cls.return_value = mock_client
@@ -780,7 +853,7 @@ FRESHNESS_WARNING::NONE"""
             mock_config.get_operation_tier = MagicMock(return_value="fast")
 
             mock_client = AsyncMock()
-            mock_client.complete_text = AsyncMock(return_value=complete_ai_response)
+            mock_client.complete_text_streaming = AsyncMock(return_value=complete_ai_response)
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
             mock_ai_client_cls.return_value = mock_client
@@ -4,7 +4,7 @@ Tests for submit_rccafp_record MCP tool.
 Covers: valid submission, missing required fields, path validation,
 JSONL format, server envelope fields, optional fields, append behavior,
 project identity validation, symlink escape prevention, filesystem error
-handling, and short write detection.
+handling, short write detection, and large records with CRC trailers.
 """
 
 import json
@@ -796,30 +796,87 @@ class TestParentSymlinkEscapePrevention:
 
 
 # ---------------------------------------------------------------------------
-# Tests — PIPE_BUF Size Guard (regression: ftruncate removal)
+# Tests — Large Records (locked append path above PIPE_BUF)
 # ---------------------------------------------------------------------------
-class TestPipeBufSizeGuard:
-    """Tests that oversized records are rejected before writing."""
+class TestLargeRecords:
+    """Tests that records of any size are accepted with a CRC trailer."""
 
     @pytest.mark.unit
-    async def test_record_exceeding_pipe_buf_rejected(self, project_root: Path) -> None:
-        """A record whose encoded size exceeds PIPE_BUF (4096) is rejected."""
+    async def test_record_exceeding_pipe_buf_accepted(self, project_root: Path) -> None:
+        """A record larger than PIPE_BUF (4096) is written as one line."""
         from hestai_mcp.modules.tools.submit_rccafp import submit_rccafp_record
 
-        # Create a context_summary large enough to push the record over 4096 bytes
-        huge_summary = "x" * 5000
+        stack_trace = "Traceback line\n" * 2000
 
         result = await submit_rccafp_record(
             working_dir=str(project_root),
-            context_summary=huge_summary,
+            context_summary="test",
+            root_cause_analysis=stack_trace,
+            fix_attempt_1="test",
+            escalation_required=False,
+            future_proofing_rule="test",
+        )
+
+        assert result["success"] is True
+        metrics_file = project_root / ".hestai" / "state" / "error-metrics.jsonl"
+        lines = metrics_file.read_bytes().splitlines()
+        assert len(lines) == 1
+        assert len(lines[0]) > 4096
+        assert json.loads(lines[0])["root_cause_analysis"] == stack_trace
+
+    @pytest.mark.unit
+    async def test_large_record_takes_exclusive_lock(self, project_root: Path) -> None:
+        """Only records above PIPE_BUF take the flock."""
+        import fcntl
+
+        from hestai_mcp.modules.tools.submit_rccafp import submit_rccafp_record
+
+        with patch("fcntl.flock", wraps=fcntl.flock) as mock_flock:
+            await submit_rccafp_record(
+                working_dir=str(project_root),
+                context_summary="small",
+                root_cause_analysis="test",
+                fix_attempt_1="test",
+                escalation_required=False,
+                future_proofing_rule="test",
+            )
+            mock_flock.assert_not_called()
+
+            await submit_rccafp_record(
+                working_dir=str(project_root),
+                context_summary="x" * 5000,
+                root_cause_analysis="test",
+                fix_attempt_1="test",
+                escalation_required=False,
+                future_proofing_rule="test",
+            )
+            mock_flock.assert_called_once()
+            assert mock_flock.call_args.args[1] == fcntl.LOCK_EX
+
+    @pytest.mark.unit
+    async def test_large_record_isolates_torn_fragment(self, project_root: Path) -> None:
+        """A fragment left by a crashed writer gets its own line."""
+        from hestai_mcp.modules.tools.shared.error_metrics import decode_record
+        from hestai_mcp.modules.tools.submit_rccafp import submit_rccafp_record
+
+        metrics_file = project_root / ".hestai" / "state" / "error-metrics.jsonl"
+        metrics_file.write_bytes(b'{"record_id":"rccafp-torn","context_su')
+
+        result = await submit_rccafp_record(
+            working_dir=str(project_root),
+            context_summary="x" * 5000,
             root_cause_analysis="test",
             fix_attempt_1="test",
             escalation_required=False,
             future_proofing_rule="test",
         )
-        assert result["success"] is False
-        assert "PIPE_BUF" in result["error"]
-        assert "too large" in result["error"]
+
+        lines = metrics_file.read_bytes().splitlines()
+        assert len(lines) == 2
+        assert decode_record(lines[0]) is None
+        decoded = decode_record(lines[1])
+        assert decoded is not None
+        assert decoded[1]["record_id"] == result["record_id"]
 
     @pytest.mark.unit
     async def test_normal_record_under_pipe_buf_succeeds(self, project_root: Path) -> None:
@@ -836,6 +893,22 @@ class TestPipeBufSizeGuard:
         )
         assert result["success"] is True
 
+    @pytest.mark.unit
+    async def test_record_has_valid_crc(self, valid_args: dict, project_root: Path) -> None:
+        """Each line ends with a crc32 field that verifies."""
+        from hestai_mcp.modules.tools.shared.error_metrics import decode_record
+        from hestai_mcp.modules.tools.submit_rccafp import submit_rccafp_record
+
+        result = await submit_rccafp_record(**valid_args)
+
+        metrics_file = project_root / ".hestai" / "state" / "error-metrics.jsonl"
+        line = metrics_file.read_bytes()
+        assert b'"crc32":"' in line
+        decoded = decode_record(line)
+        assert decoded is not None
+        assert decoded[1]["record_id"] == result["record_id"]
+        assert "crc32" not in decoded[1]
+
 
 # ---------------------------------------------------------------------------
 # Tests — Session Detection Edge Cases (regression: UnicodeDecodeError)